@@ -12,8 +12,11 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from nemo.collections.asr import data, losses, models, modules
 from nemo.package_info import __version__
+from nemo.utils.import_utils import lazy_import
+
+# The submodules are imported on first access, see `lazy_import`
+__getattr__, __dir__, __all__ = lazy_import(__name__, submodules=["data", "losses", "models", "modules"])
 
 # Set collection version equal to NeMo version.
 __version = __version__
@@ -25,10 +25,12 @@ import torch
 from torch.utils.data import ChainDataset
 from tqdm import tqdm
 
+from nemo.collections.asr.parts.preprocessing.feature_cache import CachedAudioFeaturizer
 from nemo.collections.asr.parts.preprocessing.features import WaveformFeaturizer
 from nemo.collections.asr.parts.preprocessing.segment import ChannelSelectorType
 from nemo.collections.asr.parts.preprocessing.segment import available_formats as valid_sf_formats
 from nemo.collections.common import tokenizers
+from nemo.collections.common.data.tar_index import IndexedTarFile, load_tar_index
 from nemo.collections.common.parts.preprocessing import collections, parsers
 from nemo.core.classes import Dataset, IterableDataset
 from nemo.core.neural_types import *
@@ -127,6 +129,8 @@ class ASRManifestProcessor:
         bos_id: Id of beginning of sequence symbol to append if not None.
         eos_id: Id of end of sequence symbol to append if not None.
         pad_id: Id of pad symbol. Defaults to 0.
+        compact_manifest: If True, stores the manifest in flat arrays shared between DataLoader workers instead of one
+            Python object per entry, see `AudioText`. Defaults to False.
     """
 
     def __init__(
@@ -141,6 +145,7 @@ class ASRManifestProcessor:
         pad_id: int = 0,
         index_by_file_id: bool = False,
         manifest_parse_func: Optional[Callable] = None,
+        compact_manifest: bool = False,
     ):
         self.parser = parser
 
@@ -152,6 +157,7 @@ class ASRManifestProcessor:
             max_number=max_utts,
             index_by_file_id=index_by_file_id,
             parse_func=manifest_parse_func,
+            compact=compact_manifest,
         )
 
         self.eos_id = eos_id
@@ -414,6 +420,12 @@ class _AudioTextDataset(Dataset):
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        feature_cache: Optional config of a persistent feature cache, see `CachedAudioFeaturizer.from_config`.
+            If set, the features are computed by the `preprocessor` given in this config (once per segment, and
+            read from the cache afterwards), and the batches are returned as `DALIOutputs` with a processed signal,
+            so that models skip their own preprocessor. Cannot be used with audio augmentation. Defaults to None.
+        compact_manifest: If True, stores the manifest in flat arrays shared between DataLoader workers instead of one
+            Python object per entry. Defaults to False.
     """
 
     @property
@@ -444,6 +456,8 @@ class _AudioTextDataset(Dataset):
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
         manifest_parse_func: Optional[Callable] = None,
+        feature_cache: Optional[Dict] = None,
+        compact_manifest: bool = False,
     ):
         if type(manifest_filepath) == str:
             manifest_filepath = manifest_filepath.split(",")
@@ -461,8 +475,19 @@ class _AudioTextDataset(Dataset):
             eos_id=eos_id,
             pad_id=pad_id,
             manifest_parse_func=manifest_parse_func,
+            compact_manifest=compact_manifest,
         )
-        self.featurizer = WaveformFeaturizer(sample_rate=sample_rate, int_values=int_values, augmentor=augmentor)
+        if feature_cache is not None:
+            if augmentor is not None:
+                raise ValueError("`feature_cache` cannot be used together with audio augmentation")
+            if return_sample_id:
+                raise ValueError("`feature_cache` does not support `return_sample_id`")
+            self.featurizer = CachedAudioFeaturizer.from_config(
+                feature_cache, sample_rate=sample_rate, int_values=int_values
+            )
+        else:
+            self.featurizer = WaveformFeaturizer(sample_rate=sample_rate, int_values=int_values, augmentor=augmentor)
+        self.has_processed_signal = feature_cache is not None
         self.trim = trim
         self.return_sample_id = return_sample_id
         self.channel_selector = channel_selector
@@ -491,7 +516,10 @@ class _AudioTextDataset(Dataset):
             orig_sr=sample.orig_sr,
             channel_selector=self.channel_selector,
         )
-        f, fl = features, torch.tensor(features.shape[0]).long()
+        if self.has_processed_signal:
+            f, fl = features, torch.tensor(features.shape[1]).long()
+        else:
+            f, fl = features, torch.tensor(features.shape[0]).long()
 
         t, tl = self.manifest_processor.process_text_by_sample(sample=sample)
 
@@ -506,7 +534,20 @@ class _AudioTextDataset(Dataset):
         return len(self.manifest_processor.collection)
 
     def _collate_fn(self, batch):
-        return _speech_collate_fn(batch, pad_id=self.manifest_processor.pad_id)
+        batch = _speech_collate_fn(batch, pad_id=self.manifest_processor.pad_id)
+        if self.has_processed_signal:
+            from nemo.collections.asr.data.audio_to_text_dali import DALIOutputs
+
+            processed_signal, processed_signal_len, transcript, transcript_len = batch
+            return DALIOutputs(
+                {
+                    'processed_signal': processed_signal,
+                    'processed_signal_len': processed_signal_len,
+                    'transcript': transcript,
+                    'transcript_len': transcript_len,
+                }
+            )
+        return batch
 
 
 class AudioToCharDataset(_AudioTextDataset):
@@ -541,6 +582,9 @@ class AudioToCharDataset(_AudioTextDataset):
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        feature_cache: Optional config of a persistent feature cache, see `_AudioTextDataset`. Defaults to None.
+        compact_manifest: If True, stores the manifest in flat arrays shared between DataLoader workers instead of one
+            Python object per entry. Defaults to False.
     """
 
     @property
@@ -575,6 +619,8 @@ class AudioToCharDataset(_AudioTextDataset):
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
         manifest_parse_func: Optional[Callable] = None,
+        feature_cache: Optional[Dict] = None,
+        compact_manifest: bool = False,
     ):
         self.labels = labels
 
@@ -598,6 +644,8 @@ class AudioToCharDataset(_AudioTextDataset):
             return_sample_id=return_sample_id,
             channel_selector=channel_selector,
             manifest_parse_func=manifest_parse_func,
+            feature_cache=feature_cache,
+            compact_manifest=compact_manifest,
         )
 
 
@@ -637,6 +685,9 @@ class AudioToBPEDataset(_AudioTextDataset):
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
         manifest_parse_func: Optional function to parse manifest entries. Defaults to None.
+        feature_cache: Optional config of a persistent feature cache, see `_AudioTextDataset`. Defaults to None.
+        compact_manifest: If True, stores the manifest in flat arrays shared between DataLoader workers instead of one
+            Python object per entry. Defaults to False.
     """
 
     @property
@@ -665,6 +716,8 @@ class AudioToBPEDataset(_AudioTextDataset):
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
         manifest_parse_func: Optional[Callable] = None,
+        feature_cache: Optional[Dict] = None,
+        compact_manifest: bool = False,
     ):
         if use_start_end_token and hasattr(tokenizer, "bos_id") and tokenizer.bos_id > 0:
             bos_id = tokenizer.bos_id
@@ -715,6 +768,8 @@ class AudioToBPEDataset(_AudioTextDataset):
             return_sample_id=return_sample_id,
             channel_selector=channel_selector,
             manifest_parse_func=manifest_parse_func,
+            feature_cache=feature_cache,
+            compact_manifest=compact_manifest,
         )
 
 
@@ -884,7 +939,7 @@ class _TarredAudioToTextDataset(IterableDataset):
             wds.SimpleShardList(urls=audio_tar_filepaths),
             webdataset_split_by_workers,
             wds.shuffle(shuffle_n),
-            wds.tarfile_to_samples(),
+            self._tarfile_to_samples,
             wds.rename(audio=VALID_FILE_FORMATS, key='__key__'),
             wds.to_tuple('audio', 'key'),
             self._filter,
@@ -892,6 +947,37 @@ class _TarredAudioToTextDataset(IterableDataset):
             wds.map(self._build_sample),
         )
 
+    def _tarfile_to_samples(self, shards):
+        """Expands tar shards into WebDataset samples, same as ``wds.tarfile_to_samples()``.
+        Local shards with a sidecar offset index (see ``nemo.collections.common.data.tar_index``) are read by
+        seeking directly to the audio files that are present in the manifest, without reading the filtered out ones.
+        """
+        tarfile_to_samples = wds.tarfile_to_samples()
+        mapping = self.manifest_processor.collection.mapping
+        for shard in shards:
+            url = shard["url"]
+            tar_index = load_tar_index(url)
+            if tar_index is None:
+                yield from tarfile_to_samples(iter([shard]))
+                continue
+
+            sample = None
+            with IndexedTarFile(url, index=tar_index) as tar:
+                for name in tar:
+                    key, suffix = wds.tariterators.base_plus_ext(name)
+                    if key is None:
+                        continue
+                    file_id, _ = os.path.splitext(os.path.basename(key))
+                    if file_id not in mapping:
+                        continue
+                    if sample is None or sample["__key__"] != key:
+                        if sample is not None:
+                            yield sample
+                        sample = {"__key__": key, "__url__": url}
+                    sample[suffix.lower()] = tar.read(name)
+            if sample is not None:
+                yield sample
+
     def _filter(self, iterator):
         """This function is used to remove samples that have been filtered out by ASRAudioText already.
         Otherwise, we would get a KeyError as _build_sample attempts to find the manifest entry for a sample
@@ -110,6 +110,13 @@ class DALIOutputs(object):
     def __len__(self):
         return len(self._outs)
 
+    def to(self, *args, **kwargs) -> 'DALIOutputs':
+        """Moves the outputs, e.g. produced by a DataLoader on CPU, to another device."""
+        outs = DALIOutputs.__new__(DALIOutputs)
+        outs._has_processed_signal = self._has_processed_signal
+        outs._outs = tuple(out.to(*args, **kwargs) for out in self._outs)
+        return outs
+
 
 class _AudioTextDALIDataset(Iterator):
     """
@@ -159,6 +159,8 @@ def get_char_dataset(config: dict, augmentor: Optional['AudioAugmentor'] = None)
         parser=config.get('parser', 'en'),
         return_sample_id=config.get('return_sample_id', False),
         channel_selector=config.get('channel_selector', None),
+        feature_cache=config.get('feature_cache', None),
+        compact_manifest=config.get('compact_manifest', False),
     )
     return dataset
 
@@ -239,6 +241,8 @@ def get_bpe_dataset(
         use_start_end_token=config.get('use_start_end_token', True),
         return_sample_id=config.get('return_sample_id', False),
         channel_selector=config.get('channel_selector', None),
+        feature_cache=config.get('feature_cache', None),
+        compact_manifest=config.get('compact_manifest', False),
     )
     return dataset
 
@@ -17,6 +17,7 @@ from typing import Callable, Dict, List, Optional, Tuple, Union
 import torch
 
 from nemo.collections.asr.data.feature_to_label import _audio_feature_collate_fn
+from nemo.collections.asr.parts.preprocessing.feature_cache import FeatureCache
 from nemo.collections.asr.parts.preprocessing.feature_loader import ExternalFeatureLoader
 from nemo.collections.asr.parts.preprocessing.features import normalize_batch
 from nemo.collections.asr.parts.preprocessing.segment import ChannelSelectorType
@@ -107,6 +108,7 @@ class _FeatureTextDataset(Dataset):
         pad_id (int): Id of pad symbol. Defaults to 0
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
+        feature_cache (dict): Optional config of a persistent cache of the loaded features, see `FeatureCache.from_config`. Defaults to None.
     """
 
     ZERO_LEVEL_SPEC_DB_VAL = -16.635  # Log-Melspectrogram value for zero signal
@@ -146,6 +148,7 @@ class _FeatureTextDataset(Dataset):
         pad_id: int = 0,
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
+        feature_cache: Optional[Dict] = None,
     ):
         if type(manifest_filepath) == str:
             manifest_filepath = manifest_filepath.split(",")
@@ -181,7 +184,9 @@ class _FeatureTextDataset(Dataset):
             eos_id=eos_id,
             pad_id=pad_id,
         )
-        self.featurizer = ExternalFeatureLoader(augmentor=augmentor)
+        self.featurizer = ExternalFeatureLoader(
+            augmentor=augmentor, feature_cache=FeatureCache.from_config(feature_cache) if feature_cache else None
+        )
         self.trim = trim
         self.return_sample_id = return_sample_id
         self.channel_selector = channel_selector
@@ -307,6 +312,7 @@ class FeatureToCharDataset(_FeatureTextDataset):
         eos_id: Id of end of sequence symbol to append if not None
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
+        feature_cache (dict): Optional config of a persistent cache of the loaded features, see `FeatureCache.from_config`. Defaults to None.
     """
 
     def __init__(
@@ -334,6 +340,7 @@ class FeatureToCharDataset(_FeatureTextDataset):
         parser: Union[str, Callable] = 'en',
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
+        feature_cache: Optional[Dict] = None,
     ):
         self.labels = labels
 
@@ -362,6 +369,7 @@ class FeatureToCharDataset(_FeatureTextDataset):
             pad_id=pad_id,
             return_sample_id=return_sample_id,
             channel_selector=channel_selector,
+            feature_cache=feature_cache,
         )
 
 
@@ -407,6 +415,7 @@ class FeatureToBPEDataset(_FeatureTextDataset):
             tokens to beginning and ending of speech respectively.
         return_sample_id (bool): whether to return the sample_id as a part of each sample
         channel_selector (int | Iterable[int] | str): select a single channel or a subset of channels from multi-channel audio. If set to `'average'`, it performs averaging across channels. Disabled if set to `None`. Defaults to `None`. Uses zero-based indexing.
+        feature_cache (dict): Optional config of a persistent cache of the loaded features, see `FeatureCache.from_config`. Defaults to None.
     """
 
     def __init__(
@@ -429,6 +438,7 @@ class FeatureToBPEDataset(_FeatureTextDataset):
         trim: bool = False,
         return_sample_id: bool = False,
         channel_selector: Optional[ChannelSelectorType] = None,
+        feature_cache: Optional[Dict] = None,
     ):
         if use_start_end_token and hasattr(tokenizer, "bos_id") and tokenizer.bos_id > 0:
             bos_id = tokenizer.bos_id
@@ -484,4 +494,5 @@ class FeatureToBPEDataset(_FeatureTextDataset):
             pad_id=pad_id,
             return_sample_id=return_sample_id,
             channel_selector=channel_selector,
+            feature_cache=feature_cache,
         )
@@ -14,25 +14,35 @@
 
 from typing import List, Optional, Tuple, Union
 
-import editdistance
-import jiwer
 import torch
 from torchmetrics import Metric
 
 from nemo.collections.asr.parts.submodules.ctc_decoding import AbstractCTCDecoding
 from nemo.collections.asr.parts.submodules.multitask_decoding import AbstractMultiTaskDecoding
 from nemo.collections.asr.parts.submodules.rnnt_decoding import AbstractRNNTDecoding
+from nemo.collections.asr.parts.utils.edit_distance_utils import (
+    batched_text_edit_distance,
+    batched_text_edit_operations,
+)
 from nemo.utils import logging
 
 __all__ = ['word_error_rate', 'word_error_rate_detail', 'WER']
 
+# The cached word ids of the WER metric are dropped once the vocabulary grows past this size.
+MAX_WORD_VOCABULARY_SIZE = 1 << 20
+
 
 def move_dimension_to_the_front(tensor, dim_index):
     all_dims = list(range(tensor.ndim))
     return tensor.permute(*([dim_index] + all_dims[:dim_index] + all_dims[dim_index + 1 :]))
 
 
-def word_error_rate(hypotheses: List[str], references: List[str], use_cer=False) -> float:
+def _strip_for_cer(texts: List[str], use_cer: bool) -> List[str]:
+    """Strips leading and trailing whitespace for cer, the same way ``jiwer`` normalizes texts."""
+    return [text.strip() for text in texts] if use_cer else texts
+
+
+def word_error_rate(hypotheses: List[str], references: List[str], use_cer=False, device=None) -> float:
     """
     Computes Average Word Error rate between two texts represented as
     corresponding lists of string.
@@ -43,11 +53,12 @@ def word_error_rate(hypotheses: List[str], references: List[str], use_cer=False)
         hypotheses (list): list of hypotheses
         references(list) : list of references
         use_cer (bool): set True to enable cer
+        device (str): device to compute the edit distances on, e.g. ``"cuda"`` to score
+            the whole batch with a single batched dynamic programming pass. Defaults to CPU.
 
     Returns:
         wer (float): average word error rate
     """
-    scores = 0
     words = 0
     if len(hypotheses) != len(references):
         raise ValueError(
@@ -55,17 +66,10 @@ def word_error_rate(hypotheses: List[str], references: List[str], use_cer=False)
             " lists must have the same number of elements. But I got:"
             "{0} and {1} correspondingly".format(len(hypotheses), len(references))
         )
-    for h, r in zip(hypotheses, references):
-        if use_cer:
-            h_list = list(h)
-            r_list = list(r)
-        else:
-            h_list = h.split()
-            r_list = r.split()
-        words += len(r_list)
-        # May deprecate using editdistance in future release for here and rest of codebase
-        # once we confirm jiwer is reliable.
-        scores += editdistance.eval(h_list, r_list)
+    for r in references:
+        words += len(r) if use_cer else len(r.split())
+    scores = int(batched_text_edit_distance(hypotheses, references, use_cer=use_cer, device=device).sum())
+
     if words != 0:
         wer = 1.0 * scores / words
     else:
@@ -74,7 +78,7 @@ def word_error_rate(hypotheses: List[str], references: List[str], use_cer=False)
 
 
 def word_error_rate_detail(
-    hypotheses: List[str], references: List[str], use_cer=False
+    hypotheses: List[str], references: List[str], use_cer=False, device=None
 ) -> Tuple[float, int, float, float, float]:
     """
     Computes Average Word Error Rate with details (insertion rate, deletion rate, substitution rate)
@@ -86,6 +90,8 @@ def word_error_rate_detail(
         hypotheses (list): list of hypotheses
         references(list) : list of references
         use_cer (bool): set True to enable cer
+        device (str): device to compute the edit distances on, e.g. ``"cuda"`` to score
+            the whole batch with a single batched dynamic programming pass. Defaults to CPU.
 
     Returns:
         wer (float): average word error rate
@@ -105,34 +111,23 @@ def word_error_rate_detail(
             "{0} and {1} correspondingly".format(len(hypotheses), len(references))
         )
 
-    for h, r in zip(hypotheses, references):
-        if use_cer:
-            h_list = list(h)
-            r_list = list(r)
-        else:
-            h_list = h.split()
-            r_list = r.split()
-
-        # To get rid of the issue that jiwer does not allow empty string
-        if len(r_list) == 0:
-            if len(h_list) != 0:
-                errors = len(h_list)
-                ops_count['insertions'] += errors
-            else:
-                errors = 0
-        else:
-            if use_cer:
-                measures = jiwer.cer(r, h, return_dict=True)
-            else:
-                measures = jiwer.compute_measures(r, h)
-
-            errors = measures['insertions'] + measures['deletions'] + measures['substitutions']
-            ops_count['insertions'] += measures['insertions']
-            ops_count['deletions'] += measures['deletions']
-            ops_count['substitutions'] += measures['substitutions']
-
+    distances, insertions, deletions, substitutions = batched_text_edit_operations(
+        _strip_for_cer(hypotheses, use_cer), _strip_for_cer(references, use_cer), use_cer=use_cer, device=device
+    )
+    for h, r, errors, ins, dels, subs in zip(
+        hypotheses, references, distances.tolist(), insertions.tolist(), deletions.tolist(), substitutions.tolist()
+    ):
+        r_length = len(r) if use_cer else len(r.split())
+        if r_length == 0:
+            # an empty reference turns every hypothesis token into an insertion
+            errors = ins = len(h) if use_cer else len(h.split())
+            dels = subs = 0
+
+        ops_count['insertions'] += ins
+        ops_count['deletions'] += dels
+        ops_count['substitutions'] += subs
         scores += errors
-        words += len(r_list)
+        words += r_length
 
     if words != 0:
         wer = 1.0 * scores / words
@@ -145,7 +140,9 @@ def word_error_rate_detail(
     return wer, words, ins_rate, del_rate, sub_rate
 
 
-def word_error_rate_per_utt(hypotheses: List[str], references: List[str], use_cer=False) -> Tuple[List[float], float]:
+def word_error_rate_per_utt(
+    hypotheses: List[str], references: List[str], use_cer=False, device=None
+) -> Tuple[List[float], float]:
     """
     Computes Word Error Rate per utterance and the average WER
     between two texts represented as corresponding lists of string.
@@ -156,6 +153,8 @@ def word_error_rate_per_utt(hypotheses: List[str], references: List[str], use_ce
         hypotheses (list): list of hypotheses
         references(list) : list of references
         use_cer (bool): set True to enable cer
+        device (str): device to compute the edit distances on, e.g. ``"cuda"`` to score
+            the whole batch with a single batched dynamic programming pass. Defaults to CPU.
 
     Returns:
         wer_per_utt (List[float]): word error rate per utterance
@@ -172,32 +171,21 @@ def word_error_rate_per_utt(hypotheses: List[str], references: List[str], use_ce
             "{0} and {1} correspondingly".format(len(hypotheses), len(references))
         )
 
-    for h, r in zip(hypotheses, references):
-        if use_cer:
-            h_list = list(h)
-            r_list = list(r)
-        else:
-            h_list = h.split()
-            r_list = r.split()
-
-        # To get rid of the issue that jiwer does not allow empty string
-        if len(r_list) == 0:
-            if len(h_list) != 0:
-                errors = len(h_list)
+    distances = batched_text_edit_distance(
+        _strip_for_cer(hypotheses, use_cer), _strip_for_cer(references, use_cer), use_cer=use_cer, device=device
+    )
+    for h, r, errors in zip(hypotheses, references, distances.tolist()):
+        r_length = len(r) if use_cer else len(r.split())
+        if r_length == 0:
+            errors = len(h) if use_cer else len(h.split())
+            if errors != 0:
                 wer_per_utt.append(float('inf'))
         else:
-            if use_cer:
-                measures = jiwer.cer(r, h, return_dict=True)
-                er = measures['cer']
-            else:
-                measures = jiwer.compute_measures(r, h)
-                er = measures['wer']
-
-            errors = measures['insertions'] + measures['deletions'] + measures['substitutions']
-            wer_per_utt.append(er)
+            # rates are normalized by the reference length after the whitespace stripping used for cer
+            wer_per_utt.append(errors / (len(r.strip()) if use_cer else r_length))
 
         scores += errors
-        words += len(r_list)
+        words += r_length
 
     if words != 0:
         avg_wer = 1.0 * scores / words
@@ -238,6 +226,8 @@ class WER(Metric):
         log_prediction: Whether to log a single decoded sample per call.
         batch_dim_index: Index corresponding to batch dimension. (For RNNT.)
         dist_dync_on_step: Whether to perform reduction on forward pass of metric.
+        edit_distance_device: Device on which the batched edit distances are computed. Defaults to CPU;
+            pass e.g. ``"cuda"`` to run the dynamic programming on the GPU for large batches or long utterances.
 
     Returns:
         res: a tuple of 3 zero dimensional float32 ``torch.Tensor` objects: a WER score, a sum of Levenstein's
@@ -255,6 +245,7 @@ class WER(Metric):
         batch_dim_index=0,
         dist_sync_on_step=False,
         sync_on_compute=True,
+        edit_distance_device=None,
         **kwargs,
     ):
         super().__init__(dist_sync_on_step=dist_sync_on_step, sync_on_compute=sync_on_compute)
@@ -264,6 +255,9 @@ class WER(Metric):
         self.log_prediction = log_prediction
         self.fold_consecutive = fold_consecutive
         self.batch_dim_index = batch_dim_index
+        self.edit_distance_device = edit_distance_device
+        # word to id mapping reused across updates, so that words only have to be hashed into new ids once
+        self._word_vocabulary = {}
 
         self.decode = None
         if isinstance(self.decoding, AbstractRNNTDecoding):
@@ -337,18 +331,22 @@ class WER(Metric):
             logging.info(f"WER reference:{references[0]}")
             logging.info(f"WER predicted:{hypotheses[0].text}")
 
-        for h, r in zip(hypotheses, references):
-            if isinstance(h, list):
-                h = h[0]
-            if self.use_cer:
-                h_list = list(h.text)
-                r_list = list(r)
-            else:
-                h_list = h.text.split()
-                r_list = r.split()
-            words += len(r_list)
-            # Compute Levenstein's distance
-            scores += editdistance.eval(h_list, r_list)
+        hypotheses = [(h[0] if isinstance(h, list) else h).text for h in hypotheses]
+        references = references[: len(hypotheses)]
+        for r in references:
+            words += len(r) if self.use_cer else len(r.split())
+        if len(self._word_vocabulary) > MAX_WORD_VOCABULARY_SIZE:
+            self._word_vocabulary.clear()
+        # Compute Levenstein's distance
+        scores = int(
+            batched_text_edit_distance(
+                hypotheses,
+                references,
+                use_cer=self.use_cer,
+                vocabulary=self._word_vocabulary,
+                device=self.edit_distance_device,
+            ).sum()
+        )
 
         self.scores = torch.tensor(scores, device=self.scores.device, dtype=self.scores.dtype)
         self.words = torch.tensor(words, device=self.words.device, dtype=self.words.dtype)
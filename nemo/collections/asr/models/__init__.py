@@ -12,33 +12,41 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from nemo.collections.asr.models.aed_multitask_models import EncDecMultiTaskModel
-from nemo.collections.asr.models.asr_model import ASRModel
-from nemo.collections.asr.models.classification_models import (
-    ClassificationInferConfig,
-    EncDecClassificationModel,
-    EncDecFrameClassificationModel,
-)
-from nemo.collections.asr.models.clustering_diarizer import ClusteringDiarizer
-from nemo.collections.asr.models.ctc_bpe_models import EncDecCTCModelBPE
-from nemo.collections.asr.models.ctc_models import EncDecCTCModel
-from nemo.collections.asr.models.hybrid_rnnt_ctc_bpe_models import EncDecHybridRNNTCTCBPEModel
-from nemo.collections.asr.models.hybrid_rnnt_ctc_models import EncDecHybridRNNTCTCModel
-from nemo.collections.asr.models.k2_sequence_models import (
-    EncDecK2RnntSeqModel,
-    EncDecK2RnntSeqModelBPE,
-    EncDecK2SeqModel,
-    EncDecK2SeqModelBPE,
-)
-from nemo.collections.asr.models.label_models import EncDecSpeakerLabelModel
-from nemo.collections.asr.models.msdd_models import EncDecDiarLabelModel, NeuralDiarizer
-from nemo.collections.asr.models.rnnt_bpe_models import EncDecRNNTBPEModel
-from nemo.collections.asr.models.rnnt_models import EncDecRNNTModel
-from nemo.collections.asr.models.slu_models import SLUIntentSlotBPEModel
-from nemo.collections.asr.models.sortformer_diar_models import SortformerEncLabelModel
-from nemo.collections.asr.models.ssl_models import (
-    EncDecDenoiseMaskedTokenPredModel,
-    EncDecMaskedTokenPredModel,
-    SpeechEncDecSelfSupervisedModel,
+from nemo.utils.import_utils import lazy_import
+
+# The models are imported on first access, see `lazy_import`
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    attributes={
+        "aed_multitask_models": ["EncDecMultiTaskModel"],
+        "asr_model": ["ASRModel"],
+        "classification_models": [
+            "ClassificationInferConfig",
+            "EncDecClassificationModel",
+            "EncDecFrameClassificationModel",
+        ],
+        "clustering_diarizer": ["ClusteringDiarizer"],
+        "ctc_bpe_models": ["EncDecCTCModelBPE"],
+        "ctc_models": ["EncDecCTCModel"],
+        "hybrid_rnnt_ctc_bpe_models": ["EncDecHybridRNNTCTCBPEModel"],
+        "hybrid_rnnt_ctc_models": ["EncDecHybridRNNTCTCModel"],
+        "k2_sequence_models": [
+            "EncDecK2RnntSeqModel",
+            "EncDecK2RnntSeqModelBPE",
+            "EncDecK2SeqModel",
+            "EncDecK2SeqModelBPE",
+        ],
+        "label_models": ["EncDecSpeakerLabelModel"],
+        "msdd_models": ["EncDecDiarLabelModel", "NeuralDiarizer"],
+        "rnnt_bpe_models": ["EncDecRNNTBPEModel"],
+        "rnnt_models": ["EncDecRNNTModel"],
+        "slu_models": ["SLUIntentSlotBPEModel"],
+        "sortformer_diar_models": ["SortformerEncLabelModel"],
+        "ssl_models": [
+            "EncDecDenoiseMaskedTokenPredModel",
+            "EncDecMaskedTokenPredModel",
+            "SpeechEncDecSelfSupervisedModel",
+        ],
+        "transformer_bpe_models": ["EncDecTransfModelBPE"],
+    },
 )
-from nemo.collections.asr.models.transformer_bpe_models import EncDecTransfModelBPE
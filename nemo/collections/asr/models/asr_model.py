@@ -26,6 +26,7 @@ from nemo.core.neural_types import AudioSignal, LabelsType, LengthsType, NeuralT
 from nemo.core.utils.neural_type_utils import get_io_names
 from nemo.utils import logging, model_utils
 from nemo.utils.cast_utils import cast_all
+from nemo.utils.import_utils import import_all_lazy_attributes
 
 __all__ = ['ASRModel']
 
@@ -94,6 +95,8 @@ class ASRModel(ModelPT, WithOptionalCudaGraphs, ABC):
         Returns:
             List of available pre-trained models.
         """
+        # the models are imported lazily, import all of them to find their subclasses
+        import_all_lazy_attributes('nemo.collections.asr.models')
         # recursively walk the subclasses to generate pretrained model info
         list_of_models = model_utils.resolve_subclass_pretrained_model_info(cls)
         return list_of_models
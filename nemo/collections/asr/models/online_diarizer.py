@@ -128,6 +128,7 @@ class OnlineClusteringDiarizer(ClusteringDiarizer):
             history_buffer_size=clustering_params.history_buffer_size,
             current_buffer_size=clustering_params.current_buffer_size,
             cuda=self.cuda,
+            incremental=clustering_params.get('incremental', False),
         )
         self.history_n = clustering_params.history_buffer_size
         self.current_n = clustering_params.current_buffer_size
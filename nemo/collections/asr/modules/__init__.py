@@ -12,43 +12,45 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from nemo.collections.asr.modules.audio_preprocessing import (
-    AudioToMelSpectrogramPreprocessor,
-    AudioToMFCCPreprocessor,
-    CropOrPadSpectrogramAugmentation,
-    MaskedPatchAugmentation,
-    SpectrogramAugmentation,
-)
-from nemo.collections.asr.modules.beam_search_decoder import BeamSearchDecoderWithLM
-from nemo.collections.asr.modules.conformer_encoder import ConformerEncoder, ConformerEncoderAdapter
-from nemo.collections.asr.modules.conv_asr import (
-    ConvASRDecoder,
-    ConvASRDecoderClassification,
-    ConvASRDecoderReconstruction,
-    ConvASREncoder,
-    ConvASREncoderAdapter,
-    ECAPAEncoder,
-    ParallelConvASREncoder,
-    SpeakerDecoder,
-)
-from nemo.collections.asr.modules.graph_decoder import ViterbiDecoderWithGraph
-from nemo.collections.asr.modules.hybrid_autoregressive_transducer import HATJoint
-from nemo.collections.asr.modules.lstm_decoder import LSTMDecoder
-from nemo.collections.asr.modules.msdd_diarizer import MSDD_module
-from nemo.collections.asr.modules.rnn_encoder import RNNEncoder
-from nemo.collections.asr.modules.rnnt import (
-    RNNTDecoder,
-    RNNTDecoderJointSSL,
-    RNNTJoint,
-    SampledRNNTJoint,
-    StatelessTransducerDecoder,
-)
-from nemo.collections.asr.modules.squeezeformer_encoder import SqueezeformerEncoder, SqueezeformerEncoderAdapter
-from nemo.collections.asr.modules.ssl_modules import (
-    ConformerMultiLayerFeatureExtractor,
-    ConformerMultiLayerFeaturePreprocessor,
-    ConvFeatureMaksingWrapper,
-    MultiSoftmaxDecoder,
-    RandomBlockMasking,
-    RandomProjectionVectorQuantizer,
+from nemo.utils.import_utils import lazy_import
+
+# The modules are imported on first access, see `lazy_import`
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    attributes={
+        "audio_preprocessing": [
+            "AudioToMelSpectrogramPreprocessor",
+            "AudioToMFCCPreprocessor",
+            "CropOrPadSpectrogramAugmentation",
+            "MaskedPatchAugmentation",
+            "SpectrogramAugmentation",
+        ],
+        "beam_search_decoder": ["BeamSearchDecoderWithLM"],
+        "conformer_encoder": ["ConformerEncoder", "ConformerEncoderAdapter"],
+        "conv_asr": [
+            "ConvASRDecoder",
+            "ConvASRDecoderClassification",
+            "ConvASRDecoderReconstruction",
+            "ConvASREncoder",
+            "ConvASREncoderAdapter",
+            "ECAPAEncoder",
+            "ParallelConvASREncoder",
+            "SpeakerDecoder",
+        ],
+        "graph_decoder": ["ViterbiDecoderWithGraph"],
+        "hybrid_autoregressive_transducer": ["HATJoint"],
+        "lstm_decoder": ["LSTMDecoder"],
+        "msdd_diarizer": ["MSDD_module"],
+        "rnn_encoder": ["RNNEncoder"],
+        "rnnt": ["RNNTDecoder", "RNNTDecoderJointSSL", "RNNTJoint", "SampledRNNTJoint", "StatelessTransducerDecoder"],
+        "squeezeformer_encoder": ["SqueezeformerEncoder", "SqueezeformerEncoderAdapter"],
+        "ssl_modules": [
+            "ConformerMultiLayerFeatureExtractor",
+            "ConformerMultiLayerFeaturePreprocessor",
+            "ConvFeatureMaksingWrapper",
+            "MultiSoftmaxDecoder",
+            "RandomBlockMasking",
+            "RandomProjectionVectorQuantizer",
+        ],
+    },
 )
@@ -69,7 +69,7 @@ class _RNNTNumba(Function):
             blank_label=blank,
             fastemit_lambda=fastemit_lambda,
             clamp=clamp,
-            num_threads=0,
+            num_threads=torch.get_num_threads(),
         )
 
         if reduction in ['sum', 'mean']:
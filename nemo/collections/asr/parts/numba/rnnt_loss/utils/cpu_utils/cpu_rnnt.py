@@ -31,6 +31,7 @@ import multiprocessing
 from typing import Optional
 
 import numba
+import numpy as np
 import torch
 from torch.autograd import Function
 
@@ -53,6 +54,149 @@ def log_sum_exp(a: torch.Tensor, b: torch.Tensor):
         return math.log1p(math.exp(a - b)) + b
 
 
+@numba.jit(nopython=True, boundscheck=False)
+def _log_sum_exp_scalar(a: float, b: float) -> float:
+    """
+    Logsumexp of two scalars with safety checks for infs, usable inside numba kernels.
+    """
+    if math.isinf(a):
+        return b
+
+    if math.isinf(b):
+        return a
+
+    if a > b:
+        return math.log1p(math.exp(b - a)) + a
+    else:
+        return math.log1p(math.exp(a - b)) + b
+
+
+@numba.jit(nopython=True, boundscheck=False)
+def compute_alphas_each(acts, labels, alphas, T: int, U: int, blank: int) -> float:
+    """
+    Compute the forward variable alpha of a single sample.
+
+    Args:
+        acts: float[maxT, maxU, V+1] log probabilities of the sample.
+        labels: int[maxU - 1] labels of the sample.
+        alphas: float[maxT, maxU] working memory, updated inplace.
+        T: Length of the acoustic sequence (without padding).
+        U: Length of the target sequence + 1 (without padding).
+        blank: Index of the blank token in the vocabulary.
+
+    Returns:
+        Loglikelihood of the forward variable alpha.
+    """
+    alphas[0, 0] = 0.0
+    for t in range(1, T):
+        alphas[t, 0] = alphas[t - 1, 0] + acts[t - 1, 0, blank]
+
+    for u in range(1, U):
+        alphas[0, u] = alphas[0, u - 1] + acts[0, u - 1, labels[u - 1]]
+
+    for t in range(1, T):
+        for u in range(1, U):
+            no_emit = alphas[t - 1, u] + acts[t - 1, u, blank]
+            emit = alphas[t, u - 1] + acts[t, u - 1, labels[u - 1]]
+            alphas[t, u] = _log_sum_exp_scalar(emit, no_emit)
+
+    return alphas[T - 1, U - 1] + acts[T - 1, U - 1, blank]
+
+
+@numba.jit(nopython=True, boundscheck=False)
+def compute_betas_and_grads_each(
+    acts, labels, alphas, betas, grads, T: int, U: int, blank: int, fastemit_lambda: float
+) -> float:
+    """
+    Compute the backward variable beta of a single sample, as well as the gradients of the log probabilities
+    wrt the loglikelihood.
+
+    Args:
+        acts: float[maxT, maxU, V+1] log probabilities of the sample.
+        labels: int[maxU - 1] labels of the sample.
+        alphas: float[maxT, maxU] forward variable computed by `compute_alphas_each`.
+        betas: float[maxT, maxU] working memory, updated inplace.
+        grads: float[maxT, maxU, V+1] gradients of the sample, updated inplace. Must be zero initialized.
+        T: Length of the acoustic sequence (without padding).
+        U: Length of the target sequence + 1 (without padding).
+        blank: Index of the blank token in the vocabulary.
+        fastemit_lambda: Float scaling factor for FastEmit regularization.
+
+    Returns:
+        Loglikelihood of the backward variable beta.
+    """
+    betas[T - 1, U - 1] = acts[T - 1, U - 1, blank]
+    for t in range(T - 2, -1, -1):
+        betas[t, U - 1] = betas[t + 1, U - 1] + acts[t, U - 1, blank]
+
+    for u in range(U - 2, -1, -1):
+        betas[T - 1, u] = betas[T - 1, u + 1] + acts[T - 1, u, labels[u]]
+
+    for t in range(T - 2, -1, -1):
+        for u in range(U - 2, -1, -1):
+            no_emit = betas[t + 1, u] + acts[t, u, blank]
+            emit = betas[t, u + 1] + acts[t, u, labels[u]]
+            betas[t, u] = _log_sum_exp_scalar(emit, no_emit)
+
+    loglike = betas[0, 0]
+    log_fastemit = math.log1p(fastemit_lambda)
+    # // Gradients w.r.t. log probabilities
+    for t in range(T):
+        for u in range(U):
+            if t < T - 1:
+                g = alphas[t, u] + betas[t + 1, u]
+                grads[t, u, blank] = -math.exp(acts[t, u, blank] + g - loglike)
+
+            if u < U - 1:
+                g = alphas[t, u] + betas[t, u + 1]
+                grads[t, u, labels[u]] = -math.exp(log_fastemit + acts[t, u, labels[u]] + g - loglike)
+
+    # // gradient to the last blank transition
+    grads[T - 1, U - 1, blank] = -math.exp(acts[T - 1, U - 1, blank] + alphas[T - 1, U - 1] - loglike)
+
+    return loglike
+
+
+@numba.jit(nopython=True, boundscheck=False, parallel=True)
+def compute_costs_and_grads_batch(
+    acts, labels, act_lens, label_lens, alphas, betas, grads, ll_forward, ll_backward, blank: int, fastemit_lambda
+):
+    """
+    Compute the forward / backward loglikelihoods and the gradients of a minibatch, one sample per thread.
+
+    Args:
+        acts: float[B, maxT, maxU, V+1] log probabilities.
+        labels: int[B, maxU - 1] padded labels.
+        act_lens: int[B] lengths of the acoustic sequences.
+        label_lens: int[B] lengths of the target sequences.
+        alphas: float[B, maxT, maxU] working memory for the forward variable.
+        betas: float[B, maxT, maxU] working memory for the backward variable.
+        grads: float[B, maxT, maxU, V+1] gradients, updated inplace.
+        ll_forward: float[B] output loglikelihoods of the forward variable.
+        ll_backward: float[B] output loglikelihoods of the backward variable.
+        blank: Index of the blank token in the vocabulary.
+        fastemit_lambda: Float scaling factor for FastEmit regularization.
+    """
+    for b in numba.prange(acts.shape[0]):
+        T = act_lens[b]
+        U = label_lens[b] + 1
+        grads[b] = 0.0
+        ll_forward[b] = compute_alphas_each(acts[b], labels[b], alphas[b], T, U, blank)
+        ll_backward[b] = compute_betas_and_grads_each(
+            acts[b], labels[b], alphas[b], betas[b], grads[b], T, U, blank, fastemit_lambda
+        )
+
+
+@numba.jit(nopython=True, boundscheck=False, parallel=True)
+def compute_costs_batch(acts, labels, act_lens, label_lens, alphas, ll_forward, blank: int):
+    """
+    Compute the forward loglikelihoods of a minibatch, one sample per thread.
+    Arguments are the same as for `compute_costs_and_grads_batch`.
+    """
+    for b in numba.prange(acts.shape[0]):
+        ll_forward[b] = compute_alphas_each(acts[b], labels[b], alphas[b], act_lens[b], label_lens[b] + 1, blank)
+
+
 class CpuRNNT_index:
     def __init__(self, U: int, maxU: int, minibatch: int, alphabet_size: int, batch_first: bool):
         """
@@ -344,6 +488,38 @@ class CPURNNT:
 
         return loglike
 
+    def _batch_view(
+        self,
+        log_probs: torch.Tensor,
+        flat_labels: torch.Tensor,
+        label_lengths: torch.Tensor,
+        input_lengths: torch.Tensor,
+    ):
+        """
+        View the flattened batch first inputs as numpy arrays for the batched numba kernels.
+        Half precision log probs are upcast to float32, as numba does not compute in float16.
+        """
+        acts = log_probs.view(self.minibatch_, self.maxT_, self.maxU_, self.alphabet_size_)
+        if acts.dtype not in (torch.float32, torch.float64):
+            acts = acts.float()
+
+        labels = flat_labels.view(self.minibatch_, self.maxU_ - 1).long()
+        act_lens = input_lengths.long()
+        label_lens = label_lengths.long()
+        return acts.numpy(), labels.numpy(), act_lens.numpy(), label_lens.numpy()
+
+    def _alphas_betas_view(self, dtype: np.dtype):
+        """
+        Slice the alphas and betas of shape [B, maxT, maxU] off the working space memory.
+        """
+        size = self.minibatch_ * self.maxT_ * self.maxU_
+        workspace = self.workspace.numpy()
+        if workspace.dtype != dtype:
+            workspace = np.zeros(2 * size, dtype=dtype)
+
+        shape = (self.minibatch_, self.maxT_, self.maxU_)
+        return workspace[:size].reshape(shape), workspace[size : 2 * size].reshape(shape)
+
     def cost_and_grad(
         self,
         log_probs: torch.Tensor,
@@ -353,6 +529,44 @@ class CPURNNT:
         label_lengths: torch.Tensor,
         input_lengths: torch.Tensor,
     ) -> global_constants.RNNTStatus:
+        if self.batch_first:
+            acts, labels, act_lens, label_lens = self._batch_view(log_probs, flat_labels, label_lengths, input_lengths)
+            alphas, betas = self._alphas_betas_view(acts.dtype)
+            grads_view = grads.view(self.minibatch_, self.maxT_, self.maxU_, self.alphabet_size_)
+            if grads_view.dtype == acts.dtype:
+                grads_np = grads_view.numpy()
+            else:
+                grads_np = np.zeros(acts.shape, dtype=acts.dtype)
+
+            ll_forward = np.zeros(self.minibatch_, dtype=np.float64)
+            ll_backward = np.zeros(self.minibatch_, dtype=np.float64)
+            compute_costs_and_grads_batch(
+                acts,
+                labels,
+                act_lens,
+                label_lens,
+                alphas,
+                betas,
+                grads_np,
+                ll_forward,
+                ll_backward,
+                self.blank_,
+                self.fastemit_lambda_,
+            )
+            if grads_view.dtype != acts.dtype:
+                grads_view.copy_(torch.from_numpy(grads_np))
+
+            # Scale loglikelihoods by FastEmit lambda
+            ll_forward += ll_forward * self.fastemit_lambda_
+            ll_backward += ll_backward * self.fastemit_lambda_
+
+            for diff in np.abs(ll_forward - ll_backward):
+                if diff > 0.1:
+                    print(f"WARNING: Forward backward likelihood mismatch : {diff}")
+
+            costs.copy_(torch.from_numpy(-ll_forward))
+            return global_constants.RNNTStatus.RNNT_STATUS_SUCCESS
+
         # // per minibatch memory
         per_minibatch_bytes = 0
 
@@ -389,6 +603,14 @@ class CPURNNT:
         label_lengths: torch.Tensor,
         input_lengths: torch.Tensor,
     ):
+        if self.batch_first:
+            acts, labels, act_lens, label_lens = self._batch_view(log_probs, flat_labels, label_lengths, input_lengths)
+            alphas, _ = self._alphas_betas_view(acts.dtype)
+            ll_forward = np.zeros(self.minibatch_, dtype=np.float64)
+            compute_costs_batch(acts, labels, act_lens, label_lens, alphas, ll_forward, self.blank_)
+            costs.copy_(torch.from_numpy(-ll_forward))
+            return global_constants.RNNTStatus.RNNT_STATUS_SUCCESS
+
         # // per minibatch memory
         per_minibatch_bytes = 0
 
@@ -0,0 +1,474 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Persistent on-disk cache of precomputed features (e.g. log-mel spectrograms) for ASR and TTS datasets.
+
+The cache is a directory of shards on local disk. Every process that writes to the cache appends to its own shard,
+so DataLoader workers fill the cache concurrently without locking. A shard consists of two files::
+
+    <shard name>.bin    feature arrays, stored one after another
+    <shard name>.idx    one line per array: <key>\\t<byte offset>\\t<dtype>\\t<shape as comma separated dims>
+
+The ``.bin`` files are memory-mapped for reading. When the cache exceeds its disk budget, whole shards are evicted in
+least recently used order, using the modification time of the ``.bin`` file as the time of the last access.
+"""
+
+import glob
+import hashlib
+import json
+import os
+import time
+import uuid
+from typing import Any, BinaryIO, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+import torch
+from omegaconf import DictConfig, OmegaConf
+
+from nemo.collections.asr.parts.preprocessing.features import WaveformFeaturizer
+from nemo.collections.asr.parts.preprocessing.segment import ChannelSelectorType
+from nemo.utils import logging
+
+SHARD_DATA_SUFFIX = ".bin"
+SHARD_INDEX_SUFFIX = ".idx"
+# Offsets of the arrays within a shard are aligned to this number of bytes
+SHARD_ALIGNMENT = 64
+
+CacheEntry = Tuple[str, int, str, Tuple[int, ...]]
+
+
+def get_config_hash(config: Any) -> str:
+    """
+    Computes a stable hash of a (possibly nested) configuration, e.g. the config of a preprocessor.
+
+    Args:
+        config: A dict, DictConfig or any other JSON serializable object.
+
+    Returns:
+        Hex digest of the configuration.
+    """
+    if isinstance(config, DictConfig):
+        config = OmegaConf.to_container(config, resolve=True)
+    return hashlib.sha1(json.dumps(config, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+
+
+def get_feature_cache_key(
+    filepath: str, offset: Optional[float], duration: Optional[float], config_hash: str, *extra: Any
+) -> str:
+    """
+    Builds the key of the features of a segment of a file in a `FeatureCache`.
+
+    Args:
+        filepath: Path of the audio (or feature) file.
+        offset: Start of the segment in seconds.
+        duration: Duration of the segment in seconds.
+        config_hash: Hash of the configuration used to compute the features, see `get_config_hash`.
+        extra: Any other JSON serializable values which affect the features.
+
+    Returns:
+        The cache key.
+    """
+    return get_config_hash([filepath, float(offset or 0.0), float(duration or 0.0), config_hash, *extra])
+
+
+class FeatureCache:
+    """
+    Persistent cache of feature arrays, stored in memory-mapped shards on local disk (see the module docstring).
+
+    Args:
+        cache_dir: Directory of the cache. Created if it does not exist.
+        max_disk_bytes: Disk budget of the cache. Least recently used shards are evicted when it is exceeded.
+            Defaults to None, i.e. unlimited.
+        shard_size_bytes: A new shard is started once the shard of this process reaches this size.
+        dtype: Data type of the stored features.
+        refresh_interval: Minimum time in seconds between two rescans of the shard indices written by other
+            processes, which happen on cache misses.
+        touch_interval: Minimum time in seconds between two updates of the access time of a shard.
+    """
+
+    def __init__(
+        self,
+        cache_dir: str,
+        max_disk_bytes: Optional[int] = None,
+        shard_size_bytes: int = 256 * 1024 * 1024,
+        dtype: str = "float32",
+        refresh_interval: float = 10.0,
+        touch_interval: float = 60.0,
+    ):
+        self.cache_dir = cache_dir
+        self.max_disk_bytes = max_disk_bytes
+        self.shard_size_bytes = shard_size_bytes
+        self.dtype = np.dtype(dtype)
+        self.refresh_interval = refresh_interval
+        self.touch_interval = touch_interval
+        os.makedirs(cache_dir, exist_ok=True)
+        self._reset_state()
+        self.refresh(force=True)
+
+    @classmethod
+    def from_config(cls, config: Union[Dict, DictConfig]) -> 'FeatureCache':
+        """
+        Creates a cache from the `feature_cache` section of a dataset config, with the keys `cache_dir`
+        (required), `max_disk_gb`, `shard_size_mb` and `dtype`.
+        """
+        max_disk_gb = config.get('max_disk_gb', None)
+        return cls(
+            cache_dir=config['cache_dir'],
+            max_disk_bytes=int(max_disk_gb * 1024**3) if max_disk_gb is not None else None,
+            shard_size_bytes=int(config.get('shard_size_mb', 256) * 1024**2),
+            dtype=config.get('dtype', 'float32'),
+        )
+
+    def _reset_state(self):
+        self._index: Dict[str, CacheEntry] = {}
+        self._shard_keys: Dict[str, List[str]] = {}
+        self._index_positions: Dict[str, int] = {}
+        self._memmaps: Dict[str, np.memmap] = {}
+        self._last_touch: Dict[str, float] = {}
+        self._last_refresh = 0.0
+        self._writer_shard: Optional[str] = None
+        self._writer_files: Optional[Tuple[BinaryIO, BinaryIO]] = None
+        self._writer_pid: Optional[int] = None
+        self._writer_size = 0
+        self._hits = 0
+        self._misses = 0
+
+    def __getstate__(self):
+        # Open memory maps are not picklable, and a writer shard must never be shared between processes
+        state = self.__dict__.copy()
+        for name in ("_index", "_shard_keys", "_index_positions", "_memmaps", "_last_touch"):
+            state[name] = {}
+        state.update(_last_refresh=0.0, _writer_shard=None, _writer_files=None, _writer_pid=None, _writer_size=0)
+        return state
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._index
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """Number of hits and misses of `get` in this process."""
+        return {"hits": self._hits, "misses": self._misses}
+
+    def _shard_path(self, shard: str, suffix: str) -> str:
+        return os.path.join(self.cache_dir, shard + suffix)
+
+    def refresh(self, force: bool = False) -> bool:
+        """
+        Reads the index lines which were appended to the shards since the last refresh, and forgets the shards
+        which were evicted.
+
+        Args:
+            force: Refresh even if the last refresh happened less than `refresh_interval` seconds ago.
+
+        Returns:
+            True if the index was refreshed.
+        """
+        now = time.monotonic()
+        if not force and now - self._last_refresh < self.refresh_interval:
+            return False
+        self._last_refresh = now
+
+        index_paths = glob.glob(os.path.join(glob.escape(self.cache_dir), "*" + SHARD_INDEX_SUFFIX))
+        shards = {os.path.basename(path)[: -len(SHARD_INDEX_SUFFIX)] for path in index_paths}
+        for shard in set(self._index_positions) - shards:
+            self._forget_shard(shard)
+
+        for shard in shards:
+            position = self._index_positions.get(shard, 0)
+            try:
+                with open(self._shard_path(shard, SHARD_INDEX_SUFFIX), "rb") as f:
+                    f.seek(position)
+                    data = f.read()
+            except FileNotFoundError:
+                self._forget_shard(shard)
+                continue
+            # Only complete lines are parsed, the rest is read on the next refresh
+            end = data.rfind(b"\n") + 1
+            for line in data[:end].decode("utf-8").splitlines():
+                key, offset, dtype, shape = line.split("\t")
+                self._add_entry(key, (shard, int(offset), dtype, tuple(int(dim) for dim in shape.split(",") if dim)))
+            self._index_positions[shard] = position + end
+        return True
+
+    def _add_entry(self, key: str, entry: CacheEntry):
+        self._index[key] = entry
+        self._shard_keys.setdefault(entry[0], []).append(key)
+
+    def _forget_shard(self, shard: str):
+        for key in self._shard_keys.pop(shard, []):
+            if self._index.get(key, (None,))[0] == shard:
+                del self._index[key]
+        self._index_positions.pop(shard, None)
+        self._memmaps.pop(shard, None)
+        self._last_touch.pop(shard, None)
+
+    def _get_memmap(self, shard: str, size: int) -> Optional[np.memmap]:
+        mmap = self._memmaps.get(shard)
+        if mmap is None or mmap.shape[0] < size:
+            # The shard may have grown since it was mapped
+            try:
+                mmap = np.memmap(self._shard_path(shard, SHARD_DATA_SUFFIX), dtype=np.uint8, mode="r")
+            except (FileNotFoundError, ValueError):
+                self._forget_shard(shard)
+                return None
+            self._memmaps[shard] = mmap
+        if mmap.shape[0] < size:
+            return None
+        return mmap
+
+    def _touch(self, shard: str):
+        now = time.time()
+        if now - self._last_touch.get(shard, 0.0) < self.touch_interval:
+            return
+        self._last_touch[shard] = now
+        try:
+            os.utime(self._shard_path(shard, SHARD_DATA_SUFFIX))
+        except OSError:
+            pass
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """
+        Reads the features stored under `key`.
+
+        Returns:
+            A copy of the stored array, or None if the key is not in the cache.
+        """
+        entry = self._index.get(key)
+        if entry is None and self.refresh():
+            entry = self._index.get(key)
+        mmap = None
+        if entry is not None:
+            shard, offset, dtype, shape = entry
+            dtype = np.dtype(dtype)
+            mmap = self._get_memmap(shard, offset + dtype.itemsize * int(np.prod(shape)))
+        if mmap is None:
+            self._misses += 1
+            return None
+        self._hits += 1
+        self._touch(shard)
+        return np.array(np.ndarray(shape, dtype=dtype, buffer=mmap, offset=offset))
+
+    def put(self, key: str, features: Union[np.ndarray, torch.Tensor]):
+        """
+        Appends the features under `key` to the shard of this process.
+
+        Args:
+            key: Key of the features, see `get_feature_cache_key`.
+            features: Array of any shape, stored with the `dtype` of the cache.
+        """
+        if isinstance(features, torch.Tensor):
+            features = features.detach().cpu().numpy()
+        data = np.ascontiguousarray(features, dtype=self.dtype).tobytes()
+
+        if self._writer_pid != os.getpid() or self._writer_size >= self.shard_size_bytes:
+            self._open_writer_shard()
+        offset = self._writer_size
+        padding = -(offset + len(data)) % SHARD_ALIGNMENT
+        shape = ",".join(str(dim) for dim in features.shape)
+        line = f"{key}\t{offset}\t{self.dtype.str}\t{shape}\n".encode("utf-8")
+        # The data is flushed before the index line, so that readers never see an entry without its data
+        data_file, index_file = self._writer_files
+        data_file.write(data + b"\0" * padding)
+        data_file.flush()
+        index_file.write(line)
+        index_file.flush()
+        self._writer_size = offset + len(data) + padding
+        self._index_positions[self._writer_shard] += len(line)
+        self._add_entry(key, (self._writer_shard, offset, self.dtype.str, tuple(features.shape)))
+
+    def _open_writer_shard(self):
+        if self._writer_files is not None and self._writer_pid == os.getpid():
+            for f in self._writer_files:
+                f.close()
+        # The files stay open, so that a shard evicted by another process is never recreated
+        self._writer_shard = f"shard_{uuid.uuid4().hex}"
+        self._writer_files = (
+            open(self._shard_path(self._writer_shard, SHARD_DATA_SUFFIX), "wb"),
+            open(self._shard_path(self._writer_shard, SHARD_INDEX_SUFFIX), "wb"),
+        )
+        self._writer_pid = os.getpid()
+        self._writer_size = 0
+        self._index_positions[self._writer_shard] = 0
+        self.evict()
+
+    def get_or_compute(self, key: str, compute_fn: Callable[[], Union[np.ndarray, torch.Tensor]]) -> np.ndarray:
+        """Returns the features stored under `key`, computing and storing them with `compute_fn` on a miss."""
+        features = self.get(key)
+        if features is None:
+            features = compute_fn()
+            self.put(key, features)
+            if isinstance(features, torch.Tensor):
+                features = features.detach().cpu().numpy()
+            features = np.asarray(features, dtype=self.dtype)
+        return features
+
+    def disk_usage(self) -> int:
+        """Returns the size of all shards in the cache directory, in bytes."""
+        return sum(size for _, size, _ in self._list_shards())
+
+    def _list_shards(self) -> List[Tuple[str, int, float]]:
+        shards = []
+        for path in glob.glob(os.path.join(glob.escape(self.cache_dir), "*" + SHARD_DATA_SUFFIX)):
+            shard = os.path.basename(path)[: -len(SHARD_DATA_SUFFIX)]
+            try:
+                stat = os.stat(path)
+                size = stat.st_size + os.path.getsize(self._shard_path(shard, SHARD_INDEX_SUFFIX))
+            except FileNotFoundError:
+                continue
+            shards.append((shard, size, stat.st_mtime))
+        return shards
+
+    def evict(self) -> int:
+        """
+        Removes least recently used shards until the cache fits into its disk budget.
+        The shard this process is writing to is never evicted.
+
+        Returns:
+            Number of evicted shards.
+        """
+        if self.max_disk_bytes is None:
+            return 0
+        shards = sorted(self._list_shards(), key=lambda shard: shard[2])
+        total_size = sum(size for _, size, _ in shards)
+        num_evicted = 0
+        for shard, size, _ in shards:
+            if total_size <= self.max_disk_bytes:
+                break
+            if shard == self._writer_shard:
+                continue
+            for suffix in (SHARD_INDEX_SUFFIX, SHARD_DATA_SUFFIX):
+                try:
+                    os.remove(self._shard_path(shard, suffix))
+                except FileNotFoundError:
+                    pass
+            self._forget_shard(shard)
+            total_size -= size
+            num_evicted += 1
+        if num_evicted > 0:
+            logging.info(f"Evicted {num_evicted} shards from the feature cache {self.cache_dir}")
+        return num_evicted
+
+
+class CachedAudioFeaturizer:
+    """
+    Loads audio with a `WaveformFeaturizer`, computes features with a preprocessor and caches them in a
+    `FeatureCache`, so that every segment is decoded and featurized only once across epochs and runs.
+
+    The features are computed with the preprocessor in eval mode, i.e. deterministically (without dither and
+    narrowband augmentation), so the cache must not be used together with audio augmentation.
+
+    Args:
+        featurizer: Featurizer used to load the audio.
+        preprocessor: Preprocessor module, e.g. `AudioToMelSpectrogramPreprocessor`.
+        preprocessor_config: Config of the preprocessor, used in the cache keys.
+        cache: The feature cache.
+    """
+
+    def __init__(
+        self,
+        featurizer: WaveformFeaturizer,
+        preprocessor: torch.nn.Module,
+        preprocessor_config: Union[Dict, DictConfig],
+        cache: FeatureCache,
+    ):
+        self.featurizer = featurizer
+        self.preprocessor = preprocessor.eval()
+        self.cache = cache
+        self.config_hash = get_config_hash(
+            {
+                "preprocessor": get_config_hash(preprocessor_config),
+                "sample_rate": featurizer.sample_rate,
+                "int_values": featurizer.int_values,
+            }
+        )
+
+    @classmethod
+    def from_config(
+        cls, config: Union[Dict, DictConfig], sample_rate: int, int_values: bool = False
+    ) -> 'CachedAudioFeaturizer':
+        """
+        Creates a featurizer from the `feature_cache` section of a dataset config. In addition to the keys of
+        `FeatureCache.from_config`, it must contain the `preprocessor` config, usually `${model.preprocessor}`.
+        """
+        from nemo.core.classes import Serialization
+
+        if config.get('preprocessor', None) is None:
+            raise ValueError("`feature_cache` requires the config of the `preprocessor` that computes the features")
+        return cls(
+            featurizer=WaveformFeaturizer(sample_rate=sample_rate, int_values=int_values),
+            preprocessor=Serialization.from_config_dict(config['preprocessor']),
+            preprocessor_config=config['preprocessor'],
+            cache=FeatureCache.from_config(config),
+        )
+
+    def get_cache_key(
+        self,
+        file_path: str,
+        offset: float = 0,
+        duration: float = 0,
+        trim: bool = False,
+        channel_selector: Optional[ChannelSelectorType] = None,
+    ) -> str:
+        return get_feature_cache_key(file_path, offset, duration, self.config_hash, trim, channel_selector)
+
+    @torch.no_grad()
+    def compute_features(
+        self,
+        file_path: str,
+        offset: float = 0,
+        duration: float = 0,
+        trim: bool = False,
+        orig_sr: Optional[int] = None,
+        channel_selector: Optional[ChannelSelectorType] = None,
+    ) -> torch.Tensor:
+        audio = self.featurizer.process(
+            file_path,
+            offset=offset,
+            duration=duration,
+            trim=trim,
+            orig_sr=orig_sr,
+            channel_selector=channel_selector,
+        )
+        features, length = self.preprocessor(
+            input_signal=audio.unsqueeze(0), length=torch.tensor([audio.shape[0]], dtype=torch.long)
+        )
+        return features[0, :, : length[0]]
+
+    def process(
+        self,
+        file_path: str,
+        offset: float = 0,
+        duration: float = 0,
+        trim: bool = False,
+        orig_sr: Optional[int] = None,
+        channel_selector: Optional[ChannelSelectorType] = None,
+    ) -> torch.Tensor:
+        """Returns the features of the segment of the audio file as a [num_features, num_frames] tensor."""
+        key = self.get_cache_key(file_path, offset, duration, trim, channel_selector)
+        features = self.cache.get_or_compute(
+            key,
+            lambda: self.compute_features(
+                file_path,
+                offset=offset,
+                duration=duration,
+                trim=trim,
+                orig_sr=orig_sr,
+                channel_selector=channel_selector,
+            ),
+        )
+        return torch.from_numpy(features).float()
@@ -16,20 +16,25 @@ from typing import Optional
 import numpy as np
 import torch
 
+from nemo.collections.asr.parts.preprocessing.feature_cache import FeatureCache, get_feature_cache_key
+
 
 class ExternalFeatureLoader(object):
     """Feature loader that load external features store in certain format.
     Currently support pickle, npy and npz format.
+    The loaded features can be kept in a persistent `FeatureCache`, which is faster to read than the original files.
     """
 
     def __init__(
         self,
         augmentor: Optional["nemo.collections.asr.parts.perturb.FeatureAugmentor"] = None,
+        feature_cache: Optional[FeatureCache] = None,
     ):
         """
         Feature loader
         """
         self.augmentor = augmentor
+        self.feature_cache = feature_cache
 
     def load_feature_from_file(self, file_path: str):
         """Load samples from file_path and convert it to be of type float32
@@ -62,7 +67,13 @@ class ExternalFeatureLoader(object):
 
     def process(self, file_path: str) -> torch.Tensor:
         """Processes the features from the provided `file_path`."""
-        features = self.load_feature_from_file(file_path)
+        if self.feature_cache is not None:
+            features = self.feature_cache.get_or_compute(
+                get_feature_cache_key(file_path, 0, 0, type(self).__name__),
+                lambda: self.load_feature_from_file(file_path),
+            )
+        else:
+            features = self.load_feature_from_file(file_path)
         features = self.process_segment(features)
         return features
 
@@ -14,11 +14,15 @@
 
 from __future__ import annotations
 
+import functools
 import math
+import multiprocessing
 import os
 from dataclasses import dataclass, field
+from multiprocessing.pool import ThreadPool
 from typing import List, Optional, Tuple, Union
 
+import numpy as np
 import torch
 
 from nemo.collections.asr.parts.context_biasing import BoostingTreeModelConfig, GPUBoostingTreeModel
@@ -219,6 +223,13 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
         compute_timestamps: A bool flag, which determines whether to compute the character/subword, or
                 word based timestamp mapping the output log-probabilities to discrite intervals of timestamps.
                 The timestamps will be available in the returned Hypothesis.timestep as a dictionary.
+        num_workers: Number of workers decoding the samples of a batch in parallel with the "default" and
+            "pyctcdecode" search types. None uses all the available CPUs.
+        pool_type: Type of the persistent pool of workers of the "pyctcdecode" search type, "thread" or "process".
+            Process workers are forked after the LM is loaded and share its memory with the main process, which
+            scales better on CPU-only nodes as pyctcdecode holds the GIL. Thread workers are used instead if CUDA
+            is initialized, as forking is unsafe then. The pool is terminated with the decoder or by
+            `close_decoder_pool()`.
 
     """
 
@@ -235,6 +246,8 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
         ngram_lm_model: str = None,
         flashlight_cfg: Optional['FlashlightConfig'] = None,
         pyctcdecode_cfg: Optional['PyCTCDecodeConfig'] = None,
+        num_workers: Optional[int] = None,
+        pool_type: str = "thread",
     ):
         super().__init__(blank_id=blank_id, beam_size=beam_size)
 
@@ -278,12 +291,23 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
             flashlight_cfg = FlashlightConfig()
         self.flashlight_cfg = flashlight_cfg
 
+        if pool_type not in ("thread", "process"):
+            raise ValueError(f"Unsupported pool type ({pool_type}). Please use one of : (thread, process)")
+        self.num_workers = num_workers
+        self.pool_type = pool_type
+
         # Default beam search scorer functions
         self.default_beam_scorer = None
         self.pyctcdecode_beam_scorer = None
         self.flashlight_beam_scorer = None
         self.token_offset = 0
 
+        # Persistent pool of workers, created on the first batch decoded in parallel
+        self._decoder_pool = None
+        # Lookup table from unicode code points to the ids of the chars of the vocabulary
+        self._char_lookup_table = None
+        self._char_lookup_vocab = None
+
     @typecheck()
     def forward(
         self,
@@ -374,16 +398,27 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
                 beam_width=self.beam_size,
                 alpha=self.ngram_lm_alpha,
                 beta=self.beam_beta,
-                num_cpus=max(1, os.cpu_count()),
+                num_cpus=self._get_num_workers(),
                 input_tensor=False,
             )
 
         x = x.to('cpu')
 
         with typecheck.disable_checks():
-            data = [x[sample_id, : out_len[sample_id], :].softmax(dim=-1) for sample_id in range(len(x))]
+            # The decoder threads share the LM and read the probabilities of every sample as a numpy array
+            probs = x.softmax(dim=-1).float().numpy()
+            data = [probs[sample_id, : out_len[sample_id], :] for sample_id in range(len(x))]
             beams_batch = self.default_beam_scorer.forward(log_probs=data, log_probs_length=None)
 
+        # For subword encoding, NeMo will double encode the subword (multiple tokens) into a
+        # singular unicode id. In doing so, we preserve the semantic of the unicode token, and
+        # compress the size of the final KenLM ARPA / Binary file.
+        # In order to do double encoding, we shift the subword by some token offset.
+        # The token ids of all the candidates of the batch are recovered at once.
+        batch_token_ids = iter(
+            self._texts_to_token_ids([candidate[1] for beams in beams_batch for candidate in beams])
+        )
+
         # For each sample in the batch
         nbest_hypotheses = []
         for beams_idx, beams in enumerate(beams_batch):
@@ -394,19 +429,8 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
                     score=0.0, y_sequence=[], dec_state=None, timestamp=[], last_token=None
                 )
 
-                # For subword encoding, NeMo will double encode the subword (multiple tokens) into a
-                # singular unicode id. In doing so, we preserve the semantic of the unicode token, and
-                # compress the size of the final KenLM ARPA / Binary file.
-                # In order to do double encoding, we shift the subword by some token offset.
-                # This step is ignored for character based models.
-                if self.decoding_type == 'subword':
-                    pred_token_ids = [ord(c) - self.token_offset for c in candidate[1]]
-                else:
-                    # Char models
-                    pred_token_ids = [self.vocab_index_map[c] for c in candidate[1]]
-
                 # We preserve the token ids and the score for this hypothesis
-                hypothesis.y_sequence = pred_token_ids
+                hypothesis.y_sequence = next(batch_token_ids)
                 hypothesis.score = candidate[0]
 
                 # If alignment must be preserved, we preserve a view of the output logprobs.
@@ -460,20 +484,40 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
         x = x.to('cpu').numpy()
 
         with typecheck.disable_checks():
-            beams_batch = []
-            for sample_id in range(len(x)):
-                logprobs = x[sample_id, : out_len[sample_id], :]
-                result = self.pyctcdecode_beam_scorer.decode_beams(
-                    logprobs,
-                    beam_width=self.beam_size,
-                    beam_prune_logp=self.pyctcdecode_cfg.beam_prune_logp,
-                    token_min_logp=self.pyctcdecode_cfg.token_min_logp,
-                    prune_history=self.pyctcdecode_cfg.prune_history,
-                    hotwords=self.pyctcdecode_cfg.hotwords,
-                    hotword_weight=self.pyctcdecode_cfg.hotword_weight,
-                    lm_start_state=None,
-                )  # Output format: text, last_lm_state, text_frames, logit_score, lm_score
-                beams_batch.append(result)
+            logprobs_list = [x[sample_id, : out_len[sample_id], :] for sample_id in range(len(x))]
+            decode_kwargs = dict(
+                beam_width=self.beam_size,
+                beam_prune_logp=self.pyctcdecode_cfg.beam_prune_logp,
+                token_min_logp=self.pyctcdecode_cfg.token_min_logp,
+                prune_history=self.pyctcdecode_cfg.prune_history,
+                hotwords=self.pyctcdecode_cfg.hotwords,
+                hotword_weight=self.pyctcdecode_cfg.hotword_weight,
+            )
+            # Output format: text, last_lm_state, text_frames, logit_score, lm_score
+            pool = self._get_decoder_pool() if len(logprobs_list) > 1 else None
+            if pool is None:
+                beams_batch = [
+                    self.pyctcdecode_beam_scorer.decode_beams(logprobs, **decode_kwargs) for logprobs in logprobs_list
+                ]
+            elif self.pool_type == "process":
+                # pyctcdecode looks up the LM of the forked workers in its model registry instead of pickling it
+                beams_batch = self.pyctcdecode_beam_scorer.decode_beams_batch(pool, logprobs_list, **decode_kwargs)
+            else:
+                decode_fn = functools.partial(self.pyctcdecode_beam_scorer.decode_beams, **decode_kwargs)
+                beams_batch = pool.map(decode_fn, logprobs_list)
+
+        # TODO: Requires token ids to be returned rather than text.
+        texts = [candidate[0] for beams in beams_batch for candidate in beams]
+        if self.decoding_type == 'subword':
+            if self.tokenizer is None:
+                raise ValueError("Tokenizer must be provided for subword decoding. Use set_tokenizer().")
+
+            batch_token_ids = iter(self.tokenizer.batch_text_to_ids(texts))
+        else:
+            if self.vocab is None:
+                raise ValueError("Vocab must be provided for character decoding. Use set_vocab().")
+
+            batch_token_ids = iter(self._texts_to_token_ids(texts))
 
         nbest_hypotheses = []
         for beams_idx, beams in enumerate(beams_batch):
@@ -484,20 +528,7 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
                     score=0.0, y_sequence=[], dec_state=None, timestamp=[], last_token=None
                 )
 
-                # TODO: Requires token ids to be returned rather than text.
-                if self.decoding_type == 'subword':
-                    if self.tokenizer is None:
-                        raise ValueError("Tokenizer must be provided for subword decoding. Use set_tokenizer().")
-
-                    pred_token_ids = self.tokenizer.text_to_ids(candidate[0])
-                else:
-                    if self.vocab is None:
-                        raise ValueError("Vocab must be provided for character decoding. Use set_vocab().")
-
-                    chars = list(candidate[0])
-                    pred_token_ids = [self.vocab_index_map[c] for c in chars]
-
-                hypothesis.y_sequence = pred_token_ids
+                hypothesis.y_sequence = next(batch_token_ids)
                 hypothesis.text = candidate[0]  # text
                 hypothesis.score = candidate[4]  # score
 
@@ -601,6 +632,104 @@ class BeamCTCInfer(AbstractBeamCTCInfer):
 
         return nbest_hypotheses
 
+    def _texts_to_token_ids(self, texts: List[str]) -> List[List[int]]:
+        """
+        Maps the texts of beam search candidates back to token ids, for all the candidates of a batch at once.
+
+        The LM vocabulary of subword models is made of single unicode characters shifted by ``token_offset``, so the
+        token ids are the code points of the text minus the offset. The code points of char models are mapped
+        through a lookup table built from the vocabulary.
+
+        Args:
+            texts: Texts of the candidates.
+
+        Returns:
+            List of token ids of every candidate.
+        """
+        if len(texts) == 0:
+            return []
+
+        code_points = np.frombuffer(''.join(texts).encode('utf-32-le'), dtype=np.uint32).astype(np.int64)
+        if self.decoding_type == 'subword':
+            flat_token_ids = (code_points - self.token_offset).tolist()
+        else:
+            lookup_table = self._get_char_lookup_table()
+            if lookup_table is None:
+                flat_token_ids = [self.vocab_index_map[chr(c)] for c in code_points.tolist()]
+            else:
+                token_ids = np.where(
+                    code_points < len(lookup_table), lookup_table[np.minimum(code_points, len(lookup_table) - 1)], -1
+                )
+                if (token_ids < 0).any():
+                    raise KeyError(chr(code_points[np.argmax(token_ids < 0)]))
+                flat_token_ids = token_ids.tolist()
+
+        batch_token_ids = []
+        start = 0
+        for text in texts:
+            batch_token_ids.append(flat_token_ids[start : start + len(text)])
+            start += len(text)
+        return batch_token_ids
+
+    def _get_char_lookup_table(self) -> Optional[np.ndarray]:
+        """
+        Returns the lookup table from unicode code points to the ids of the vocabulary chars (-1 if not in the
+        vocabulary), or None if some vocabulary entries are not single characters.
+        """
+        if self._char_lookup_vocab is not self.vocab:
+            self._char_lookup_vocab = self.vocab
+            self._char_lookup_table = None
+            if len(self.vocab) > 0 and all(len(token) == 1 for token in self.vocab):
+                self._char_lookup_table = np.full(max(ord(token) for token in self.vocab) + 1, -1, dtype=np.int64)
+                for token, idx in self.vocab_index_map.items():
+                    self._char_lookup_table[ord(token)] = idx
+        return self._char_lookup_table
+
+    def _get_num_workers(self) -> int:
+        return max(1, self.num_workers if self.num_workers is not None else os.cpu_count())
+
+    def _get_decoder_pool(self) -> Optional[ThreadPool]:
+        """
+        Returns the persistent pool of workers decoding the samples of a batch in parallel,
+        or None if the samples are decoded sequentially.
+        Process workers are forked after the LM is loaded, so they share its memory with the main process.
+        Forking is unsafe once CUDA is initialized: thread workers are used instead in that case.
+        """
+        num_workers = self._get_num_workers()
+        if num_workers == 1:
+            return None
+        if self._decoder_pool is None:
+            use_processes = self.pool_type == "process"
+            if use_processes and torch.cuda.is_initialized():
+                # pyctcdecode only decodes in parallel with a "fork" pool, "spawn" workers would not find the LM
+                logging.warning(
+                    "CUDA is initialized in this process, so the decoding workers cannot be forked. "
+                    "Falling back to `pool_type='thread'`."
+                )
+                use_processes = False
+            if use_processes:
+                self._decoder_pool = multiprocessing.get_context("fork").Pool(num_workers)
+            else:
+                self._decoder_pool = ThreadPool(num_workers)
+        return self._decoder_pool
+
+    def close_decoder_pool(self):
+        """Terminates the persistent pool of decoding workers. It is re-created on the next batch if needed."""
+        if self._decoder_pool is not None:
+            self._decoder_pool.terminate()
+            self._decoder_pool = None
+
+    def __del__(self):
+        # the pool is not available if __init__ failed
+        if getattr(self, '_decoder_pool', None) is not None:
+            self.close_decoder_pool()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        # pools cannot be copied or pickled, it is re-created lazily
+        state['_decoder_pool'] = None
+        return state
+
     def set_decoding_type(self, decoding_type: str):
         super().set_decoding_type(decoding_type)
 
@@ -1041,6 +1170,8 @@ class BeamCTCInferConfig:
     compute_timestamps: bool = False
     return_best_hypothesis: bool = True
     allow_cuda_graphs: bool = True
+    num_workers: Optional[int] = None  # None uses all the available CPUs
+    pool_type: str = "thread"  # "thread" or "process" (pyctcdecode)
 
     beam_alpha: Optional[float] = None  # Deprecated
     beam_beta: float = 1.0
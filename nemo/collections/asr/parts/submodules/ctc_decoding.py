@@ -325,6 +325,8 @@ class AbstractCTCDecoding(ConfidenceMixin):
                 ngram_lm_alpha=self.cfg.beam.get('ngram_lm_alpha', 1.0),
                 beam_beta=self.cfg.beam.get('beam_beta', 0.0),
                 ngram_lm_model=self.cfg.beam.get('ngram_lm_model', None),
+                num_workers=self.cfg.beam.get('num_workers', None),
+                pool_type=self.cfg.beam.get('pool_type', 'thread'),
             )
 
             self.decoding.override_fold_consecutive_value = False
@@ -342,6 +344,8 @@ class AbstractCTCDecoding(ConfidenceMixin):
                 beam_beta=self.cfg.beam.get('beam_beta', 0.0),
                 ngram_lm_model=self.cfg.beam.get('ngram_lm_model', None),
                 pyctcdecode_cfg=self.cfg.beam.get('pyctcdecode_cfg', None),
+                num_workers=self.cfg.beam.get('num_workers', None),
+                pool_type=self.cfg.beam.get('pool_type', 'thread'),
             )
 
             self.decoding.override_fold_consecutive_value = False
@@ -12,9 +12,14 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import hashlib
+import json
+import mmap
+import os
 import re
 from collections import defaultdict
 from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import InitVar, dataclass, field
 from pathlib import Path
 from typing import NamedTuple, Optional, Union, cast
@@ -48,11 +53,61 @@ _UNK_ID = -3  # Unk
 _SPECIAL_SYMBOLS_MAP = {"<s>": _BOS_ID, "</s>": _EOS_ID, "<unk>": _UNK_ID}
 
 
+# Binary cache for the compiled LM, see `NGramGPULanguageModel.compile_arpa`
+NGPU_LM_CACHE_SUFFIX = ".ngpulm"
+_CACHE_MAGIC = b"NGPULM\x00\x00"
+_CACHE_VERSION = 1
+_CACHE_ALIGNMENT = 64
+
+
 def _log_10_to_e(score):
     """Convert logarithm with base 10 to natural"""
     return score / np.log10(np.e)
 
 
+def _file_checksum(path: Path | str, chunk_size: int = 1 << 24) -> str:
+    """SHA-256 checksum of the file, used to detect stale LM caches"""
+    checksum = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(chunk_size):
+            checksum.update(chunk)
+    return checksum.hexdigest()
+
+
+def _ngrams_np_dtype(order: int) -> list:
+    """NumPy dtype of the array storing n-grams of the given order"""
+    return [
+        ("symbols", [(f"{i}", np.int32) for i in range(order)]),
+        ("weight", np.float32),
+        ("backoff", np.float32),
+    ]
+
+
+def _arpa_symbols_pattern() -> re.Pattern:
+    """Pattern to split ARPA n-gram into symbols (each symbol is a single character or a special word)"""
+    special_words_pattern = '|'.join(re.escape(symbol) for symbol in _SPECIAL_SYMBOLS_MAP)
+    return re.compile(rf'({special_words_pattern}|.)\s?')
+
+
+def _parse_arpa_chunk(lm_path: str, start: int, end: int, order: int, token_offset: int) -> np.ndarray:
+    """
+    Parse n-grams of the given order from the byte range [start, end) of the ARPA file.
+    The range should contain only full lines from the single n-gram section.
+    Used as a worker function for the parallel ARPA reader.
+    """
+    with open(lm_path, "rb") as f:
+        f.seek(start)
+        lines = f.read(end - start).decode("utf-8").split("\n")
+    pattern = _arpa_symbols_pattern()
+    ngrams = []
+    for line in lines:
+        if not line:
+            continue
+        ngram = NGramGPULanguageModel._line_to_ngram(line=line, pattern=pattern, token_offset=token_offset)
+        ngrams.append((ngram.symbols, ngram.weight, ngram.backoff))
+    return np.array(ngrams, dtype=_ngrams_np_dtype(order))
+
+
 class KenLMBatchedWrapper:
     """
     KenLM model wrapper for single element and batched queries (slow) for reference decoding and testing purposes.
@@ -426,12 +481,7 @@ class SuffixTreeStorage:
         self._start_arcs = self.num_arcs
         self._cur_order = order
         if order < self.max_order:
-            dtype = [
-                ("symbols", [(f"{i}", np.int32) for i in range(order)]),
-                ("weight", np.float32),
-                ("backoff", np.float32),
-            ]
-            self._ngrams = np.zeros([max_ngrams], dtype=dtype)
+            self._ngrams = np.zeros([max_ngrams], dtype=_ngrams_np_dtype(order))
             self._ngrams_cnt = 0
         # for max order - no need in accumulator
 
@@ -444,6 +494,18 @@ class SuffixTreeStorage:
         self._ngrams[self._ngrams_cnt] = (ngram.symbols, ngram.weight, ngram.backoff)
         self._ngrams_cnt += 1
 
+    def _add_ngrams_array(self, order: int, ngrams: np.ndarray, bos_id: int, unk_id: int):
+        """Add all ngrams for the given order at once; should be called using increasing order"""
+        self._start_arcs = self.num_arcs
+        self._cur_order = order
+        if order < self.max_order:
+            self._ngrams = ngrams
+            self._ngrams_cnt = ngrams.shape[0]
+        else:
+            for symbols, weight, backoff in ngrams.tolist():
+                self._add_ngram_max_order(ngram=NGram(symbols=symbols, weight=weight, backoff=backoff), bos_id=bos_id)
+        self._end_adding_ngrams_for_order(order=order, bos_id=bos_id, unk_id=unk_id)
+
     def _end_adding_ngrams_for_order(self, order: int, bos_id: int, unk_id: int):
         """Finish adding ngrams for the given order"""
         if order == 1:
@@ -617,17 +679,28 @@ class NGramGPULanguageModel(ModelPT):
         normalize_unk: bool = True,
         use_triton: bool | None = None,
         token_offset: int = DEFAULT_TOKEN_OFFSET,
+        cache_path: Path | str | None = None,
+        num_workers: int = 1,
+        strict_cache_validation: bool = False,
     ) -> "NGramGPULanguageModel":
         """
-        Constructor from ARPA or Nemo (`.nemo`) checkpoint.
+        Constructor from ARPA, Nemo (`.nemo`) checkpoint or compiled binary cache (`.ngpulm`).
+        For ARPA files, the binary cache (see `compile_arpa`) is used instead of parsing the file,
+        if it exists and was built from the same ARPA file with the same parameters.
+        The ARPA file is considered unchanged if its size and modification time match the ones stored in the cache;
+        otherwise (or with `strict_cache_validation`) its SHA-256 checksum is compared.
 
         Args:
-            lm_path: path to .nemo checkpoint or ARPA (text) file
+            lm_path: path to .nemo checkpoint, ARPA (text) file or binary cache
             vocab_size: model vocabulary size:
             normalize_unk: normalize unk probabilities (for tokens missing in LM) to make
                 all unigram probabilities sum to 1.0 (default: True)
             use_triton: allow using Triton implementation; None (default) means "auto" (used if available)
             token_offset: offset for the tokens used for building ARPA LM
+            cache_path: path to the binary cache for the ARPA file;
+                None (default) means `<lm_path>.ngpulm` next to the ARPA file
+            num_workers: number of processes to parse ARPA file if the cache is missing or stale
+            strict_cache_validation: always compare the checksum of the ARPA file with the one stored in the cache
 
         Returns:
             NGramGPULanguageModel instance
@@ -636,14 +709,204 @@ class NGramGPULanguageModel(ModelPT):
             lm_path = Path(lm_path)
         if lm_path.suffix == ".nemo":
             return cls.from_nemo(lm_path=lm_path, vocab_size=vocab_size, use_triton=use_triton)
+        if lm_path.suffix == NGPU_LM_CACHE_SUFFIX:
+            return cls.from_cache(cache_path=lm_path, vocab_size=vocab_size, use_triton=use_triton)
+
+        cache_path = Path(cache_path) if cache_path is not None else cls.get_default_cache_path(lm_path)
+        if cache_path.exists():
+            header = cls._read_cache_header(cache_path)
+            if header is not None and cls._is_cache_valid(
+                header["metadata"],
+                lm_path=lm_path,
+                vocab_size=vocab_size,
+                normalize_unk=normalize_unk,
+                token_offset=token_offset,
+                strict=strict_cache_validation,
+            ):
+                return cls.from_cache(cache_path=cache_path, vocab_size=vocab_size, use_triton=use_triton)
+            logging.warning(f"{cls.__name__}: cache {cache_path} is stale, reading ARPA file instead")
         return cls.from_arpa(
             lm_path=lm_path,
             vocab_size=vocab_size,
             normalize_unk=normalize_unk,
             token_offset=token_offset,
             use_triton=use_triton,
+            num_workers=num_workers,
         )
 
+    @classmethod
+    def compile_arpa(
+        cls,
+        lm_path: Path | str,
+        vocab_size: int,
+        cache_path: Path | str | None = None,
+        normalize_unk: bool = True,
+        use_triton: bool | None = None,
+        token_offset: int = DEFAULT_TOKEN_OFFSET,
+        num_workers: int = 1,
+    ) -> "NGramGPULanguageModel":
+        """
+        Build the LM from ARPA file and store it in the memory-mappable binary cache.
+        The cache stores the size, modification time and checksum of the ARPA file and is picked up by `from_file`,
+        which loads it in seconds instead of parsing the ARPA file.
+
+        Args:
+            lm_path: path to ARPA model (human-readable)
+            vocab_size: vocabulary size (existing vocabulary units in LM; should not include blank etc.)
+            cache_path: path to store the cache; None (default) means `<lm_path>.ngpulm` next to the ARPA file
+            normalize_unk: unk normalization to make all output probabilities sum to 1.0 (default: True).
+            use_triton: allow using Triton implementation; None (default) means "auto" (used if available)
+            token_offset: offset for the tokens used for building ARPA LM
+            num_workers: number of processes to parse ARPA file
+
+        Returns:
+            NGramGPULanguageModel instance
+        """
+        lm_path = Path(lm_path)
+        cache_path = Path(cache_path) if cache_path is not None else cls.get_default_cache_path(lm_path)
+        model = cls.from_arpa(
+            lm_path=lm_path,
+            vocab_size=vocab_size,
+            normalize_unk=normalize_unk,
+            use_triton=use_triton,
+            token_offset=token_offset,
+            num_workers=num_workers,
+        )
+        metadata = cls._cache_metadata(
+            lm_path=lm_path, vocab_size=vocab_size, normalize_unk=normalize_unk, token_offset=token_offset
+        )
+        model._save_cache(cache_path=cache_path, metadata=metadata)
+        logging.info(f"{cls.__name__}: saved LM cache to {cache_path}")
+        return model
+
+    @classmethod
+    def from_cache(
+        cls, cache_path: Path | str, vocab_size: int | None = None, use_triton: bool | None = None
+    ) -> "NGramGPULanguageModel":
+        """
+        Constructor from the binary cache created by `compile_arpa`.
+        The arrays are memory-mapped and copied directly to the model buffers, no parsing is involved.
+
+        Args:
+            cache_path: path to the binary cache
+            vocab_size: model vocabulary size (optional, checked if provided)
+            use_triton: allow using Triton implementation; None (default) means "auto" (used if available)
+
+        Returns:
+            NGramGPULanguageModel instance
+        """
+        logging.info(f"{cls.__name__}: reading LM from cache {cache_path}")
+        header = cls._read_cache_header(cache_path)
+        if header is None:
+            raise ValueError(f"{cache_path} is not a valid {cls.__name__} cache")
+        model = NGramGPULanguageModel(OmegaConf.structured(NGramLMConfig(**header["config"], use_triton=use_triton)))
+        if vocab_size is not None:
+            assert model.vocab_size == vocab_size
+        state_dict = model.state_dict()
+        with torch.no_grad():
+            for name, spec in header["arrays"].items():
+                if np.prod(spec["shape"]) == 0:
+                    continue
+                array = np.memmap(
+                    cache_path,
+                    dtype=np.dtype(spec["dtype"]),
+                    mode="c",
+                    offset=header["data_offset"] + spec["offset"],
+                    shape=tuple(spec["shape"]),
+                )
+                state_dict[name].copy_(torch.from_numpy(array))
+        # weights are stored after resolving final weights
+        model._final_resolved = True
+        return model
+
+    @staticmethod
+    def get_default_cache_path(lm_path: Path | str) -> Path:
+        """Default path of the binary cache for ARPA file: `<lm_path>.ngpulm`"""
+        lm_path = Path(lm_path)
+        return lm_path.with_name(lm_path.name + NGPU_LM_CACHE_SUFFIX)
+
+    @staticmethod
+    def _cache_metadata(lm_path: Path | str, vocab_size: int, normalize_unk: bool, token_offset: int) -> dict:
+        """Parameters which identify the LM built from ARPA file; the cache is stale if any of them changes"""
+        stat = os.stat(lm_path)
+        return {
+            "arpa_size": stat.st_size,
+            "arpa_mtime_ns": stat.st_mtime_ns,
+            "arpa_sha256": _file_checksum(lm_path),
+            "vocab_size": vocab_size,
+            "normalize_unk": normalize_unk,
+            "token_offset": token_offset,
+        }
+
+    @staticmethod
+    def _is_cache_valid(
+        metadata: dict, lm_path: Path | str, vocab_size: int, normalize_unk: bool, token_offset: int, strict: bool
+    ) -> bool:
+        """
+        Check the cache metadata against the ARPA file and parameters.
+        A different size means a changed ARPA file; the checksum is computed only if the size is the same
+        but the modification time changed (e.g., the file was copied), or if `strict`.
+        """
+        params = {"vocab_size": vocab_size, "normalize_unk": normalize_unk, "token_offset": token_offset}
+        if any(metadata.get(key) != value for key, value in params.items()):
+            return False
+        stat = os.stat(lm_path)
+        if metadata.get("arpa_size", stat.st_size) != stat.st_size:
+            return False
+        if not strict and metadata.get("arpa_mtime_ns") == stat.st_mtime_ns:
+            return True
+        return metadata.get("arpa_sha256") == _file_checksum(lm_path)
+
+    @staticmethod
+    def _read_cache_header(cache_path: Path | str) -> dict | None:
+        """Read header of the binary cache; returns None if the file is not a cache of the current version"""
+        with open(cache_path, "rb") as f:
+            if f.read(len(_CACHE_MAGIC)) != _CACHE_MAGIC:
+                return None
+            header_size = int.from_bytes(f.read(8), "little")
+            header = json.loads(f.read(header_size).decode("utf-8"))
+        if header.get("version") != _CACHE_VERSION:
+            return None
+        header["data_offset"] = -(-(len(_CACHE_MAGIC) + 8 + header_size) // _CACHE_ALIGNMENT) * _CACHE_ALIGNMENT
+        return header
+
+    def _save_cache(self, cache_path: Path | str, metadata: dict):
+        """
+        Save the LM to the binary cache: magic bytes, header size, JSON header
+        (metadata, config, array specs), followed by aligned raw arrays (model state dict)
+        """
+        self._resolve_final()
+        cache_path = Path(cache_path)
+        config = {
+            "num_states": self.num_states,
+            "num_arcs": self.num_arcs,
+            "max_order": self.max_order,
+            "vocab_size": self.vocab_size,
+            "separate_bos_state": self.bos_state != self.START_STATE,
+        }
+        arrays = {name: tensor.detach().cpu().numpy() for name, tensor in self.state_dict().items()}
+        arrays_specs = dict()
+        offset = 0
+        for name, array in arrays.items():
+            arrays_specs[name] = {"dtype": array.dtype.str, "shape": list(array.shape), "offset": offset}
+            offset += -(-array.nbytes // _CACHE_ALIGNMENT) * _CACHE_ALIGNMENT
+        header = json.dumps(
+            {"version": _CACHE_VERSION, "metadata": metadata, "config": config, "arrays": arrays_specs}
+        ).encode("utf-8")
+        data_offset = -(-(len(_CACHE_MAGIC) + 8 + len(header)) // _CACHE_ALIGNMENT) * _CACHE_ALIGNMENT
+
+        # write to temporary file first to avoid partially written cache in case of failure or concurrent jobs
+        tmp_path = cache_path.with_name(f"{cache_path.name}.tmp{os.getpid()}")
+        with open(tmp_path, "wb") as f:
+            f.write(_CACHE_MAGIC)
+            f.write(len(header).to_bytes(8, "little"))
+            f.write(header)
+            for name, array in arrays.items():
+                f.seek(data_offset + arrays_specs[name]["offset"])
+                f.write(np.ascontiguousarray(array).data)
+            f.truncate(data_offset + offset)
+        os.replace(tmp_path, cache_path)
+
     @classmethod
     def from_arpa(
         cls,
@@ -652,6 +915,7 @@ class NGramGPULanguageModel(ModelPT):
         normalize_unk: bool = True,
         use_triton: bool | None = None,
         token_offset: int = DEFAULT_TOKEN_OFFSET,
+        num_workers: int = 1,
     ) -> "NGramGPULanguageModel":
         """
         Constructor from ARPA LM (text format).
@@ -665,6 +929,7 @@ class NGramGPULanguageModel(ModelPT):
                 None (default) means "auto" (used if available), True means forced mode
                 (will crash if Triton is unavailable)
             token_offset: offset for the tokens used for building ARPA LM
+            num_workers: number of processes to parse ARPA file; 1 (default) means reading in the main process
 
         Returns:
             NGramGPULanguageModel instance
@@ -686,21 +951,29 @@ class NGramGPULanguageModel(ModelPT):
                 max_order=max_order,
             )
             # add ngrams to suffix tree
-            ngram_cur_order_i = 0
-            cur_order = 1
-            for ngram in tqdm(cls._read_ngrams(f=f, token_offset=token_offset), total=total_ngrams):
-                if ngram_cur_order_i == 0:
-                    suffix_tree_np._start_adding_ngrams_for_order(order=cur_order, max_ngrams=order2cnt[cur_order])
-                ngram_cur_order_i += 1
-                suffix_tree_np._add_ngram(ngram=ngram, bos_id=_BOS_ID)
-
-                if ngram_cur_order_i == order2cnt[cur_order]:
-                    suffix_tree_np._end_adding_ngrams_for_order(order=cur_order, bos_id=_BOS_ID, unk_id=_UNK_ID)
-                    logging.info(f"Processed {order2cnt[cur_order]} n-grams of order {cur_order}")
-                    cur_order += 1
-                    ngram_cur_order_i = 0
-
-            assert ngram_cur_order_i == 0
+            if num_workers > 1:
+                for order, ngrams in cls._read_ngrams_parallel(
+                    lm_path=lm_path, order2cnt=order2cnt, token_offset=token_offset, num_workers=num_workers
+                ):
+                    suffix_tree_np._add_ngrams_array(order=order, ngrams=ngrams, bos_id=_BOS_ID, unk_id=_UNK_ID)
+                    logging.info(f"Processed {order2cnt[order]} n-grams of order {order}")
+            else:
+                ngram_cur_order_i = 0
+                cur_order = 1
+                for ngram in tqdm(cls._read_ngrams(f=f, token_offset=token_offset), total=total_ngrams):
+                    if ngram_cur_order_i == 0:
+                        suffix_tree_np._start_adding_ngrams_for_order(order=cur_order, max_ngrams=order2cnt[cur_order])
+                    ngram_cur_order_i += 1
+                    suffix_tree_np._add_ngram(ngram=ngram, bos_id=_BOS_ID)
+
+                    if ngram_cur_order_i == order2cnt[cur_order]:
+                        suffix_tree_np._end_adding_ngrams_for_order(order=cur_order, bos_id=_BOS_ID, unk_id=_UNK_ID)
+                        logging.info(f"Processed {order2cnt[cur_order]} n-grams of order {cur_order}")
+                        cur_order += 1
+                        ngram_cur_order_i = 0
+
+                assert ngram_cur_order_i == 0
+
             suffix_tree_np.sanity_check()
         return NGramGPULanguageModel.from_suffix_tree(suffix_tree_np=suffix_tree_np, use_triton=use_triton)
 
@@ -819,8 +1092,7 @@ class NGramGPULanguageModel(ModelPT):
 
     @classmethod
     def _read_ngrams(cls, f, token_offset: int) -> Iterator[NGram]:
-        special_words_pattern = '|'.join(re.escape(symbol) for symbol in _SPECIAL_SYMBOLS_MAP)
-        pattern = re.compile(rf'({special_words_pattern}|.)\s?')
+        pattern = _arpa_symbols_pattern()
         for line in f:
             if line.endswith("\n"):
                 line = line[:-1]
@@ -837,6 +1109,67 @@ class NGramGPULanguageModel(ModelPT):
             ngram = cls._line_to_ngram(line=line, pattern=pattern, token_offset=token_offset)
             yield ngram
 
+    @classmethod
+    def _read_ngrams_parallel(
+        cls, lm_path: Path | str, order2cnt: dict[int, int], token_offset: int, num_workers: int
+    ) -> Iterator[tuple[int, np.ndarray]]:
+        """
+        Parse ARPA n-grams using multiple processes.
+        Each n-gram section is split into chunks of full lines, which are parsed by workers
+        into structured arrays (see `_ngrams_np_dtype`). All chunks are scheduled at once,
+        so higher orders are parsed while lower orders are added to the suffix tree.
+
+        Args:
+            lm_path: path to ARPA model
+            order2cnt: number of n-grams for each order (from header)
+            token_offset: offset for the tokens used for building ARPA LM
+            num_workers: number of processes
+
+        Returns:
+            iterator over (order, n-grams array) in increasing order
+        """
+        sections = []
+        with open(lm_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            position = 0
+            for order in sorted(order2cnt.keys()):
+                marker = f"\\{order}-grams:".encode("utf-8")
+                start = mm.find(marker, position)
+                if start < 0:
+                    raise ValueError(f"Section {marker.decode()} not found in {lm_path}")
+                start = mm.find(b"\n", start) + 1
+                # section ends before the next line starting with "\" (next section or end of data)
+                end = mm.find(b"\n\\", start)
+                end = mm.size() if end < 0 else end + 1
+                chunk_size = max(1, (end - start) // (num_workers * 4))
+                boundaries = [start]
+                while boundaries[-1] < end:
+                    newline = mm.find(b"\n", min(boundaries[-1] + chunk_size, end), end)
+                    boundaries.append(end if newline < 0 else newline + 1)
+                sections.append((order, list(zip(boundaries[:-1], boundaries[1:]))))
+                position = end
+
+        with ProcessPoolExecutor(max_workers=num_workers) as executor:
+            futures = [
+                (
+                    order,
+                    [
+                        executor.submit(_parse_arpa_chunk, str(lm_path), start, end, order, token_offset)
+                        for start, end in chunks
+                    ],
+                )
+                for order, chunks in sections
+            ]
+            for order, order_futures in futures:
+                if order_futures:
+                    ngrams = np.concatenate([future.result() for future in order_futures])
+                else:
+                    ngrams = np.zeros([0], dtype=_ngrams_np_dtype(order))
+                if ngrams.shape[0] != order2cnt[order]:
+                    raise ValueError(
+                        f"Expected {order2cnt[order]} n-grams of order {order}, found {ngrams.shape[0]} in {lm_path}"
+                    )
+                yield order, ngrams
+
     @staticmethod
     def _line_to_ngram(line: str, pattern: re.Pattern, token_offset: int) -> NGram:
         """Parse ARPA line to N-Gram structure"""
@@ -0,0 +1,283 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from collections import Counter
+from typing import Dict, List, Optional, Sequence, Tuple, Union
+
+import torch
+from rapidfuzz.distance import Levenshtein
+
+__all__ = [
+    'batched_edit_distance',
+    'batched_text_edit_distance',
+    'batched_text_edit_operations',
+    'texts_to_padded_ids',
+    'EditDistanceResult',
+]
+
+EditDistanceResult = Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]
+
+
+def texts_to_padded_ids(
+    texts: Sequence[str],
+    use_cer: bool = False,
+    vocabulary: Optional[Dict[str, int]] = None,
+    device: Optional[Union[str, torch.device]] = None,
+    padding_value: int = -1,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Converts a list of texts into a padded tensor of integer ids suitable for ``batched_edit_distance``.
+
+    Characters are mapped to their unicode code points. Words are mapped through ``vocabulary``, which is
+    extended in-place with unseen words, so that the same dictionary can be reused across calls
+    (e.g. across validation batches) to avoid re-hashing the same words into new ids.
+
+    Args:
+        texts: list of strings.
+        use_cer: if True, split the texts into characters, otherwise into whitespace separated words.
+        vocabulary: word to id mapping shared between calls. Ignored when ``use_cer`` is True.
+        device: device of the returned tensors.
+        padding_value: value used to pad the ids.
+
+    Returns:
+        A tuple of padded ids of shape ``[Batch, MaxLength]`` and lengths of shape ``[Batch]``.
+    """
+    if use_cer:
+        sequences = [[ord(c) for c in text] for text in texts]
+    else:
+        if vocabulary is None:
+            vocabulary = {}
+        sequences = []
+        for text in texts:
+            ids = []
+            for word in text.split():
+                word_id = vocabulary.get(word)
+                if word_id is None:
+                    word_id = vocabulary[word] = len(vocabulary)
+                ids.append(word_id)
+            sequences.append(ids)
+
+    lengths = torch.tensor([len(seq) for seq in sequences], dtype=torch.long)
+    max_length = int(lengths.max()) if len(sequences) > 0 else 0
+    padded = torch.full((len(sequences), max_length), padding_value, dtype=torch.long)
+    mask = torch.arange(max_length).unsqueeze(0) < lengths.unsqueeze(1)
+    padded[mask] = torch.tensor([token for seq in sequences for token in seq], dtype=torch.long)
+    return padded.to(device), lengths.to(device)
+
+
+def _strip_common_affix(
+    hypotheses: torch.Tensor,
+    hypotheses_lengths: torch.Tensor,
+    references: torch.Tensor,
+    references_lengths: torch.Tensor,
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    """Removes the common prefix and suffix of every hypothesis-reference pair."""
+    batch_size = hypotheses.shape[0]
+    shared = min(hypotheses.shape[1], references.shape[1])
+    if shared == 0:
+        return hypotheses, hypotheses_lengths, references, references_lengths
+
+    device = hypotheses.device
+    positions = torch.arange(shared, device=device).unsqueeze(0).expand(batch_size, -1)
+    shared_lengths = torch.minimum(hypotheses_lengths, references_lengths).unsqueeze(1)
+
+    same = (hypotheses[:, :shared] == references[:, :shared]) & (positions < shared_lengths)
+    prefix = same.long().cumprod(dim=1).sum(dim=1)
+
+    hyp_last = (hypotheses_lengths.unsqueeze(1) - 1 - positions).clamp(min=0)
+    ref_last = (references_lengths.unsqueeze(1) - 1 - positions).clamp(min=0)
+    same = (hypotheses.gather(1, hyp_last) == references.gather(1, ref_last)) & (
+        positions < shared_lengths - prefix.unsqueeze(1)
+    )
+    suffix = same.long().cumprod(dim=1).sum(dim=1)
+
+    def _slice(tokens, lengths):
+        lengths = lengths - prefix - suffix
+        width = int(lengths.max())
+        index = (torch.arange(width, device=device).unsqueeze(0) + prefix.unsqueeze(1)).clamp(max=tokens.shape[1] - 1)
+        return tokens.gather(1, index) if width > 0 else tokens[:, :0], lengths
+
+    return (*_slice(hypotheses, hypotheses_lengths), *_slice(references, references_lengths))
+
+
+@torch.no_grad()
+def batched_edit_distance(
+    hypotheses: torch.Tensor,
+    hypotheses_lengths: torch.Tensor,
+    references: torch.Tensor,
+    references_lengths: torch.Tensor,
+) -> EditDistanceResult:
+    """
+    Computes Levenshtein distances between a batch of hypotheses and references given as padded id tensors.
+
+    The dynamic programming table is filled one reference position at a time for the whole batch at once.
+    Within a row, the insertion chain ``D[i][j] = min_k (T[i][k] + j - k)`` is resolved with a single ``cummin``,
+    so there is no Python loop over hypothesis positions or utterances. The computation runs on the device
+    of the input tensors.
+
+    Along with the distance, the number of insertions, deletions and substitutions is counted on the
+    same optimal alignment that ``rapidfuzz`` (and hence ``jiwer``) recovers: the common prefix and suffix
+    are skipped, and every cell picks its predecessor with the rules of Hyyrö's alignment backtrace.
+
+    Args:
+        hypotheses: integer tensor of shape ``[Batch, MaxHypLength]``.
+        hypotheses_lengths: integer tensor of shape ``[Batch]``.
+        references: integer tensor of shape ``[Batch, MaxRefLength]``.
+        references_lengths: integer tensor of shape ``[Batch]``.
+
+    Returns:
+        A tuple of ``(distances, insertions, deletions, substitutions)``, each a long tensor of shape ``[Batch]``.
+    """
+    device = hypotheses.device
+    hypotheses_lengths = hypotheses_lengths.to(device=device, dtype=torch.long)
+    if hypotheses.shape[0] == 0:
+        return tuple(torch.zeros_like(hypotheses_lengths) for _ in range(4))
+    references = references.to(device)
+    references_lengths = references_lengths.to(device=device, dtype=torch.long)
+    hypotheses, hypotheses_lengths, references, references_lengths = _strip_common_affix(
+        hypotheses, hypotheses_lengths, references, references_lengths
+    )
+    batch_size, max_hyp_length = hypotheses.shape
+
+    columns = torch.arange(max_hyp_length + 1, device=device).unsqueeze(0).expand(batch_size, -1)
+    # row 0: every hypothesis token is an insertion
+    dist = columns.clone()
+    ins = columns.clone()
+    dels = torch.zeros_like(columns)
+    hyp_index = hypotheses_lengths.unsqueeze(1)
+
+    result_dist = hypotheses_lengths.clone()
+    result_ins = hypotheses_lengths.clone()
+    result_dels = torch.zeros_like(hypotheses_lengths)
+
+    for i in range(1, references.shape[1] + 1):
+        mismatch = (hypotheses != references[:, i - 1 : i]).long()
+        # distances of the new row: best of deletion and match/substitution, then the chain of insertions
+        prev_dist = dist
+        t_dist = torch.cat(
+            [prev_dist[:, :1] + 1, torch.minimum(prev_dist[:, :-1] + mismatch, prev_dist[:, 1:] + 1)], 1
+        )
+        dist = torch.cummin(t_dist - columns, dim=1).values + columns
+
+        # predecessor of every cell as chosen by the backtrace: a deletion whenever it is optimal, otherwise
+        # an insertion if the cell to the left sits one below the cell above it, otherwise the diagonal
+        is_del = dist == prev_dist + 1
+        is_del[:, 0] = True
+        is_ins = ~is_del
+        is_ins[:, :2] = False
+        is_ins[:, 2:] &= dist[:, 1:-1] == prev_dist[:, 1:-1] - 1
+
+        # counts of the cells that do not end with an insertion come from the previous row
+        t_ins = torch.cat([ins[:, :1], torch.where(is_del[:, 1:], ins[:, 1:], ins[:, :-1])], 1)
+        t_dels = torch.cat([dels[:, :1] + 1, torch.where(is_del[:, 1:], dels[:, 1:] + 1, dels[:, :-1])], 1)
+        # an insertion chain extends the counts of the closest cell on its left that does not end with one
+        source = torch.where(is_ins, torch.zeros_like(columns), columns).cummax(dim=1).values
+        ins = t_ins.gather(1, source) + (columns - source)
+        dels = t_dels.gather(1, source)
+
+        finished = references_lengths == i
+        result_dist = torch.where(finished, dist.gather(1, hyp_index).squeeze(1), result_dist)
+        result_ins = torch.where(finished, ins.gather(1, hyp_index).squeeze(1), result_ins)
+        result_dels = torch.where(finished, dels.gather(1, hyp_index).squeeze(1), result_dels)
+
+    result_subs = result_dist - result_ins - result_dels
+    return result_dist, result_ins, result_dels, result_subs
+
+
+def _is_cpu(device: Optional[Union[str, torch.device]]) -> bool:
+    return device is None or torch.device(device).type == 'cpu'
+
+
+def _split(text: str, use_cer: bool) -> Union[str, List[str]]:
+    return text if use_cer else text.split()
+
+
+def _texts_to_device(
+    hypotheses: List[str],
+    references: List[str],
+    use_cer: bool,
+    vocabulary: Optional[Dict[str, int]],
+    device: Union[str, torch.device],
+) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor, torch.Tensor]:
+    if vocabulary is None:
+        vocabulary = {}
+    hyp_ids, hyp_lengths = texts_to_padded_ids(hypotheses, use_cer=use_cer, vocabulary=vocabulary, device=device)
+    ref_ids, ref_lengths = texts_to_padded_ids(
+        references, use_cer=use_cer, vocabulary=vocabulary, device=device, padding_value=-2
+    )
+    return hyp_ids, hyp_lengths, ref_ids, ref_lengths
+
+
+def batched_text_edit_distance(
+    hypotheses: List[str],
+    references: List[str],
+    use_cer: bool = False,
+    vocabulary: Optional[Dict[str, int]] = None,
+    device: Optional[Union[str, torch.device]] = None,
+) -> torch.Tensor:
+    """
+    Computes per-utterance Levenshtein distances between lists of strings.
+
+    On CPU every pair is scored with the bit-parallel ``rapidfuzz`` implementation, which outperforms a dense
+    dynamic programming over padded tensors there. On other devices the texts are converted to padded id tensors
+    and scored at once with ``batched_edit_distance``.
+
+    Args:
+        hypotheses: list of hypotheses.
+        references: list of references.
+        use_cer: if True, compare characters instead of whitespace separated words.
+        vocabulary: optional word to id mapping shared between calls, used to build the id tensors.
+        device: device to run the computation on. Defaults to CPU.
+
+    Returns:
+        A long CPU tensor of shape ``[Batch]`` with the distances.
+    """
+    if _is_cpu(device):
+        return torch.tensor(
+            [Levenshtein.distance(_split(h, use_cer), _split(r, use_cer)) for h, r in zip(hypotheses, references)],
+            dtype=torch.long,
+        )
+    return batched_edit_distance(*_texts_to_device(hypotheses, references, use_cer, vocabulary, device))[0].cpu()
+
+
+def batched_text_edit_operations(
+    hypotheses: List[str],
+    references: List[str],
+    use_cer: bool = False,
+    vocabulary: Optional[Dict[str, int]] = None,
+    device: Optional[Union[str, torch.device]] = None,
+) -> EditDistanceResult:
+    """
+    Computes per-utterance Levenshtein distances together with the number of insertions, deletions and
+    substitutions between lists of strings. The counts follow the alignment recovered by ``jiwer``.
+
+    Args:
+        hypotheses: list of hypotheses.
+        references: list of references.
+        use_cer: if True, compare characters instead of whitespace separated words.
+        vocabulary: optional word to id mapping shared between calls, used to build the id tensors.
+        device: device to run the computation on. Defaults to CPU.
+
+    Returns:
+        A tuple of ``(distances, insertions, deletions, substitutions)``, each a long CPU tensor of shape ``[Batch]``.
+    """
+    if _is_cpu(device):
+        counts = []
+        for h, r in zip(hypotheses, references):
+            ops = Counter(tag for tag, _, _ in Levenshtein.editops(_split(r, use_cer), _split(h, use_cer)).as_list())
+            counts.append((ops['insert'], ops['delete'], ops['replace']))
+        insertions, deletions, substitutions = torch.tensor(counts, dtype=torch.long).reshape(-1, 3).unbind(1)
+        return insertions + deletions + substitutions, insertions, deletions, substitutions
+    results = batched_edit_distance(*_texts_to_device(hypotheses, references, use_cer, vocabulary, device))
+    return tuple(x.cpu() for x in results)
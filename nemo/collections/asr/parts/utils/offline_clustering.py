@@ -31,7 +31,7 @@
 # https://arxiv.org/pdf/2003.02405.pdf and the implementation from
 # https://github.com/tango4j/Auto-Tuning-Spectral-Clustering.
 
-from typing import Dict, List, Tuple
+from typing import Dict, List, Optional, Tuple
 
 import torch
 from torch.linalg import eigh, eigvalsh
@@ -531,18 +531,61 @@ def getMultiScaleCosAffinityMatrix(
 
 def getLaplacian(X: torch.Tensor) -> torch.Tensor:
     """
-    Calculate a laplacian matrix from an affinity matrix X.
+    Calculate a laplacian matrix from an affinity matrix X, or a batch of laplacian matrices from
+    a batch of affinity matrices.
     """
-    X.fill_diagonal_(0)
-    D = torch.sum(torch.abs(X), dim=1)
+    X.diagonal(dim1=-2, dim2=-1).fill_(0)
+    D = torch.sum(torch.abs(X), dim=-1)
     D = torch.diag_embed(D)
     L = D - X
     return L
 
 
-def eigDecompose(laplacian: torch.Tensor, cuda: bool, device: torch.device) -> Tuple[torch.Tensor, torch.Tensor]:
+def usePartialEigSolver(laplacian: torch.Tensor, num_eigs: int, min_mat_size: int = 2048) -> bool:
+    """
+    Check whether the `num_eigs` smallest eigenpairs of a single Laplacian matrix should be computed with
+    the partial (LOBPCG) eigen-solver instead of a full eigendecomposition, which is the case for matrices
+    of at least `min_mat_size` rows.
+    """
+    mat_size = laplacian.shape[-1]
+    return laplacian.dim() == 2 and mat_size >= min_mat_size and 0 < num_eigs and 3 * num_eigs < mat_size
+
+
+def getEigInitVecs(mat_size: int, num_eigs: int, device: torch.device, dtype: torch.dtype) -> torch.Tensor:
+    """
+    Deterministic initial vectors for the partial eigen-solver, so that the results are reproducible.
+    """
+    rows = torch.arange(1, mat_size + 1, device=device, dtype=dtype)
+    cols = torch.arange(1, num_eigs + 1, device=device, dtype=dtype)
+    return torch.cos(torch.outer(rows, cols))
+
+
+def partialEigh(
+    laplacian: torch.Tensor,
+    num_eigs: int,
+    largest: bool,
+    init_vecs: Optional[torch.Tensor] = None,
+    niter: Optional[int] = None,
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Calculate the `num_eigs` smallest (or largest) eigenvalues and eigenvectors of a Laplacian matrix with LOBPCG,
+    sorted in ascending order. `init_vecs` can be used to warm-start the solver, e.g. with the eigenvectors of
+    a similar matrix, and `niter` limits the number of iterations.
+    """
+    if init_vecs is None:
+        init_vecs = getEigInitVecs(laplacian.shape[0], num_eigs, device=laplacian.device, dtype=laplacian.dtype)
+    lambdas, diffusion_map = torch.lobpcg(laplacian, k=num_eigs, X=init_vecs, niter=niter, largest=largest)
+    sorted_idx = torch.argsort(lambdas)
+    return lambdas[sorted_idx], diffusion_map[:, sorted_idx]
+
+
+def eigDecompose(
+    laplacian: torch.Tensor, cuda: bool, device: torch.device, num_eigs: int = -1
+) -> Tuple[torch.Tensor, torch.Tensor]:
     """
     Calculate eigenvalues and eigenvectors from the Laplacian matrix.
+    If `num_eigs` is positive, only the `num_eigs` smallest eigenpairs are guaranteed to be calculated, and a partial
+    eigen-solver is used for large matrices.
     """
     if cuda:
         if device is None:
@@ -550,13 +593,17 @@ def eigDecompose(laplacian: torch.Tensor, cuda: bool, device: torch.device) -> T
         laplacian = laplacian.float().to(device)
     else:
         laplacian = laplacian.float().to(torch.device('cpu'))
+    if usePartialEigSolver(laplacian, num_eigs):
+        return partialEigh(laplacian, num_eigs, largest=False)
     lambdas, diffusion_map = eigh(laplacian)
     return lambdas, diffusion_map
 
 
-def eigValueSh(laplacian: torch.Tensor, cuda: bool, device: torch.device) -> torch.Tensor:
+def eigValueSh(laplacian: torch.Tensor, cuda: bool, device: torch.device, num_eigs: int = -1) -> torch.Tensor:
     """
-    Calculate only eigenvalues from the Laplacian matrix.
+    Calculate only eigenvalues from the Laplacian matrix (or a batch of Laplacian matrices).
+    If `num_eigs` is positive, only the `num_eigs` smallest eigenvalues and the largest eigenvalue are guaranteed
+    to be calculated, and a partial eigen-solver is used for large matrices.
     """
     if cuda:
         if device is None:
@@ -564,6 +611,10 @@ def eigValueSh(laplacian: torch.Tensor, cuda: bool, device: torch.device) -> tor
         laplacian = laplacian.float().to(device)
     else:
         laplacian = laplacian.float().to(torch.device('cpu'))
+    if usePartialEigSolver(laplacian, num_eigs):
+        smallest_lambdas = partialEigh(laplacian, num_eigs, largest=False)[0]
+        largest_lambda = partialEigh(laplacian, 1, largest=True)[0]
+        return torch.cat([smallest_lambdas, largest_lambda])
     lambdas = eigvalsh(laplacian)
     return lambdas
 
@@ -574,7 +625,7 @@ def getLamdaGaplist(lambdas: torch.Tensor) -> torch.Tensor:
     """
     if torch.is_complex(lambdas):
         lambdas = torch.real(lambdas)
-    return lambdas[1:] - lambdas[:-1]
+    return lambdas[..., 1:] - lambdas[..., :-1]
 
 
 def addAnchorEmb(emb: torch.Tensor, anchor_sample_n: int, anchor_spk_n: int, sigma: float) -> torch.Tensor:
@@ -739,7 +790,8 @@ def estimateNumofSpeakers(
             The gap between the lambda values from eigendecomposition
     """
     laplacian = getLaplacian(affinity_mat)
-    lambdas = eigValueSh(laplacian, cuda=cuda, device=affinity_mat.device)
+    # Only the gaps between the smallest `max_num_speakers + 1` eigenvalues and the largest eigenvalue are used
+    lambdas = eigValueSh(laplacian, cuda=cuda, device=affinity_mat.device, num_eigs=max_num_speakers + 1)
     lambdas = torch.sort(lambdas)[0]
     lambda_gap = getLamdaGaplist(lambdas)
     num_of_spk = torch.argmax(lambda_gap[: min(max_num_speakers, lambda_gap.shape[0])]) + 1
@@ -800,6 +852,22 @@ class SpectralClustering:
         labels = self.clusterSpectralEmbeddings(X, cuda=self.cuda, device=self.device)
         return labels
 
+    def forwardDiffusionMap(self, diffusion_map: torch.Tensor) -> torch.Tensor:
+        """
+        Predict cluster labels from precomputed eigenvectors of the Laplacian matrix, sorted by ascending
+        eigenvalues. Only the first `self.n_clusters` eigenvectors are used.
+
+        Args:
+            diffusion_map (Tensor):
+                Matrix containing the eigenvectors of the Laplacian matrix in its columns
+
+        Returns:
+            labels (Tensor):
+                Clustering label output
+        """
+        spectral_emb = self.getSpectralEmbeddingsFromDiffusionMap(diffusion_map, n_spks=self.n_clusters)
+        return self.kmeansSpectralEmbeddings(spectral_emb, device=self.device)
+
     def clusterSpectralEmbeddings(
         self, affinity: torch.Tensor, cuda: bool = False, device: torch.device = torch.device('cpu')
     ) -> torch.Tensor:
@@ -823,6 +891,24 @@ class SpectralClustering:
 
         """
         spectral_emb = self.getSpectralEmbeddings(affinity, n_spks=self.n_clusters, cuda=cuda)
+        return self.kmeansSpectralEmbeddings(spectral_emb, device=device)
+
+    def kmeansSpectralEmbeddings(
+        self, spectral_emb: torch.Tensor, device: torch.device = torch.device('cpu')
+    ) -> torch.Tensor:
+        """
+        Run k-means clustering on spectral embeddings for (self.n_random_trials) times and take a majority vote.
+
+        Args:
+            spectral_emb (Tensor):
+                Spectral embeddings of the segments
+            device (torch.device):
+                Torch device variable
+
+        Returns:
+            labels (Tensor):
+                clustering label output
+        """
         labels_set = []
 
         for random_state_seed in range(self.random_state, self.random_state + self.n_random_trials):
@@ -852,7 +938,13 @@ class SpectralClustering:
                 clustering label output
         """
         laplacian = getLaplacian(affinity_mat)
-        _, diffusion_map_ = eigDecompose(laplacian, cuda=cuda, device=affinity_mat.device)
+        _, diffusion_map_ = eigDecompose(laplacian, cuda=cuda, device=affinity_mat.device, num_eigs=n_spks)
+        return self.getSpectralEmbeddingsFromDiffusionMap(diffusion_map_, n_spks=n_spks)
+
+    def getSpectralEmbeddingsFromDiffusionMap(self, diffusion_map_: torch.Tensor, n_spks: int = 8) -> torch.Tensor:
+        """
+        Extract spectral embeddings from the eigenvectors of the Laplacian matrix sorted by ascending eigenvalues.
+        """
         diffusion_map = diffusion_map_[:, :n_spks]
         inv_idx = torch.arange(diffusion_map.size(1) - 1, -1, -1).long()
         embedding = diffusion_map.T[inv_idx, :]
@@ -996,6 +1088,10 @@ class NMESC:
             for future in futures:
                 results.append(torch.jit.wait(future))
 
+        elif not usePartialEigSolver(self.mat, self.max_num_speakers + 1):
+            # The affinity graphs of all the p-values have the same size, eigen-analyze them in batches of
+            # at most 2^25 matrix elements
+            results = list(torch.unbind(self.getEigRatioBatch(self.p_value_list, 33554432), dim=0))
         else:
             for p_idx, p_value in enumerate(self.p_value_list):
                 results.append(self.getEigRatio(p_value))
@@ -1080,6 +1176,35 @@ class NMESC:
         g_p = (p_neighbors / self.mat.shape[0]) / (max_eig_gap + self.eps)
         return torch.stack([g_p, est_num_of_spk])
 
+    def getEigRatioBatch(self, p_value_list: torch.Tensor, max_batch_numel: int) -> torch.Tensor:
+        """
+        Batched version of `getEigRatio`: calculate g_p and the estimated number of speakers for all the p-values
+        in `p_value_list` with batched eigendecompositions.
+
+        Args:
+            p_value_list (Tensor):
+                Tensor containing the p_values to be examined.
+            max_batch_numel (int):
+                Maximum number of elements of the batch of affinity matrices decomposed at once.
+
+        Returns:
+            (Tensor): Tensor of shape (number of p-values, 2) containing g_p and the estimated number of speakers
+                for every p-value.
+        """
+        batch_size = max(1, max_batch_numel // (self.mat.shape[0] * self.mat.shape[0]))
+        lambdas_list: List[torch.Tensor] = []
+        for p_value_batch in torch.split(p_value_list, batch_size):
+            affinity_mats = torch.stack([getAffinityGraphMat(self.mat, p_value) for p_value in p_value_batch])
+            laplacians = getLaplacian(affinity_mats)
+            lambdas_list.append(eigValueSh(laplacians, cuda=self.cuda, device=affinity_mats.device))
+        lambdas = torch.sort(torch.cat(lambdas_list), dim=1)[0]
+        lambda_gaps = getLamdaGaplist(lambdas)[:, : self.max_num_speakers]
+        max_keys = torch.argmax(lambda_gaps, dim=1, keepdim=True)
+        est_num_of_spk = (max_keys.squeeze(1) + 1).to(lambdas.dtype)
+        max_eig_gap = lambda_gaps.gather(1, max_keys).squeeze(1) / (torch.max(lambdas, dim=1)[0] + self.eps)
+        g_p = (p_value_list.to(lambdas.device) / self.mat.shape[0]) / (max_eig_gap + self.eps)
+        return torch.stack([g_p, est_num_of_spk], dim=1)
+
     def getPvalueList(self) -> torch.Tensor:
         """
         Generates a p-value (p_neighbour) list for searching. p_value_list must include 2 (min_p_value)
@@ -31,16 +31,24 @@
 # https://arxiv.org/pdf/2003.02405.pdf and the implementation from
 # https://github.com/tango4j/Auto-Tuning-Spectral-Clustering.
 
-from typing import List, Tuple
+import math
+import time
+from typing import Dict, List, Tuple
 import torch
 
 from nemo.collections.asr.parts.utils.offline_clustering import (
     NMESC,
+    ScalerMinMax,
     SpeakerClustering,
     SpectralClustering,
+    eigDecompose,
     get_scale_interpolated_embs,
     getAffinityGraphMat,
     getCosAffinityMatrix,
+    getEigInitVecs,
+    getLamdaGaplist,
+    getLaplacian,
+    partialEigh,
     split_input_data,
 )
 from nemo.collections.asr.parts.utils.optimization_utils import linear_sum_assignment
@@ -488,6 +496,85 @@ def get_first_arg_index(mat: torch.Tensor, label: int) -> int:
     return int(torch.where(mat == label)[0][0])
 
 
+def get_reused_row_indices(prev_embs: torch.Tensor, embs: torch.Tensor) -> torch.Tensor:
+    """
+    Find the embedding vectors in `embs` that are identical to an embedding vector in `prev_embs`.
+    The candidates are looked up through a linear fingerprint of each vector and verified by exact comparison.
+
+    Args:
+        prev_embs (Tensor):
+            Embedding vectors of the previous step
+        embs (Tensor):
+            Embedding vectors of the current step
+
+    Returns:
+        reused_row_indices (Tensor):
+            Index of the identical vector in `prev_embs` for each vector in `embs`, -1 if there is none.
+    """
+    reused_row_indices = torch.full((embs.shape[0],), -1, dtype=torch.long, device=embs.device)
+    if prev_embs.dim() != 2 or prev_embs.shape[0] == 0 or prev_embs.shape[1] != embs.shape[1]:
+        return reused_row_indices
+    prev_embs = prev_embs.to(embs.device, embs.dtype)
+    weights = torch.linspace(1.0, 2.0, embs.shape[1], device=embs.device, dtype=embs.dtype)
+    sorted_prev_keys, sorted_prev_idx = torch.sort(torch.sum(prev_embs * weights, dim=1))
+    keys = torch.sum(embs * weights, dim=1)
+    candidate_pos = torch.searchsorted(sorted_prev_keys, keys).clamp(max=prev_embs.shape[0] - 1)
+    candidates = sorted_prev_idx[candidate_pos]
+    is_identical = torch.all(prev_embs[candidates] == embs, dim=1)
+    reused_row_indices[is_identical] = candidates[is_identical]
+    return reused_row_indices
+
+
+def get_incremental_cos_similarity(
+    prev_embs: torch.Tensor, prev_cos_sim: torch.Tensor, embs: torch.Tensor, eps: float = 3.5e-4
+) -> Tuple[torch.Tensor, torch.Tensor]:
+    """
+    Calculate the cosine similarity matrix of `embs` by reusing the similarity values of the embedding vectors
+    that are identical to the vectors in `prev_embs`. Only the rows and columns of the new embedding vectors are
+    calculated, e.g. the newly added or merged vectors of a streaming step.
+
+    Args:
+        prev_embs (Tensor):
+            Embedding vectors of the previous step
+        prev_cos_sim (Tensor):
+            Cosine similarity matrix of `prev_embs`
+        embs (Tensor):
+            Embedding vectors of the current step
+        eps (float):
+            Small value added to the norms of the embedding vectors, as in `cos_similarity`
+
+    Returns:
+        cos_sim (Tensor):
+            Cosine similarity matrix of `embs`
+        reused_row_indices (Tensor):
+            Index of the identical vector in `prev_embs` for each vector in `embs`, -1 if there is none.
+    """
+    embs = embs.float()
+    if prev_cos_sim.dim() == 2 and prev_cos_sim.shape[0] == prev_embs.shape[0]:
+        reused_row_indices = get_reused_row_indices(prev_embs, embs)
+    else:
+        reused_row_indices = torch.full((embs.shape[0],), -1, dtype=torch.long, device=embs.device)
+    reused_rows = torch.where(reused_row_indices >= 0)[0]
+    new_rows = torch.where(reused_row_indices < 0)[0]
+
+    embs_norm = embs / (torch.norm(embs, dim=1).unsqueeze(1) + eps)
+    cos_sim = torch.empty((embs.shape[0], embs.shape[0]), dtype=embs.dtype, device=embs.device)
+    if reused_rows.shape[0] > 0:
+        prev_rows = reused_row_indices[reused_rows]
+        reused_cos_sim = prev_cos_sim.to(embs.device)[prev_rows.unsqueeze(1), prev_rows]
+        # Repeated vectors are copies of the same previous vector, whose similarity is not on the diagonal
+        is_repeated = prev_rows.unsqueeze(1) == prev_rows.unsqueeze(0)
+        self_sim = torch.sum(embs_norm[reused_rows] * embs_norm[reused_rows], dim=1)
+        reused_cos_sim = torch.where(is_repeated, self_sim.unsqueeze(1).expand_as(reused_cos_sim), reused_cos_sim)
+        cos_sim[reused_rows.unsqueeze(1), reused_rows] = reused_cos_sim
+    if new_rows.shape[0] > 0:
+        new_cos_sim = torch.mm(embs_norm[new_rows], embs_norm.transpose(0, 1))
+        cos_sim[new_rows] = new_cos_sim
+        cos_sim[:, new_rows] = new_cos_sim.transpose(0, 1)
+    cos_sim.fill_diagonal_(1)
+    return cos_sim, reused_row_indices
+
+
 class OnlineSpeakerClustering(torch.nn.Module):
     """
     Online clustering method for speaker diarization based on cosine similarity.
@@ -558,6 +645,42 @@ class OnlineSpeakerClustering(torch.nn.Module):
             To save the computation time, p_value is estimated every `p_update_freq` frames and
             saved to `self.p_value_hist`.
 
+    Incremental Processing Attributes:
+
+        incremental (bool):
+            If True, the affinity matrix of each step is updated from the previous step: only the rows and columns
+            of new (or newly merged) embedding vectors are calculated. Speaker counting and spectral clustering
+            share a single eigendecomposition, which is warm-started from the eigenvectors of the previous step
+            for large matrices.
+        eig_warm_start_min_size (int):
+            In incremental mode, matrices with at least this many rows are decomposed with the partial eigen-solver
+            (LOBPCG) warm-started from the previous eigenvectors, smaller ones with a full eigendecomposition.
+        eig_warm_start_niter (int):
+            The number of iterations of the warm-started partial eigen-solver. A few iterations are enough to refine
+            the previous eigenvectors, and a fixed number keeps the latency of each step bounded.
+        prev_merged_embs (Tensor):
+            The embedding vectors clustered in the previous step.
+        prev_cos_sim (Tensor):
+            The cosine similarity matrix of `prev_merged_embs`.
+        prev_eig_vecs (Tensor):
+            The eigenvectors of the previous step, empty if they were not calculated with the partial eigen-solver.
+
+    Attributes for latency counters:
+
+        step_count (int):
+            The number of `forward_infer` calls.
+        last_step_latency (float):
+            Latency of the last `forward_infer` call in seconds.
+        total_step_latency (float):
+            Sum of the latencies of all the `forward_infer` calls in seconds.
+        max_step_latency (float):
+            The largest latency of a `forward_infer` call in seconds.
+        reused_affinity_rows (int):
+            The number of affinity matrix rows copied from the previous step in incremental mode.
+        computed_affinity_rows (int):
+            The number of affinity matrix rows calculated in incremental mode.
+        NOTE: Latencies are not measured in TorchScript modules.
+
     Attributes for counters and buffers in streaming system:
         
         is_online (bool):
@@ -610,6 +733,9 @@ class OnlineSpeakerClustering(torch.nn.Module):
         use_temporal_label_major_vote: bool = False,
         temporal_label_major_vote_buffer_size: int = 11,
         cuda: bool = False,
+        incremental: bool = False,
+        eig_warm_start_min_size: int = 600,
+        eig_warm_start_niter: int = 10,
     ):
         super().__init__()
         self.max_num_speakers = max_num_speakers
@@ -642,26 +768,27 @@ class OnlineSpeakerClustering(torch.nn.Module):
         self.history_embedding_buffer_label = torch.tensor([])
         self.Y_fullhist = torch.tensor([])
 
-    def onlineNMEanalysis(self, mat_in: torch.Tensor, frame_index: int) -> Tuple[int, int]:
+        # Initialize the state of incremental mode
+        self.incremental = incremental
+        self.eig_warm_start_min_size = eig_warm_start_min_size
+        self.eig_warm_start_niter = eig_warm_start_niter
+        self.prev_merged_embs = torch.tensor([])
+        self.prev_cos_sim = torch.tensor([])
+        self.prev_eig_vecs = torch.tensor([])
+
+        # Initialize the latency counters
+        self.step_count = 0
+        self.last_step_latency = 0.0
+        self.total_step_latency = 0.0
+        self.max_step_latency = 0.0
+        self.reused_affinity_rows = 0
+        self.computed_affinity_rows = 0
+
+    def get_nmesc(self, mat_in: torch.Tensor) -> NMESC:
         """
-        To save the running time, the p-value is only estimated in the beginning of the session.
-        After switching to online mode, the system uses the most common estimated p-value.
-        Estimating p-value requires a plenty of computational resource. The less frequent estimation of
-        p-value can speed up the clustering algorithm by a huge margin.
-
-        Args:
-            mat_in (Tensor):
-                Tensor containing the affinity matrix for the current segments
-            frame_index (int):
-                Unique index for each segment and embedding vector
-
-        Returns:
-            est_num_of_spk: (int)
-                The estimated number of speakers.
-            p_hat_value: (int)
-                The estimated p-value from NMESC method.
+        Create the NMESC instance used for the online NME analysis of the given affinity matrix.
         """
-        nmesc = NMESC(
+        return NMESC(
             mat_in,
             max_num_speakers=self.max_num_speakers,
             max_rp_threshold=self.max_rp_threshold,
@@ -674,6 +801,22 @@ class OnlineSpeakerClustering(torch.nn.Module):
             device=mat_in.device,
             cuda=self.cuda,
         )
+
+    def online_p_value_estimation(self, nmesc: NMESC, frame_index: int) -> int:
+        """
+        Estimate the p-value in the beginning of the session, every `self.p_update_freq` frames, and take
+        the most common p-value among the recent estimations.
+
+        Args:
+            nmesc (NMESC):
+                NMESC instance for the affinity matrix of the current segments
+            frame_index (int):
+                Unique index for each segment and embedding vector
+
+        Returns:
+            p_hat_value: (int)
+                The most common estimated p-value from NMESC method.
+        """
         if len(self.p_value_hist) == 0 or (
             frame_index < self.p_value_skip_frame_thres and frame_index % self.p_update_freq == 0
         ):
@@ -682,7 +825,29 @@ class OnlineSpeakerClustering(torch.nn.Module):
             if len(self.p_value_hist) > self.p_value_queue_size:
                 self.p_value_hist.pop(0)
         p_hat_int_list: List[int] = [int(p) for p in self.p_value_hist]
-        p_hat_value = torch.mode(torch.tensor(p_hat_int_list))[0].item()
+        return int(torch.mode(torch.tensor(p_hat_int_list))[0].item())
+
+    def onlineNMEanalysis(self, mat_in: torch.Tensor, frame_index: int) -> Tuple[int, int]:
+        """
+        To save the running time, the p-value is only estimated in the beginning of the session.
+        After switching to online mode, the system uses the most common estimated p-value.
+        Estimating p-value requires a plenty of computational resource. The less frequent estimation of
+        p-value can speed up the clustering algorithm by a huge margin.
+
+        Args:
+            mat_in (Tensor):
+                Tensor containing the affinity matrix for the current segments
+            frame_index (int):
+                Unique index for each segment and embedding vector
+
+        Returns:
+            est_num_of_spk: (int)
+                The estimated number of speakers.
+            p_hat_value: (int)
+                The estimated p-value from NMESC method.
+        """
+        nmesc = self.get_nmesc(mat_in)
+        p_hat_value = self.online_p_value_estimation(nmesc, frame_index)
         output = nmesc.getEigRatio(p_hat_value)
         g_p, est_num_of_spk = output[0], output[1].int()
         return est_num_of_spk, p_hat_value
@@ -746,6 +911,128 @@ class OnlineSpeakerClustering(torch.nn.Module):
         est_num_of_spk = self.limit_frames_per_speaker(frame_index, raw_est_num_of_spk.item())
         return est_num_of_spk, affinity_mat
 
+    def warm_start_eigh(
+        self, laplacian: torch.Tensor, reused_row_indices: torch.Tensor, num_eigs: int
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Calculate the eigenvalues and eigenvectors of the Laplacian matrix in ascending order. Matrices with at least
+        `self.eig_warm_start_min_size` rows are decomposed with the partial eigen-solver, which only calculates the
+        `num_eigs` smallest eigenpairs and is warm-started from the eigenvectors of the previous step.
+
+        Args:
+            laplacian (Tensor):
+                Laplacian matrix of the current affinity matrix
+            reused_row_indices (Tensor):
+                Index of the identical embedding vector of the previous step for each row, -1 if there is none.
+            num_eigs (int):
+                The number of the smallest eigenpairs needed
+
+        Returns:
+            lambdas (Tensor):
+                Eigenvalues in ascending order
+            diffusion_map (Tensor):
+                Eigenvectors corresponding to `lambdas`
+        """
+        mat_size = laplacian.shape[0]
+        if mat_size < max(self.eig_warm_start_min_size, 3 * num_eigs):
+            self.prev_eig_vecs = torch.empty(0)
+            return eigDecompose(laplacian, cuda=self.cuda, device=laplacian.device)
+
+        is_reused = reused_row_indices >= 0
+        # Warm-start only if most of the rows are carried over from the previous step, since a cold-started
+        # partial eigen-solver is slower than a full eigendecomposition
+        if (
+            self.prev_eig_vecs.dim() == 2
+            and self.prev_eig_vecs.shape[1] == num_eigs
+            and 2 * int(is_reused.sum()) >= mat_size
+        ):
+            laplacian = laplacian.float()
+            # The rows of new embedding vectors are filled with (unit-norm scaled) deterministic initial vectors
+            init_vecs = getEigInitVecs(mat_size, num_eigs, device=laplacian.device, dtype=laplacian.dtype)
+            init_vecs = init_vecs / math.sqrt(mat_size)
+            init_vecs[is_reused] = self.prev_eig_vecs.to(laplacian.device)[reused_row_indices[is_reused]]
+            lambdas, diffusion_map = partialEigh(
+                laplacian, num_eigs, largest=False, init_vecs=init_vecs, niter=self.eig_warm_start_niter
+            )
+        else:
+            lambdas, diffusion_map = eigDecompose(laplacian, cuda=self.cuda, device=laplacian.device)
+        self.prev_eig_vecs = diffusion_map[:, :num_eigs]
+        return lambdas, diffusion_map
+
+    def incremental_clustering(self, merged_embs: torch.Tensor, frame_index: int, cuda: bool) -> torch.Tensor:
+        """
+        Incremental version of the clustering step of `forward_infer`:
+            - Only the affinity matrix rows and columns of new (or newly merged) embedding vectors are calculated,
+              the others are copied from the previous step.
+            - Speaker counting and spectral clustering share a single eigendecomposition of the Laplacian matrix,
+              which is warm-started from the eigenvectors of the previous step for large matrices.
+
+        Args:
+            merged_embs (Tensor):
+                Embedding vectors of the history buffer and the current buffer
+            frame_index (int):
+                Unique index for each segment (also each embedding vector)
+            cuda (bool):
+                Boolean that determines whether cuda is used or not
+
+        Returns:
+            Y (Tensor):
+                Speaker labels of `merged_embs`
+        """
+        cos_sim, reused_row_indices = get_incremental_cos_similarity(
+            self.prev_merged_embs, self.prev_cos_sim, merged_embs
+        )
+        num_reused_rows = int((reused_row_indices >= 0).sum())
+        self.reused_affinity_rows += num_reused_rows
+        self.computed_affinity_rows += merged_embs.shape[0] - num_reused_rows
+        self.prev_merged_embs, self.prev_cos_sim = merged_embs, cos_sim
+
+        mat = ScalerMinMax(cos_sim)
+        p_hat_value = self.online_p_value_estimation(self.get_nmesc(mat), frame_index)
+        affinity_mat = getAffinityGraphMat(mat, p_hat_value)
+        lambdas, diffusion_map = self.warm_start_eigh(
+            getLaplacian(affinity_mat), reused_row_indices, num_eigs=self.max_num_speakers + 1
+        )
+        lambda_gap = getLamdaGaplist(lambdas)
+        est_num_of_spk = int(torch.argmax(lambda_gap[: min(self.max_num_speakers, lambda_gap.shape[0])])) + 1
+        raw_est_num_of_spk = self.speaker_counter_buffer(est_num_of_spk)
+        est_num_of_spk = self.limit_frames_per_speaker(frame_index, raw_est_num_of_spk.item())
+
+        spectral_model = SpectralClustering(n_clusters=est_num_of_spk, cuda=cuda, device=merged_embs.device)
+        return spectral_model.forwardDiffusionMap(diffusion_map).to(merged_embs.device)
+
+    def update_latency_counters(self, step_latency: float):
+        """
+        Update the latency counters with the latency of a `forward_infer` call in seconds.
+        """
+        self.last_step_latency = step_latency
+        self.total_step_latency += step_latency
+        self.max_step_latency = max(self.max_step_latency, step_latency)
+
+    def get_latency_stats(self) -> Dict[str, float]:
+        """
+        Get the per-step latency counters (in seconds) and the affinity matrix row counters of incremental mode.
+        """
+        return {
+            'step_count': float(self.step_count),
+            'last_step_latency': self.last_step_latency,
+            'mean_step_latency': self.total_step_latency / max(self.step_count, 1),
+            'max_step_latency': self.max_step_latency,
+            'reused_affinity_rows': float(self.reused_affinity_rows),
+            'computed_affinity_rows': float(self.computed_affinity_rows),
+        }
+
+    def reset_latency_counters(self):
+        """
+        Reset the latency counters, e.g. at the beginning of a new session.
+        """
+        self.step_count = 0
+        self.last_step_latency = 0.0
+        self.total_step_latency = 0.0
+        self.max_step_latency = 0.0
+        self.reused_affinity_rows = 0
+        self.computed_affinity_rows = 0
+
     def prepare_embedding_update(
         self, emb_in: torch.Tensor, segment_indexes_matrix: torch.Tensor
     ) -> Tuple[bool, int, torch.Tensor, torch.Tensor]:
@@ -1171,6 +1458,9 @@ class OnlineSpeakerClustering(torch.nn.Module):
             Y (Tensor):
                 Speaker labels for history embeddings and current embedding inputs
         """
+        start_time = 0.0
+        if not torch.jit.is_scripting():
+            start_time = time.perf_counter()
         self.max_num_speakers = max_num_speakers
         self.max_rp_threshold = max_rp_threshold
         self.enhanced_count_thres = enhanced_count_thres
@@ -1185,6 +1475,8 @@ class OnlineSpeakerClustering(torch.nn.Module):
         # Perform clustering on the embedding matrix containing history and current FIFO buffer merged_embeddings
         if merged_embs.shape[0] == 1:
             Y = torch.zeros((1,), dtype=torch.int32)
+        elif self.incremental:
+            Y = self.incremental_clustering(merged_embs, frame_index, cuda)
         else:
             mat = getCosAffinityMatrix(merged_embs)
             est_num_of_spk, affinity_mat = self.online_spk_num_estimation(mat, frame_index)
@@ -1192,4 +1484,8 @@ class OnlineSpeakerClustering(torch.nn.Module):
             Y = spectral_model.forward(affinity_mat).to(merged_embs.device)
         # Match the permutation of the newly obtained speaker labels and the previous labels
         merged_clus_labels = self.match_labels(Y_merged=Y, add_new=add_new)
+
+        self.step_count += 1
+        if not torch.jit.is_scripting():
+            self.update_latency_counters(time.perf_counter() - start_time)
         return merged_clus_labels
@@ -12,6 +12,8 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
+import contextlib
 import gc
 import json
 import math
@@ -432,6 +434,68 @@ def generate_cluster_labels(segment_ranges: List[str], cluster_labels: List[int]
     return diar_hyp, lines
 
 
+def cluster_session_embeddings(
+    speaker_clustering: LongFormSpeakerClustering,
+    uniq_embs_and_timestamps: Dict[str, torch.Tensor],
+    oracle_num_speakers: int,
+    clustering_kwargs: Dict[str, Union[int, float, None]],
+) -> Tuple[np.ndarray, torch.Tensor]:
+    """
+    Cluster the multi-scale embeddings of a single session.
+
+    Args:
+        speaker_clustering (LongFormSpeakerClustering):
+            Speaker clustering module (or its TorchScript version)
+        uniq_embs_and_timestamps (dict):
+            Dictionary containing 'embeddings', 'timestamps', 'multiscale_segment_counts' and 'multiscale_weights'
+            of the session.
+        oracle_num_speakers (int):
+            The number of speakers in the session, -1 if unknown.
+        clustering_kwargs (dict):
+            Keyword arguments passed to `forward_infer`: max_num_speakers, max_rp_threshold, sparse_search_volume,
+            chunk_cluster_count and embeddings_per_chunk.
+
+    Returns:
+        cluster_labels (np.ndarray):
+            Speaker label of each base-scale segment.
+        timestamps (Tensor):
+            Base-scale segment timestamps.
+    """
+    base_scale_idx = uniq_embs_and_timestamps['multiscale_segment_counts'].shape[0] - 1
+    cluster_labels = speaker_clustering.forward_infer(
+        embeddings_in_scales=uniq_embs_and_timestamps['embeddings'],
+        timestamps_in_scales=uniq_embs_and_timestamps['timestamps'],
+        multiscale_segment_counts=uniq_embs_and_timestamps['multiscale_segment_counts'],
+        multiscale_weights=uniq_embs_and_timestamps['multiscale_weights'],
+        oracle_num_speakers=oracle_num_speakers,
+        **clustering_kwargs,
+    )
+    timestamps = speaker_clustering.timestamps_in_scales[base_scale_idx]
+
+    cluster_labels = cluster_labels.cpu().numpy()
+    if len(cluster_labels) != timestamps.shape[0]:
+        raise ValueError("Mismatch of length between cluster_labels and timestamps.")
+    return cluster_labels, timestamps.cpu()
+
+
+# Speaker clustering module of a clustering worker process, created by `_init_clustering_worker`
+_worker_speaker_clustering = None
+
+
+def _init_clustering_worker(num_threads: int, use_torch_script: bool):
+    global _worker_speaker_clustering
+    torch.set_num_threads(num_threads)
+    _worker_speaker_clustering = LongFormSpeakerClustering(cuda=False)
+    if use_torch_script:
+        _worker_speaker_clustering = torch.jit.script(_worker_speaker_clustering)
+
+
+def _cluster_session_in_worker(args) -> Tuple[np.ndarray, torch.Tensor]:
+    cluster_labels, timestamps = cluster_session_embeddings(_worker_speaker_clustering, *args)
+    gc.collect()
+    return cluster_labels, timestamps
+
+
 def perform_clustering(
     embs_and_timestamps, AUDIO_RTTM_MAP, out_rttm_dir, clustering_params, device, verbose: bool = True
 ):
@@ -450,7 +514,8 @@ def perform_clustering(
         clustering_params (dict):
             Clustering parameters provided through config that contains max_num_speakers (int),
             oracle_num_speakers (bool), max_rp_threshold(float), sparse_search_volume(int)
-            and enhance_count_threshold (int).
+            and enhance_count_threshold (int). If `num_workers` (int) is larger than 1 and clustering runs on CPU,
+            the sessions are clustered in parallel by that many worker processes.
         use_torch_script (bool):
             Boolean that determines whether to use torch.jit.script for speaker clustering
         device (torch.device):
@@ -475,62 +540,79 @@ def perform_clustering(
 
     speaker_clustering = LongFormSpeakerClustering(cuda=cuda)
 
-    if clustering_params.get('export_script_module', False):
+    use_torch_script = bool(clustering_params.get('export_script_module', False))
+    if use_torch_script:
         speaker_clustering = torch.jit.script(speaker_clustering)
         torch.jit.save(speaker_clustering, 'speaker_clustering_script.pt')
 
-    for uniq_id, audio_rttm_values in tqdm(AUDIO_RTTM_MAP.items(), desc='clustering', leave=True, disable=not verbose):
-        uniq_embs_and_timestamps = embs_and_timestamps[uniq_id]
-
+    clustering_kwargs = dict(
+        max_num_speakers=int(clustering_params.max_num_speakers),
+        max_rp_threshold=float(clustering_params.max_rp_threshold),
+        sparse_search_volume=int(clustering_params.sparse_search_volume),
+        chunk_cluster_count=clustering_params.get('chunk_cluster_count', None),
+        embeddings_per_chunk=clustering_params.get('embeddings_per_chunk', None),
+    )
+    if use_torch_script:
+        # The TorchScript `forward_infer` only accepts int chunking options: unset ones keep its defaults.
+        clustering_kwargs = {key: value for key, value in clustering_kwargs.items() if value is not None}
+    session_args = []
+    for uniq_id, audio_rttm_values in AUDIO_RTTM_MAP.items():
         if clustering_params.oracle_num_speakers:
             num_speakers = audio_rttm_values.get('num_speakers', None)
             if num_speakers is None:
                 raise ValueError("Provided option as oracle num of speakers but num_speakers in manifest is null")
         else:
             num_speakers = -1
-
-        base_scale_idx = uniq_embs_and_timestamps['multiscale_segment_counts'].shape[0] - 1
-
-        cluster_labels = speaker_clustering.forward_infer(
-            embeddings_in_scales=uniq_embs_and_timestamps['embeddings'],
-            timestamps_in_scales=uniq_embs_and_timestamps['timestamps'],
-            multiscale_segment_counts=uniq_embs_and_timestamps['multiscale_segment_counts'],
-            multiscale_weights=uniq_embs_and_timestamps['multiscale_weights'],
-            oracle_num_speakers=int(num_speakers),
-            max_num_speakers=int(clustering_params.max_num_speakers),
-            max_rp_threshold=float(clustering_params.max_rp_threshold),
-            sparse_search_volume=int(clustering_params.sparse_search_volume),
-            chunk_cluster_count=clustering_params.get('chunk_cluster_count', None),
-            embeddings_per_chunk=clustering_params.get('embeddings_per_chunk', None),
+        session_args.append((embs_and_timestamps[uniq_id], int(num_speakers), clustering_kwargs))
+
+    num_workers = min(int(clustering_params.get('num_workers', 1) or 1), len(session_args))
+    if num_workers > 1 and not cuda:
+        # Sessions are independent: cluster them in worker processes sharing the available CPU threads.
+        # The workers are shut down when the clustering ends, also if it fails.
+        executor_context = concurrent.futures.ProcessPoolExecutor(
+            max_workers=num_workers,
+            initializer=_init_clustering_worker,
+            initargs=(max(1, torch.get_num_threads() // num_workers), use_torch_script),
         )
+    else:
+        executor_context = contextlib.nullcontext()
 
-        del uniq_embs_and_timestamps
-        if cuda:
-            torch.cuda.empty_cache()
+    with executor_context as executor:
+        if executor is not None:
+            session_results = executor.map(_cluster_session_in_worker, session_args)
         else:
-            gc.collect()
-        timestamps = speaker_clustering.timestamps_in_scales[base_scale_idx]
-
-        cluster_labels = cluster_labels.cpu().numpy()
-        if len(cluster_labels) != timestamps.shape[0]:
-            raise ValueError("Mismatch of length between cluster_labels and timestamps.")
-
-        labels, lines = generate_cluster_labels(timestamps, cluster_labels)
-
-        if out_rttm_dir:
-            labels_to_rttmfile(labels, uniq_id, out_rttm_dir)
-            lines_cluster_labels.extend([f'{uniq_id} {seg_line}\n' for seg_line in lines])
-        hypothesis = labels_to_pyannote_object(labels, uniq_name=uniq_id)
-        all_hypothesis.append([uniq_id, hypothesis])
-
-        rttm_file = audio_rttm_values.get('rttm_filepath', None)
-        if rttm_file is not None and os.path.exists(rttm_file) and not no_references:
-            ref_labels = rttm_to_labels(rttm_file)
-            reference = labels_to_pyannote_object(ref_labels, uniq_name=uniq_id)
-            all_reference.append([uniq_id, reference])
-        else:
-            no_references = True
-            all_reference = []
+            session_results = map(lambda args: cluster_session_embeddings(speaker_clustering, *args), session_args)
+
+        for (uniq_id, audio_rttm_values), args, (cluster_labels, timestamps) in tqdm(
+            zip(AUDIO_RTTM_MAP.items(), session_args, session_results),
+            total=len(session_args),
+            desc='clustering',
+            leave=True,
+            disable=not verbose,
+        ):
+            base_scale_idx = args[0]['multiscale_segment_counts'].shape[0] - 1
+            if executor is None:
+                if cuda:
+                    torch.cuda.empty_cache()
+                else:
+                    gc.collect()
+
+            labels, lines = generate_cluster_labels(timestamps, cluster_labels)
+
+            if out_rttm_dir:
+                labels_to_rttmfile(labels, uniq_id, out_rttm_dir)
+                lines_cluster_labels.extend([f'{uniq_id} {seg_line}\n' for seg_line in lines])
+            hypothesis = labels_to_pyannote_object(labels, uniq_name=uniq_id)
+            all_hypothesis.append([uniq_id, hypothesis])
+
+            rttm_file = audio_rttm_values.get('rttm_filepath', None)
+            if rttm_file is not None and os.path.exists(rttm_file) and not no_references:
+                ref_labels = rttm_to_labels(rttm_file)
+                reference = labels_to_pyannote_object(ref_labels, uniq_name=uniq_id)
+                all_reference.append([uniq_id, reference])
+            else:
+                no_references = True
+                all_reference = []
 
     if out_rttm_dir:
         write_cluster_labels(base_scale_idx, lines_cluster_labels, out_rttm_dir)
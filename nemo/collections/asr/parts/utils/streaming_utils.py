@@ -109,33 +109,124 @@ def longest_common_subsequence_merge(X, Y, filepath=None):
             - slice_len: number of tokens to slice off from the ith chunk.
         The LCS alignment matrix itself (shape m + 1, n + 1)
     """
-    # LCSuff is the table with zero
-    # value initially in each cell
-    m = len(X)
-    n = len(Y)
-    LCSuff = [[0 for _ in range(n + 1)] for _ in range(m + 1)]
-
-    # To store the length of
-    # longest common substring
-    result = 0
-    result_idx = [0, 0, 0]  # Contains (i, j, slice_len)
-
-    # Following steps to build
-    # LCSuff[m+1][n+1] in bottom up fashion
-    for i in range(m + 1):
-        for j in range(n + 1):
-            if i == 0 or j == 0:
-                LCSuff[i][j] = 0
-            elif X[i - 1] == Y[j - 1]:
-                LCSuff[i][j] = LCSuff[i - 1][j - 1] + 1
-
-                if result <= LCSuff[i][j]:
-                    result = LCSuff[i][j]  # max(result, LCSuff[i][j])
-                    result_idx = [i, j, result]
+    result_idx, LCSuff = batched_longest_common_subsequence_merge([X], [Y], filepaths=[filepath])
+    return result_idx[0], LCSuff[0].tolist()
+
+
+def batched_longest_common_subsequence_merge(X_batch, Y_batch, filepaths=None):
+    """
+    Batched version of `longest_common_subsequence_merge`, aligning several pairs of consecutive buffers at once.
+
+    The pairs are padded into a single [B, M + 1, N + 1] table of longest common suffixes, which is filled
+    one row at a time for the whole batch. The search for the longest common suffix and the backward search for
+    the leftmost one are vectorized over the batch as well, only the diagonal expansion and backtracking
+    heuristics (which touch a handful of cells) are run per pair.
+
+    Args:
+        X_batch: List of subsets of the previous chunks, see `longest_common_subsequence_merge`.
+        Y_batch: List of the current chunks.
+        filepaths: Optional list of filepaths (or None) to save the LCS alignment matrices for later introspection.
+
+    Returns:
+        A tuple containing -
+            - List of (i, j, slice_len) for every pair, see `longest_common_subsequence_merge`.
+            - List of the LCS alignment matrices (np.ndarray of shape m + 1, n + 1) for every pair.
+    """
+    batch_size = len(X_batch)
+    if filepaths is None:
+        filepaths = [None] * batch_size
+
+    m_lens = np.array([len(x) for x in X_batch], dtype=np.int64)
+    n_lens = np.array([len(y) for y in Y_batch], dtype=np.int64)
+    max_m = int(m_lens.max(initial=0))
+    max_n = int(n_lens.max(initial=0))
+
+    # Pad the two sides with different values, so that the padding never matches
+    X = np.full([batch_size, max_m], -1, dtype=np.int64)
+    Y = np.full([batch_size, max_n], -2, dtype=np.int64)
+    for b, (x, y) in enumerate(zip(X_batch, Y_batch)):
+        X[b, : len(x)] = x
+        Y[b, : len(y)] = y
+
+    # LCSuff[b, i, j] is the length of the common suffix of X[b, :i] and Y[b, :j]
+    matches = X[:, :, None] == Y[:, None, :]
+    LCSuff = np.zeros([batch_size, max_m + 1, max_n + 1], dtype=np.int64)
+    for i in range(1, max_m + 1):
+        LCSuff[:, i, 1:] = (LCSuff[:, i - 1, :-1] + 1) * matches[:, i - 1]
+
+    # Longest common suffix, ties are resolved to the last cell in row-major order
+    flat_LCSuff = LCSuff.reshape(batch_size, -1)
+    result = flat_LCSuff.max(axis=1, initial=0)
+    result_flat_idx = flat_LCSuff.shape[1] - 1 - np.argmax(flat_LCSuff[:, ::-1], axis=1)
+
+    # Backward search for the leftmost longest common suffix, starting from the last row of the old buffer.
+    # Every row can update the selection at most once: at its first column (up to the current one)
+    # holding a longer suffix than the current selection.
+    batch_idx = np.arange(batch_size)
+    columns = np.arange(max_n + 1)
+    max_j = np.zeros(batch_size, dtype=np.int64)
+    max_j_idx = n_lens.copy()
+    i_partial = m_lens.copy()
+    j_partial = np.full(batch_size, -1, dtype=np.int64)
+    for i_idx in range(max_m, -1, -1):
+        row = LCSuff[:, i_idx]
+        candidates = (row > max_j[:, None]) & (columns[None, :] <= max_j_idx[:, None])
+        found = candidates.any(axis=1)
+        first_j = candidates.argmax(axis=1)
+
+        max_j = np.where(found, row[batch_idx, first_j], max_j)
+        max_j_idx = np.where(found, first_j, max_j_idx)
+        i_partial = np.where(found, i_idx, i_partial)
+        j_partial = np.where(found, first_j, j_partial)
+
+    results_idx = []
+    alignments = []
+    for b in range(batch_size):
+        m, n = int(m_lens[b]), int(n_lens[b])
+        alignment = LCSuff[b, : m + 1, : n + 1]
+
+        if result[b] > 0:
+            i, j = divmod(int(result_flat_idx[b]), max_n + 1)
+            result_idx = [i, j, int(result[b])]
+        else:
+            result_idx = [0, 0, 0]
+
+        result_idx, is_complete_merge = _lcs_merge_slice(
+            alignment.tolist(), m, n, result_idx, int(i_partial[b]), int(j_partial[b]), int(max_j[b])
+        )
+
+        if filepaths[b] is not None:
+            extras = {
+                "is_complete_merge": is_complete_merge,
+                "X": X_batch[b],
+                "Y": Y_batch[b],
+                "slice_idx": result_idx,
+            }
+            write_lcs_alignment_to_pickle(alignment.tolist(), filepath=filepaths[b], extras=extras)
+            print("Wrote alignemnt to :", filepaths[b])
+
+        results_idx.append(result_idx)
+        alignments.append(alignment)
+
+    return results_idx, alignments
 
-            else:
-                LCSuff[i][j] = 0
 
+def _lcs_merge_slice(LCSuff, m, n, result_idx, i_partial, j_partial, max_j):
+    """
+    Computes the slice of the new buffer from a LCS alignment matrix.
+
+    Args:
+        LCSuff: The LCS alignment matrix (nested lists of shape m + 1, n + 1).
+        m: Length of the old buffer.
+        n: Length of the new buffer.
+        result_idx: (i, j, length) of the longest common suffix.
+        i_partial: Row of the leftmost longest common suffix.
+        j_partial: Column of the leftmost longest common suffix.
+        max_j: Length of the leftmost longest common suffix.
+
+    Returns:
+        A tuple of the final (i, j, slice_len) and whether a complete merge was found.
+    """
     # Check if perfect alignment was found or not
     # Perfect alignment is found if :
     # Longest common subsequence extends to the final row of of the old buffer
@@ -168,34 +259,15 @@ def longest_common_subsequence_merge(X, Y, filepath=None):
         # 2) Greedy expansion of leftmost LCS to the right
         # 3) Backtrack final leftmost expanded LCS to find origin point of slice
 
-        # (1) Backward search for Leftmost LCS
+        # (1) Backward search for Leftmost LCS (i_partial, j_partial, max_j) is done by the caller
         # This is required for cases where multiple common subsequences exist
         # We only need to select the leftmost one - since that corresponds
         # to the last potential subsequence that matched with the new buffer.
         # If we just chose the LCS (and not the leftmost LCS), then we can potentially
         # slice off major sections of text which are repeated between two overlapping buffers.
-
-        # backward linear search for leftmost j with longest subsequence
-        max_j = 0
-        max_j_idx = n
-
-        i_partial = m  # Starting index of i for partial merge
-        j_partial = -1  # Index holder of j for partial merge
         j_skip = 0  # Number of tokens that were skipped along the diagonal
         slice_count = 0  # Number of tokens that should be sliced
 
-        # Select leftmost LCS
-        for i_idx in range(m, -1, -1):  # start from last timestep of old buffer
-            for j_idx in range(0, n + 1):  # start from first token from new buffer
-                # Select the longest LCSuff, while minimizing the index of j (token index for new buffer)
-                if LCSuff[i_idx][j_idx] > max_j and j_idx <= max_j_idx:
-                    max_j = LCSuff[i_idx][j_idx]
-                    max_j_idx = j_idx
-
-                    # Update the starting indices of the partial merge
-                    i_partial = i_idx
-                    j_partial = j_idx
-
         # EARLY EXIT (if max subsequence length <= MIN merge length)
         # Important case where there is long silence
         # The end of one buffer will have many blank tokens, the beginning of new buffer may have many blank tokens
@@ -280,17 +352,7 @@ def longest_common_subsequence_merge(X, Y, filepath=None):
     result_idx[0] = i
     result_idx[1] = j
 
-    if filepath is not None:
-        extras = {
-            "is_complete_merge": is_complete_merge,
-            "X": X,
-            "Y": Y,
-            "slice_idx": result_idx,
-        }
-        write_lcs_alignment_to_pickle(LCSuff, filepath=filepath, extras=extras)
-        print("Wrote alignemnt to :", filepath)
-
-    return result_idx, LCSuff
+    return result_idx, is_complete_merge
 
 
 def lcs_alignment_merge_buffer(
@@ -322,33 +384,85 @@ def lcs_alignment_merge_buffer(
         min_lcs_length: Minimum LCS length for deduplication
         parallel_chunking: If True, remove the LCS from the buffer as well, then concatenate with data; if False, make changes only to the data
     """
-    if delay < 1 or len(buffer) == 0:
-        buffer += data
-        return buffer
+    return batched_lcs_alignment_merge_buffer(
+        [buffer],
+        [data],
+        delay,
+        model,
+        max_steps_per_timestep=max_steps_per_timestep,
+        filepaths=[filepath],
+        min_lcs_length=min_lcs_length,
+        parallel_chunking=parallel_chunking,
+    )[0]
+
+
+def batched_lcs_alignment_merge_buffer(
+    buffers,
+    data,
+    delay,
+    model,
+    max_steps_per_timestep: int = 5,
+    filepaths: Optional[list] = None,
+    min_lcs_length: int = 1,
+    parallel_chunking: bool = False,
+):
+    """
+    Batched version of `lcs_alignment_merge_buffer`, merging the new text of several independent streams
+    with their buffers. The LCS alignments of all streams are computed at once with
+    `batched_longest_common_subsequence_merge`.
+
+    Args:
+        buffers: List of the existing buffers of tokens, one per stream
+        data: List of new data to merge with every buffer
+        delay: Number of delay timesteps
+        model: The ASR model
+        max_steps_per_timestep: Maximum steps per timestep
+        filepaths: Optional list of filepaths (or None) for debugging
+        min_lcs_length: Minimum LCS length for deduplication
+        parallel_chunking: If True, remove the LCS from the buffer as well, then concatenate with data; if False, make changes only to the data
+
+    Returns:
+        List of the merged buffers
+    """
+    if filepaths is None:
+        filepaths = [None] * len(buffers)
+
+    merged = list(buffers)
+    to_align = []
+    for idx, buffer in enumerate(buffers):
+        if delay < 1 or len(buffer) == 0:
+            buffer += data[idx]
+        else:
+            to_align.append(idx)
+
+    if len(to_align) == 0:
+        return merged
 
     search_size = int(delay * max_steps_per_timestep)
-    buffer_slice = buffer[-search_size:]
+    buffer_slices = [buffers[idx][-search_size:] for idx in to_align]
 
-    lcs_idx, lcs_alignment = longest_common_subsequence_merge(buffer_slice, data, filepath=filepath)
-    i_rel, j_rel, length = lcs_idx
+    lcs_indices, _ = batched_longest_common_subsequence_merge(
+        buffer_slices, [data[idx] for idx in to_align], filepaths=[filepaths[idx] for idx in to_align]
+    )
 
-    if length < min_lcs_length:
-        return buffer + data
+    for idx, buffer_slice, (i_rel, j_rel, length) in zip(to_align, buffer_slices, lcs_indices):
+        buffer, new_data = buffers[idx], data[idx]
 
-    if parallel_chunking:
-        base = len(buffer) - len(buffer_slice)
-        i_abs_start = base + i_rel
-        i_abs_end = i_abs_start + length  # end position (exclusive) in `buffer`
-        j_after = j_rel + length  # first index after LCS in `data`
+        if length < min_lcs_length:
+            merged[idx] = buffer + new_data
+        elif parallel_chunking:
+            base = len(buffer) - len(buffer_slice)
+            i_abs_start = base + i_rel
+            i_abs_end = i_abs_start + length  # end position (exclusive) in `buffer`
+            j_after = j_rel + length  # first index after LCS in `data`
 
-        merged = buffer[:i_abs_end] + data[j_after:]
-        return merged
-    else:
-        # Slice off new data based on LCS and concatenate
-        slice_idx = j_rel + length
-        data = data[slice_idx:]
-        buffer += data
-        return buffer
+            merged[idx] = buffer[:i_abs_end] + new_data[j_after:]
+        else:
+            # Slice off new data based on LCS and concatenate
+            slice_idx = j_rel + length
+            buffer += new_data[slice_idx:]
+
+    return merged
 
 
 def inplace_buffer_merge(buffer, data, timesteps, model):
@@ -1442,14 +1556,22 @@ class LongestCommonSubsequenceBatchedFrameASRRNNT(BatchedFrameASRRNNT):
 
         self.infer_logits()
 
+        for idx in range(len(self.all_alignments)):
+            if self.frame_bufferer.signal_end_index[idx] is None:
+                raise ValueError("Signal did not end")
+
+        # Chunks are visited in order, and the LCS merges of all the streams for a given chunk are batched together
         self.unmerged = [[] for _ in range(self.batch_size)]
-        for idx, alignments in enumerate(self.all_alignments):
+        num_chunks = max((len(alignments) for alignments in self.all_alignments), default=0)
+        for a_idx in range(num_chunks):
+            lcs_streams, lcs_ids, lcs_filepaths = [], [], []
 
-            signal_end_idx = self.frame_bufferer.signal_end_index[idx]
-            if signal_end_idx is None:
-                raise ValueError("Signal did not end")
+            for idx, alignments in enumerate(self.all_alignments):
+                if a_idx >= len(alignments):
+                    continue
 
-            for a_idx, alignment in enumerate(alignments):
+                alignment = alignments[a_idx]
+                signal_end_idx = self.frame_bufferer.signal_end_index[idx]
 
                 # Middle token first chunk
                 if a_idx == 0:
@@ -1482,14 +1604,21 @@ class LongestCommonSubsequenceBatchedFrameASRRNNT(BatchedFrameASRRNNT):
                         else:
                             filepath = None
 
-                        self.unmerged[idx] = lcs_alignment_merge_buffer(
-                            self.unmerged[idx],
-                            ids,
-                            self.lcs_delay,
-                            model=self.asr_model,
-                            max_steps_per_timestep=self.max_steps_per_timestep,
-                            filepath=filepath,
-                        )
+                        lcs_streams.append(idx)
+                        lcs_ids.append(ids)
+                        lcs_filepaths.append(filepath)
+
+            if len(lcs_streams) > 0:
+                merged = batched_lcs_alignment_merge_buffer(
+                    [self.unmerged[idx] for idx in lcs_streams],
+                    lcs_ids,
+                    self.lcs_delay,
+                    model=self.asr_model,
+                    max_steps_per_timestep=self.max_steps_per_timestep,
+                    filepaths=lcs_filepaths,
+                )
+                for idx, buffer in zip(lcs_streams, merged):
+                    self.unmerged[idx] = buffer
 
         output = []
         for idx in range(self.batch_size):
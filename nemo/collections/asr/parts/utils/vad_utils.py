@@ -706,14 +706,12 @@ def prepare_gen_segment_table(sequence: torch.Tensor, per_args: dict) -> Tuple[s
 
 
 @torch.jit.script
-def generate_vad_segment_table_per_tensor(sequence: torch.Tensor, per_args: Dict[str, float]) -> torch.Tensor:
+def speech_segments_to_table(speech_segments: torch.Tensor, per_args: Dict[str, float]) -> torch.Tensor:
     """
-    See description in generate_overlap_vad_seq.
-    Use this for single instance pipeline.
+    Filter the binarized speech segments and convert them to a sorted table of [start, end, duration].
     """
     UNIT_FRAME_LEN = 0.01
 
-    speech_segments = binarization(sequence, per_args)
     speech_segments = filtering(speech_segments, per_args)
 
     if speech_segments.shape == torch.Size([0]):
@@ -727,28 +725,34 @@ def generate_vad_segment_table_per_tensor(sequence: torch.Tensor, per_args: Dict
     return speech_segments
 
 
-def generate_vad_segment_table_per_file(pred_filepath: str, per_args: dict) -> str:
+@torch.jit.script
+def generate_vad_segment_table_per_tensor(sequence: torch.Tensor, per_args: Dict[str, float]) -> torch.Tensor:
     """
-    A wrapper for generate_vad_segment_table_per_tensor
+    See description in generate_overlap_vad_seq.
+    Use this for single instance pipeline.
     """
-    sequence, name = load_tensor_from_file(pred_filepath)
-    out_dir, per_args_float = prepare_gen_segment_table(sequence, per_args)
+    speech_segments = binarization(sequence, per_args)
+    return speech_segments_to_table(speech_segments, per_args)
 
-    preds = generate_vad_segment_table_per_tensor(sequence, per_args_float)
-    ext = ".rttm" if per_args.get("use_rttm", False) else ".txt"
+
+def write_vad_segment_table(preds: torch.Tensor, name: str, out_dir: str, use_rttm: bool = False) -> str:
+    """
+    Write a table of speech segments (see generate_vad_segment_table_per_tensor) to an rttm-like file.
+    """
+    ext = ".rttm" if use_rttm else ".txt"
     save_name = name + ext
     save_path = os.path.join(out_dir, save_name)
 
     if preds.shape[0] == 0:
         with open(save_path, "w", encoding='utf-8') as fp:
-            if per_args.get("use_rttm", False):
+            if use_rttm:
                 fp.write(f"SPEAKER <NA> 1 0 0 <NA> <NA> speech <NA> <NA>\n")
             else:
                 fp.write(f"0 0 speech\n")
     else:
         with open(save_path, "w", encoding='utf-8') as fp:
             for i in preds:
-                if per_args.get("use_rttm", False):
+                if use_rttm:
                     fp.write(f"SPEAKER {name} 1 {i[0]:.4f} {i[2]:.4f} <NA> <NA> speech <NA> <NA>\n")
                 else:
                     fp.write(f"{i[0]:.4f} {i[2]:.4f} speech\n")
@@ -756,6 +760,17 @@ def generate_vad_segment_table_per_file(pred_filepath: str, per_args: dict) -> s
     return save_path
 
 
+def generate_vad_segment_table_per_file(pred_filepath: str, per_args: dict) -> str:
+    """
+    A wrapper for generate_vad_segment_table_per_tensor
+    """
+    sequence, name = load_tensor_from_file(pred_filepath)
+    out_dir, per_args_float = prepare_gen_segment_table(sequence, per_args)
+
+    preds = generate_vad_segment_table_per_tensor(sequence, per_args_float)
+    return write_vad_segment_table(preds, name, out_dir, use_rttm=per_args.get("use_rttm", False))
+
+
 def generate_vad_segment_table(
     vad_pred_dir: str,
     postprocessing_params: dict,
@@ -825,6 +840,252 @@ def generate_vad_segment_table_per_file_star(args):
     return generate_vad_segment_table_per_file(*args)
 
 
+def _flatten_vad_preds(sequences: List[torch.Tensor]) -> Tuple[torch.Tensor, torch.Tensor, torch.Tensor]:
+    """
+    Concatenate frame level predictions into a single flat tensor.
+    Returns:
+        flat (torch.Tensor): concatenated predictions.
+        lengths (torch.Tensor): length of every sequence.
+        seq_ids (torch.Tensor): index of the sequence of every element of `flat`.
+    """
+    lengths = torch.tensor([len(sequence) for sequence in sequences], dtype=torch.long)
+    if len(sequences) == 0:
+        return torch.empty(0), lengths, torch.empty(0, dtype=torch.long)
+    flat = torch.cat([sequence.detach().float().reshape(-1).cpu() for sequence in sequences])
+    seq_ids = torch.repeat_interleave(torch.arange(len(sequences)), lengths)
+    return flat, lengths, seq_ids
+
+
+def _exclusive_cumsum(lengths: torch.Tensor) -> torch.Tensor:
+    """
+    Offsets of the sequences with the given lengths in a flat tensor.
+    """
+    return torch.cumsum(lengths, 0) - lengths
+
+
+def _forward_fill_index(is_valid: torch.Tensor) -> torch.Tensor:
+    """
+    For every position, the index of the last position (up to and including itself) where `is_valid` is True.
+    """
+    index = torch.where(is_valid, torch.arange(len(is_valid)), torch.full_like(is_valid, -1, dtype=torch.long))
+    return torch.cummax(index, 0).values
+
+
+def _nanmedian_rows(values: torch.Tensor) -> torch.Tensor:
+    """
+    Row-wise torch.nanquantile(q=0.5) with linear interpolation, without the input size limitation of torch.quantile.
+    """
+    sorted_values, _ = torch.sort(values, dim=1)  # NaN are sorted to the end
+    count = (~torch.isnan(values)).sum(dim=1)
+    ranks = 0.5 * (count - 1).to(values.dtype)
+    ranks_below = ranks.floor().long().clamp(min=0)
+    ranks_above = ranks.ceil().long().clamp(min=0)
+    values_below = sorted_values.gather(1, ranks_below.unsqueeze(1)).squeeze(1)
+    values_above = sorted_values.gather(1, ranks_above.unsqueeze(1)).squeeze(1)
+    median = torch.lerp(values_below, values_above, ranks - ranks.floor())
+    median[count == 0] = float('nan')
+    return median
+
+
+def _overlap_vad_seq_batch(
+    frames: List[torch.Tensor], smoothing_method: str, shift: int, seg: int, jump_on_frame: int
+) -> List[torch.Tensor]:
+    """
+    Overlap smoothing of a batch of frame level predictions, see generate_overlap_vad_seq_per_tensor.
+    """
+    flat, lengths, _ = _flatten_vad_preds(frames)
+    target_lengths = lengths * shift
+    target_offsets = _exclusive_cumsum(target_lengths)
+
+    # Input windows start at every `jump_on_frame`-th frame of every sequence
+    num_windows = (lengths + jump_on_frame - 1) // jump_on_frame
+    window_seq = torch.repeat_interleave(torch.arange(len(frames)), num_windows)
+    window_idx = torch.arange(len(window_seq)) - torch.repeat_interleave(_exclusive_cumsum(num_windows), num_windows)
+    window_preds = flat[_exclusive_cumsum(lengths)[window_seq] + window_idx * jump_on_frame]
+
+    # Every window spans `seg` units of the target sequence
+    positions = (window_idx * jump_on_frame * shift).unsqueeze(1) + torch.arange(seg).unsqueeze(0)
+    valid = positions < target_lengths[window_seq].unsqueeze(1)
+    target_positions = (target_offsets[window_seq].unsqueeze(1) + positions)[valid]
+    values = window_preds.unsqueeze(1).expand(-1, seg)[valid]
+    total_len = int(target_lengths.sum())
+
+    if smoothing_method == 'mean':
+        preds = torch.zeros(total_len).index_add_(0, target_positions, values)
+        pred_count = torch.zeros(total_len).index_add_(0, target_positions, torch.ones_like(values))
+        preds = preds / pred_count
+        is_valid = pred_count != 0
+    else:
+        # Consecutive windows covering a position are at most `max_windows` apart,
+        # so the window index modulo `max_windows` is a unique column for every position
+        max_windows = math.ceil(seg / (jump_on_frame * shift))
+        columns = (window_idx % max_windows).unsqueeze(1).expand(-1, seg)[valid]
+        window_values = torch.full([total_len, max_windows], float('nan'))
+        window_values[target_positions, columns] = values
+        preds = _nanmedian_rows(window_values)
+        is_valid = ~torch.isnan(preds)
+
+    # Fill the tail of every sequence, which is not covered by any window, with its last prediction
+    preds = preds[_forward_fill_index(is_valid)]
+    return list(torch.split(preds, target_lengths.tolist()))
+
+
+def generate_overlap_vad_seq_from_tensors(
+    frame_preds: Dict[str, torch.Tensor],
+    smoothing_method: str,
+    overlap: float,
+    window_length_in_sec: float,
+    shift_length_in_sec: float,
+    frame_len: float = 0.01,
+    batch_size: int = 256,
+) -> Dict[str, torch.Tensor]:
+    """
+    In-memory version of generate_overlap_vad_seq, which does not read nor write any prediction files.
+    The sequences are smoothed in batches of `batch_size`, all the windows of a batch are processed at once.
+    Args:
+        frame_preds (Dict[str, torch.Tensor]): frame level predictions keyed by name,
+            e.g. from generate_vad_frame_pred_tensors.
+        smoothing_method (str): median or mean smoothing filter.
+        overlap (float): amounts of overlap of adjacent windows.
+        window_length_in_sec (float): length of window for generating the frame.
+        shift_length_in_sec (float): amount of shift of window for generating the frame.
+        frame_len (float): length of the generated frames.
+        batch_size (int): number of sequences to process at once.
+    Returns:
+        overlap_preds (Dict[str, torch.Tensor]): smoothed predictions keyed by name.
+    """
+    if smoothing_method not in ('mean', 'median'):
+        raise ValueError("smoothing_method should be either mean or median")
+
+    shift = int(shift_length_in_sec / frame_len)  # number of units of shift
+    seg = int((window_length_in_sec / frame_len + 1))  # number of units of each window/segment
+
+    jump_on_target = int(seg * (1 - overlap))  # jump on target generated sequence
+    jump_on_frame = int(jump_on_target / shift)  # jump on input frame sequence
+
+    if jump_on_frame < 1:
+        raise ValueError(
+            f"Your input makes jump_on_frame={jump_on_frame} < 1 which is invalid because it cannot jump and will "
+            f"stuck. Please try different window_length_in_sec, shift_length_in_sec and overlap choices."
+        )
+
+    names = list(frame_preds.keys())
+    overlap_preds = {}
+    for start in range(0, len(names), batch_size):
+        batch_names = names[start : start + batch_size]
+        batch_preds = _overlap_vad_seq_batch(
+            [frame_preds[name] for name in batch_names], smoothing_method, shift, seg, jump_on_frame
+        )
+        overlap_preds.update(zip(batch_names, batch_preds))
+    return overlap_preds
+
+
+def _binarization_batch(sequences: List[torch.Tensor], per_args: List[Dict[str, float]]) -> List[torch.Tensor]:
+    """
+    Batched version of binarization, where every sequence has its own parameters.
+
+    With onset >= offset, every frame above the onset threshold switches to speech and every frame below
+    the offset threshold switches to non-speech, all the other frames keep the previous state.
+    The state of every frame is therefore the one of the last switching frame, which is found without a loop.
+    The switching frames are ambiguous if onset < offset, such sequences are binarized sequentially.
+    """
+
+    def get_args(key: str, default: float) -> torch.Tensor:
+        return torch.tensor([args.get(key, default) for args in per_args], dtype=torch.float64)
+
+    onsets = get_args('onset', 0.5)
+    offsets = get_args('offset', 0.5)
+    speech_segments = [None] * len(sequences)
+    batched = (onsets >= offsets).nonzero().squeeze(1)
+    for idx in (onsets < offsets).nonzero().squeeze(1).tolist():
+        speech_segments[idx] = binarization(sequences[idx].float(), per_args[idx])
+
+    flat, lengths, seq_ids = _flatten_vad_preds([sequences[idx] for idx in batched.tolist()])
+    seq_offsets = _exclusive_cumsum(lengths)
+    frame_idx = torch.arange(len(flat)) - seq_offsets[seq_ids]
+    is_first = frame_idx == 0
+    is_last = frame_idx == (lengths - 1)[seq_ids]
+
+    # compare in the dtype of the predictions, as binarization does
+    is_onset = flat > onsets[batched].to(flat.dtype)[seq_ids]
+    is_offset = flat < offsets[batched].to(flat.dtype)[seq_ids]
+    # every sequence starts as non-speech, so its first frame always decides the state
+    speech = is_onset[_forward_fill_index(is_onset | is_offset | is_first)]
+    prev_speech = torch.roll(speech, 1) & ~is_first
+
+    start_idx = (speech & ~prev_speech).nonzero().squeeze(1)
+    # a speech segment ends at the first non-speech frame or at the last frame of the sequence
+    end_idx = ((~speech & prev_speech) | (speech & is_last)).nonzero().squeeze(1)
+    is_final = speech[end_idx]
+
+    segment_seq_ids = seq_ids[start_idx]
+    frame_lengths = get_args('frame_length_in_sec', 0.01)[batched][segment_seq_ids]
+    start = frame_idx[start_idx].double() * frame_lengths
+    end = frame_idx[end_idx].double() * frame_lengths + get_args('pad_offset', 0.0)[batched][segment_seq_ids]
+    start = torch.clamp(start - get_args('pad_onset', 0.0)[batched][segment_seq_ids], min=0)
+    keep = is_final | (end > start)
+
+    segments = torch.stack((start[keep], end[keep]), dim=1).float()
+    counts = torch.bincount(segment_seq_ids[keep], minlength=len(batched)).tolist()
+    for idx, seq_segments in zip(batched.tolist(), torch.split(segments, counts)):
+        if seq_segments.shape[0] == 0:
+            speech_segments[idx] = torch.empty(0)
+        else:
+            # Merge the overlapped speech segments due to padding
+            speech_segments[idx] = merge_overlap_segment(seq_segments)
+    return speech_segments
+
+
+def generate_vad_segment_table_from_tensors(
+    vad_preds: Dict[str, torch.Tensor],
+    postprocessing_params: dict,
+    frame_length_in_sec: float,
+    out_dir: Optional[str] = None,
+    use_rttm: bool = False,
+    batch_size: int = 256,
+) -> Dict[str, torch.Tensor]:
+    """
+    In-memory version of generate_vad_segment_table, which does not read any prediction files.
+    Binarization is done in batches of `batch_size` sequences, and only the final tables are written
+    (if out_dir is given).
+    Args:
+        vad_preds (Dict[str, torch.Tensor]): frame level or smoothed predictions keyed by name,
+            e.g. from generate_vad_frame_pred_tensors or generate_overlap_vad_seq_from_tensors.
+        postprocessing_params (dict): dictionary of thresholds for prediction score.
+        See details in binarization and filtering.
+        frame_length_in_sec (float): frame length.
+        out_dir (str): optional output dir of generated table/csv files.
+        use_rttm (bool): whether to write the tables in rttm format.
+        batch_size (int): number of sequences to process at once.
+    Returns:
+        segment_tables (Dict[str, torch.Tensor]): tables of [start, end, duration] speech segments keyed by name.
+    """
+    per_args = {"frame_length_in_sec": frame_length_in_sec, **postprocessing_params}
+
+    if out_dir and not os.path.exists(out_dir):
+        os.mkdir(out_dir)
+
+    names = list(vad_preds.keys())
+    segment_tables = {}
+    for start in range(0, len(names), batch_size):
+        batch_names = names[start : start + batch_size]
+        sequences = [vad_preds[name] for name in batch_names]
+
+        # calculate onset offset of every sequence based on scale selection
+        batch_per_args = []
+        for sequence in sequences:
+            _, per_args_float = prepare_gen_segment_table(sequence, dict(per_args))
+            batch_per_args.append(per_args_float)
+        speech_segments = _binarization_batch(sequences, batch_per_args)
+        for idx, (name, segments) in enumerate(zip(batch_names, speech_segments)):
+            table = speech_segments_to_table(segments, batch_per_args[idx])
+            if out_dir:
+                write_vad_segment_table(table, name, out_dir, use_rttm=use_rttm)
+            segment_tables[name] = table
+
+    return segment_tables
+
+
 def vad_construct_pyannote_object_per_file(
     vad_table_filepath: str, groundtruth_RTTM_file: str
 ) -> Tuple[Annotation, Annotation]:
@@ -964,6 +1225,191 @@ def vad_tune_threshold_on_dev(
     return best_threshold, optimal_scores
 
 
+def _vad_tune_score_per_file(
+    pred_filepath: str,
+    groundtruth_RTTM_file: str,
+    params_grid: List[dict],
+    frame_length_in_sec: float,
+    max_frames_per_batch: int = 2**24,
+) -> Tuple[np.ndarray, np.ndarray, int]:
+    """
+    Frame level false alarm and miss of the predictions of a single file for every parameter of the grid.
+    The distinct binarization parameters are processed in chunks of at most `max_frames_per_batch` frames.
+    Returns:
+        false_alarm (np.ndarray): number of false alarm frames for every parameter.
+        miss (np.ndarray): number of missed frames for every parameter.
+        total (int): number of speech frames of the reference.
+    """
+    sequence, _ = load_tensor_from_file(pred_filepath)
+    num_frames = len(sequence)
+
+    segments = load_speech_segments_from_rttm(groundtruth_RTTM_file)
+    if segments:
+        labels = get_frame_labels(segments, frame_length_in_sec, 0.0, num_frames * frame_length_in_sec, as_str=False)
+        labels = align_labels_to_frames(probs=sequence.tolist(), labels=labels)
+    else:
+        labels = [0] * num_frames
+    # cumulative number of reference speech frames, for counting the speech frames of any span at once
+    labels_cumsum = torch.nn.functional.pad(torch.cumsum(torch.tensor(labels, dtype=torch.long), 0), [1, 0])
+    times = torch.arange(num_frames, dtype=torch.float64) * frame_length_in_sec
+
+    # compute the range of the thresholds once, as prepare_gen_segment_table would for every parameter
+    scale_range = {}
+    grid_per_args = []
+    for param in params_grid:
+        scale = param.get('scale', 'absolute')
+        if scale not in scale_range:
+            scale_range[scale] = cal_vad_onset_offset(scale, 0.0, 1.0, sequence)
+        mini, maxi = scale_range[scale]
+
+        per_args = {"frame_length_in_sec": frame_length_in_sec, **param}
+        per_args['onset'] = mini + per_args.get('onset', 0.5) * (maxi - mini)
+        per_args['offset'] = mini + per_args.get('offset', 0.5) * (maxi - mini)
+        if 'filter_speech_first' in per_args:
+            per_args['filter_speech_first'] = 1.0 if per_args['filter_speech_first'] else 0.0
+        grid_per_args.append({k: float(v) for k, v in per_args.items() if isinstance(v, (int, float))})
+
+    # binarize once for every distinct set of binarization parameters
+    binarization_keys = ('onset', 'offset', 'pad_onset', 'pad_offset')
+    binarization_idx = {}
+    for per_args in grid_per_args:
+        binarization_idx.setdefault(tuple(per_args.get(key) for key in binarization_keys), per_args)
+    # the batch holds a copy of the sequence per parameter, so bound the number of frames binarized at once
+    chunk_size = max(1, max_frames_per_batch // max(num_frames, 1))
+    param_keys = list(binarization_idx.keys())
+    binarized = {}
+    for start in range(0, len(param_keys), chunk_size):
+        chunk_keys = param_keys[start : start + chunk_size]
+        chunk_segments = _binarization_batch(
+            [sequence] * len(chunk_keys), [binarization_idx[key] for key in chunk_keys]
+        )
+        binarized.update(zip(chunk_keys, chunk_segments))
+
+    false_alarm = np.zeros(len(params_grid), dtype=np.int64)
+    miss = np.zeros(len(params_grid), dtype=np.int64)
+    total = int(labels_cumsum[-1])
+    for i, per_args in enumerate(grid_per_args):
+        speech_segments = filtering(binarized[tuple(per_args.get(key) for key in binarization_keys)], per_args)
+        if speech_segments.shape[0] == 0 or num_frames == 0:
+            miss[i] = total
+            continue
+
+        # frames inside of the [start, end] speech segments, as in get_frame_labels
+        speech_segments = speech_segments.double()
+        first = torch.searchsorted(times, speech_segments[:, 0])
+        last = torch.searchsorted(times, speech_segments[:, 1], right=True)
+        hyp = int((last - first).clamp(min=0).sum())
+        hit = int((labels_cumsum[last] - labels_cumsum[torch.minimum(first, last)]).sum())
+        false_alarm[i] = hyp - hit
+        miss[i] = total - hit
+
+    return false_alarm, miss, total
+
+
+def _vad_tune_score_per_file_star(args):
+    """
+    A workaround for tqdm with starmap of multiprocessing
+    """
+    return _vad_tune_score_per_file(*args)
+
+
+def vad_tune_threshold_on_dev_frame_level(
+    params: dict,
+    vad_pred: str,
+    groundtruth_RTTM: str,
+    result_file: str = "res",
+    vad_pred_method: str = "frame",
+    focus_metric: str = "DetER",
+    frame_length_in_sec: float = 0.01,
+    num_workers: int = 20,
+    max_frames_per_batch: int = 2**24,
+) -> Tuple[dict, dict]:
+    """
+    Faster alternative to vad_tune_threshold_on_dev, which scores the detection error on frame level labels
+    instead of writing segment tables and scoring them with pyannote for every parameter of the grid.
+
+    The predictions and ground-truth labels of every file are loaded once, the binarization of all the
+    distinct onset/offset/pad thresholds of the grid is batched, and the files are processed in parallel.
+    The detection error rate, false alarm and miss are computed as the number of wrongly classified frames,
+    so they can slightly differ from the pyannote ones computed on continuous segments.
+
+    Args:
+        params (dict): dictionary of parameters to be tuned on.
+        vad_pred_method (str): suffix of prediction file. Use to locate file.
+                               Should be either in "frame", "mean" or "median".
+        groundtruth_RTTM_dir (str): Directory of ground-truth rttm files or a file contains the paths of them.
+        focus_metric (str): Metrics we care most when tuning threshold. Should be either in "DetER", "FA", "MISS"
+        frame_length_in_sec (float): Frame length.
+        num_workers (int): Number of workers.
+        max_frames_per_batch (int): Maximum number of frames binarized at once by every worker,
+            which bounds the memory used for long files and large grids.
+    Returns:
+        best_threshold (float): Threshold that gives lowest DetER.
+    """
+    if focus_metric not in ("DetER", "FA", "MISS"):
+        raise ValueError("Metric we care most should be only in 'DetER', 'FA' or 'MISS'!")
+    try:
+        check_if_param_valid(params)
+    except:
+        raise ValueError("Please check if the parameters are valid")
+
+    paired_filenames, groundtruth_RTTM_dict, vad_pred_dict = pred_rttm_map(vad_pred, groundtruth_RTTM, vad_pred_method)
+    params_grid = get_parameter_grid(params)
+    for param in params_grid:
+        for i in param:
+            if type(param[i]) == np.float64 or type(param[i]) == np.int64:
+                param[i] = float(param[i])
+
+    inputs = [
+        (
+            vad_pred_dict[filename],
+            groundtruth_RTTM_dict[filename],
+            params_grid,
+            frame_length_in_sec,
+            max_frames_per_batch,
+        )
+        for filename in sorted(paired_filenames)
+    ]
+    false_alarm = np.zeros(len(params_grid), dtype=np.int64)
+    miss = np.zeros(len(params_grid), dtype=np.int64)
+    total = 0
+    if num_workers is not None and num_workers > 1:
+        with multiprocessing.Pool(processes=num_workers) as p:
+            results = p.imap(_vad_tune_score_per_file_star, inputs)
+            for file_false_alarm, file_miss, file_total in tqdm(results, total=len(inputs), desc='tuning'):
+                false_alarm += file_false_alarm
+                miss += file_miss
+                total += file_total
+    else:
+        for file_inputs in tqdm(inputs, desc='tuning'):
+            file_false_alarm, file_miss, file_total = _vad_tune_score_per_file(*file_inputs)
+            false_alarm += file_false_alarm
+            miss += file_miss
+            total += file_total
+
+    min_score = 100
+    all_perf = {}
+    best_threshold, optimal_scores = None, None
+    with open(result_file + ".txt", "a", encoding='utf-8') as fp:
+        for i, param in enumerate(params_grid):
+            FA = 100.0 * float(false_alarm[i]) / total if total > 0 else 0.0
+            MISS = 100.0 * float(miss[i]) / total if total > 0 else 0.0
+            all_perf[str(param)] = {'DetER (%)': FA + MISS, 'FA (%)': FA, 'MISS (%)': MISS}
+            logging.info(f"parameter {param}, {all_perf[str(param)] }")
+
+            # save results for analysis
+            fp.write(f"{param}, {all_perf[str(param)] }\n")
+
+            score = all_perf[str(param)][focus_metric + ' (%)']
+            if score < min_score:
+                best_threshold = param
+                optimal_scores = all_perf[str(param)]
+                min_score = score
+
+    logging.info(f"Best parameter {best_threshold}, {optimal_scores}")
+    return best_threshold, optimal_scores
+
+
 def check_if_param_valid(params: dict) -> bool:
     """
     Check if the parameters are valid.
@@ -1158,16 +1604,16 @@ def extract_labels(path2ground_truth_label: str, time: list) -> list:
     return labels
 
 
-def generate_vad_frame_pred(
+def _vad_frame_pred_iter(
     vad_model,
     window_length_in_sec: float,
     shift_length_in_sec: float,
     manifest_vad_input: str,
-    out_dir: str,
     use_feat: bool = False,
-) -> str:
+):
     """
-    Generate VAD frame level prediction and write to out_dir
+    Run VAD inference on the test dataloader of the model and yield the name of the audio file
+    and the frame level predictions of every segment.
     """
     time_unit = int(window_length_in_sec / shift_length_in_sec)
     trunc = int(time_unit / 2)
@@ -1206,20 +1652,60 @@ def generate_vad_frame_pred(
             else:
                 to_save = pred
 
-            to_save = to_save.cpu().tolist()
-            all_len += len(to_save)
-            outpath = os.path.join(out_dir, data[i] + ".frame")
-            with open(outpath, "a", encoding='utf-8') as fout:
-                for f in range(len(to_save)):
-                    fout.write('{0:0.4f}\n'.format(to_save[f]))
-
         del test_batch
+        all_len += len(to_save)
+        yield data[i], to_save
+
         if status[i] == 'end' or status[i] == 'single':
             logging.debug(f"Overall length of prediction of {data[i]} is {all_len}!")
             all_len = 0
+
+
+def generate_vad_frame_pred(
+    vad_model,
+    window_length_in_sec: float,
+    shift_length_in_sec: float,
+    manifest_vad_input: str,
+    out_dir: str,
+    use_feat: bool = False,
+) -> str:
+    """
+    Generate VAD frame level prediction and write to out_dir
+    """
+    for name, to_save in _vad_frame_pred_iter(
+        vad_model, window_length_in_sec, shift_length_in_sec, manifest_vad_input, use_feat=use_feat
+    ):
+        to_save = to_save.cpu().tolist()
+        outpath = os.path.join(out_dir, name + ".frame")
+        with open(outpath, "a", encoding='utf-8') as fout:
+            for f in range(len(to_save)):
+                fout.write('{0:0.4f}\n'.format(to_save[f]))
+
     return out_dir
 
 
+def generate_vad_frame_pred_tensors(
+    vad_model,
+    window_length_in_sec: float,
+    shift_length_in_sec: float,
+    manifest_vad_input: str,
+    use_feat: bool = False,
+) -> Dict[str, torch.Tensor]:
+    """
+    Generate VAD frame level prediction and keep it in memory instead of writing `.frame` files.
+    The result can be passed to generate_overlap_vad_seq_from_tensors and generate_vad_segment_table_from_tensors.
+    Returns:
+        frame_preds (Dict[str, torch.Tensor]): frame level predictions of every audio file, keyed by file name.
+    """
+    frame_preds = {}
+    for name, to_save in _vad_frame_pred_iter(
+        vad_model, window_length_in_sec, shift_length_in_sec, manifest_vad_input, use_feat=use_feat
+    ):
+        frame_preds.setdefault(name, []).append(to_save.detach().float().cpu())
+
+    return {name: torch.cat(preds) for name, preds in frame_preds.items()}
+
+
 def init_vad_model(model_path: str):
     """
     Initiate VAD model with model path
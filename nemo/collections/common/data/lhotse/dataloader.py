@@ -211,6 +211,10 @@ class LhotseDataLoadingConfig:
     # The first K examples will actually be read and then discarded, incurring the IO cost, due to
     # our support of object stores and gzipped files that generally don't have indexes of byte offsets per line.
     slice_length: Optional[int] = None
+    # Read the members of every NeMo tarred shard in a random order.
+    # Requires the sidecar offset indices of the shards (``audio_0.tar.idx``),
+    # the members of shards without an index are read in the tar order.
+    shuffle_within_shard: bool = False
 
 
 def determine_use_iterable_dataset(use_iterable_dataset: bool, config: DictConfig) -> bool:
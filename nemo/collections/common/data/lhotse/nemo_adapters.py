@@ -30,9 +30,11 @@ from lhotse.lazy import LazyIteratorChain, LazyJsonlIterator
 from lhotse.serialization import open_best
 from lhotse.utils import compute_num_samples, ifnone
 
+from nemo.collections.common.data.tar_index import IndexedTarFile, load_tar_index
 from nemo.collections.common.parts.preprocessing.manifest import get_full_path
 from nemo.utils import logging
 from nemo.utils.data_utils import is_datastore_path
+from nemo.utils.nemo_logging import LogMode
 
 
 class LazyNeMoIterator:
@@ -236,6 +238,18 @@ class LazyNeMoTarredIterator:
     This will still read the tar files sequentially (very fast) and discard the audio files that
     are not present in the corresponding manifest.
 
+    When a local tar file has a sidecar offset index (``audio_0.tar.idx``, see
+    ``nemo.collections.common.data.tar_index``), the members are read by seeking to their offsets instead:
+    recordings that are missing from the manifest or marked with ``_skipme``, as well as the recordings
+    skipped by ``slice_length``, are not read at all.
+    Indexed shards also support ``shuffle_within_shard``, which reads the members of every shard in a random
+    order (the members of shards without an index are read in the tar order).
+
+    The iteration can be resumed exactly where it stopped, at the granularity of a single cut, with
+    ``state_dict`` and ``load_state_dict``. The shards before the saved position are not opened (their manifests
+    are read only with ``slice_length`` or ``shuffle_within_shard``, to replay their random draws), and the members
+    before it are not read from indexed shards (they are streamed through in shards without an index).
+
     The ``shard_seed`` argument is used to seed the RNG shuffling the shards.
     By default, it's ``trng`` which samples a seed number from OS-provided TRNG (see Python ``secrets`` module).
     Seed is resolved lazily so that every dataloading worker may sample a different one.
@@ -285,6 +299,7 @@ class LazyNeMoTarredIterator:
         skip_missing_manifest_entries: bool = False,
         extra_fields: list[dict[str, str]] | None = None,
         slice_length: int = None,
+        shuffle_within_shard: bool = False,
     ) -> None:
         self.skip_missing_manifest_entries = skip_missing_manifest_entries
         self.shard_id_to_manifest: dict[int, Iterable[dict]]
@@ -329,7 +344,13 @@ class LazyNeMoTarredIterator:
         self.lang_field = lang_field
         self.extra_fields = extra_fields
         self.slice_length = slice_length
+        self.shuffle_within_shard = shuffle_within_shard
         self.epoch = 0
+        # position of the next cut: (index in the shard order, index in the member order of the shard, index of
+        # the cut among the cuts of the member), the seed of the current iteration, and the state to resume from
+        self._position = (0, 0, 0)
+        self._seed = None
+        self._resume_state = None
         self._validate()
 
     def to_shards(self) -> List["LazyNeMoTarredIterator"]:
@@ -347,6 +368,7 @@ class LazyNeMoTarredIterator:
                     shard_seed=self.shard_seed,
                     text_field=self.text_field,
                     lang_field=self.lang_field,
+                    shuffle_within_shard=self.shuffle_within_shard,
                 )
                 for path, tarpath in zip(self.paths, self.shard_id_to_tar_path.values())
             ]
@@ -370,14 +392,50 @@ class LazyNeMoTarredIterator:
     def shard_ids(self) -> List[int]:
         return sorted(self.shard_id_to_manifest.keys())
 
-    def _iter_sequential(
-        self, tar_path, shard_manifest, manifest_path, rng
-    ) -> Generator[tuple[dict, bytes], None, None]:
+    def state_dict(self) -> dict:
+        """
+        Returns the position of the iteration, which can be restored with ``load_state_dict``:
+        the epoch and its resolved seed, the index of the current shard in the (shuffled) shard order, the index
+        of the current member in the (shuffled) member order of the shard, and the number of cuts of that member
+        already yielded.
+        """
+        shard_position, member_position, cut_position = self._position
+        return {
+            "epoch": self.epoch,
+            "seed": self._seed,
+            "shard_position": shard_position,
+            "member_position": member_position,
+            "cut_position": cut_position,
+        }
+
+    def load_state_dict(self, state_dict: dict) -> None:
+        """
+        Restores the position returned by ``state_dict``; the next iteration resumes from the cut following
+        the last one yielded before the state was saved. Extra fields of type ``text_iter`` are not resumed.
+        """
+        self.epoch = state_dict["epoch"]
+        position = (state_dict["shard_position"], state_dict["member_position"], state_dict["cut_position"])
+        self._resume_state = (state_dict["seed"], position)
+
+    def _draw_member_order(self, rng, shard_manifest, tar_index) -> tuple[int, list[str] | None]:
+        """
+        Draws the random slice offset of a shard and, for indexed shards, the order of its members.
+        """
         slice_offset = (
             rng.randint(0, len(shard_manifest) - self.slice_length)
             if self.slice_length is not None and self.slice_length < len(shard_manifest)
             else -1
         )
+        names = None
+        if tar_index is not None:
+            names = list(tar_index)
+            if self.shuffle_within_shard:
+                rng.shuffle(names)
+        return slice_offset, names
+
+    def _iter_sequential(
+        self, tar_path, shard_manifest, manifest_path, slice_offset, start_position=0
+    ) -> Generator[tuple[int, dict, bytes, tarfile.TarInfo], None, None]:
         cntr = 0
         with tarfile.open(fileobj=open_best(tar_path, mode="rb"), mode="r|*") as tar:
             for idx, tar_info in enumerate(tar):
@@ -385,10 +443,15 @@ class LazyNeMoTarredIterator:
                     continue
                 elif cntr == self.slice_length:
                     break
+                if idx < start_position:
+                    # yielded before the iteration was resumed; the data is skipped without being extracted
+                    if tar_info.name in shard_manifest:
+                        cntr += 1
+                    continue
                 try:
                     data = shard_manifest[tar_info.name]
                     raw_audio = tar.extractfile(tar_info).read()
-                    yield data, raw_audio, tar_info
+                    yield idx, data, raw_audio, tar_info
                     cntr += 1
                 except KeyError as e:
                     if self.skip_missing_manifest_entries:
@@ -399,10 +462,44 @@ class LazyNeMoTarredIterator:
                             f"Cannot locate JSON entry for tar file '{tar_info.name}'"
                         ) from e
 
+    def _iter_indexed(
+        self, tar_path, tar_index, names, shard_manifest, manifest_path, slice_offset, start_position=0
+    ) -> Generator[tuple[int, dict, bytes, tarfile.TarInfo], None, None]:
+        """
+        Same as ``_iter_sequential``, but uses the offset index of the tar file to seek directly to the members,
+        which are visited in the order of ``names``. Members before the slice offset or the resumed position,
+        and members whose manifest entries are all skipped are not read at all.
+        """
+        cntr = 0
+        with IndexedTarFile(tar_path, index=tar_index) as tar:
+            for position in range(max(slice_offset, 0), len(names)):
+                name = names[position]
+                if cntr == self.slice_length:
+                    break
+                if name not in shard_manifest:
+                    if self.skip_missing_manifest_entries:
+                        continue
+                    raise RuntimeError(
+                        f"Mismatched entry between JSON manifest ('{manifest_path}') and tar file ('{tar_path}'). "
+                        f"Cannot locate JSON entry for tar file '{name}'"
+                    )
+                cntr += 1
+                if position < start_position or all(data.get("_skipme", False) for data in shard_manifest[name]):
+                    continue
+                tar_info = tarfile.TarInfo(name)
+                tar_info.size = tar_index[name][1]
+                yield position, shard_manifest[name], tar.read(name), tar_info
+
     def __iter__(self) -> Generator[Cut, None, None]:
         shard_ids = self.shard_ids
 
-        seed = self._get_seed()
+        if self._resume_state is not None and self._resume_state[0] is not None:
+            seed, (start_shard, start_member, start_cut) = self._resume_state
+        else:
+            seed, (start_shard, start_member, start_cut) = self._get_seed(), (0, 0, 0)
+        self._resume_state = None
+        self._seed = seed
+        self._position = (start_shard, start_member, start_cut)
         rng = random.Random(seed)
         if self.shuffle_shards:
             rng.shuffle(shard_ids)
@@ -414,7 +511,7 @@ class LazyNeMoTarredIterator:
         # They have multiple JSONL entries where audio paths end with '-sub1', '-sub2', etc. for each offset.
         offset_pattern = re.compile(r'^(?P<stem>.+)(?P<sub>-sub\d+)(?P<ext>\.\w+)?$')
 
-        for sid in shard_ids:
+        for shard_position, sid in enumerate(shard_ids):
             manifest_path = self.paths[sid] if len(self.paths) > 1 else self.paths[0]
 
             def basename(d: dict) -> str:
@@ -424,10 +521,34 @@ class LazyNeMoTarredIterator:
                     else k
                 )
 
-            shard_manifest: dict[str, list[dict]] = groupby(basename, self.shard_id_to_manifest[sid])
             tar_path = self.shard_id_to_tar_path[sid]
+            if shard_position < start_shard:
+                # The shard was read before the iteration was resumed. Its random draws are replayed,
+                # so that the following shards are read in the same order as in the original iteration.
+                if self.slice_length is not None or self.shuffle_within_shard:
+                    shard_manifest = groupby(basename, self.shard_id_to_manifest[sid])
+                    self._draw_member_order(rng, shard_manifest, load_tar_index(tar_path))
+                continue
+            start_position = start_member if shard_position == start_shard else 0
+
+            shard_manifest: dict[str, list[dict]] = groupby(basename, self.shard_id_to_manifest[sid])
+            tar_index = load_tar_index(tar_path)
+            slice_offset, names = self._draw_member_order(rng, shard_manifest, tar_index)
+            if tar_index is not None:
+                tar_iter = self._iter_indexed(
+                    tar_path, tar_index, names, shard_manifest, manifest_path, slice_offset, start_position
+                )
+            else:
+                if self.shuffle_within_shard:
+                    logging.warning(
+                        "shuffle_within_shard requires a sidecar offset index (see "
+                        "scripts/speech_recognition/create_tarred_dataset_offset_index.py): the members of the shards "
+                        "without an index are read in the tar order.",
+                        mode=LogMode.ONCE,
+                    )
+                tar_iter = self._iter_sequential(tar_path, shard_manifest, manifest_path, slice_offset, start_position)
             try:
-                for data, raw_audio, tar_info in self._iter_sequential(tar_path, shard_manifest, manifest_path, rng):
+                for member_position, data, raw_audio, tar_info in tar_iter:
                     try:
                         meta = soundfile.info(BytesIO(raw_audio))
                     except Exception:
@@ -467,13 +588,18 @@ class LazyNeMoTarredIterator:
                         cuts_for_recording.append(cut)
                     del recording  # free the memory - helps with very large audio files
                     del raw_audio
-                    yield from cuts_for_recording
+                    first_cut = start_cut if (shard_position, member_position) == (start_shard, start_member) else 0
+                    for cut_position in range(first_cut, len(cuts_for_recording)):
+                        self._position = (shard_position, member_position, cut_position + 1)
+                        yield cuts_for_recording[cut_position]
             except tarfile.ReadError:
                 logging.warning(
                     f"Skipping tar file due to read errors (unstable storage or bad file?): {tar_path=}",
                 )
+            self._position = (shard_position + 1, 0, 0)
 
         self.epoch += 1
+        self._position = (0, 0, 0)
 
     def __len__(self) -> int:
         return len(self.source)
@@ -0,0 +1,181 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Sidecar offset indices for uncompressed tar shards (e.g. NeMo tarred audio datasets).
+
+The index of ``audio_0.tar`` is stored next to it as ``audio_0.tar.idx``. It is a small text file with one line
+per regular member, in the order of the members in the tar file::
+
+    <member name>\\t<byte offset of the member data>\\t<member size in bytes>
+
+It allows reading any member with a single seek, without streaming through the whole shard.
+"""
+
+import os
+import tarfile
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from nemo.utils import logging
+
+TAR_INDEX_SUFFIX = ".idx"
+
+TarIndex = Dict[str, Tuple[int, int]]
+
+
+def get_tar_index_path(tar_path: str) -> str:
+    """Returns the path of the sidecar index of ``tar_path``."""
+    return f"{tar_path}{TAR_INDEX_SUFFIX}"
+
+
+def tar_index_from_members(members: Iterable[tarfile.TarInfo]) -> TarIndex:
+    """
+    Builds the offset index from the members of a tar file opened for reading.
+    Note that the members of a tar file opened for writing do not have their data offsets set.
+
+    Args:
+        members: Members read from an uncompressed tar file.
+
+    Returns:
+        Mapping from member name to a tuple of (data offset, size), in the order of the members.
+    """
+    return {member.name: (member.offset_data, member.size) for member in members if member.isfile()}
+
+
+def build_tar_index(tar_path: str) -> TarIndex:
+    """
+    Builds the offset index of an existing uncompressed tar file by streaming through its headers.
+
+    Args:
+        tar_path: Path to the tar file.
+
+    Returns:
+        Mapping from member name to a tuple of (data offset, size), in the order of the members.
+    """
+    with tarfile.open(tar_path, mode="r:") as tar:
+        return tar_index_from_members(tar)
+
+
+def write_tar_index(index: TarIndex, index_path: str) -> None:
+    """
+    Writes the offset index to ``index_path``. The file is written atomically so that concurrent readers
+    never observe a partial index.
+    """
+    tmp_path = f"{index_path}.tmp{os.getpid()}"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        for name, (offset, size) in index.items():
+            f.write(f"{name}\t{offset}\t{size}\n")
+    os.replace(tmp_path, index_path)
+
+
+def read_tar_index(index_path: str) -> TarIndex:
+    """Reads an offset index written by :func:`write_tar_index`."""
+    index = {}
+    with open(index_path, "r", encoding="utf-8") as f:
+        for line in f:
+            name, offset, size = line.rstrip("\n").rsplit("\t", 2)
+            index[name] = (int(offset), int(size))
+    return index
+
+
+def load_tar_index(tar_path: str) -> Optional[TarIndex]:
+    """
+    Loads the sidecar offset index of ``tar_path`` if it can be used for random access.
+
+    Returns None if ``tar_path`` is not a local file (e.g. a ``pipe:`` specifier or an object store URL),
+    if it has no index, or if the index is older than the tar file.
+    """
+    index_path = get_tar_index_path(tar_path)
+    if not os.path.isfile(tar_path) or not os.path.isfile(index_path):
+        return None
+
+    if os.path.getmtime(index_path) < os.path.getmtime(tar_path):
+        logging.warning(f"Ignoring the offset index '{index_path}' as it is older than the tar file '{tar_path}'.")
+        return None
+
+    return read_tar_index(index_path)
+
+
+class IndexedTarFile:
+    """
+    Map-style random access to the members of an uncompressed tar file, using its offset index.
+
+    The file handle is opened lazily and re-opened after a fork, so that an instance can be created in the main
+    process and used in dataloader workers.
+
+    Args:
+        tar_path: Path to the tar file.
+        index: Offset index of the tar file. If None, it is loaded from the sidecar index, or built by
+            reading the tar headers when there is no sidecar index.
+
+    Example::
+
+        >>> with IndexedTarFile("audio_0.tar") as tar:
+        ...     raw_audio = tar["recording_17.wav"]
+    """
+
+    def __init__(self, tar_path: str, index: Optional[TarIndex] = None):
+        self.tar_path = tar_path
+        if index is None:
+            index = load_tar_index(tar_path)
+        if index is None:
+            index = build_tar_index(tar_path)
+        self.index = index
+        self._file = None
+        self._pid = None
+
+    def _get_file(self):
+        if self._file is None or self._pid != os.getpid():
+            self._file = open(self.tar_path, "rb")
+            self._pid = os.getpid()
+        return self._file
+
+    def read(self, name: str) -> bytes:
+        """Reads the member ``name``. Raises KeyError if the member is not in the tar file."""
+        offset, size = self.index[name]
+        f = self._get_file()
+        f.seek(offset)
+        data = f.read(size)
+        if len(data) != size:
+            raise tarfile.ReadError(f"Unexpected end of file when reading '{name}' from '{self.tar_path}'.")
+        return data
+
+    def __getitem__(self, name: str) -> bytes:
+        return self.read(name)
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.index)
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def close(self) -> None:
+        if self._file is not None and self._pid == os.getpid():
+            self._file.close()
+        self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["_file"] = None
+        state["_pid"] = None
+        return state
@@ -15,6 +15,8 @@
 import collections
 import json
 import os
+from array import array
+from collections.abc import Sequence
 from itertools import combinations
 from typing import Any, Callable, Dict, Iterable, List, Optional, Union
 
@@ -32,6 +34,177 @@ class _Collection(collections.UserList):
     OUTPUT_TYPE = None  # Single element output type.
 
 
+class _FloatColumn:
+    """Column of optional floats, stored in a float64 array with NaN for None."""
+
+    def __init__(self):
+        self._values = array('d')
+
+    def append(self, value):
+        self._values.append(float('nan') if value is None else value)
+
+    def freeze(self):
+        self.values = np.frombuffer(self._values, dtype=np.float64)
+        del self._values
+
+    def __getitem__(self, index):
+        value = self.values[index]
+        return None if np.isnan(value) else float(value)
+
+
+class _IntColumn:
+    """Column of integers, stored in an int64 array."""
+
+    def __init__(self):
+        self._values = array('q')
+
+    def append(self, value):
+        self._values.append(value)
+
+    def freeze(self):
+        self.values = np.frombuffer(self._values, dtype=np.int64)
+        del self._values
+
+    def __getitem__(self, index):
+        return int(self.values[index])
+
+
+class _TokensColumn:
+    """Column of token id lists, stored as one concatenated int32 array with the offsets of the lists."""
+
+    def __init__(self):
+        self._tokens = array('i')
+        self._offsets = array('q', [0])
+
+    def append(self, tokens):
+        self._tokens.extend(tokens)
+        self._offsets.append(len(self._tokens))
+
+    def freeze(self):
+        self.tokens = np.frombuffer(self._tokens, dtype=np.int32)
+        self.offsets = np.frombuffer(self._offsets, dtype=np.int64)
+        del self._tokens, self._offsets
+
+    def __getitem__(self, index):
+        return self.tokens[self.offsets[index] : self.offsets[index + 1]].tolist()
+
+
+class _StringColumn:
+    """
+    Column of strings, stored as one UTF-8 buffer with the offsets of the strings.
+    With `intern=True`, every distinct string is stored once and the rows hold its position in the pool.
+    Values which are not strings (e.g. None) are kept as they are, and are expected to be rare.
+    """
+
+    def __init__(self, intern: bool = False):
+        self.intern = intern
+        self._buffer = bytearray()
+        self._offsets = array('q', [0])
+        self._codes = array('q')
+        self._pool = {}
+        self.others = {}
+
+    def append(self, value):
+        if not isinstance(value, str):
+            self.others[len(self._codes)] = value
+            self._codes.append(-1)
+            return
+        code = self._pool.get(value) if self.intern else None
+        if code is None:
+            code = len(self._offsets) - 1
+            self._buffer += value.encode('utf-8')
+            self._offsets.append(len(self._buffer))
+            if self.intern:
+                self._pool[value] = code
+        self._codes.append(code)
+
+    def freeze(self):
+        self.buffer = np.frombuffer(bytes(self._buffer), dtype=np.uint8)
+        self.offsets = np.frombuffer(self._offsets, dtype=np.int64)
+        self.codes = np.frombuffer(self._codes, dtype=np.int64)
+        del self._buffer, self._offsets, self._codes, self._pool
+
+    def __getitem__(self, index):
+        code = self.codes[index]
+        if code < 0:
+            return self.others[index]
+        return self.buffer[self.offsets[code] : self.offsets[code + 1]].tobytes().decode('utf-8')
+
+
+class _CategoricalColumn:
+    """Column of hashable values with few distinct values (e.g. speakers or languages), stored as int32 codes."""
+
+    def __init__(self):
+        self._codes = array('i')
+        self._pool = {}
+        self.values = []
+
+    def append(self, value):
+        code = self._pool.get(value)
+        if code is None:
+            code = self._pool[value] = len(self.values)
+            self.values.append(value)
+        self._codes.append(code)
+
+    def freeze(self):
+        self.codes = np.frombuffer(self._codes, dtype=np.int32)
+        del self._codes, self._pool
+
+    def __getitem__(self, index):
+        return self.values[self.codes[index]]
+
+
+class _CompactEntries(Sequence):
+    """
+    Read-only sequence of collection entries stored column by column in flat numpy arrays, instead of one
+    namedtuple of Python objects per entry. The entries are created on access.
+
+    Python objects are reference counted, so merely reading a list of millions of entries in a DataLoader worker
+    copies the pages holding them after fork. The flat arrays stay shared between the workers.
+
+    Args:
+        output_type: Namedtuple type of the entries.
+        columns: Column of every field of `output_type`, in the same order.
+    """
+
+    def __init__(self, output_type, columns: List[Any]):
+        self.output_type = output_type
+        self.columns = columns
+        self.order = None
+        self._len = 0
+
+    def append(self, entity):
+        """Appends an entry. Must not be called after `freeze`."""
+        for column, value in zip(self.columns, entity):
+            column.append(value)
+        self._len += 1
+
+    def freeze(self) -> '_CompactEntries':
+        """Converts the appended entries to flat arrays."""
+        for column in self.columns:
+            column.freeze()
+        return self
+
+    def sort_by(self, field: str):
+        """Sorts the entries by a numeric field (stable, like `list.sort`). Must be called after `freeze`."""
+        values = self.columns[self.output_type._fields.index(field)].values
+        self.order = np.argsort(values, kind='stable')
+
+    def __len__(self):
+        return self._len
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(self._len))]
+        if index < 0:
+            index += self._len
+        if not 0 <= index < self._len:
+            raise IndexError("entry index out of range")
+        if self.order is not None:
+            index = self.order[index]
+        return self.output_type._make(column[index] for column in self.columns)
+
+
 class Text(_Collection):
     """Simple list of preprocessed text entries, result in list of tokens."""
 
@@ -115,6 +288,7 @@ class AudioText(_Collection):
         max_number: Optional[int] = None,
         do_sort_by_duration: bool = False,
         index_by_file_id: bool = False,
+        compact: bool = False,
     ):
         """Instantiates audio-text manifest with filters and preprocessing.
 
@@ -133,11 +307,29 @@ class AudioText(_Collection):
             max_number: Maximum number of samples to collect.
             do_sort_by_duration: True if sort samples list by duration. Not compatible with index_by_file_id.
             index_by_file_id: If True, saves a mapping from filename base (ID) to index in data.
+            compact: If True, stores the entries column by column in flat numpy arrays, which take a fraction of
+                the memory and stay shared between DataLoader workers. The entries are created on access, and the
+                collection is read-only.
         """
 
         output_type = self.OUTPUT_TYPE
         all_has_duration = True
         data, duration_filtered, num_filtered, total_duration = [], 0.0, 0, 0.0
+        if compact:
+            data = _CompactEntries(
+                output_type,
+                [
+                    _IntColumn(),  # id
+                    _StringColumn(intern=True),  # audio_file
+                    _FloatColumn(),  # duration
+                    _TokensColumn(),  # text_tokens
+                    _FloatColumn(),  # offset
+                    _StringColumn(),  # text_raw
+                    _CategoricalColumn(),  # speaker
+                    _CategoricalColumn(),  # orig_sr
+                    _CategoricalColumn(),  # lang
+                ],
+            )
         if index_by_file_id:
             self.mapping = {}
 
@@ -192,9 +384,14 @@ class AudioText(_Collection):
             if len(data) == max_number:
                 break
 
+        if compact:
+            data.freeze()
+
         if do_sort_by_duration:
             if index_by_file_id:
                 logging.warning("Tried to sort dataset by duration, but cannot since index_by_file_id is set.")
+            elif compact:
+                data.sort_by('duration')
             else:
                 data.sort(key=lambda entity: entity.duration)
 
@@ -202,7 +399,11 @@ class AudioText(_Collection):
         logging.info("%d files were filtered totalling %.2f hours", num_filtered, duration_filtered / 3600)
         if not all_has_duration:
             logging.info("Not all audios have duration information, the total number of hours is inaccurate.")
-        super().__init__(data)
+        if compact:
+            super().__init__()
+            self.data = data
+        else:
+            super().__init__(data)
 
 
 class VideoText(_Collection):
@@ -12,7 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Union
 
 import numpy as np
 import torch
@@ -88,24 +88,40 @@ class AggregateTokenizer(TokenizerSpec):
         self.tokenizers_by_token_id = tokenizers_by_token_id
         self.langs_by_token_id = langs_by_token_id
 
+        # flat numpy lookup tables indexed by the aggregate token id, used for decoding:
+        # the piece of every token, the index of its language in self.langs, and whether it starts a new word
+        self.pieces_by_token_id, self.lang_idx_by_token_id = self._calculate_lookup_tables()
+        self.word_start_by_token_id = np.array(
+            [piece.startswith('▁') for piece in self.pieces_by_token_id], dtype=bool
+        )
+        self._piece_len_by_token_id = np.array([len(piece) for piece in self.pieces_by_token_id], dtype=np.int64)
+
     def _calculate_offsets(self):
         offsets = {}
         tokenizers = {}
         langs = {}
-        cur_num = 0
-        tot = len(self.tokenizers_dict)
-        for id in range(len(self.vocabulary)):
-            off_id = id - list(self.token_id_offset.values())[cur_num]
-            if cur_num + 1 < tot:
-                if id >= list(self.token_id_offset.values())[cur_num + 1]:
-                    cur_num += 1
-                    off_id = id - list(self.token_id_offset.values())[cur_num]
-            offsets[id] = off_id
-            tokenizers[id] = list(self.tokenizers_dict.values())[cur_num]
-            langs[id] = list(self.tokenizers_dict.keys())[cur_num]
+        for (lang, tokenizer), offset in zip(self.tokenizers_dict.items(), self.token_id_offset.values()):
+            for off_id in range(len(tokenizer.vocab)):
+                offsets[offset + off_id] = off_id
+                tokenizers[offset + off_id] = tokenizer
+                langs[offset + off_id] = lang
 
         return offsets, tokenizers, langs
 
+    def _calculate_lookup_tables(self):
+        pieces = np.empty(self.vocab_size, dtype=object)
+        lang_idx = np.empty(self.vocab_size, dtype=np.int64)
+        for i, (tokenizer, offset) in enumerate(zip(self.tokenizers_dict.values(), self.token_id_offset.values())):
+            num_tokens = len(tokenizer.vocab)
+            tokens = tokenizer.ids_to_tokens(list(range(num_tokens)))
+            if len(tokens) != num_tokens:
+                # some tokenizers drop special tokens when decoding a sequence, decode token by token instead
+                tokens = [''.join(tokenizer.ids_to_tokens([off_id])) for off_id in range(num_tokens)]
+            pieces[offset : offset + num_tokens] = tokens
+            lang_idx[offset : offset + num_tokens] = i
+
+        return pieces, lang_idx
+
     def text_to_tokens(self, text, lang_id):
         tokenizer = self.tokenizers_dict[lang_id]
         return tokenizer.text_to_tokens(text)
@@ -117,6 +133,31 @@ class AggregateTokenizer(TokenizerSpec):
 
         return token_ids
 
+    def batch_text_to_ids(self, texts: List[str], lang_id: Union[str, List[str]]) -> List[List[int]]:
+        """
+        Encodes a batch of texts. The texts of every language are encoded in a single batch by the tokenizer
+        of that language.
+
+        Args:
+            texts: List of B texts.
+            lang_id: Language of all the texts, or a list of B languages.
+
+        Returns:
+            List of B token id lists.
+        """
+        lang_ids = [lang_id] * len(texts) if isinstance(lang_id, str) else lang_id
+        indices_by_lang = {}
+        for idx, lang in enumerate(lang_ids):
+            indices_by_lang.setdefault(lang, []).append(idx)
+
+        batch_ids = [None] * len(texts)
+        for lang, indices in indices_by_lang.items():
+            offset = self.token_id_offset[lang]
+            lang_batch_ids = self.tokenizers_dict[lang].batch_text_to_ids([texts[idx] for idx in indices])
+            for idx, token_ids in zip(indices, lang_batch_ids):
+                batch_ids[idx] = [t + offset for t in token_ids]
+        return batch_ids
+
     def tokens_to_text(self, tokens, lang_id):
         if isinstance(tokens, np.ndarray):
             tokens = tokens.tolist()
@@ -125,93 +166,128 @@ class AggregateTokenizer(TokenizerSpec):
         return tokenizer.decode_pieces(tokens)
 
     def ids_to_text(self, ids):
-        if isinstance(ids, (np.ndarray, torch.Tensor)):
-            ids = ids.tolist()
+        if isinstance(ids, torch.Tensor):
+            ids = ids.cpu().numpy()
 
-        tokens = []
-        for id in ids:
-            offset_id = self.offset_token_ids_by_token_id[id]
-            tokenizer = self.tokenizers_by_token_id[id]
-            tokens.extend(tokenizer.ids_to_tokens([offset_id]))
-        text = ''.join(tokens).replace('▁', ' ')
-
-        return text
+        return ''.join(self.pieces_by_token_id[np.asarray(ids, dtype=np.int64)]).replace('▁', ' ')
 
     def token_to_id(self, token, lang_id):
         tokenizer = self.tokenizers_dict[lang_id]
         return tokenizer.token_to_id(token) + self.token_id_offset[lang_id]
 
     def ids_to_tokens(self, ids):
-        tokens = []
-
-        for id in ids:
-            offset_id = self.offset_token_ids_by_token_id[id]
-            tokenizer = self.tokenizers_by_token_id[id]
-            token = tokenizer.ids_to_tokens([offset_id])[0]
-            tokens.append(token)
-
-        return tokens
+        return self.pieces_by_token_id[np.asarray(ids, dtype=np.int64)].tolist()
 
     def ids_to_text_and_langs(self, ids):
-        text_and_langs = []
+        ids = np.asarray(ids, dtype=np.int64)
+        langs = self.langs
+        return [
+            {'char': token.replace('▁', ' ').strip(), 'lang': langs[lang_idx]}  # strip for display purposes
+            for token, lang_idx in zip(self.pieces_by_token_id[ids].tolist(), self.lang_idx_by_token_id[ids].tolist())
+        ]
 
-        for id in ids:
-            offset_id = self.offset_token_ids_by_token_id[id]
-            tokenizer = self.tokenizers_by_token_id[id]
-            token = tokenizer.ids_to_tokens([offset_id])[0]
-            text = token.replace('▁', ' ')
-            text = text.strip()  # strip for display purposes
-            lang = self.langs_by_token_id[id]
-            text_and_langs.append({'char': text, 'lang': lang})
+    def ids_to_words_and_langs(self, ids):
+        ids = np.asarray(ids, dtype=np.int64)
+        pieces = self.pieces_by_token_id[ids]
+        lang_idx = self.lang_idx_by_token_id[ids]
+        langs = self.langs
 
-        return text_and_langs
+        # a token starting with '▁' starts a new word, unless it is the first token
+        word_starts = np.flatnonzero(self.word_start_by_token_id[ids][1:]) + 1
+        bounds = [0, *word_starts.tolist(), len(ids)] if len(ids) > 0 else []
 
-    def ids_to_words_and_langs(self, ids):
         words_and_langs = []
-
-        word_ids = []  # tokens belonging to the current word
-        for id in ids:
-            offset_id = self.offset_token_ids_by_token_id[id]
-            tokenizer = self.tokenizers_by_token_id[id]
-            token = tokenizer.ids_to_tokens([offset_id])[0]
-            if token.startswith('▁'):
-                if len(word_ids) > 0:  # if this isn't the first word
-                    word = self.ids_to_text(word_ids)
-                    word = word.strip()  # strip for display purposes
-                    lang = self.ids_to_lang(word_ids)
-                    wl = {'word': word, 'lang': lang}
-                    words_and_langs.append(wl)
-                word_ids = []
-            word_ids.append(id)
-
-        if len(word_ids) > 0:  # the last tokens
-            word = self.ids_to_text(word_ids)
-            word = word.strip()  # strip for display purposes
-            lang = self.ids_to_lang(word_ids)
-            wl = {'word': word, 'lang': lang}
-            words_and_langs.append(wl)
+        for start, end in zip(bounds[:-1], bounds[1:]):
+            word = ''.join(pieces[start:end]).replace('▁', ' ').strip()  # strip for display purposes
+            words_and_langs.append({'word': word, 'lang': langs[self._majority_lang_idx(lang_idx[start:end])]})
 
         return words_and_langs
 
     def ids_to_lang(self, ids):
-        lang_cnts = {}
-
-        for id in ids:
-            lang = self.langs_by_token_id[id]
-            lang_cnt = lang_cnts.get(lang)
-            if lang_cnt is not None:
-                lang_cnts[lang] = lang_cnt + 1
-            else:
-                lang_cnts[lang] = 1
-
-        max_lang = ''
-        max_lang_cnt = -1
-        for lang, lang_cnt in lang_cnts.items():
-            if lang_cnt > max_lang_cnt:
-                max_lang = lang
-                max_lang_cnt = lang_cnt
-
-        return max_lang
+        if len(ids) == 0:
+            return ''
+        return self.langs[self._majority_lang_idx(self.lang_idx_by_token_id[np.asarray(ids, dtype=np.int64)])]
+
+    def _majority_lang_idx(self, lang_idx: np.ndarray) -> int:
+        """Most frequent language index, ties are resolved in favor of the language that appears first."""
+        counts = np.bincount(lang_idx, minlength=len(self.tokenizers_dict))
+        is_max = counts[lang_idx] == counts.max()
+        return int(lang_idx[np.argmax(is_max)])
+
+    def batch_ids_to_text(
+        self,
+        ids: Union[torch.Tensor, np.ndarray, List[List[int]]],
+        lengths: Optional[Union[torch.Tensor, List[int]]] = None,
+    ) -> List[str]:
+        """
+        Decodes a batch of token id sequences into texts.
+
+        Args:
+            ids: Padded ids of shape [B, T], or a list of B id sequences.
+            lengths: Lengths of the sequences of shape [B]. If None, the whole rows of ``ids`` are decoded.
+
+        Returns:
+            List of B texts.
+        """
+        flat_ids, bounds = self._flatten_batch(ids, lengths)
+        text = ''.join(self.pieces_by_token_id[flat_ids]).replace('▁', ' ')
+        # pieces may have different lengths, map token boundaries to character boundaries
+        char_bounds = np.concatenate([[0], np.cumsum(self._piece_len_by_token_id[flat_ids])])[bounds].tolist()
+        return [text[start:end] for start, end in zip(char_bounds[:-1], char_bounds[1:])]
+
+    def batch_ids_to_lang(
+        self,
+        ids: Union[torch.Tensor, np.ndarray, List[List[int]]],
+        lengths: Optional[Union[torch.Tensor, List[int]]] = None,
+    ) -> List[str]:
+        """
+        Predicts the language of every sequence of a batch as the most frequent language of its tokens.
+        Arguments are the same as for ``batch_ids_to_text``.
+
+        Returns:
+            List of B language ids, empty strings for empty sequences.
+        """
+        flat_ids, bounds = self._flatten_batch(ids, lengths)
+        lang_idx = self.lang_idx_by_token_id[flat_ids]
+        return [
+            self.langs[self._majority_lang_idx(lang_idx[start:end])] if end > start else ''
+            for start, end in zip(bounds[:-1].tolist(), bounds[1:].tolist())
+        ]
+
+    def batch_ids_to_words_and_langs(
+        self,
+        ids: Union[torch.Tensor, np.ndarray, List[List[int]]],
+        lengths: Optional[Union[torch.Tensor, List[int]]] = None,
+    ) -> List[List[Dict[str, str]]]:
+        """
+        Splits every sequence of a batch into words with their languages, same as ``ids_to_words_and_langs``.
+        Arguments are the same as for ``batch_ids_to_text``.
+        """
+        flat_ids, bounds = self._flatten_batch(ids, lengths)
+        return [self.ids_to_words_and_langs(flat_ids[start:end]) for start, end in zip(bounds[:-1], bounds[1:])]
+
+    @staticmethod
+    def _flatten_batch(ids, lengths):
+        """Concatenates the valid ids of a batch, returns them with the [B + 1] sequence boundaries."""
+        if isinstance(ids, torch.Tensor):
+            ids = ids.cpu().numpy()
+        if isinstance(lengths, torch.Tensor):
+            lengths = lengths.cpu().numpy()
+
+        if isinstance(ids, np.ndarray) and ids.ndim == 2:
+            if lengths is None:
+                lengths = np.full(ids.shape[0], ids.shape[1], dtype=np.int64)
+            lengths = np.asarray(lengths, dtype=np.int64)
+            flat_ids = ids[np.arange(ids.shape[1])[None, :] < lengths[:, None]].astype(np.int64)
+        else:
+            seqs = [np.asarray(seq, dtype=np.int64).reshape(-1) for seq in ids]
+            if lengths is not None:
+                seqs = [seq[:length] for seq, length in zip(seqs, lengths)]
+            lengths = np.array([len(seq) for seq in seqs], dtype=np.int64)
+            flat_ids = np.concatenate(seqs) if seqs else np.zeros(0, dtype=np.int64)
+
+        bounds = np.concatenate([[0], np.cumsum(lengths)])
+        return flat_ids, bounds
 
     def tokens_to_ids(self, tokens: Union[str, List[str]], langs: Union[str, List[str]]) -> Union[int, List[int]]:
         if isinstance(tokens, str):
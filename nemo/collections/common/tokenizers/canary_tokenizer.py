@@ -126,6 +126,11 @@ class CanaryTokenizer(AggregateTokenizer):
             return self._text_to_ids_maybe_with_timestamps(text[: -len(CANARY_EOS)], lang_id) + [self.eos_id]
         return self._text_to_ids_maybe_with_timestamps(text, lang_id)
 
+    def batch_text_to_ids(self, texts: list[str], lang_id: str | list[str]) -> list[list[int]]:
+        # special prompts and timestamps are handled per text in text_to_ids
+        lang_ids = [lang_id] * len(texts) if isinstance(lang_id, str) else lang_id
+        return [self.text_to_ids(text, lang) for text, lang in zip(texts, lang_ids)]
+
     def _tokenize_special_prompt(self, text: str) -> list[int]:
         """
         Tokenize the input special prompt of Canary family of models.
@@ -327,6 +327,23 @@ class AutoTokenizer(TokenizerSpec):
         ids = self.tokens_to_ids(tokens)
         return ids
 
+    def batch_text_to_ids(self, texts):
+        """
+        Converts a batch of texts to token IDs, same as calling ``text_to_ids`` on every text.
+        Fast (Rust) tokenizers encode the whole batch in parallel.
+
+        Args:
+            texts (List[str]): Input texts to be converted to IDs.
+
+        Returns:
+            List[List[int]]: List of token IDs for every text.
+        """
+        if not self.tokenizer.is_fast:
+            return [self.text_to_ids(text) for text in texts]
+        if len(texts) == 0:
+            return []
+        return self.tokenizer(list(texts), add_special_tokens=self.include_special_tokens).input_ids
+
     def apply_chat_template(self, *args, **kwargs):
         """Appies chat template and tokenizes results"""
         return self.tokenizer.apply_chat_template(*args, **kwargs)
@@ -14,7 +14,7 @@
 
 import os
 import re
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import sentencepiece
@@ -96,25 +96,10 @@ class SentencePieceTokenizer(TokenizerSpec, ChatTemplateMixin):
         if self.removed_extra_spaces and not self.ignore_extra_whitespaces:
             text = re.sub(r'(?<= )(?= )|^ | $', f' {self.extra_space_token} ', text)
         if self.legacy:
+            split = self._split_special_tokens(text)
+            segments_tokens = self.tokenizer.encode([segment for segment, _ in split], out_type=str)
             tokens = []
-            cur_idx = 0
-
-            while 1:
-                st_indices = {}
-
-                for token in self.special_token_to_id:
-                    try:
-                        st_indices[token] = text[cur_idx:].index(token)
-                    except ValueError:
-                        continue
-
-                if len(st_indices) == 0:
-                    break
-
-                next_special_token = min(st_indices, key=st_indices.get)
-                next_start_idx = cur_idx + st_indices[next_special_token]
-                # tokens between the last special token and the next special token
-                text_tokens = self.tokenizer.encode_as_pieces(text[cur_idx:next_start_idx])
+            for (_, special_token), text_tokens in zip(split[:-1], segments_tokens):
                 # Chat-templates insert a space between a special token and first word (e.g.
                 # "[INST] who") which is tokenized as <inst-id> <space-id> <who-id> instead of
                 # <inst-id> <who-id>.
@@ -129,11 +114,9 @@ class SentencePieceTokenizer(TokenizerSpec, ChatTemplateMixin):
                 # Add the text tokens between the last special token and this one
                 tokens.extend(text_tokens)
                 # add the next special token
-                tokens.append(next_special_token)
-                # increment
-                cur_idx = next_start_idx + len(next_special_token)
+                tokens.append(special_token)
 
-            tokens.extend(self.tokenizer.encode_as_pieces(text[cur_idx:]))
+            tokens.extend(segments_tokens[-1])
 
         else:
             tokens = self.tokenizer.encode_as_pieces(text)
@@ -174,49 +157,7 @@ class SentencePieceTokenizer(TokenizerSpec, ChatTemplateMixin):
         if self.removed_extra_spaces and not self.ignore_extra_whitespaces:
             text = re.sub(r'(?<= )(?= )|^ | $', f' {self.extra_space_token} ', text).rstrip()
         if self.legacy:
-            ids = []
-            cur_idx = 0
-
-            # Account for special tokens
-            while 1:
-                st_indices = {}
-
-                for token in self.special_token_to_id:
-                    try:
-                        st_indices[token] = text[cur_idx:].index(token)
-                    except ValueError:
-                        continue
-
-                if len(st_indices) == 0:
-                    break
-
-                next_special_token = min(st_indices, key=st_indices.get)
-                next_start_idx = cur_idx + st_indices[next_special_token]
-                # tokens between the last special token and the next special token
-                text_tokens = self.tokenizer.encode(text[cur_idx:next_start_idx])
-                # Chat-templates insert a space between a special token and first word (e.g.
-                # "[INST] who") which is tokenized as <inst-id> <space-id> <who-id> instead of
-                # <inst-id> <who-id>.
-                if (
-                    self.trim_spm_separator_after_special_token
-                    and len(ids) > 0
-                    and ids[-1] in self.id_to_special_token
-                    and len(text_tokens) > 0
-                    and text_tokens[0] == self.spm_separator_id
-                ):
-                    text_tokens.pop(0)
-                # Add the text tokens between the last special token and this one
-                ids.extend(text_tokens)
-                # add the next special token
-                ids.append(self.special_token_to_id[next_special_token])
-                # increment
-                cur_idx = next_start_idx + len(next_special_token)
-
-            if self.removed_extra_spaces and not self.ignore_extra_whitespaces:
-                ids.extend(self._text_to_ids_extra_space(text[cur_idx:]))
-            else:
-                ids.extend(self.tokenizer.encode_as_ids(text[cur_idx:]))
-            return ids
+            return self._legacy_texts_to_ids([text])[0]
 
         if self.removed_extra_spaces and not self.ignore_extra_whitespaces:
             return self._text_to_ids_extra_space(text, sample_alpha)
@@ -249,6 +190,106 @@ class SentencePieceTokenizer(TokenizerSpec, ChatTemplateMixin):
 
         return ids
 
+    def batch_text_to_ids(self, texts: List[str], sample_alpha=None) -> List[List[int]]:
+        """Converts a batch of input texts to lists of token IDs, same as calling ``text_to_ids`` on every text.
+
+        The texts (or, in legacy mode, all the text segments between special tokens) are encoded with a single
+        call to SentencePiece.
+
+        Args:
+            texts: List of input strings.
+            sample_alpha: Optional float to enable subword sampling for data augmentation.
+
+        Returns:
+            A list of lists of token IDs.
+        """
+        if self.removed_extra_spaces and not self.ignore_extra_whitespaces:
+            return [self._text_to_ids(text, sample_alpha) for text in texts]
+        if len(texts) == 0:
+            return []
+        if self.legacy:
+            return self._legacy_texts_to_ids(texts)
+        if sample_alpha is not None:
+            return self.tokenizer.encode(list(texts), enable_sampling=True, alpha=sample_alpha, nbest_size=-1)
+        return self.tokenizer.encode(list(texts))
+
+    def _legacy_texts_to_ids(self, texts: List[str]) -> List[List[int]]:
+        """Converts texts to token IDs in legacy mode, where special tokens are matched in the text.
+
+        All the text segments between special tokens are encoded with a single call to SentencePiece.
+
+        Args:
+            texts: List of input strings, already preprocessed for extra whitespaces.
+
+        Returns:
+            A list of lists of token IDs.
+        """
+        extra_spaces = self.removed_extra_spaces and not self.ignore_extra_whitespaces
+        splits = [self._split_special_tokens(text) for text in texts]
+        segments = [segment for split in splits for segment, _ in (split[:-1] if extra_spaces else split)]
+        encoded_segments = iter(self.tokenizer.encode(segments) if segments else [])
+
+        batch_ids = []
+        for split in splits:
+            ids = []
+            # Account for special tokens
+            for _, special_token in split[:-1]:
+                # tokens between the last special token and the next special token
+                text_tokens = next(encoded_segments)
+                # Chat-templates insert a space between a special token and first word (e.g.
+                # "[INST] who") which is tokenized as <inst-id> <space-id> <who-id> instead of
+                # <inst-id> <who-id>.
+                if (
+                    self.trim_spm_separator_after_special_token
+                    and len(ids) > 0
+                    and ids[-1] in self.id_to_special_token
+                    and len(text_tokens) > 0
+                    and text_tokens[0] == self.spm_separator_id
+                ):
+                    text_tokens.pop(0)
+                # Add the text tokens between the last special token and this one
+                ids.extend(text_tokens)
+                # add the next special token
+                ids.append(self.special_token_to_id[special_token])
+
+            if extra_spaces:
+                ids.extend(self._text_to_ids_extra_space(split[-1][0]))
+            else:
+                ids.extend(next(encoded_segments))
+            batch_ids.append(ids)
+
+        return batch_ids
+
+    def _split_special_tokens(self, text: str) -> List[Tuple[str, Optional[str]]]:
+        """Splits text on the special tokens in a single pass.
+
+        At every position, the special tokens are matched in the order they were added, so the split is the same as
+        repeatedly looking for the earliest occurrence of any special token.
+
+        Args:
+            text: Input string.
+
+        Returns:
+            A list of (text segment, special token following the segment) pairs. The last pair holds the text after
+            the last special token, and None.
+        """
+        tokens = tuple(self.special_token_to_id)
+        if getattr(self, '_special_tokens_pattern_key', None) != tokens:
+            tokens_alternation = '|'.join(re.escape(token) for token in tokens if token)
+            self._special_tokens_pattern = re.compile(tokens_alternation) if tokens_alternation else None
+            self._special_tokens_pattern_key = tokens
+
+        if self._special_tokens_pattern is None:
+            return [(text, None)]
+
+        split = []
+        cur_idx = 0
+        for match in self._special_tokens_pattern.finditer(text):
+            split.append((text[cur_idx : match.start()], match.group()))
+            cur_idx = match.end()
+        split.append((text[cur_idx:], None))
+        return split
+
     def tokens_to_text(self, tokens):
         """Converts a list of tokens back to the corresponding string.
 
@@ -290,6 +331,28 @@ class SentencePieceTokenizer(TokenizerSpec, ChatTemplateMixin):
 
         return self.tokenizer.decode_ids(ids)
 
+    def batch_ids_to_text(self, ids) -> List[str]:
+        """Decodes a batch of token ID sequences, same as calling ``ids_to_text`` on every sequence.
+
+        Args:
+            ids: A list of lists or tensors/arrays of token IDs, or a 2D tensor/array.
+
+        Returns:
+            A list of decoded strings.
+        """
+        if isinstance(ids, (np.ndarray, torch.Tensor)):
+            ids = ids.tolist()
+        ids = [seq.tolist() if isinstance(seq, (np.ndarray, torch.Tensor)) else list(seq) for seq in ids]
+        if len(ids) == 0:
+            return []
+
+        if self.legacy:
+            if len(self.id_to_special_token) > 0:
+                return [self.ids_to_text(seq) for seq in ids]
+            return [text.strip() for text in self.tokenizer.decode(ids)]
+
+        return self.tokenizer.decode(ids)
+
     def token_to_id(self, token):
         """Gets the ID corresponding to a token.
 
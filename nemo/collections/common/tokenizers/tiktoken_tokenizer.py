@@ -225,6 +225,27 @@ class TiktokenTokenizer(TokenizerSpec):
         tokens = [t + self.num_special_tokens for t in tokens]
         return tokens
 
+    def batch_text_to_ids(self, texts: List[str], num_threads: Optional[int] = None) -> List[List[int]]:
+        """Converts a batch of input texts to lists of token IDs, same as calling ``text_to_ids`` on every text.
+
+        The texts are encoded in parallel by tiktoken's thread pool.
+
+        Args:
+            texts: List of input strings.
+            num_threads: Number of encoding threads. Defaults to the number of CPUs, at most one per text.
+
+        Returns:
+            A list of lists of token IDs.
+        """
+        if len(texts) == 0:
+            return []
+        if num_threads is None:
+            num_threads = min(len(texts), os.cpu_count() or 1)
+        batch_tokens = self.tokenizer.encode_batch(
+            list(texts), num_threads=num_threads, allowed_special=self.allowed_special
+        )
+        return [[t + self.num_special_tokens for t in tokens] for tokens in batch_tokens]
+
     def ids_to_text(
         self, tokens: List[int], remove_special_tokens: bool = True
     ):  # Filter out special tokens and adjust the remaining tokens
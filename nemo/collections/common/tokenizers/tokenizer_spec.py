@@ -54,6 +54,14 @@ class TokenizerSpec(ABC):
         """Converts token IDs back to text."""
         pass
 
+    def batch_text_to_ids(self, texts: List[str], *args, **kwargs) -> List[List[int]]:
+        """Converts a batch of texts to token IDs. Tokenizers with a native batch encoding override it."""
+        return [self.text_to_ids(text, *args, **kwargs) for text in texts]
+
+    def batch_ids_to_text(self, ids: List[List[int]], *args, **kwargs) -> List[str]:
+        """Converts a batch of token ID sequences back to texts. Tokenizers with a native batch decoding override it."""
+        return [self.ids_to_text(seq, *args, **kwargs) for seq in ids]
+
     def add_special_tokens(self, special_tokens: List[str]):
         """Adds special tokens (eos, pad, cls...) to vocab."""
         raise NotImplementedError("To be implemented")
@@ -132,6 +132,7 @@ class FineTuningDataModule(pl.LightningDataModule):
                     seed=self.seed,
                     output_metadata_path=self.pack_metadata,
                     dataset_kwargs=self.dataset_kwargs,
+                    tokenizer_workers=self.packed_sequence_specs.tokenizer_workers,
                 )
 
             if not self.validation_path_packed.is_file():
@@ -144,6 +145,7 @@ class FineTuningDataModule(pl.LightningDataModule):
                     seed=self.seed,
                     output_metadata_path=self.pack_metadata,
                     dataset_kwargs=self.dataset_kwargs,
+                    tokenizer_workers=self.packed_sequence_specs.tokenizer_workers,
                 )
 
     def setup(self, stage: str):
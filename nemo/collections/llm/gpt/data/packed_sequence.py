@@ -12,39 +12,33 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import json
+import pickle
+import tempfile
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 import numpy as np
 
 from nemo.collections.common.tokenizers import TokenizerSpec
 from nemo.collections.llm.gpt.data.core import create_sft_dataset
+from nemo.collections.llm.gpt.data.utils import safe_map
 from nemo.utils import logging
 from nemo.utils.sequence_packing_utils import create_hist, create_packing_strategy, fill_packing_strategy
 
+SHARD_TOKENS_SUFFIX = ".tokens.bin"
+SHARD_LOSS_MASK_SUFFIX = ".loss_mask.bin"
+SHARD_LENGTHS_SUFFIX = ".lengths.npy"
+SHARD_TOKEN_DTYPE = np.int32
 
-def tokenize_dataset(
+
+def _build_sft_dataset(
     path: Path,
     tokenizer: TokenizerSpec,
     max_seq_length: int,
     seed: int,
     dataset_kwargs: Optional[dict],
 ):
-    """
-    Tokenizes a dataset from the provided path using the specified tokenizer
-    and prepares it for further processing.
-
-    Args:
-        path (Path): Path to the dataset file.
-        tokenizer (TokenizerSpec): The tokenizer to use for tokenization.
-        max_seq_length (int): Maximum sequence length for the tokens.
-        seed (int): Random seed for shuffling the dataset (optional).
-
-    Returns:
-        np.ndarray: A NumPy array containing the tokenized data.
-    """
-
     if not dataset_kwargs:
         dataset_kwargs = {}
 
@@ -58,7 +52,7 @@ def tokenize_dataset(
         # But it can't be in prepare_data because it is only called in Rank 0
         tokenizer.tokenizer.chat_template = chat_template
 
-    dataset = create_sft_dataset(
+    return create_sft_dataset(
         path=path,
         tokenizer=tokenizer,
         seq_length=max_seq_length,
@@ -66,9 +60,278 @@ def tokenize_dataset(
         is_test=True,
         **dataset_kwargs,
     )
+
+
+def tokenize_dataset(
+    path: Path,
+    tokenizer: TokenizerSpec,
+    max_seq_length: int,
+    seed: int,
+    dataset_kwargs: Optional[dict],
+):
+    """
+    Tokenizes a dataset from the provided path using the specified tokenizer
+    and prepares it for further processing.
+
+    Args:
+        path (Path): Path to the dataset file.
+        tokenizer (TokenizerSpec): The tokenizer to use for tokenization.
+        max_seq_length (int): Maximum sequence length for the tokens.
+        seed (int): Random seed for shuffling the dataset (optional).
+
+    Returns:
+        np.ndarray: A NumPy array containing the tokenized data.
+    """
+    dataset = _build_sft_dataset(path, tokenizer, max_seq_length, seed, dataset_kwargs)
     return np.array([dataset[i] for i in range(len(dataset))])
 
 
+def _shifted_loss_mask(item: dict) -> np.ndarray:
+    """
+    Loss mask of a tokenized sample, aligned with the labels as done in `fill_packing_strategy`.
+    """
+    if "loss_mask" in item:
+        # roll loss mask by 1 to align with labels. We want to train on the output after the last context token
+        loss_mask = np.asarray(item["loss_mask"], dtype=bool)
+        return np.append(loss_mask[1:], False)
+    # (answer_start_idx - 1) because we want to train on the output after the last context token
+    return np.arange(len(item["input_ids"])) >= (item["answer_start_idx"] - 1)
+
+
+class TokenizedShards:
+    """
+    Read-only view over the tokenized samples written by `tokenize_dataset_to_shards`.
+
+    Each shard consists of three files: the concatenated token ids, the concatenated (shifted) loss masks,
+    and the length of every sample. Tokens and loss masks are memory-mapped, so only the lengths are held in memory.
+
+    Args:
+        shard_dir (Path): Directory containing the shard files.
+    """
+
+    def __init__(self, shard_dir: Path):
+        self.shard_dir = Path(shard_dir)
+        shard_names = sorted(
+            p.name[: -len(SHARD_LENGTHS_SUFFIX)] for p in self.shard_dir.glob(f"*{SHARD_LENGTHS_SUFFIX}")
+        )
+        if len(shard_names) == 0:
+            raise FileNotFoundError(f"No tokenized shards found in {self.shard_dir}")
+
+        self._tokens, self._loss_masks, self._offsets = [], [], []
+        shard_lengths = []
+        for name in shard_names:
+            lengths = np.load(self.shard_dir / f"{name}{SHARD_LENGTHS_SUFFIX}")
+            shard_lengths.append(lengths)
+            self._offsets.append(np.concatenate([[0], np.cumsum(lengths, dtype=np.int64)]))
+            num_tokens = int(self._offsets[-1][-1])
+            self._tokens.append(self._open_memmap(f"{name}{SHARD_TOKENS_SUFFIX}", SHARD_TOKEN_DTYPE, num_tokens))
+            self._loss_masks.append(self._open_memmap(f"{name}{SHARD_LOSS_MASK_SUFFIX}", np.bool_, num_tokens))
+
+        self.lengths = np.concatenate(shard_lengths)
+        # index of the first sample of every shard
+        self._shard_starts = np.cumsum([0] + [len(x) for x in shard_lengths[:-1]])
+
+    def _open_memmap(self, filename: str, dtype, num_items: int) -> np.ndarray:
+        if num_items == 0:
+            return np.zeros(0, dtype=dtype)
+        return np.memmap(self.shard_dir / filename, dtype=dtype, mode="r", shape=(num_items,))
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def get_arrays(self, idx: int):
+        """
+        Returns the token ids and the shifted loss mask of a sample as NumPy arrays.
+        """
+        shard = int(np.searchsorted(self._shard_starts, idx, side="right")) - 1
+        local_idx = idx - self._shard_starts[shard]
+        start, end = self._offsets[shard][local_idx], self._offsets[shard][local_idx + 1]
+        return self._tokens[shard][start:end], self._loss_masks[shard][start:end]
+
+    def __getitem__(self, idx: int) -> dict:
+        input_ids, loss_mask = self.get_arrays(idx)
+        return {"input_ids": input_ids.tolist(), "loss_mask": loss_mask.tolist()}
+
+    def histogram(self, truncate_seq_len: int) -> List[int]:
+        """
+        Histogram of sequence lengths, as returned by `create_hist`, computed from the lengths only.
+        """
+        # Minus 1 to account for input and label having one less token than the full sequence (see `create_hist`)
+        seq_lens = self.lengths - 1
+        if len(seq_lens) > 0 and seq_lens.max() > truncate_seq_len:
+            raise ValueError(
+                f"Found a sequence of length {seq_lens.max()} longer than truncate_seq_len={truncate_seq_len}"
+            )
+        return np.bincount(seq_lens, minlength=truncate_seq_len + 1).tolist()
+
+
+def tokenize_dataset_to_shards(
+    path: Path,
+    tokenizer: TokenizerSpec,
+    max_seq_length: int,
+    seed: int,
+    dataset_kwargs: Optional[dict],
+    output_dir: Path,
+    num_workers: int = 1,
+    samples_per_shard: int = 100000,
+) -> TokenizedShards:
+    """
+    Tokenizes a dataset in parallel and streams the result into on-disk shards instead of keeping every
+    tokenized sample in memory.
+
+    Samples are split into contiguous shards of `samples_per_shard` samples, and every shard is tokenized by
+    one of `num_workers` forked worker processes, which write the token ids, loss masks and lengths of their
+    samples directly to `output_dir`.
+
+    Args:
+        path (Path): Path to the dataset file.
+        tokenizer (TokenizerSpec): The tokenizer to use for tokenization.
+        max_seq_length (int): Maximum sequence length for the tokens.
+        seed (int): Random seed for shuffling the dataset (optional).
+        dataset_kwargs (Optional[dict]): Additional arguments passed to `create_sft_dataset`.
+        output_dir (Path): Directory where the shards are written.
+        num_workers (int): Number of tokenization processes.
+        samples_per_shard (int): Maximum number of samples per shard.
+
+    Returns:
+        TokenizedShards: A view over the written shards.
+    """
+    dataset = _build_sft_dataset(path, tokenizer, max_seq_length, seed, dataset_kwargs)
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    shard_ranges = [
+        (shard_idx, start, min(start + samples_per_shard, len(dataset)))
+        for shard_idx, start in enumerate(range(0, len(dataset), samples_per_shard))
+    ]
+
+    def tokenize_shard(shard_range) -> int:
+        shard_idx, start, end = shard_range
+        name = f"shard_{shard_idx:06d}"
+        lengths = np.zeros(end - start, dtype=np.int64)
+        with (
+            open(output_dir / f"{name}{SHARD_TOKENS_SUFFIX}", "wb") as tokens_file,
+            open(output_dir / f"{name}{SHARD_LOSS_MASK_SUFFIX}", "wb") as loss_mask_file,
+        ):
+            for i in range(start, end):
+                item = dataset[i]
+                np.asarray(item["input_ids"], dtype=SHARD_TOKEN_DTYPE).tofile(tokens_file)
+                _shifted_loss_mask(item).astype(np.bool_).tofile(loss_mask_file)
+                lengths[i - start] = len(item["input_ids"])
+        # the lengths file is written last and marks the shard as complete
+        np.save(output_dir / f"{name}{SHARD_LENGTHS_SUFFIX}", lengths)
+        return end - start
+
+    logging.info(f"Tokenizing {len(dataset)} samples into {len(shard_ranges)} shards with {num_workers} workers")
+    if num_workers > 1:
+        num_samples = safe_map(tokenize_shard, shard_ranges, workers=num_workers)
+    else:
+        num_samples = [tokenize_shard(shard_range) for shard_range in shard_ranges]
+    failed_shards = [shard_idx for (shard_idx, _, _), n in zip(shard_ranges, num_samples) if n is None]
+    if failed_shards:
+        raise RuntimeError(f"Tokenization failed for shards {failed_shards} of {path}")
+
+    return TokenizedShards(output_dir)
+
+
+def iter_packing_strategy_from_shards(assignments: List[List[int]], shards: TokenizedShards) -> Iterator[Dict]:
+    """
+    Equivalent of `fill_packing_strategy` that reads the sequences from tokenized shards and yields
+    the packed sequences one by one, so that only one of them is held in memory at a time.
+
+    Samples are grouped by length using the lengths column only, and the token ids and loss masks of each
+    sample are read from the memory-mapped shards when its pack is built.
+
+    Args:
+        assignments: A list of lists, where each inner list represents a bin and contains the indices of the
+                      sequence lengths assigned to that bin (output of 'create_packing_strategy').
+        shards: The tokenized samples (output of 'tokenize_dataset_to_shards').
+
+    Yields:
+        A dictionary per bin, which represents a packed sequence with its input IDs, loss mask,
+        and starting indices.
+    """
+    seq_lens = shards.lengths - 1
+    # a stable sort keeps dataset order within each length, so the random permutation below matches
+    # the one drawn by `fill_packing_strategy` for the same seed
+    order = np.argsort(seq_lens, kind="stable")
+    sorted_seq_lens = seq_lens[order]
+    samples_by_len = {}
+    for seq_len in np.unique(sorted_seq_lens):
+        start, end = np.searchsorted(sorted_seq_lens, [seq_len, seq_len + 1])
+        group = order[start:end]
+        samples_by_len[int(seq_len)] = group[np.random.permutation(len(group))].tolist()
+
+    for assignment in assignments:
+        input_ids, loss_mask, seq_start_id = [], [], []
+        num_tokens = 0
+        for seq_length in assignment:
+            sample_input_ids, sample_loss_mask = shards.get_arrays(samples_by_len[seq_length].pop())
+            seq_start_id.append(num_tokens)
+            num_tokens += len(sample_input_ids)
+            input_ids.append(sample_input_ids)
+            loss_mask.append(sample_loss_mask)
+        yield {
+            "input_ids": np.concatenate(input_ids).tolist(),
+            "loss_mask": np.concatenate(loss_mask).tolist(),
+            "seq_start_id": seq_start_id,
+        }
+
+    assert all(not x for x in samples_by_len.values()), "Error: There are items left over from the assignment"
+
+
+def fill_packing_strategy_from_shards(assignments: List[List[int]], shards: TokenizedShards) -> List[Dict]:
+    """
+    Returns all the packed sequences of `iter_packing_strategy_from_shards` as a list,
+    in the format of `fill_packing_strategy`.
+    """
+    return list(iter_packing_strategy_from_shards(assignments, shards))
+
+
+class _StreamedList:
+    """Pickles as a list whose items are appended one by one as they are drawn from `items`."""
+
+    def __init__(self, items: Iterable):
+        self.items = items
+
+    def __reduce__(self):
+        return list, (), None, iter(self.items)
+
+
+class _StreamedObjectArray:
+    """Pickles as a 1-D object array of `num_items` elements drawn from `items`, like `np.save` does."""
+
+    def __init__(self, items: Iterable, num_items: int):
+        self.items = items
+        self.num_items = num_items
+
+    def __reduce__(self):
+        reconstruct, args, state = np.empty(self.num_items, dtype=object).__reduce__()
+        # the last element of the state is the list of the array elements
+        return reconstruct, args, state[:-1] + (_StreamedList(self.items),)
+
+
+def save_packed_sequences(output_path: Path, packed_sequences: Iterable[Dict], num_packed_sequences: int):
+    """
+    Saves the packed sequences in the same format as `np.save(output_path, list(packed_sequences))`,
+    but pickles them one by one as they are produced instead of collecting them in memory first.
+
+    Args:
+        output_path (Path): Path of the `.npy` file (the suffix is added if missing, as `np.save` does).
+        packed_sequences (Iterable[Dict]): The packed sequences, e.g. from `iter_packing_strategy_from_shards`.
+        num_packed_sequences (int): Number of packed sequences.
+    """
+    output_path = str(output_path)
+    if not output_path.endswith(".npy"):
+        output_path += ".npy"
+    header = np.lib.format.header_data_from_array_1_0(np.empty(num_packed_sequences, dtype=object))
+    with open(output_path, "wb") as f:
+        np.lib.format.write_array_header_1_0(f, header)
+        pickler = pickle.Pickler(f, protocol=3)
+        # without the memo, every packed sequence is released as soon as it is written
+        pickler.fast = True
+        pickler.dump(_StreamedObjectArray(packed_sequences, num_packed_sequences))
+
+
 def prepare_packed_sequence_data(
     input_path: Path,
     output_path: Path,
@@ -79,6 +342,7 @@ def prepare_packed_sequence_data(
     seed: Optional[int] = 0,
     packing_algorithm: str = "first_fit_shuffle",
     dataset_kwargs: dict = None,
+    tokenizer_workers: int = 0,
 ):
     """
     Prepares a packed sequence dataset from a given input file and saves it to an output file.
@@ -91,21 +355,37 @@ def prepare_packed_sequence_data(
         max_seq_length (int): Maximum sequence length for the tokens.
         seed (Optional[int]): Random seed for shuffling (optional).
         packing_algorithm (str): The algorithm used for packing sequences
-                currently supports "first_fit_shuffle" and "first_fit_decreasing".
+                currently supports "first_fit_shuffle", "first_fit_decreasing", "best_fit_decreasing"
+                and "histogram_best_fit_decreasing".
+        tokenizer_workers (int): If positive, the dataset is tokenized by this many processes into temporary
+                on-disk shards next to `output_path` (see `tokenize_dataset_to_shards`) instead of in memory.
 
     Returns:
         None: Saves the packed sequence data to the specified output path.
     """
 
     logging.info(f"Preparing packed sequence from {input_path}")
-    dataset = tokenize_dataset(input_path, tokenizer, max_seq_length, seed, dataset_kwargs)
-    sequences, histogram = create_hist(dataset, max_seq_length)
+    if tokenizer_workers > 0:
+        with tempfile.TemporaryDirectory(dir=Path(output_path).parent) as shard_dir:
+            shards = tokenize_dataset_to_shards(
+                input_path, tokenizer, max_seq_length, seed, dataset_kwargs, shard_dir, num_workers=tokenizer_workers
+            )
+            histogram = shards.histogram(max_seq_length)
+            assignments, packing_metadata = create_packing_strategy(histogram, packed_sequence_size, packing_algorithm)
+            # the packed sequences are written as they are built, so they are never all held in memory
+            save_packed_sequences(
+                output_path, iter_packing_strategy_from_shards(assignments, shards), len(assignments)
+            )
+            del shards
+    else:
+        dataset = tokenize_dataset(input_path, tokenizer, max_seq_length, seed, dataset_kwargs)
+        sequences, histogram = create_hist(dataset, max_seq_length)
 
-    assignments, packing_metadata = create_packing_strategy(histogram, packed_sequence_size, packing_algorithm)
-    output_data = fill_packing_strategy(assignments, sequences, packed_sequence_size, tokenizer.eos_id)
+        assignments, packing_metadata = create_packing_strategy(histogram, packed_sequence_size, packing_algorithm)
+        output_data = fill_packing_strategy(assignments, sequences, packed_sequence_size, tokenizer.eos_id)
 
-    # save output data
-    np.save(output_path, output_data)
+        # save output data
+        np.save(output_path, output_data)
 
     # save packing metadata, packing_metadata is appended to the packing file if it exists
     if output_metadata_path is not None:
@@ -168,6 +448,12 @@ class PackedSequenceSpecs:
     If True, pad cu_seqlens to a constant size, which is required for use with cudagraphs.
     """
 
+    tokenizer_workers: int = 0
+    """
+    If a positive integer, the dataset is tokenized by this many processes into temporary on-disk shards
+    before packing, which keeps memory usage bounded for large datasets. Defaults to 0 (tokenize in memory).
+    """
+
     def __post_init__(self):
         if self.packed_train_data_path is not None:
             self.packed_train_data_path = Path(self.packed_train_data_path)
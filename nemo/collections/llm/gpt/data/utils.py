@@ -53,36 +53,156 @@ __idx_version__ = "0.2"  # index file version
 __idx_suffix__ = "idx"  # index file suffix
 
 
-def build_index_from_memdata(fn, newline_int):
+__idx_chunk_size__ = 1 << 28  # bytes scanned at once when building index files
+
+
+def _file_chunks(start: int, end: int, chunk_size: int) -> List[tuple]:
+    """Split the byte range [start, end) into windows of at most chunk_size bytes"""
+    return [(i, min(i + chunk_size, end)) for i in range(start, end, chunk_size)]
+
+
+def _count_newlines_in_chunk(fn: str, newline_int: int, start: int, end: int) -> int:
+    """Count the delimiters in fn[start:end]"""
+    mdata = np.memmap(fn, dtype=np.uint8, mode="r", offset=start, shape=(end - start,))
+    count = int(np.count_nonzero(mdata == newline_int))
+    mdata._mmap.close()
+    del mdata
+    return count
+
+
+def _find_newlines_in_chunk(fn: str, newline_int: int, start: int, end: int) -> np.ndarray:
+    """Return the absolute positions of the delimiters in fn[start:end]"""
+    mdata = np.memmap(fn, dtype=np.uint8, mode="r", offset=start, shape=(end - start,))
+    positions = np.flatnonzero(mdata == newline_int)
+    positions += start
+    mdata._mmap.close()
+    del mdata
+    return positions
+
+
+def _write_newlines_in_chunk(
+    fn: str, newline_int: int, start: int, end: int, idx_npy_fn: str, out_start: int, out_end: int
+) -> None:
+    """Write the positions of the delimiters in fn[start:end] to idx_npy_fn[out_start:out_end]"""
+    if out_end <= out_start:
+        return
+    positions = _find_newlines_in_chunk(fn, newline_int, start, end)
+    midx = np.load(idx_npy_fn, mmap_mode="r+")
+    midx[out_start:out_end] = positions[: out_end - out_start]
+    midx.flush()
+    del midx
+
+
+def _map_chunks(fn, args_list, workers):
+    """Run fn over a list of argument tuples, in a process pool if workers > 1"""
+    if workers is None or workers <= 1 or len(args_list) <= 1:
+        return [fn(*args) for args in args_list]
+    with mp.get_context("fork").Pool(min(workers, len(args_list))) as pool:
+        return pool.starmap(fn, args_list)
+
+
+def _index_tail(fn: str, newline_int: int, file_size: int, num_newlines: int):
+    """
+    Returns how the list of delimiter positions has to be adjusted at the end of the file:
+    the number of trailing positions to drop (empty lines at the end of the file) and
+    whether an extra position has to be added (no delimiter at the end of the file).
+    """
+    if file_size == 0 or num_newlines == 0:
+        return 0, True
+    # count the run of delimiters at the end of the file
+    trailing = 0
+    block_size = 1 << 16
+    with open(fn, "rb") as f:
+        end = file_size
+        while end > 0:
+            start = max(0, end - block_size)
+            f.seek(start)
+            block = np.frombuffer(f.read(end - start), dtype=np.uint8)
+            not_newline = np.flatnonzero(block != newline_int)
+            if len(not_newline) > 0:
+                trailing += len(block) - 1 - int(not_newline[-1])
+                break
+            trailing += len(block)
+            end = start
+    if trailing == 0:
+        # add last item in case there is no new-line at the end of the file
+        return 0, True
+    # remove empty lines from end of file
+    return min(trailing - 1, num_newlines - 1), False
+
+
+def build_index_from_memdata(fn, newline_int, workers: int = 1, chunk_size: int = __idx_chunk_size__):
     """
     Build index of delimiter positions between samples in memmap.
     Can be provided externally.
 
+    The file is scanned in windows of chunk_size bytes, in a process pool if workers > 1.
+
     Returns a 1D array of ints.
     """
-    # use memmap to read file
-    mdata = np.memmap(fn, dtype=np.uint8, mode="r")
-    # find newline positions
-    midx = np.where(mdata == newline_int)[0]
-    midx_dtype = midx.dtype
-    # make sure to account for all data
-    midx = midx.tolist()
-    # add last item in case there is no new-line at the end of the file
-    if (len(midx) == 0) or (midx[-1] + 1 != len(mdata)):
-        midx = midx + [len(mdata) + 1]
+    file_size = os.path.getsize(fn)
+    chunks = [(fn, newline_int, start, end) for start, end in _file_chunks(0, file_size, chunk_size)]
+    positions = _map_chunks(_find_newlines_in_chunk, chunks, workers)
+    midx = np.concatenate(positions) if positions else np.zeros(0, dtype=np.int64)
 
-    # remove empty lines from end of file
-    while len(midx) > 1 and (midx[-1] - midx[-2]) < 2:
-        midx.pop(-1)
-    midx = np.asarray(midx, dtype=midx_dtype)
-
-    # free memmap
-    mdata._mmap.close()
-    del mdata
+    drop, extra = _index_tail(fn, newline_int, file_size, len(midx))
+    midx = midx[: len(midx) - drop]
+    if extra:
+        midx = np.append(midx, file_size + 1)
 
     return midx
 
 
+def _write_index_file(
+    fn: str,
+    newline_int: int,
+    idx_npy_fn: str,
+    workers: int = 1,
+    chunk_size: int = __idx_chunk_size__,
+    prefix: Optional[np.ndarray] = None,
+) -> int:
+    """
+    Write the index of delimiter positions of fn (see build_index_from_memdata) directly to idx_npy_fn.
+
+    The file is scanned twice in windows of chunk_size bytes: once to count the delimiters in every window,
+    and once to write their positions into a memory-mapped .npy file, so the positions are never collected
+    in memory. If prefix is given, it must hold the (already known) positions of the first delimiters of fn,
+    and only the bytes after its last position are scanned.
+
+    Returns the number of items in the index.
+    """
+    file_size = os.path.getsize(fn)
+    prefix = np.zeros(0, dtype=np.int64) if prefix is None else prefix
+    scan_start = int(prefix[-1]) + 1 if len(prefix) > 0 else 0
+    chunks = _file_chunks(scan_start, file_size, chunk_size)
+
+    counts = _map_chunks(_count_newlines_in_chunk, [(fn, newline_int, start, end) for start, end in chunks], workers)
+    num_newlines = len(prefix) + sum(counts)
+    drop, extra = _index_tail(fn, newline_int, file_size, num_newlines)
+    num_kept = num_newlines - drop
+
+    tmp_fn = idx_npy_fn + ".tmp"
+    midx = np.lib.format.open_memmap(tmp_fn, mode="w+", dtype=np.int64, shape=(int(num_kept) + int(extra),))
+    midx[: len(prefix)] = prefix
+    if extra:
+        midx[-1] = file_size + 1
+    midx.flush()
+    del midx
+
+    out_starts = len(prefix) + np.cumsum([0] + counts[:-1], dtype=np.int64)
+    _map_chunks(
+        _write_newlines_in_chunk,
+        [
+            (fn, newline_int, start, end, tmp_fn, int(out_start), int(min(out_start + count, num_kept)))
+            for (start, end), out_start, count in zip(chunks, out_starts, counts)
+        ],
+        workers,
+    )
+    os.replace(tmp_fn, idx_npy_fn)
+
+    return num_kept + int(extra)
+
+
 def safe_map(fn, iterable, workers=1, ctx="fork"):
     """
     Crash-resilient alternative to multiprocessing.Pool.map() that can handle
@@ -618,6 +738,8 @@ def build_index_files(
         workers = max(1, os.cpu_count() // 2)
 
     logger.info(f"Processing {len(dataset_paths)} data files using {workers} workers")
+    # workers not needed for separate files are used to scan chunks of each file in parallel
+    chunk_workers = max(1, workers // len(dataset_paths))
     # load all files into memmap
     start_time = time.time()
     build_status = safe_map(
@@ -626,9 +748,10 @@ def build_index_files(
             newline_int,
             build_index_fn,
             index_mapping_dir=index_mapping_dir,
+            workers=chunk_workers,
         ),
         dataset_paths,
-        workers=workers,
+        workers=min(workers, len(dataset_paths)),
     )
 
     logger.info(
@@ -1200,34 +1323,87 @@ def _identify_start_index_of_subsequence(subsequence, sequence):
     return -1
 
 
-def _build_memmap_index_files(newline_int, build_index_fn, fn, index_mapping_dir: str):
+def _build_memmap_index_files(newline_int, build_index_fn, fn, index_mapping_dir: str, workers: int = 1):
     """Helper function to build an index file"""
     idx_fn = _index_fn(fn, index_mapping_dir)
 
     # create data map
     if _index_file_exists(idx_fn):
+        if build_index_fn is build_index_from_memdata:
+            return _update_memmap_index_files(newline_int, fn, idx_fn, workers=workers)
         return False
     else:
         logger.info(f"Building indexing for fn = {fn}")
-        # find all newline positions
-        midx = build_index_fn(fn, newline_int)
-        # validate midx
-        midx = np.asarray(midx)
-        if not np.issubdtype(midx.dtype, np.integer):
-            raise TypeError(f"midx must be an integer array, but got type = {midx.dtype}")
+        if build_index_fn is build_index_from_memdata:
+            # find all newline positions and save them directly to the index file
+            logger.info(f"Saving idx file = {idx_fn}.npy")
+            _write_index_file(fn, newline_int, idx_fn + ".npy", workers=workers)
+        else:
+            # find all newline positions
+            midx = build_index_fn(fn, newline_int)
+            # validate midx
+            midx = np.asarray(midx)
+            if not np.issubdtype(midx.dtype, np.integer):
+                raise TypeError(f"midx must be an integer array, but got type = {midx.dtype}")
 
-        # create e metadata file
-        data = dict(newline_int=newline_int, version=__idx_version__)
+            # save index as numpy array to enable memmap reading
+            logger.info(f"Saving idx file = {idx_fn}.npy")
+            np.save(idx_fn + ".npy", midx, allow_pickle=True)
 
-        # save index as numpy array to enable memmap reading
-        logger.info(f"Saving idx file = {idx_fn}.npy")
-        np.save(idx_fn + ".npy", midx, allow_pickle=True)
+        # create e metadata file
+        # file_size records how much of the file is indexed, which allows to extend the index if the file grows
+        data = dict(newline_int=newline_int, version=__idx_version__, file_size=os.path.getsize(fn))
         logger.info(f"Saving metadata file = {idx_fn}.info")
         pickle.dump(data, open(idx_fn + ".info", "wb"))
 
         return True
 
 
+def _update_memmap_index_files(newline_int, fn, idx_fn: str, workers: int = 1) -> bool:
+    """
+    Extend an existing index file if its data file was appended to since the index was built.
+
+    Only the appended bytes (and the empty lines at the previous end of file) are scanned.
+    If the data file shrank or no longer matches the index, the index is rebuilt from scratch.
+
+    Returns True if the index file was updated.
+    """
+    with open(idx_fn + ".info", "rb") as fp:
+        idx_info_dict = pickle.load(fp)
+    indexed_size = idx_info_dict.get("file_size")
+    file_size = os.path.getsize(fn)
+    if (
+        indexed_size is None
+        or indexed_size == file_size
+        or idx_info_dict.get("newline_int") != newline_int
+        or idx_info_dict.get("version") != __idx_version__
+    ):
+        # nothing to update, or the index was not built by this version of the builder
+        return False
+
+    prefix = None
+    if indexed_size < file_size:
+        old_midx = np.load(idx_fn + ".npy", mmap_mode="r")
+        # keep the positions of delimiters that were inside the previously indexed part of the file
+        prefix = np.asarray(old_midx[: np.searchsorted(old_midx, indexed_size)], dtype=np.int64)
+        del old_midx
+        if (
+            len(prefix) > 0
+            and _find_newlines_in_chunk(fn, newline_int, int(prefix[-1]), int(prefix[-1]) + 1).size == 0
+        ):
+            logger.warning(f"Index file {idx_fn}.npy does not match {fn}, rebuilding it")
+            prefix = None
+        else:
+            logger.info(f"Extending index file {idx_fn}.npy with {file_size - indexed_size} bytes appended to {fn}")
+    else:
+        logger.warning(f"{fn} is smaller than when {idx_fn}.npy was built, rebuilding it")
+
+    _write_index_file(fn, newline_int, idx_fn + ".npy", workers=workers, prefix=prefix)
+    idx_info_dict["file_size"] = file_size
+    pickle.dump(idx_info_dict, open(idx_fn + ".info", "wb"))
+    return True
+
+
 def _index_fn(fn: str, index_mapping_dir: str) -> str:
     """Return base file name of index files.
 
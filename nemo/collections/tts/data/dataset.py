@@ -27,6 +27,7 @@ import torch
 from einops import rearrange
 from tqdm import tqdm
 
+from nemo.collections.asr.parts.preprocessing.feature_cache import FeatureCache
 from nemo.collections.asr.parts.preprocessing.features import WaveformFeaturizer
 from nemo.collections.asr.parts.preprocessing.segment import AudioSegment
 from nemo.collections.common.tokenizers.text_to_speech.tts_tokenizers import (
@@ -90,6 +91,7 @@ class TTSDataset(Dataset):
         text_tokenizer_pad_id: Optional[int] = None,
         sup_data_types: Optional[List[str]] = None,
         sup_data_path: Optional[Union[Path, str]] = None,
+        sup_data_store_dir: Optional[Union[Path, str]] = None,
         max_duration: Optional[float] = None,
         min_duration: Optional[float] = None,
         ignore_file: Optional[Union[str, Path]] = None,
@@ -133,6 +135,11 @@ class TTSDataset(Dataset):
             text_tokenizer_pad_id (Optional[int]): Index of padding. Should be specified if text_tokenizer is not BaseTokenizer.
             sup_data_types (Optional[List[str]]): List of supplementary data types.
             sup_data_path (Optional[Union[Path, str]]): A folder that contains or will contain supplementary data (e.g. pitch).
+            sup_data_store_dir (Optional[Union[Path, str]]): A folder (preferably on local disk) that contains or will
+                contain log mel, pitch, voiced mask, p_voiced and energy packed into memory-mapped shards, one
+                subfolder per data type, instead of one .pt file per utterance. Data found only in the .pt files of
+                sup_data_path is copied to the store when it is first loaded. The store can be filled ahead of training
+                with scripts/dataset_processing/tts/build_sup_data_store.py. Defaults to None, i.e. .pt files are used.
             max_duration (Optional[float]): Max duration of audio clips in seconds. All samples exceeding this will be
                 pruned prior to training. Note: Requires "duration" to be set in the manifest file. It does not load
                 audio to compute duration. Defaults to None which does not prune.
@@ -340,6 +347,12 @@ class TTSDataset(Dataset):
 
         self.sup_data_types_set = set(self.sup_data_types)
 
+        self.sup_data_stores = {}
+        if sup_data_store_dir is not None:
+            for data_type in [LogMel, Pitch, Voiced_mask, P_voiced, Energy]:
+                if data_type in self.sup_data_types_set:
+                    self.sup_data_stores[data_type] = FeatureCache(os.path.join(sup_data_store_dir, data_type.name))
+
         for data_type in self.sup_data_types:
             getattr(self, f"add_{data_type.name}")(**kwargs)
 
@@ -384,15 +397,20 @@ class TTSDataset(Dataset):
 
         return filtered_data
 
-    def add_log_mel(self, **kwargs):
-        self.log_mel_folder = kwargs.pop('log_mel_folder', None)
+    def get_sup_data_folder(self, data_type: TTSDataType, folder: Optional[Union[Path, str]]) -> Optional[Path]:
+        """Creates the folder of the .pt files of a supplementary data type, defaulting to sup_data_path/<type name>.
+        Returns None if there is no such folder, i.e. the data type is only kept in the packed store."""
+        if folder is None:
+            if data_type in self.sup_data_stores and getattr(self, "sup_data_path", None) is None:
+                return None
+            folder = Path(self.sup_data_path) / data_type.name
 
-        if self.log_mel_folder is None:
-            self.log_mel_folder = Path(self.sup_data_path) / LogMel.name
-        elif isinstance(self.log_mel_folder, str):
-            self.log_mel_folder = Path(self.log_mel_folder)
+        folder = Path(folder)
+        folder.mkdir(exist_ok=True, parents=True)
+        return folder
 
-        self.log_mel_folder.mkdir(exist_ok=True, parents=True)
+    def add_log_mel(self, **kwargs):
+        self.log_mel_folder = self.get_sup_data_folder(LogMel, kwargs.pop('log_mel_folder', None))
 
     def add_durations(self, **kwargs):
         durs_file = kwargs.pop('durs_file')
@@ -424,14 +442,7 @@ class TTSDataset(Dataset):
             self.beta_binomial_interpolator = BetaBinomialInterpolator()
 
     def add_pitch(self, **kwargs):
-        self.pitch_folder = kwargs.pop('pitch_folder', None)
-
-        if self.pitch_folder is None:
-            self.pitch_folder = Path(self.sup_data_path) / Pitch.name
-        elif isinstance(self.pitch_folder, str):
-            self.pitch_folder = Path(self.pitch_folder)
-
-        self.pitch_folder.mkdir(exist_ok=True, parents=True)
+        self.pitch_folder = self.get_sup_data_folder(Pitch, kwargs.pop('pitch_folder', None))
 
         self.pitch_fmin = kwargs.pop("pitch_fmin", librosa.note_to_hz('C2'))
         self.pitch_fmax = kwargs.pop("pitch_fmax", librosa.note_to_hz('C7'))
@@ -458,30 +469,13 @@ class TTSDataset(Dataset):
 
     # saving voiced_mask and p_voiced with pitch
     def add_voiced_mask(self, **kwargs):
-        self.voiced_mask_folder = kwargs.pop('voiced_mask_folder', None)
-
-        if self.voiced_mask_folder is None:
-            self.voiced_mask_folder = Path(self.sup_data_path) / Voiced_mask.name
-
-        self.voiced_mask_folder.mkdir(exist_ok=True, parents=True)
+        self.voiced_mask_folder = self.get_sup_data_folder(Voiced_mask, kwargs.pop('voiced_mask_folder', None))
 
     def add_p_voiced(self, **kwargs):
-        self.p_voiced_folder = kwargs.pop('p_voiced_folder', None)
-
-        if self.p_voiced_folder is None:
-            self.p_voiced_folder = Path(self.sup_data_path) / P_voiced.name
-
-        self.p_voiced_folder.mkdir(exist_ok=True, parents=True)
+        self.p_voiced_folder = self.get_sup_data_folder(P_voiced, kwargs.pop('p_voiced_folder', None))
 
     def add_energy(self, **kwargs):
-        self.energy_folder = kwargs.pop('energy_folder', None)
-
-        if self.energy_folder is None:
-            self.energy_folder = Path(self.sup_data_path) / Energy.name
-        elif isinstance(self.energy_folder, str):
-            self.energy_folder = Path(self.energy_folder)
-
-        self.energy_folder.mkdir(exist_ok=True, parents=True)
+        self.energy_folder = self.get_sup_data_folder(Energy, kwargs.pop('energy_folder', None))
 
     def add_speaker_id(self, **kwargs):
         pass
@@ -519,6 +513,42 @@ class TTSDataset(Dataset):
             log_mel = torch.log(torch.clamp(mel, min=torch.finfo(mel.dtype).tiny))
         return log_mel
 
+    def get_rel_audio_path_as_text_id(self, sample: Dict) -> str:
+        """Id of an utterance, under which its supplementary data is saved."""
+        # Let's keep audio name and all internal directories in rel_audio_path_as_text_id to avoid any collisions
+        rel_audio_path = Path(sample["audio_filepath"]).relative_to(self.base_data_dir).with_suffix("")
+        return str(rel_audio_path).replace("/", "_")
+
+    def get_num_frames(self, audio_length: int) -> int:
+        """Number of frames of the (log mel) spectrogram of audio with audio_length samples, without computing it."""
+        # torch.stft pads n_fft // 2 samples on both sides of the audio
+        return 1 + (int(audio_length) + 2 * (self.n_fft // 2) - self.n_fft) // self.hop_len
+
+    def load_sup_data(self, data_type: TTSDataType, rel_audio_path_as_text_id: str) -> Optional[torch.Tensor]:
+        """Loads supplementary data of an utterance from the packed store or from its .pt file, None if not found."""
+        store = self.sup_data_stores.get(data_type)
+        if store is not None:
+            data = store.get(rel_audio_path_as_text_id)
+            if data is not None:
+                return torch.from_numpy(data)
+
+        folder = getattr(self, f"{data_type.name}_folder")
+        if folder is None or not (folder / f"{rel_audio_path_as_text_id}.pt").exists():
+            return None
+
+        data = torch.load(folder / f"{rel_audio_path_as_text_id}.pt")
+        if store is not None:
+            store.put(rel_audio_path_as_text_id, data)
+        return data
+
+    def save_sup_data(self, data_type: TTSDataType, rel_audio_path_as_text_id: str, data: torch.Tensor):
+        """Saves supplementary data of an utterance to the packed store, or to a .pt file if there is no store."""
+        store = self.sup_data_stores.get(data_type)
+        if store is not None:
+            store.put(rel_audio_path_as_text_id, data)
+        else:
+            torch.save(data, getattr(self, f"{data_type.name}_folder") / f"{rel_audio_path_as_text_id}.pt")
+
     def pitch_shift(self, audio, sr, rel_audio_path_as_text_id):
         audio_shifted_path = Path(self.sup_data_path) / f"{rel_audio_path_as_text_id}_pitch_shift.pt"
         if audio_shifted_path.exists() and self.cache_pitch_augment:
@@ -545,10 +575,7 @@ class TTSDataset(Dataset):
 
     def __getitem__(self, index):
         sample = self.data[index]
-
-        # Let's keep audio name and all internal directories in rel_audio_path_as_text_id to avoid any collisions
-        rel_audio_path = Path(sample["audio_filepath"]).relative_to(self.base_data_dir).with_suffix("")
-        rel_audio_path_as_text_id = str(rel_audio_path).replace("/", "_")
+        rel_audio_path_as_text_id = self.get_rel_audio_path_as_text_id(sample)
 
         if (
             self.segment_max_duration is not None
@@ -608,13 +635,11 @@ class TTSDataset(Dataset):
             if mel_path is not None and Path(mel_path).exists():
                 log_mel = torch.load(mel_path)
             else:
-                mel_path = self.log_mel_folder / f"{rel_audio_path_as_text_id}.pt"
+                log_mel = self.load_sup_data(LogMel, rel_audio_path_as_text_id)
 
-                if mel_path.exists():
-                    log_mel = torch.load(mel_path)
-                else:
+                if log_mel is None:
                     log_mel = self.get_log_mel(audio)
-                    torch.save(log_mel, mel_path)
+                    self.save_sup_data(LogMel, rel_audio_path_as_text_id, log_mel)
 
             log_mel = log_mel.squeeze(0)
             log_mel_length = torch.tensor(log_mel.shape[1]).long()
@@ -627,7 +652,7 @@ class TTSDataset(Dataset):
         # Load alignment prior matrix if needed
         align_prior_matrix = None
         if AlignPriorMatrix in self.sup_data_types_set:
-            mel_len = self.get_log_mel(audio).shape[2]
+            mel_len = self.get_num_frames(audio_length)
             if self.use_beta_binomial_interpolator:
                 align_prior_matrix = torch.from_numpy(self.beta_binomial_interpolator(mel_len, text_length.item()))
             else:
@@ -637,12 +662,11 @@ class TTSDataset(Dataset):
         my_var = locals()
         for i, voiced_item in enumerate([Pitch, Voiced_mask, P_voiced]):
             if voiced_item in self.sup_data_types_set:
-                voiced_folder = getattr(self, f"{voiced_item.name}_folder")
-                voiced_filepath = voiced_folder / f"{rel_audio_path_as_text_id}.pt"
-                if voiced_filepath.exists():
-                    my_var.__setitem__(voiced_item.name, torch.load(voiced_filepath).float())
+                voiced_data = self.load_sup_data(voiced_item, rel_audio_path_as_text_id)
+                if voiced_data is not None:
+                    my_var.__setitem__(voiced_item.name, voiced_data.float())
                 else:
-                    non_exist_voiced_index.append((i, voiced_item.name, voiced_filepath))
+                    non_exist_voiced_index.append((i, voiced_item))
 
         if len(non_exist_voiced_index) != 0:
             voiced_tuple = librosa.pyin(
@@ -653,9 +677,9 @@ class TTSDataset(Dataset):
                 sr=self.sample_rate,
                 fill_na=0.0,
             )
-            for i, voiced_name, voiced_filepath in non_exist_voiced_index:
-                my_var.__setitem__(voiced_name, torch.from_numpy(voiced_tuple[i]).float())
-                torch.save(my_var.get(voiced_name), voiced_filepath)
+            for i, voiced_item in non_exist_voiced_index:
+                my_var.__setitem__(voiced_item.name, torch.from_numpy(voiced_tuple[i]).float())
+                self.save_sup_data(voiced_item, rel_audio_path_as_text_id, my_var.get(voiced_item.name))
 
         pitch = my_var.get('pitch', None)
         pitch_length = my_var.get('pitch_length', None)
@@ -688,14 +712,14 @@ class TTSDataset(Dataset):
         # Load energy if needed
         energy, energy_length = None, None
         if Energy in self.sup_data_types_set:
-            energy_path = self.energy_folder / f"{rel_audio_path_as_text_id}.pt"
+            energy = self.load_sup_data(Energy, rel_audio_path_as_text_id)
 
-            if energy_path.exists():
-                energy = torch.load(energy_path).float()
+            if energy is not None:
+                energy = energy.float()
             else:
                 spec = self.get_spec(audio)
                 energy = torch.linalg.norm(spec.squeeze(0), axis=0).float()
-                torch.save(energy, energy_path)
+                self.save_sup_data(Energy, rel_audio_path_as_text_id, energy)
 
             energy_length = torch.tensor(len(energy)).long()
 
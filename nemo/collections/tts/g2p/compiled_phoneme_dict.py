@@ -0,0 +1,226 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Compact, read-only phoneme dictionary which is memory-mapped from a binary file, so that it is loaded almost instantly
+and its memory is shared by all processes (e.g. DataLoader workers) that use the same file. The file consists of::
+
+    magic (8 bytes) | header size (uint64) | JSON header | sections, each aligned to 64 bytes:
+        words               sorted, UTF-8 encoded, null-padded to the length of the longest word
+        word_pron_offsets   uint32, index of the first pronunciation of every word, plus the total count
+        pron_offsets        uint32, index of the first phoneme id of every pronunciation, plus the total count
+        phoneme_ids         uint16, indices into the list of phoneme symbols stored in the header
+"""
+
+import hashlib
+import json
+import os
+import uuid
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from nemo.utils import logging
+
+__all__ = ["CompiledPhonemeDict", "get_file_hash"]
+
+MAGIC = b"NEMOPHD1"
+SECTION_ALIGNMENT = 64
+
+
+def get_file_hash(path: str) -> str:
+    """Returns the SHA-1 hex digest of the contents of a file."""
+    sha1 = hashlib.sha1()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            sha1.update(chunk)
+    return sha1.hexdigest()
+
+
+def _align(offset: int) -> int:
+    return offset + -offset % SECTION_ALIGNMENT
+
+
+class CompiledPhonemeDict(Mapping):
+    """
+    Read-only mapping from words to lists of pronunciations (lists of phoneme symbols), stored in a memory-mapped
+    file (see the module docstring). Can be used instead of a `Dict[str, List[List[str]]]` phoneme dictionary.
+
+    Args:
+        path: Path of a file written by `CompiledPhonemeDict.build`.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        mmap = np.memmap(path, dtype=np.uint8, mode="r")
+        if bytes(mmap[: len(MAGIC)]) != MAGIC:
+            raise ValueError(f"{path} is not a compiled phoneme dictionary.")
+
+        header_size = int(np.frombuffer(mmap, dtype="<u8", count=1, offset=len(MAGIC))[0])
+        header_offset = len(MAGIC) + 8
+        header = json.loads(bytes(mmap[header_offset : header_offset + header_size]).decode("utf-8"))
+        self.metadata: Dict[str, Any] = header["metadata"]
+        self.symbols: List[str] = header["symbols"]
+
+        sections = header["sections"]
+        self._words = np.ndarray(
+            (header["num_words"],), dtype=f"S{header['word_width']}", buffer=mmap, offset=sections["words"]
+        )
+        self._word_pron_offsets = np.ndarray(
+            (header["num_words"] + 1,), dtype="<u4", buffer=mmap, offset=sections["word_pron_offsets"]
+        )
+        self._pron_offsets = np.ndarray(
+            (header["num_prons"] + 1,), dtype="<u4", buffer=mmap, offset=sections["pron_offsets"]
+        )
+        self._phoneme_ids = np.ndarray(
+            (header["num_phonemes"],), dtype="<u2", buffer=mmap, offset=sections["phoneme_ids"]
+        )
+        self._word_width = header["word_width"]
+
+    def __getstate__(self):
+        # The file is mapped again instead of copying its contents into every process
+        return {"path": self.path}
+
+    def __setstate__(self, state):
+        self.__init__(state["path"])
+
+    @classmethod
+    def build(
+        cls, path: str, phoneme_dict: Dict[str, List[List[str]]], metadata: Optional[Dict[str, Any]] = None
+    ) -> 'CompiledPhonemeDict':
+        """
+        Compiles a phoneme dictionary into a file and maps it. The file is written atomically, so that processes
+        building the same file concurrently never read an incomplete one.
+
+        Args:
+            path: Path of the compiled dictionary.
+            phoneme_dict: Dictionary of the pronunciations of every word.
+            metadata: JSON serializable information about the dictionary, e.g. its source, see `load`.
+
+        Returns:
+            The compiled dictionary.
+        """
+        words = sorted(phoneme_dict, key=lambda word: word.encode("utf-8"))
+        symbols = sorted({symbol for prons in phoneme_dict.values() for pron in prons for symbol in pron})
+        if len(symbols) > np.iinfo(np.uint16).max:
+            raise ValueError(f"Phoneme dictionary has {len(symbols)} phoneme symbols, which is too many to compile.")
+        symbol_to_id = {symbol: i for i, symbol in enumerate(symbols)}
+
+        word_pron_offsets = [0]
+        pron_offsets = [0]
+        phoneme_ids = []
+        for word in words:
+            for pron in phoneme_dict[word]:
+                phoneme_ids.extend(symbol_to_id[symbol] for symbol in pron)
+                pron_offsets.append(len(phoneme_ids))
+            word_pron_offsets.append(len(pron_offsets) - 1)
+
+        encoded_words = np.array([word.encode("utf-8") for word in words], dtype=np.bytes_)
+        if len(words) == 0:
+            encoded_words = encoded_words.astype("S1")
+        arrays = {
+            "words": encoded_words,
+            "word_pron_offsets": np.array(word_pron_offsets, dtype="<u4"),
+            "pron_offsets": np.array(pron_offsets, dtype="<u4"),
+            "phoneme_ids": np.array(phoneme_ids, dtype="<u2"),
+        }
+
+        header = {
+            "metadata": metadata or {},
+            "symbols": symbols,
+            "num_words": len(words),
+            "word_width": encoded_words.dtype.itemsize,
+            "num_prons": len(pron_offsets) - 1,
+            "num_phonemes": len(phoneme_ids),
+        }
+        # The section offsets depend on the size of the header, which depends on the offsets: the header is padded
+        # to a size which is large enough for any offsets within the file.
+        header_bytes = json.dumps({**header, "sections": {name: 0 for name in arrays}}).encode("utf-8")
+        header_size = len(header_bytes) + 32 * len(arrays)
+        sections = {}
+        offset = _align(len(MAGIC) + 8 + header_size)
+        for name, array in arrays.items():
+            sections[name] = offset
+            offset = _align(offset + array.nbytes)
+        header_bytes = json.dumps({**header, "sections": sections}).encode("utf-8").ljust(header_size)
+
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        tmp_path = f"{path}.{uuid.uuid4().hex}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(MAGIC)
+            f.write(np.array([header_size], dtype="<u8").tobytes())
+            f.write(header_bytes)
+            for name, array in arrays.items():
+                f.seek(sections[name])
+                f.write(array.tobytes())
+            f.truncate(offset)
+        os.replace(tmp_path, path)
+        logging.info(f"Compiled a phoneme dictionary of {len(words)} words into {path}")
+        return cls(path)
+
+    @classmethod
+    def load(cls, path: str, metadata: Optional[Dict[str, Any]] = None) -> Optional['CompiledPhonemeDict']:
+        """
+        Maps a compiled dictionary, if it exists and was built with the given metadata.
+
+        Args:
+            path: Path of the compiled dictionary.
+            metadata: Values which must match the metadata the dictionary was built with.
+
+        Returns:
+            The compiled dictionary, or None if the file does not exist or its metadata does not match.
+        """
+        if not os.path.exists(path):
+            return None
+        try:
+            compiled_dict = cls(path)
+        except ValueError as e:
+            logging.warning(f"{e} It will be rebuilt.")
+            return None
+        if any(compiled_dict.metadata.get(key) != value for key, value in (metadata or {}).items()):
+            logging.info(f"The compiled phoneme dictionary {path} is outdated and will be rebuilt.")
+            return None
+        return compiled_dict
+
+    def _find(self, word: str) -> int:
+        """Returns the index of `word` in the sorted word table, or -1 if it is not in the dictionary."""
+        if not isinstance(word, str):
+            return -1
+        key = word.encode("utf-8")
+        if not key or len(key) > self._word_width or key.endswith(b"\0"):
+            return -1
+        index = int(np.searchsorted(self._words, key))
+        if index < len(self._words) and self._words[index] == key:
+            return index
+        return -1
+
+    def __contains__(self, word: str) -> bool:
+        return self._find(word) >= 0
+
+    def __getitem__(self, word: str) -> List[List[str]]:
+        index = self._find(word)
+        if index < 0:
+            raise KeyError(word)
+        prons = []
+        for pron_index in range(self._word_pron_offsets[index], self._word_pron_offsets[index + 1]):
+            phoneme_ids = self._phoneme_ids[self._pron_offsets[pron_index] : self._pron_offsets[pron_index + 1]]
+            prons.append([self.symbols[phoneme_id] for phoneme_id in phoneme_ids.tolist()])
+        return prons
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def __iter__(self) -> Iterator[str]:
+        return (word.decode("utf-8") for word in self._words)
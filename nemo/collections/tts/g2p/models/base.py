@@ -12,11 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 from abc import ABC, abstractmethod
-from typing import Optional
+from collections import OrderedDict
+from typing import List, Optional, Sequence
+
 from nemo.utils import logging
 
 
+def _init_g2p_process(g2p):
+    global g2p_global  # process-global
+    g2p_global = g2p
+    # every process must sample graphemes/phonemes with a different random state
+    if hasattr(g2p_global, "_rng"):
+        g2p_global._rng.seed()
+
+
+def _g2p_call(text: str) -> List[str]:
+    return g2p_global(text)
+
+
 class BaseG2p(ABC):
     def __init__(
         self,
@@ -24,6 +39,7 @@ class BaseG2p(ABC):
         word_tokenize_func=lambda x: x,
         apply_to_oov_word=None,
         mapping_file: Optional[str] = None,
+        pronunciation_cache_size: int = 0,
     ):
         """Abstract class for creating an arbitrary module to convert grapheme words
         to phoneme sequences, leave unchanged, or use apply_to_oov_word.
@@ -31,17 +47,70 @@ class BaseG2p(ABC):
             phoneme_dict: Arbitrary representation of dictionary (phoneme -> grapheme) for known words.
             word_tokenize_func: Function for tokenizing text to words.
             apply_to_oov_word: Function that will be applied to out of phoneme_dict word.
+            pronunciation_cache_size: Maximum number of words whose pronunciations are kept in a least recently used
+                cache, see `get_pronunciation`. Defaults to 0, i.e. no cache.
         """
         self.phoneme_dict = phoneme_dict
         self.word_tokenize_func = word_tokenize_func
         self.apply_to_oov_word = apply_to_oov_word
         self.mapping_file = mapping_file
         self.heteronym_model = None  # heteronym classification model
+        self.pronunciation_cache_size = pronunciation_cache_size
+        self._pronunciation_cache = OrderedDict()
 
     @abstractmethod
     def __call__(self, text: str) -> str:
         pass
 
+    def convert_word(self, word: str) -> List[str]:
+        """Converts a single word, which is not marked as unchangeable by `word_tokenize_func`."""
+        raise NotImplementedError(f"{type(self).__name__} does not support word-level conversion.")
+
+    def get_pronunciation(self, word: str) -> Sequence[str]:
+        """
+        Returns the result of `convert_word(word)`, looked up in a least recently used cache of the pronunciations
+        of up to `pronunciation_cache_size` words. The cache is bypassed while `phoneme_probability` is set, because
+        words are then randomly kept as graphemes.
+        """
+        if self.pronunciation_cache_size <= 0 or getattr(self, "phoneme_probability", None) is not None:
+            return self.convert_word(word)
+
+        pron = self._pronunciation_cache.get(word)
+        if pron is not None:
+            self._pronunciation_cache.move_to_end(word)
+            return pron
+
+        pron = tuple(self.convert_word(word))
+        self._pronunciation_cache[word] = pron
+        if len(self._pronunciation_cache) > self.pronunciation_cache_size:
+            self._pronunciation_cache.popitem(last=False)
+        return pron
+
+    def clear_pronunciation_cache(self):
+        """Has to be called after changing the phoneme dict or any other setting which affects pronunciations."""
+        self._pronunciation_cache.clear()
+
+    def batch_call(self, texts: List[str], num_workers: int = 1, chunksize: int = 1000) -> List[List[str]]:
+        """
+        Converts many texts, in `num_workers` processes if greater than 1. Every process works with its own copy of
+        this module, including its pronunciation cache.
+
+        Args:
+            texts: Texts to convert.
+            num_workers: Number of processes.
+            chunksize: Number of texts sent to a process at once.
+
+        Returns:
+            The results of calling this module on every text.
+        """
+        if num_workers <= 1 or len(texts) <= 1:
+            return [self(text) for text in texts]
+
+        with concurrent.futures.ProcessPoolExecutor(
+            initializer=_init_g2p_process, initargs=(self,), max_workers=num_workers
+        ) as pool:
+            return list(pool.map(_g2p_call, texts, chunksize=chunksize))
+
     # TODO @xueyang: replace `wordid_to_phonemes_file` default variable with a global variable defined in util file.
     def setup_heteronym_model(
         self,
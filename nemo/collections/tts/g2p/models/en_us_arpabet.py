@@ -22,12 +22,17 @@ import nltk
 import torch
 
 from nemo.collections.common.tokenizers.text_to_speech.tokenizer_utils import english_word_tokenize
+from nemo.collections.tts.g2p.compiled_phoneme_dict import CompiledPhonemeDict, get_file_hash
 from nemo.collections.tts.g2p.models.base import BaseG2p
 from nemo.utils import logging
 from nemo.utils.get_rank import is_global_rank_zero
 
 
 class EnglishG2p(BaseG2p):
+    # Regex for roman characters, accented characters and digits, words without any of them are punctuation
+    CHAR_REGEX = re.compile(r"[a-zA-ZÀ-ÿ\d]")
+    ALT_REGEX = re.compile(r'\([0-9]+\)')
+
     def __init__(
         self,
         phoneme_dict=None,
@@ -38,6 +43,8 @@ class EnglishG2p(BaseG2p):
         encoding='latin-1',
         phoneme_probability: Optional[float] = None,
         mapping_file: Optional[str] = None,
+        pronunciation_cache_size: int = 10000,
+        compiled_phoneme_dict_path: Optional[str] = None,
     ):
         """English G2P module. This module converts words from grapheme to phoneme representation using phoneme_dict in CMU dict format.
         Optionally, it can ignore words which are heteronyms, ambiguous or marked as unchangeable by word_tokenize_func (see code for details).
@@ -55,12 +62,16 @@ class EnglishG2p(BaseG2p):
             phoneme_probability (Optional[float]): The probability (0.<var<1.) that each word is phonemized. Defaults to None which is the same as 1.
                 Note that this code path is only run if the word can be phonemized. For example: If the word does not have an entry in the g2p dict, it will be returned
                 as characters. If the word has multiple entries and ignore_ambiguous_words is True, it will be returned as characters.
+            pronunciation_cache_size (int): Maximum number of words whose pronunciations are cached while phoneme_probability is None.
+                Defaults to 10000. Set to 0 to disable the cache.
+            compiled_phoneme_dict_path (Optional[str]): Path of a compiled, memory-mapped copy of phoneme_dict (see CompiledPhonemeDict),
+                which is used instead of parsing phoneme_dict. It is built if it does not exist or phoneme_dict has changed.
+                Requires phoneme_dict to be a path. Defaults to None, i.e. phoneme_dict is parsed into a Python dict.
         """
-        phoneme_dict = (
-            self._parse_as_cmu_dict(phoneme_dict, encoding)
-            if isinstance(phoneme_dict, str) or isinstance(phoneme_dict, pathlib.Path) or phoneme_dict is None
-            else phoneme_dict
-        )
+        if compiled_phoneme_dict_path is not None:
+            phoneme_dict = self._load_compiled_dict(phoneme_dict, compiled_phoneme_dict_path, encoding)
+        elif isinstance(phoneme_dict, str) or isinstance(phoneme_dict, pathlib.Path) or phoneme_dict is None:
+            phoneme_dict = self._parse_as_cmu_dict(phoneme_dict, encoding)
 
         if apply_to_oov_word is None:
             logging.warning(
@@ -75,6 +86,7 @@ class EnglishG2p(BaseG2p):
             word_tokenize_func=word_tokenize_func,
             apply_to_oov_word=apply_to_oov_word,
             mapping_file=mapping_file,
+            pronunciation_cache_size=pronunciation_cache_size,
         )
 
         self.ignore_ambiguous_words = ignore_ambiguous_words
@@ -127,13 +139,12 @@ class EnglishG2p(BaseG2p):
 
             return nltk.corpus.cmudict.dict()
 
-        _alt_re = re.compile(r'\([0-9]+\)')
         g2p_dict = {}
         with open(phoneme_dict_path, encoding=encoding) as file:
             for line in file:
                 if len(line) and ('A' <= line[0] <= 'Z' or line[0] == "'"):
                     parts = line.split('  ')
-                    word = re.sub(_alt_re, '', parts[0])
+                    word = EnglishG2p.ALT_REGEX.sub('', parts[0])
                     word = word.lower()
 
                     pronunciation = parts[1].strip().split(" ")
@@ -143,6 +154,19 @@ class EnglishG2p(BaseG2p):
                         g2p_dict[word] = [pronunciation]
         return g2p_dict
 
+    @staticmethod
+    def _load_compiled_dict(phoneme_dict_path, compiled_phoneme_dict_path, encoding='latin-1'):
+        if not isinstance(phoneme_dict_path, (str, pathlib.Path)):
+            raise ValueError("compiled_phoneme_dict_path requires phoneme_dict to be the path of a CMU dict file.")
+
+        metadata = {"g2p": "EnglishG2p", "source_hash": get_file_hash(phoneme_dict_path), "encoding": encoding}
+        compiled_dict = CompiledPhonemeDict.load(compiled_phoneme_dict_path, metadata)
+        if compiled_dict is None:
+            compiled_dict = CompiledPhonemeDict.build(
+                compiled_phoneme_dict_path, EnglishG2p._parse_as_cmu_dict(phoneme_dict_path, encoding), metadata
+            )
+        return compiled_dict
+
     @staticmethod
     def _parse_file_by_lines(p, encoding):
         with open(p, encoding=encoding) as f:
@@ -161,7 +185,7 @@ class EnglishG2p(BaseG2p):
             return word, True
 
         # punctuation or whitespace.
-        if re.search(r"[a-zA-ZÀ-ÿ\d]", word) is None:
+        if self.CHAR_REGEX.search(word) is None:
             return list(word), True
 
         # heteronyms
@@ -197,6 +221,20 @@ class EnglishG2p(BaseG2p):
         else:
             return word, False
 
+    def convert_word(self, word):
+        word_by_hyphen = word.split("-")
+        pron, is_handled = self.parse_one_word(word)
+
+        if not is_handled and len(word_by_hyphen) > 1:
+            pron = []
+            for sub_word in word_by_hyphen:
+                p, _ = self.parse_one_word(sub_word)
+                pron.extend(p)
+                pron.extend(["-"])
+            pron.pop()
+
+        return pron
+
     def __call__(self, text):
         words = self.word_tokenize_func(text)
 
@@ -206,18 +244,6 @@ class EnglishG2p(BaseG2p):
                 prons.extend(word)
                 continue
 
-            word_str = word[0]
-            word_by_hyphen = word_str.split("-")
-            pron, is_handled = self.parse_one_word(word_str)
-
-            if not is_handled and len(word_by_hyphen) > 1:
-                pron = []
-                for sub_word in word_by_hyphen:
-                    p, _ = self.parse_one_word(sub_word)
-                    pron.extend(p)
-                    pron.extend(["-"])
-                pron.pop()
-
-            prons.extend(pron)
+            prons.extend(self.get_pronunciation(word[0]))
 
         return prons
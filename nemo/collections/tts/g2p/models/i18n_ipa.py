@@ -25,6 +25,7 @@ from nemo.collections.common.tokenizers.text_to_speech.tokenizer_utils import (
     english_word_tokenize,
     normalize_unicode_text,
 )
+from nemo.collections.tts.g2p.compiled_phoneme_dict import CompiledPhonemeDict, get_file_hash
 from nemo.collections.tts.g2p.models.base import BaseG2p
 from nemo.collections.tts.g2p.utils import GRAPHEME_CASE_MIXED, GRAPHEME_CASE_UPPER, set_grapheme_case
 from nemo.utils import logging
@@ -38,6 +39,8 @@ class IpaG2p(BaseG2p):
     # Regex for roman characters, accented characters, and locale-agnostic numbers/digits
     CHAR_REGEX = re.compile(fr"[{LATIN_CHARS_ALL}\d]")
     PUNCT_REGEX = re.compile(fr"[^{LATIN_CHARS_ALL}\d]")
+    ALT_REGEX = re.compile(r"\([0-9]+\)")
+    WHITESPACE_REGEX = re.compile(r"\s+")
     # fmt: on
 
     def __init__(
@@ -53,6 +56,8 @@ class IpaG2p(BaseG2p):
         grapheme_case: Optional[str] = GRAPHEME_CASE_UPPER,
         grapheme_prefix: Optional[str] = "",
         mapping_file: Optional[str] = None,
+        pronunciation_cache_size: int = 10000,
+        compiled_phoneme_dict_path: Optional[str] = None,
     ) -> None:
         """
         Generic IPA G2P module. This module converts words from graphemes to International Phonetic Alphabet
@@ -92,6 +97,13 @@ class IpaG2p(BaseG2p):
                 from phonemes because there may be overlaps between the two set. It is suggested to choose a prefix that
                 is not used or preserved somewhere else. "#" could be a good candidate. Default to "".
             TODO @borisfom: add docstring for newly added `mapping_file` argument.
+            pronunciation_cache_size (int): Maximum number of words whose pronunciations are cached, while
+                `phoneme_probability` is None. Defaults to 10000. Set to 0 to disable the cache.
+            compiled_phoneme_dict_path (Optional[str]): Path of a compiled, memory-mapped copy of the normalized
+                `phoneme_dict` (see `CompiledPhonemeDict`), which is used instead of parsing `phoneme_dict`. It is built
+                if it does not exist, or if `phoneme_dict` or any setting which affects the normalized dictionary has
+                changed. Requires `phoneme_dict` to be a path. Defaults to None, i.e. `phoneme_dict` is parsed into a
+                Python dict.
         """
         self.use_stresses = use_stresses
         self.grapheme_case = grapheme_case
@@ -112,13 +124,17 @@ class IpaG2p(BaseG2p):
         else:
             self.use_chars = use_chars
 
-        phoneme_dict_obj = self._parse_phoneme_dict(phoneme_dict)
-
-        # verify if phoneme dict obj is empty
-        if phoneme_dict_obj:
-            _phoneme_dict, self.symbols = self._normalize_dict(phoneme_dict_obj)
+        if compiled_phoneme_dict_path is not None:
+            _phoneme_dict = self._load_compiled_dict(phoneme_dict, compiled_phoneme_dict_path)
+            self.symbols = set(_phoneme_dict.metadata["symbols"])
         else:
-            raise ValueError(f"{phoneme_dict} contains no entries!")
+            phoneme_dict_obj = self._parse_phoneme_dict(phoneme_dict)
+
+            # verify if phoneme dict obj is empty
+            if phoneme_dict_obj:
+                _phoneme_dict, self.symbols = self._normalize_dict(phoneme_dict_obj)
+            else:
+                raise ValueError(f"{phoneme_dict} contains no entries!")
 
         if apply_to_oov_word is None:
             logging.warning(
@@ -141,6 +157,7 @@ class IpaG2p(BaseG2p):
             word_tokenize_func=word_tokenize_func,
             apply_to_oov_word=apply_to_oov_word,
             mapping_file=mapping_file,
+            pronunciation_cache_size=pronunciation_cache_size,
         )
 
         self.ignore_ambiguous_words = ignore_ambiguous_words
@@ -173,7 +190,6 @@ class IpaG2p(BaseG2p):
             # load the dictionary file where there may exist a digit suffix after a word, e.g. "Word(2)", which
             # represents the pronunciation variant of that word.
             phoneme_dict_obj = defaultdict(list)
-            _alt_re = re.compile(r"\([0-9]+\)")
             with open(phoneme_dict, "r", encoding="utf-8") as fdict:
                 for line in fdict:
                     # skip the empty lines
@@ -195,8 +211,8 @@ class IpaG2p(BaseG2p):
                         or line[0] == "'"
                     ):
                         parts = line.strip().split(maxsplit=1)
-                        word = re.sub(_alt_re, "", parts[0])
-                        prons = re.sub(r"\s+", "", parts[1])
+                        word = IpaG2p.ALT_REGEX.sub("", parts[0])
+                        prons = IpaG2p.WHITESPACE_REGEX.sub("", parts[1])
                         phoneme_dict_obj[word].append(list(prons))
         else:
             # Load phoneme_dict as dictionary object
@@ -219,11 +235,41 @@ class IpaG2p(BaseG2p):
 
         return phoneme_dict_obj
 
+    def _load_compiled_dict(
+        self, phoneme_dict: Union[str, pathlib.Path], compiled_phoneme_dict_path: str
+    ) -> CompiledPhonemeDict:
+        """
+        Maps the compiled copy of the normalized `phoneme_dict`, building it if it is missing or outdated.
+        """
+        if not isinstance(phoneme_dict, (str, pathlib.Path)):
+            raise ValueError("compiled_phoneme_dict_path requires phoneme_dict to be the path of a dictionary file.")
+
+        # the compiled dictionary is normalized, so it depends on the settings used by `_normalize_dict`
+        metadata = {
+            "g2p": "IpaG2p",
+            "source_hash": get_file_hash(phoneme_dict),
+            "use_chars": self.use_chars,
+            "use_stresses": self.use_stresses,
+            "grapheme_case": self.grapheme_case,
+            "grapheme_prefix": self.grapheme_prefix,
+        }
+        compiled_dict = CompiledPhonemeDict.load(compiled_phoneme_dict_path, metadata)
+        if compiled_dict is None:
+            phoneme_dict_obj = self._parse_phoneme_dict(phoneme_dict)
+            if not phoneme_dict_obj:
+                raise ValueError(f"{phoneme_dict} contains no entries!")
+            g2p_dict, symbols = self._normalize_dict(phoneme_dict_obj)
+            compiled_dict = CompiledPhonemeDict.build(
+                compiled_phoneme_dict_path, g2p_dict, metadata={**metadata, "symbols": sorted(symbols)}
+            )
+        return compiled_dict
+
     def replace_dict(self, phoneme_dict: Union[str, pathlib.Path, Dict[str, List[List[str]]]]):
         """
         Replace model's phoneme dictionary with a custom one
         """
         self.phoneme_dict = self._parse_phoneme_dict(phoneme_dict)
+        self.clear_pronunciation_cache()
 
     @staticmethod
     def _parse_file_by_lines(p: Union[str, pathlib.Path]) -> List[str]:
@@ -301,6 +347,9 @@ class IpaG2p(BaseG2p):
                 Defaults to True.
         """
         new_symbols = set(symbols)
+        if isinstance(self.phoneme_dict, CompiledPhonemeDict):
+            # the compiled dictionary is read-only
+            self.phoneme_dict = dict(self.phoneme_dict.items())
 
         # Keep track of what will need to be deleted or (if keep_alternate=True) replaced
         deletion_words = []
@@ -339,6 +388,7 @@ class IpaG2p(BaseG2p):
             self.phoneme_dict.update(replacement_dict)
 
         self.symbols = new_symbols
+        self.clear_pronunciation_cache()
 
     def is_unique_in_phoneme_dict(self, word: str) -> bool:
         return len(self.phoneme_dict[word]) == 1
@@ -448,14 +498,48 @@ class IpaG2p(BaseG2p):
         else:
             return self._prepend_prefix_for_one_word(word), False
 
+    def convert_word(self, word: str) -> List[str]:
+        pron, is_handled = self.parse_one_word(word)
+
+        # If `is_handled` is False, then the only possible case is that the word is an OOV. The OOV may have a
+        # hyphen so that it doesn't show up in the g2p dictionary. We need split it into sub-words by a hyphen,
+        # and parse the sub-words again just in case any sub-word exists in the g2p dictionary.
+        if not is_handled:
+            subwords_by_hyphen = word.split("-")
+            if len(subwords_by_hyphen) > 1:
+                pron = []  # reset the previous pron
+                for sub_word in subwords_by_hyphen:
+                    p, _ = self.parse_one_word(sub_word)
+                    pron.extend(p)
+                    pron.append("-")
+                pron.pop()  # remove the redundant hyphen that is previously appended at the end of the word.
+
+        return pron
+
+    def _disambiguate_heteronyms(self, texts: List[str]) -> List[str]:
+        try:
+            return self.heteronym_model.disambiguate(sentences=texts)[1]
+        except Exception as e:
+            logging.warning(f"Heteronym model failed {e}, skipping")
+            return texts
+
+    def batch_call(self, texts: List[str], num_workers: int = 1, chunksize: int = 1000) -> List[List[str]]:
+        if self.heteronym_model is None:
+            return super().batch_call(texts, num_workers=num_workers, chunksize=chunksize)
+
+        # disambiguate the heteronyms of all texts in a single pass of the heteronym model
+        texts = self._disambiguate_heteronyms([normalize_unicode_text(text) for text in texts])
+        heteronym_model, self.heteronym_model = self.heteronym_model, None
+        try:
+            return super().batch_call(texts, num_workers=num_workers, chunksize=chunksize)
+        finally:
+            self.heteronym_model = heteronym_model
+
     def __call__(self, text: str) -> List[str]:
         text = normalize_unicode_text(text)
 
         if self.heteronym_model is not None:
-            try:
-                text = self.heteronym_model.disambiguate(sentences=[text])[1][0]
-            except Exception as e:
-                logging.warning(f"Heteronym model failed {e}, skipping")
+            text = self._disambiguate_heteronyms([text])[0]
 
         words_list_of_tuple = self.word_tokenize_func(text)
 
@@ -469,22 +553,7 @@ class IpaG2p(BaseG2p):
                     len(words) == 1
                 ), f"{words} should only have a single item when `without_changes` is False, but found {len(words)}."
 
-                word = words[0]
-                pron, is_handled = self.parse_one_word(word)
-
-                # If `is_handled` is False, then the only possible case is that the word is an OOV. The OOV may have a
-                # hyphen so that it doesn't show up in the g2p dictionary. We need split it into sub-words by a hyphen,
-                # and parse the sub-words again just in case any sub-word exists in the g2p dictionary.
-                if not is_handled:
-                    subwords_by_hyphen = word.split("-")
-                    if len(subwords_by_hyphen) > 1:
-                        pron = []  # reset the previous pron
-                        for sub_word in subwords_by_hyphen:
-                            p, _ = self.parse_one_word(sub_word)
-                            pron.extend(p)
-                            pron.append("-")
-                        pron.pop()  # remove the redundant hyphen that is previously appended at the end of the word.
-
-                prons.extend(pron)
+                # `parse_one_word` starts with setting the grapheme case, so it is the normalized form of the word
+                prons.extend(self.get_pronunciation(set_grapheme_case(words[0], case=self.grapheme_case)))
 
         return prons
@@ -12,40 +12,26 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-from nemo.collections.tts.models.aligner import AlignerModel
-from nemo.collections.tts.models.audio_codec import AudioCodecModel
-from nemo.collections.tts.models.fastpitch import FastPitchModel
-from nemo.collections.tts.models.fastpitch_ssl import FastPitchModel_SSL
-from nemo.collections.tts.models.hifigan import HifiGanModel
-from nemo.collections.tts.models.magpietts import MagpieTTS_Model, MagpieTTS_ModelDPO, MagpieTTS_ModelInference
-from nemo.collections.tts.models.mixer_tts import MixerTTSModel
-from nemo.collections.tts.models.radtts import RadTTSModel
-from nemo.collections.tts.models.spectrogram_enhancer import SpectrogramEnhancerModel
-from nemo.collections.tts.models.ssl_tts import SSLDisentangler
-from nemo.collections.tts.models.tacotron2 import Tacotron2Model
-from nemo.collections.tts.models.two_stages import GriffinLimModel, MelPsuedoInverseModel, TwoStagesModel
-from nemo.collections.tts.models.univnet import UnivNetModel
-from nemo.collections.tts.models.vits import VitsModel
-from nemo.collections.tts.models.waveglow import WaveGlowModel
+from nemo.utils.import_utils import lazy_import
 
-__all__ = [
-    "AlignerModel",
-    "AudioCodecModel",
-    "FastPitchModel",
-    "FastPitchModel_SSL",
-    "SSLDisentangler",
-    "GriffinLimModel",
-    "HifiGanModel",
-    "MelPsuedoInverseModel",
-    "MixerTTSModel",
-    "RadTTSModel",
-    "MagpieTTS_Model",
-    "MagpieTTS_ModelInference",
-    "MagpieTTS_ModelDPO",
-    "Tacotron2Model",
-    "TwoStagesModel",
-    "UnivNetModel",
-    "VitsModel",
-    "WaveGlowModel",
-    "SpectrogramEnhancerModel",
-]
+# The models are imported on first access, see `lazy_import`
+__getattr__, __dir__, __all__ = lazy_import(
+    __name__,
+    attributes={
+        "aligner": ["AlignerModel"],
+        "audio_codec": ["AudioCodecModel"],
+        "fastpitch": ["FastPitchModel"],
+        "fastpitch_ssl": ["FastPitchModel_SSL"],
+        "hifigan": ["HifiGanModel"],
+        "magpietts": ["MagpieTTS_Model", "MagpieTTS_ModelDPO", "MagpieTTS_ModelInference"],
+        "mixer_tts": ["MixerTTSModel"],
+        "radtts": ["RadTTSModel"],
+        "spectrogram_enhancer": ["SpectrogramEnhancerModel"],
+        "ssl_tts": ["SSLDisentangler"],
+        "tacotron2": ["Tacotron2Model"],
+        "two_stages": ["GriffinLimModel", "MelPsuedoInverseModel", "TwoStagesModel"],
+        "univnet": ["UnivNetModel"],
+        "vits": ["VitsModel"],
+        "waveglow": ["WaveGlowModel"],
+    },
+)
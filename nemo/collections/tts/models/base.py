@@ -28,6 +28,7 @@ from nemo.core.classes.common import PretrainedModelInfo, typecheck
 from nemo.core.neural_types.elements import AudioSignal
 from nemo.core.neural_types.neural_type import NeuralType
 from nemo.utils import logging, model_utils
+from nemo.utils.import_utils import import_all_lazy_attributes
 
 PYNINI_AVAILABLE = True
 try:
@@ -92,6 +93,8 @@ class SpectrogramGenerator(NeedsNormalizer, ModelPT, ABC):
         Returns:
             List of available pre-trained models.
         """
+        # the models are imported lazily, import all of them to find their subclasses
+        import_all_lazy_attributes('nemo.collections.tts.models')
         list_of_models = []
         for subclass in cls.__subclasses__():
             subclass_models = subclass.list_available_models()
@@ -137,6 +140,8 @@ class Vocoder(ModelPT, ABC):
         Returns:
             List of available pre-trained models.
         """
+        # the models are imported lazily, import all of them to find their subclasses
+        import_all_lazy_attributes('nemo.collections.tts.models')
         list_of_models = []
         for subclass in cls.__subclasses__():
             subclass_models = subclass.list_available_models()
@@ -279,6 +284,8 @@ class MelToSpec(ModelPT, ABC):
         Returns:
             List of available pre-trained models.
         """
+        # the models are imported lazily, import all of them to find their subclasses
+        import_all_lazy_attributes('nemo.collections.tts.models')
         list_of_models = []
         for subclass in cls.__subclasses__():
             subclass_models = subclass.list_available_models()
@@ -315,6 +322,8 @@ class TextToWaveform(NeedsNormalizer, ModelPT, ABC):
         Returns:
             List of available pre-trained models.
         """
+        # the models are imported lazily, import all of them to find their subclasses
+        import_all_lazy_attributes('nemo.collections.tts.models')
         list_of_models = []
         for subclass in cls.__subclasses__():
             subclass_models = subclass.list_available_models()
@@ -21,7 +21,9 @@ import hashlib
 import inspect
 import os
 import shutil
+import time
 import traceback
+import weakref
 from abc import ABC, abstractmethod
 from collections.abc import Mapping, Sequence
 from contextlib import contextmanager
@@ -53,6 +55,8 @@ __all__ = ['Typing', 'FileIO', 'Model', 'Serialization', 'typecheck', 'Pretraine
 
 _TYPECHECK_ENABLED = True
 _TYPECHECK_SEMANTIC_CHECK_ENABLED = True
+_TYPECHECK_CACHED_CHECKS_ENABLED = False
+_TYPECHECK_NUM_VALIDATED_CALLS = 1
 # TODO @blisc: Remove _HAS_HYDRA
 _HAS_HYDRA = True
 
@@ -123,6 +127,13 @@ def is_semantic_typecheck_enabled():
     return _TYPECHECK_SEMANTIC_CHECK_ENABLED
 
 
+def is_cached_typecheck_enabled():
+    """
+    Getter method for the state of cached type checks.
+    """
+    return _TYPECHECK_CACHED_CHECKS_ENABLED
+
+
 @dataclass
 class TypecheckMetadata:
     """
@@ -210,6 +221,120 @@ class TypecheckMetadata:
         }
 
 
+@dataclass
+class TypecheckStats:
+    """
+    Counters of the cached type checks of one method of one class, see `typecheck.set_cached_checks_enabled`.
+
+    calls: Number of calls of the method.
+    validated_calls: Number of calls whose inputs and outputs were fully validated.
+    typecheck_time: Total time in seconds spent in type checks, excluding the method itself.
+    """
+
+    calls: int = 0
+    validated_calls: int = 0
+    typecheck_time: float = 0.0
+
+
+_TYPECHECK_STATS: Dict[str, TypecheckStats] = {}
+# All `typecheck` decorators, to drop their cached plans in `typecheck.reset_cached_checks`
+_TYPECHECK_DECORATORS = weakref.WeakSet()
+
+
+class TypecheckPlan:
+    """
+    Type information of a typed method of one instance, resolved once for the cached type checks.
+
+    The inputs are fully validated on the first calls, and on every call whose input signature (argument names,
+    object types, ranks, dtypes and attached neural types of the arguments) was not validated before.
+    All other calls only attach the output neural types.
+
+    Args:
+        input_types: Resolved input types of the method, or None.
+        output_types: Resolved output types of the method, or None.
+        ignore_collections: Same as for `TypecheckMetadata`.
+        stats: Counters shared by all instances of the class.
+        max_signatures: Maximum number of validated signatures to remember.
+    """
+
+    def __init__(
+        self,
+        input_types: Optional[Dict[str, NeuralType]],
+        output_types: Optional[Dict[str, NeuralType]],
+        ignore_collections: bool,
+        stats: TypecheckStats,
+        max_signatures: int = 64,
+    ):
+        self.input_types = input_types
+        self.output_types = output_types
+        self.stats = stats
+        self.max_signatures = max_signatures
+        self.num_calls = 0
+        self.signatures = set()
+        # Keeps the neural types of validated signatures alive, so that their ids are not reused
+        self.neural_types = {}
+
+        self.fast_output_types = None
+        if output_types is not None:
+            metadata = TypecheckMetadata(original_types=output_types, ignore_collections=ignore_collections)
+            if not metadata.has_container_types:
+                self.fast_output_types = list(metadata.base_types.values())
+
+    def get_signature(self, kwargs: Dict[str, Any]) -> Optional[Tuple]:
+        """Returns the signature of the arguments, or None if it cannot be cached (containers)."""
+        signature = [is_semantic_typecheck_enabled()]
+        for key, value in kwargs.items():
+            if isinstance(value, (list, tuple)):
+                return None
+            shape = getattr(value, 'shape', None)
+            if shape is None:
+                signature.append((key, type(value)))
+            else:
+                neural_type = getattr(value, 'neural_type', None)
+                signature.append((key, type(value), len(shape), getattr(value, 'dtype', None), id(neural_type)))
+        return tuple(signature)
+
+    def should_validate(self, kwargs: Dict[str, Any]) -> bool:
+        """Returns whether the call with these arguments must be fully validated."""
+        self.num_calls += 1
+        signature = self.get_signature(kwargs)
+        if signature is None:
+            return True
+        if signature in self.signatures and self.num_calls > _TYPECHECK_NUM_VALIDATED_CALLS:
+            return False
+        if len(self.signatures) >= self.max_signatures:
+            self.signatures.clear()
+            self.neural_types.clear()
+        self.signatures.add(signature)
+        for value in kwargs.values():
+            neural_type = getattr(value, 'neural_type', None)
+            if neural_type is not None:
+                self.neural_types[id(neural_type)] = neural_type
+        return True
+
+    def attach_output_types(self, outputs) -> bool:
+        """
+        Attaches the output neural types without validation.
+
+        Returns:
+            False if the outputs need the full `Typing._attach_and_validate_output_types` (containers).
+        """
+        if self.fast_output_types is None:
+            return False
+        if not isinstance(outputs, (list, tuple)):
+            outputs = (outputs,)
+        elif len(outputs) > len(self.fast_output_types):
+            return False
+        for obj, type_val in zip(outputs, self.fast_output_types):
+            if isinstance(obj, (list, tuple)):
+                return False
+            try:
+                obj.neural_type = type_val
+            except Exception:
+                pass
+        return True
+
+
 class Typing(ABC):
     """
     An interface which endows module with neural types
@@ -1074,6 +1199,9 @@ class typecheck:
             self.output_override = True
 
         self.ignore_collections = ignore_collections
+        # Cached type check plans of the instances, see `set_cached_checks_enabled`
+        self._plans = weakref.WeakKeyDictionary()
+        _TYPECHECK_DECORATORS.add(self)
 
     def __call__(self, wrapped):
         return self.wrapped_call(wrapped)
@@ -1096,6 +1224,35 @@ class typecheck:
                 if depth checks are skipped entirely.
 
         """
+        if _TYPECHECK_CACHED_CHECKS_ENABLED:
+            plan = self._get_plan(wrapped, instance)
+            if plan is not None:
+                return self._cached_call(plan, wrapped, instance, args, kwargs)
+
+        input_types, output_types = self._resolve_types(instance)
+
+        # If types are not defined, skip type checks and just call the wrapped method
+        if input_types is None and output_types is None:
+            return wrapped(*args, **kwargs)
+
+        # Check that all arguments are kwargs
+        if input_types is not None and len(args) > 0:
+            raise TypeError("All arguments must be passed by kwargs only for typed methods")
+
+        # Perform rudimentary input checks here
+        instance._validate_input_types(input_types=input_types, ignore_collections=self.ignore_collections, **kwargs)
+
+        # Call the method - this can be forward, or any other callable method
+        outputs = wrapped(*args, **kwargs)
+
+        instance._attach_and_validate_output_types(
+            output_types=output_types, ignore_collections=self.ignore_collections, out_objects=outputs
+        )
+
+        return outputs
+
+    def _resolve_types(self, instance: Typing):
+        """Validates the instance and returns its resolved (input_types, output_types) for this method."""
         if instance is None:
             raise RuntimeError("Only classes which inherit nemo.core.Typing can use this decorator !")
 
@@ -1126,23 +1283,48 @@ class typecheck:
         else:
             output_types = instance.output_types
 
-        # If types are not defined, skip type checks and just call the wrapped method
-        if input_types is None and output_types is None:
+        return input_types, output_types
+
+    def _get_plan(self, wrapped, instance: Typing) -> Optional[TypecheckPlan]:
+        """Returns the cached type check plan of the instance, or None if the instance cannot be cached."""
+        try:
+            plan = self._plans.get(instance)
+        except TypeError:
+            # Unhashable or not weak-referenceable instances are always checked in full
+            return None
+        if plan is None:
+            input_types, output_types = self._resolve_types(instance)
+            name = f"{type(instance).__qualname__}.{wrapped.__name__}"
+            stats = _TYPECHECK_STATS.setdefault(name, TypecheckStats())
+            plan = TypecheckPlan(input_types, output_types, self.ignore_collections, stats)
+            self._plans[instance] = plan
+        return plan
+
+    def _cached_call(self, plan: TypecheckPlan, wrapped, instance: Typing, args, kwargs):
+        if plan.input_types is None and plan.output_types is None:
             return wrapped(*args, **kwargs)
 
-        # Check that all arguments are kwargs
-        if input_types is not None and len(args) > 0:
+        if plan.input_types is not None and len(args) > 0:
             raise TypeError("All arguments must be passed by kwargs only for typed methods")
 
-        # Perform rudimentary input checks here
-        instance._validate_input_types(input_types=input_types, ignore_collections=self.ignore_collections, **kwargs)
+        start = time.perf_counter()
+        validate = plan.should_validate(kwargs)
+        if validate and plan.input_types is not None:
+            instance._validate_input_types(
+                input_types=plan.input_types, ignore_collections=self.ignore_collections, **kwargs
+            )
+        typecheck_time = time.perf_counter() - start
 
-        # Call the method - this can be forward, or any other callable method
         outputs = wrapped(*args, **kwargs)
 
-        instance._attach_and_validate_output_types(
-            output_types=output_types, ignore_collections=self.ignore_collections, out_objects=outputs
-        )
+        start = time.perf_counter()
+        if plan.output_types is not None and (validate or not plan.attach_output_types(outputs)):
+            instance._attach_and_validate_output_types(
+                output_types=plan.output_types, ignore_collections=self.ignore_collections, out_objects=outputs
+            )
+        plan.stats.calls += 1
+        plan.stats.validated_calls += int(validate)
+        plan.stats.typecheck_time += typecheck_time + time.perf_counter() - start
 
         return outputs
 
@@ -1192,6 +1374,55 @@ class typecheck:
         finally:
             typecheck.set_semantic_check_enabled(enabled=True)
 
+    @staticmethod
+    def set_cached_checks_enabled(enabled: bool = True, num_validated_calls: int = 1):
+        """
+        Global method to enable/disable cached type checks.
+
+        In this mode, the types of every typed method of every instance are resolved once into a `TypecheckPlan`,
+        instead of on every call. The inputs and outputs are fully validated only on the first `num_validated_calls`
+        calls, and on calls whose input signature (argument names, ranks, dtypes, neural types) is new.
+        This removes most of the type checking overhead of small-batch streaming inference, but assumes that the
+        types of an instance do not change after its first call; call `reset_cached_checks` if they do.
+
+        Args:
+            enabled: bool, when True will enable cached type checks.
+            num_validated_calls: int, number of calls of every method of every instance which are fully validated.
+        """
+        global _TYPECHECK_CACHED_CHECKS_ENABLED, _TYPECHECK_NUM_VALIDATED_CALLS
+        _TYPECHECK_CACHED_CHECKS_ENABLED = enabled
+        _TYPECHECK_NUM_VALIDATED_CALLS = num_validated_calls
+
+    @staticmethod
+    @contextmanager
+    def cached_checks(num_validated_calls: int = 1):
+        """
+        Context manager that temporarily enables cached type checks within its context.
+        """
+        enabled, prev_num_validated_calls = _TYPECHECK_CACHED_CHECKS_ENABLED, _TYPECHECK_NUM_VALIDATED_CALLS
+        typecheck.set_cached_checks_enabled(enabled=True, num_validated_calls=num_validated_calls)
+        try:
+            yield
+        finally:
+            typecheck.set_cached_checks_enabled(enabled=enabled, num_validated_calls=prev_num_validated_calls)
+
+    @staticmethod
+    def get_cached_check_stats() -> Dict[str, Dict[str, float]]:
+        """
+        Returns the counters of the cached type checks, keyed by `<class name>.<method name>`.
+        Every entry contains the number of `calls`, of fully `validated_calls`, and the `typecheck_time` in seconds.
+        """
+        return {name: vars(stats).copy() for name, stats in _TYPECHECK_STATS.items()}
+
+    @staticmethod
+    def reset_cached_checks():
+        """
+        Drops all cached type check plans, e.g. after the types of some instances changed, and resets the counters.
+        """
+        for obj in list(_TYPECHECK_DECORATORS):
+            obj._plans.clear()
+        _TYPECHECK_STATS.clear()
+
     @staticmethod
     def enable_wrapping(enabled: bool = True):
         typecheck.set_typecheck_enabled(enabled)
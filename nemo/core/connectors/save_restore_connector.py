@@ -14,14 +14,19 @@
 # limitations under the License.
 from __future__ import annotations  # necessary for lazy types evaluation
 
+import inspect
+import io
+import mmap
 import os
+import pickle
 import shutil
 import tarfile
 import tempfile
 import time
 import uuid
 from contextlib import contextmanager
-from typing import Callable, Generator, Optional, Set, Union
+from functools import lru_cache
+from typing import BinaryIO, Callable, Generator, Optional, Set, Union
 
 import torch
 from lightning.pytorch.trainer.trainer import Trainer
@@ -36,17 +41,42 @@ from nemo.utils.get_rank import is_global_rank_zero
 from nemo.utils.model_utils import inject_model_parallel_rank
 from nemo.utils.msc_utils import import_multistorageclient, is_multistorageclient_url
 
+# size of the chunks used to copy single members out of a nemo file
+_COPY_CHUNK_SIZE = 16 * 1024 * 1024
+
+
+@lru_cache(maxsize=1)
+def _can_map_weights_from_archive() -> bool:
+    """
+    Whether this version of torch provides the private serialization API used to map the tensor storages
+    of a checkpoint from a slice of a file. Restoring falls back to extracting the weights otherwise.
+    """
+    serialization = torch.serialization
+    if not all(hasattr(serialization, name) for name in ("_is_zipfile", "_open_zipfile_reader", "_load")):
+        return False
+    if not hasattr(torch.UntypedStorage, "from_file"):
+        return False
+    try:
+        return "overall_storage" in inspect.signature(serialization._load).parameters
+    except (TypeError, ValueError):
+        return False
+
 
 class SaveRestoreConnector:
     """
     Connector for saving and restoring models.
     """
 
+    # key and member index of the last indexed nemo file. It is shared by all connectors, because the artifacts
+    # of a model being restored are registered through the connector of the new model instance.
+    _tar_index_cache: Optional[tuple[tuple[str, int, int], Optional[dict[str, tarfile.TarInfo]]]] = None
+
     def __init__(self) -> None:
         self._model_config_yaml = "model_config.yaml"
         self._model_weights_ckpt = "model_weights.ckpt"
         self._model_extracted_dir = None
         self._pack_nemo_file = True
+        self._mmap_restore = False
 
     def save_to(self, model: "nemo_classes.ModelPT", save_path: str):
         """
@@ -68,6 +98,7 @@ class SaveRestoreConnector:
         """
 
         if is_global_rank_zero():
+            start_time = time.time()
             with tempfile.TemporaryDirectory() as tmpdir:
                 config_yaml = os.path.join(tmpdir, self.model_config_yaml)
                 model_weights = os.path.join(tmpdir, self.model_weights_ckpt)
@@ -78,17 +109,30 @@ class SaveRestoreConnector:
                     self._handle_artifacts(model, nemo_file_folder=tmpdir)
                     # We should not update self._cfg here - the model can still be in use
                     self._update_artifact_paths(model, path2yaml_file=config_yaml)
-                self._save_state_dict_to_disk(model.state_dict(), model_weights)
 
                 # Check if we are packing the folder into a nemo file
-                if self.pack_nemo_file:
+                if self.pack_nemo_file and not is_multistorageclient_url(save_path):
+                    # the weights are serialized straight into the archive, without an intermediate file
+                    self._make_nemo_file_from_folder(
+                        filename=save_path,
+                        source_dir=tmpdir,
+                        streamed_members={
+                            self.model_weights_ckpt: lambda f: self._save_state_dict_to_disk(model.state_dict(), f)
+                        },
+                    )
+                elif self.pack_nemo_file:
+                    self._save_state_dict_to_disk(model.state_dict(), model_weights)
                     self._make_nemo_file_from_folder(filename=save_path, source_dir=tmpdir)
                 else:
+                    self._save_state_dict_to_disk(model.state_dict(), model_weights)
                     # Get the folder path from the save_path and move all values inside the tmpdir to the folder
                     folder_path = os.path.dirname(save_path)
 
                     for file in os.listdir(tmpdir):
                         shutil.move(os.path.join(tmpdir, file), folder_path)
+            logging.debug(
+                f"Time spent for saving {model.__class__.__name__} to {save_path}: {time.time() - start_time:.4f}"
+            )
         else:
             return
 
@@ -136,6 +180,8 @@ class SaveRestoreConnector:
                 map_location = torch.device('cpu')
 
         app_state = AppState()
+        # offsets of the members of an uncompressed .nemo file, set only when weights are read in place
+        tar_index = None
         with tempfile.TemporaryDirectory() as tmpdir:
             try:
                 # Check if self.model_extracted_dir is set, and is a valid path
@@ -153,7 +199,16 @@ class SaveRestoreConnector:
                     filter_fn = None
                     if return_config:
                         filter_fn = lambda name: '.yaml' in name
-                    members = self._filtered_tar_info(restore_path, filter_fn=filter_fn)
+                    elif self.mmap_restore and _can_map_weights_from_archive():
+                        tar_index = self._cached_tar_member_index(restore_path)
+                        if tar_index is not None:
+                            # weights are memory-mapped from the archive and artifacts are extracted
+                            # on demand by register_artifact, so only extract the config
+                            filter_fn = lambda name: '.yaml' in name
+                    if tar_index is not None:
+                        members = [member for member in tar_index.values() if filter_fn(member.name)]
+                    else:
+                        members = self._filtered_tar_info(restore_path, filter_fn=filter_fn)
                     self._unpack_nemo_file(path2file=restore_path, out_folder=tmpdir, members=members)
 
                 # Change current working directory to
@@ -192,7 +247,16 @@ class SaveRestoreConnector:
                 # add load_state_dict override
                 if app_state.model_parallel_size is not None and app_state.model_parallel_size > 1:
                     model_weights = self._inject_model_parallel_rank_for_ckpt(tmpdir, self.model_weights_ckpt)
-                state_dict = self._load_state_dict_from_disk(model_weights, map_location=map_location)
+                if tar_index is not None:
+                    member_name = os.path.normpath(os.path.relpath(model_weights, tmpdir))
+                    member = tar_index.get(member_name)
+                    if member is None or not member.isfile():
+                        raise FileNotFoundError(f"{member_name} was not found inside {restore_path}")
+                    state_dict = self._load_state_dict_from_tar(
+                        restore_path, member.offset_data, member.size, map_location=map_location
+                    )
+                else:
+                    state_dict = self._load_state_dict_from_disk(model_weights, map_location=map_location)
             finally:
                 os.chdir(cwd)
 
@@ -333,12 +397,27 @@ class SaveRestoreConnector:
         if not os.path.exists(save_dir):
             os.makedirs(save_dir, exist_ok=True)
 
+        start_time = time.time()
+        tar_index = self._cached_tar_member_index(restore_path)
+        weights_member = None
+        if tar_index is not None:
+            weights_member = tar_index.get(os.path.normpath(self.model_weights_ckpt))
+            if weights_member is not None and not weights_member.isfile():
+                weights_member = None
+
         with tempfile.TemporaryDirectory() as tmpdir:
             try:
-                self._unpack_nemo_file(path2file=restore_path, out_folder=tmpdir)
-                os.chdir(tmpdir)
-                model_weights = os.path.join(tmpdir, self.model_weights_ckpt)
-                state_dict = self._load_state_dict_from_disk(model_weights)
+                if weights_member is not None:
+                    # read the weights in place, without extracting the rest of the archive
+                    state_dict = self._load_state_dict_from_tar(
+                        restore_path, weights_member.offset_data, weights_member.size
+                    )
+                else:
+                    self._unpack_nemo_file(path2file=restore_path, out_folder=tmpdir)
+                    os.chdir(tmpdir)
+                    model_weights = os.path.join(tmpdir, self.model_weights_ckpt)
+                    state_dict = self._load_state_dict_from_disk(model_weights)
+                logging.debug(f"Time spent for loading weights from {restore_path}: {time.time() - start_time:.4f}")
 
                 if not split_by_module:
                     filepath = os.path.join(save_dir, self.model_weights_ckpt)
@@ -415,10 +494,11 @@ class SaveRestoreConnector:
         # we are assuming that the location of the right nemo file is available from _MODEL_RESTORE_PATH
         elif src.startswith("nemo:"):
             return_path = os.path.abspath(os.path.join(app_state.nemo_file_folder, src[5:]))
+            self._extract_artifact_from_restore_path(src[5:])
             artifact_item.path_type = model_utils.ArtifactPathType.TAR_PATH
 
         # backward compatibility implementation
-        elif os.path.exists(src_obj_path):
+        elif os.path.exists(src_obj_path) or self._extract_artifact_from_restore_path(src_obj_name) is not None:
             return_path = src_obj_path
             artifact_item.path_type = model_utils.ArtifactPathType.TAR_PATH
         else:
@@ -445,6 +525,59 @@ class SaveRestoreConnector:
                 OmegaConf.update(model.cfg, config_path, return_path)
         return return_path
 
+    def _extract_artifact_from_restore_path(self, artifact_name: str) -> Optional[str]:
+        """
+        Extract a single artifact of the model being restored into the nemo file folder,
+        reading only its members from the archive. A directory artifact is extracted with all its content.
+        It is a no-op if the artifact was already extracted.
+
+        Returns:
+            The path of the extracted artifact, or None if it cannot be found in an uncompressed nemo file.
+        """
+        app_state = AppState()
+        restore_path = app_state.model_restore_path
+        if app_state.nemo_file_folder is None or restore_path is None or is_multistorageclient_url(restore_path):
+            return None
+
+        artifact_path = os.path.join(app_state.nemo_file_folder, artifact_name)
+        if os.path.exists(artifact_path):
+            return artifact_path
+        member_name = os.path.normpath(artifact_name)
+        if os.path.isabs(member_name) or ".." in member_name.split(os.sep) or not os.path.isfile(restore_path):
+            return None
+
+        tar_index = self._cached_tar_member_index(restore_path)
+        if tar_index is None:
+            return None
+        member_prefix = member_name + os.sep
+        members = [
+            member
+            for name, member in tar_index.items()
+            if name == member_name or (member_name != "." and name.startswith(member_prefix))
+        ]
+        if not members:
+            return None
+
+        start_time = time.time()
+        with open(restore_path, "rb") as archive:
+            for member in members:
+                member_path = os.path.join(app_state.nemo_file_folder, os.path.normpath(member.name))
+                if member.isdir():
+                    os.makedirs(member_path, exist_ok=True)
+                    continue
+                os.makedirs(os.path.dirname(member_path), exist_ok=True)
+                archive.seek(member.offset_data)
+                with open(member_path, "wb") as fout:
+                    remaining = member.size
+                    while remaining > 0:
+                        chunk = archive.read(min(remaining, _COPY_CHUNK_SIZE))
+                        if not chunk:
+                            raise EOFError(f"Unexpected end of {restore_path} while extracting {member.name}")
+                        fout.write(chunk)
+                        remaining -= len(chunk)
+        logging.debug(f"Time spent for extracting {artifact_name} from {restore_path}: {time.time() - start_time:.4f}")
+        return artifact_path
+
     def _handle_artifacts(self, model, nemo_file_folder):
         tarfile_artifacts = []
         app_state = AppState()
@@ -598,14 +731,71 @@ class SaveRestoreConnector:
         return model_weights
 
     @staticmethod
-    def _make_nemo_file_from_folder(filename, source_dir):
+    def _make_nemo_file_from_folder(
+        filename, source_dir, streamed_members: Optional[dict[str, Callable[[BinaryIO], None]]] = None
+    ):
+        """
+        Pack a folder into a nemo file.
+
+        Args:
+            filename: path of the nemo file.
+            source_dir: folder to pack.
+            streamed_members: optional mapping from member names to functions writing their content to a file
+                object, which are streamed directly into the archive (not supported with multistorageclient).
+        """
         if is_multistorageclient_url(filename):
+            if streamed_members:
+                raise ValueError("Streaming members into a nemo file is not supported with multistorageclient")
             SaveRestoreConnector._make_nemo_file_from_folder_with_multistorageclient(filename, source_dir)
         else:
+            start_time = time.time()
             dirname = os.path.dirname(filename)
             os.makedirs(dirname, exist_ok=True)
             with tarfile.open(filename, "w:") as tar:
                 tar.add(source_dir, arcname=".")
+                for name, write_fn in (streamed_members or {}).items():
+                    SaveRestoreConnector._add_streamed_tar_member(tar, os.path.join(".", name), write_fn)
+            logging.debug(f"Time spent for packing {filename}: {time.time() - start_time:.4f}")
+
+    @staticmethod
+    def _add_streamed_tar_member(
+        tar: tarfile.TarFile, name: str, write_fn: Callable[[BinaryIO], None]
+    ) -> tarfile.TarInfo:
+        """
+        Append a regular file to an uncompressed tarball opened for writing, with its content written
+        by `write_fn` directly into the archive.
+
+        The size of the member is not known upfront, so its header is reserved and rewritten once the content
+        has been written. The header uses the GNU format, which encodes large sizes without changing its length.
+        """
+        tarinfo = tarfile.TarInfo(name)
+        tarinfo.mtime = int(time.time())
+        tarinfo.mode = 0o644
+        header_len = len(tarinfo.tobuf(tarfile.GNU_FORMAT, tar.encoding, tar.errors))
+
+        fileobj = tar.fileobj
+        header_offset = tar.offset
+        fileobj.seek(header_offset)
+        fileobj.write(tarfile.NUL * header_len)
+        data_offset = header_offset + header_len
+        write_fn(fileobj)
+
+        tarinfo.size = fileobj.tell() - data_offset
+        remainder = tarinfo.size % tarfile.BLOCKSIZE
+        if remainder > 0:
+            fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - remainder))
+        end_offset = fileobj.tell()
+
+        header = tarinfo.tobuf(tarfile.GNU_FORMAT, tar.encoding, tar.errors)
+        assert len(header) == header_len, "The size of a streamed tar member header should not change"
+        fileobj.seek(header_offset)
+        fileobj.write(header)
+        fileobj.seek(end_offset)
+
+        tarinfo.offset, tarinfo.offset_data = header_offset, data_offset
+        tar.offset = end_offset
+        tar.members.append(tarinfo)
+        return tarinfo
 
     @staticmethod
     def _make_nemo_file_from_folder_with_multistorageclient(filename, source_dir):
@@ -699,6 +889,82 @@ class SaveRestoreConnector:
         finally:
             tar.close()
 
+    @staticmethod
+    def _tar_member_index(path2file: str) -> Optional[dict[str, tarfile.TarInfo]]:
+        """
+        Index the regular files and directories of an uncompressed nemo file.
+
+        Returns:
+            A dict mapping the normalized member name to its tar info, which holds the offset (offset_data)
+            and size of the member data, or None if the file cannot be read in place
+            (compressed tar or remote storage).
+        """
+        if is_multistorageclient_url(path2file):
+            return None
+        if not os.path.exists(path2file):
+            raise FileNotFoundError(f"{path2file} does not exist")
+        try:
+            # only the headers are read, member data is skipped over
+            with tarfile.open(path2file, "r:") as tar:
+                return {
+                    os.path.normpath(m.name): m
+                    for m in tar.getmembers()
+                    if (m.isfile() or m.isdir()) and os.path.normpath(m.name) != "."
+                }
+        except tarfile.ReadError:
+            # older checkpoints are compressed and have to be extracted
+            return None
+
+    @classmethod
+    def _cached_tar_member_index(cls, path2file: str) -> Optional[dict[str, tarfile.TarInfo]]:
+        """
+        Same as _tar_member_index, but the index of the last indexed nemo file is kept,
+        so that it is built once per restore instead of once per registered artifact.
+        The index is rebuilt if the file was modified.
+        """
+        if is_multistorageclient_url(path2file) or not os.path.isfile(path2file):
+            return cls._tar_member_index(path2file)
+        stat = os.stat(path2file)
+        key = (os.path.abspath(path2file), stat.st_mtime_ns, stat.st_size)
+        cache = SaveRestoreConnector._tar_index_cache
+        if cache is not None and cache[0] == key:
+            return cache[1]
+        tar_index = cls._tar_member_index(path2file)
+        SaveRestoreConnector._tar_index_cache = (key, tar_index)
+        return tar_index
+
+    @staticmethod
+    def _load_state_dict_from_tar(path2file: str, member_offset: int, member_size: int, map_location=None):
+        """
+        Load a state dict stored as a member of an uncompressed nemo file without extracting it.
+
+        Tensor storages of zipfile-based checkpoints are memory-mapped straight from the archive,
+        so their pages are only read when the tensors are first accessed (e.g. in load_state_dict).
+        Legacy checkpoints, or any checkpoint if torch does not support mapping storages from a file,
+        are deserialized with torch.load through a read-only view of the member.
+
+        Args:
+            map_location: passed to torch.load, defaults to 'cpu'.
+        """
+        if map_location is None:
+            map_location = 'cpu'
+        start_time = time.time()
+        with open(path2file, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as archive:
+            member = _TarMemberReader(archive, member_offset, member_size)
+            if _can_map_weights_from_archive() and torch.serialization._is_zipfile(member):
+                member.seek(0)
+                archive_storage = torch.UntypedStorage.from_file(path2file, False, os.path.getsize(path2file))
+                member_storage = archive_storage[member_offset : member_offset + member_size]
+                with torch.serialization._open_zipfile_reader(member) as zip_file:
+                    state_dict = torch.serialization._load(
+                        zip_file, map_location, pickle, overall_storage=member_storage, weights_only=False
+                    )
+            else:
+                member.seek(0)
+                state_dict = torch.load(member, map_location=map_location, weights_only=False)
+        logging.debug(f"Time spent for mapping weights from {path2file}: {time.time() - start_time:.4f}")
+        return state_dict
+
     @staticmethod
     def _unpack_nemo_file(path2file: str, out_folder: str, members: Optional[list[str]] = None) -> str:
         """
@@ -802,3 +1068,66 @@ class SaveRestoreConnector:
     @pack_nemo_file.setter
     def pack_nemo_file(self, save_nemo_file: bool):
         self._pack_nemo_file = save_nemo_file
+
+    @property
+    def mmap_restore(self) -> bool:
+        """
+        Get the flag for restoring weights by memory-mapping them from an uncompressed nemo file
+        instead of extracting the whole archive. Only the config is extracted upfront,
+        the artifacts are extracted one by one when they are registered with register_artifact.
+        """
+        return self._mmap_restore
+
+    @mmap_restore.setter
+    def mmap_restore(self, mmap_restore: bool):
+        self._mmap_restore = mmap_restore
+
+
+class _TarMemberReader(io.RawIOBase):
+    """
+    Read-only, seekable file object over a single member of an uncompressed tarball.
+
+    Args:
+        archive: memory map of the whole tarball.
+        offset: offset of the member data inside the tarball, in bytes.
+        size: size of the member data, in bytes.
+    """
+
+    def __init__(self, archive: mmap.mmap, offset: int, size: int):
+        super().__init__()
+        self._archive = archive
+        self._offset = offset
+        self._size = size
+        self._pos = 0
+
+    def readable(self) -> bool:
+        return True
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._pos
+
+    def seek(self, pos: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            new_pos = pos
+        elif whence == io.SEEK_CUR:
+            new_pos = self._pos + pos
+        elif whence == io.SEEK_END:
+            new_pos = self._size + pos
+        else:
+            raise ValueError(f"Invalid whence value: {whence}")
+        if new_pos < 0:
+            raise ValueError(f"Negative seek position {new_pos}")
+        self._pos = new_pos
+        return self._pos
+
+    def readinto(self, buffer) -> int:
+        num_bytes = min(len(buffer), self._size - self._pos)
+        if num_bytes <= 0:
+            return 0
+        start = self._offset + self._pos
+        buffer[:num_bytes] = self._archive[start : start + num_bytes]
+        self._pos += num_bytes
+        return num_bytes
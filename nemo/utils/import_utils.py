@@ -17,7 +17,10 @@
 
 
 import importlib
+import importlib.util
 import logging
+import os
+import sys
 import traceback
 from contextlib import contextmanager
 
@@ -399,3 +402,103 @@ def gpu_only_import_from(module, symbol, *, alt=None):
         msg=f"{module}.{symbol} is not enabled in non GPU-enabled installations or environments. {GPU_INSTALL_STRING}",
         alt=alt,
     )
+
+
+def lazy_import(package, *, submodules=(), attributes=None, wildcard_modules=()):
+    """A function used to lazily import the public names of a package (PEP 562)
+
+    The `__init__.py` of the package exports its names without importing the
+    modules that define them:
+
+        __getattr__, __dir__, __all__ = lazy_import(
+            __name__, submodules=["data"], attributes={"models.ctc_models": ["EncDecCTCModel"]}
+        )
+
+    The defining module of a name is imported on the first access of the name,
+    e.g. `package.EncDecCTCModel` or `from package import EncDecCTCModel`, and
+    the name is then cached in the package. Importing the package itself stays
+    cheap. Set the environment variable `NEMO_LAZY_IMPORTS=0` to import all the
+    names eagerly instead, e.g. to debug import errors.
+
+    Parameters
+    ----------
+    package: str
+        The name of the package, i.e. `__name__` of its `__init__.py`.
+    submodules: list of str
+        The names of the submodules of the package exported as attributes.
+    attributes: dict or None
+        A mapping of module names, relative to the package, to the names they
+        export. A name can be renamed with `"<name> as <alias>"`.
+    wildcard_modules: list of str
+        The names of modules, relative to the package, whose `__all__` is also
+        exported, as with `from module import *`. They are imported when a name
+        is not found otherwise, and are not part of the returned `__all__`.
+
+    Returns
+    -------
+    Tuple(function, function, list)
+        The `__getattr__` and `__dir__` functions and the `__all__` list of the package.
+    """
+    names = {}
+    for module, module_names in (attributes or {}).items():
+        for name in module_names:
+            symbol, _, alias = name.partition(" as ")
+            names[alias or symbol] = (module, symbol)
+    submodules = set(submodules)
+    all_names = sorted(submodules) + list(names)
+
+    def __getattr__(name):
+        if name in submodules:
+            value = importlib.import_module(f"{package}.{name}")
+        elif name in names:
+            module, symbol = names[name]
+            value = getattr(importlib.import_module(f"{package}.{module}"), symbol)
+        elif name.startswith("__"):
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        elif importlib.util.find_spec(f"{package}.{name}") is not None:
+            # Submodules that are not exported, but that eager imports of the package used to make available
+            value = importlib.import_module(f"{package}.{name}")
+        else:
+            for module in wildcard_modules:
+                try:
+                    module = importlib.import_module(f"{package}.{module}")
+                except ImportError as error:
+                    raise AttributeError(f"module {package!r} has no attribute {name!r} ({error})") from error
+                if name in getattr(module, "__all__", ()):
+                    value = getattr(module, name)
+                    break
+            else:
+                raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__():
+        return sorted(set(vars(sys.modules[package])) | set(all_names))
+
+    if os.environ.get("NEMO_LAZY_IMPORTS", "1").lower() in ("0", "false", "no"):
+        # Modules imported here may import names of the package being initialized
+        sys.modules[package].__getattr__ = __getattr__
+        for name in all_names:
+            __getattr__(name)
+        for module in wildcard_modules:
+            module = importlib.import_module(f"{package}.{module}")
+            for name in module.__all__:
+                setattr(sys.modules[package], name, getattr(module, name))
+
+    return __getattr__, __dir__, all_names
+
+
+def import_all_lazy_attributes(package):
+    """Imports all the names exported by a package using `lazy_import`
+
+    This is needed where all the classes of a package must be defined, e.g. to
+    walk the subclasses of a base class.
+
+    Parameters
+    ----------
+    package: str
+        The name of the package.
+    """
+    module = importlib.import_module(package)
+    for name in getattr(module, "__all__", ()):
+        getattr(module, name)
@@ -20,7 +20,59 @@ from tqdm import tqdm
 
 from nemo.utils import logging
 
-PACKING_ALGOS = ["first_fit_decreasing", "first_fit_shuffle"]
+PACKING_ALGOS = [
+    "first_fit_decreasing",
+    "first_fit_shuffle",
+    "best_fit_decreasing",
+    "histogram_best_fit_decreasing",
+]
+# algorithms that take the histogram of sequence lengths as input instead of the list of sequence lengths
+HISTOGRAM_PACKING_ALGOS = ["histogram_best_fit_decreasing"]
+
+
+class _CapacityTree:
+    """
+    Max segment tree over a fixed number of slots, used to find the leftmost slot whose value is at least
+    a given size in O(log n) time.
+
+    Args:
+      num_slots: The number of slots (leaves) in the tree.
+      init_value: The initial value of every slot.
+    """
+
+    def __init__(self, num_slots: int, init_value: int):
+        self.size = 1
+        while self.size < max(num_slots, 1):
+            self.size *= 2
+        # slots past num_slots can never be selected
+        self.tree = [-1] * (2 * self.size)
+        self.tree[self.size : self.size + num_slots] = [init_value] * num_slots
+        for node in range(self.size - 1, 0, -1):
+            self.tree[node] = max(self.tree[2 * node], self.tree[2 * node + 1])
+
+    def __getitem__(self, slot: int) -> int:
+        return self.tree[self.size + slot]
+
+    def __setitem__(self, slot: int, value: int):
+        tree = self.tree
+        node = self.size + slot
+        tree[node] = value
+        node //= 2
+        while node:
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+            node //= 2
+
+    def find_first(self, s: int) -> int:
+        """
+        Returns the index of the leftmost slot with a value of at least 's', or -1 if no such slot exists.
+        """
+        tree = self.tree
+        if tree[1] < s:
+            return -1
+        node = 1
+        while node < self.size:
+            node = 2 * node if tree[2 * node] >= s else 2 * node + 1
+        return node - self.size
 
 
 def find_first_bin_that_fits(bins: List[List[int]], s: int, bin_size: int) -> int:
@@ -53,13 +105,18 @@ def first_fit(seqlens: List[int], pack_size: int) -> List[List[int]]:
       A list of lists, where each inner list represents a bin and contains the indices
         of the sequences assigned to that bin.
     """
+    # Remaining capacity of every bin that may be opened. Bins are opened left to right and an unopened bin
+    # has full capacity, so the leftmost slot that fits is either the first fitting open bin or a new bin.
+    capacities = _CapacityTree(len(seqlens), pack_size)
     res = []
     for s in seqlens:
-        first_bin = find_first_bin_that_fits(res, s, pack_size)
-        if first_bin == -1:  # open a new bin
+        first_bin = capacities.find_first(s)
+        if first_bin == -1 or first_bin == len(res):  # open a new bin
+            first_bin = len(res)
             res.append([s])
         else:
             res[first_bin].append(s)
+        capacities[first_bin] = capacities[first_bin] - s
     return res
 
 
@@ -98,6 +155,149 @@ def first_fit_shuffle(seqlens: List[int], pack_size: int) -> List[List[int]]:
     return first_fit(shuffled_seqlens, pack_size)
 
 
+def best_fit_decreasing(seqlens: List[int], pack_size: int) -> List[List[int]]:
+    """
+    Packs sequences of varying lengths into bins using the Best-Fit Decreasing algorithm.
+
+    The sequences are sorted by decreasing length and each one is placed into the open bin with the smallest
+    remaining capacity that can still fit it. Bins are bucketed by remaining capacity, so each placement
+    takes O(log pack_size) time.
+
+    Args:
+      seqlens: A list of integers, representing the lengths of the sequences to be packed.
+      pack_size: The maximum capacity of each bin.
+
+    Returns:
+      A list of lists, similar to the output of the 'first_fit' function.
+    """
+    # bins_by_capacity[c] holds the indices of open bins with exactly c free tokens left
+    bins_by_capacity = [[] for _ in range(pack_size + 1)]
+    # slot c holds c if there is an open bin with capacity c, so the leftmost slot >= s is the best fit
+    capacities = _CapacityTree(pack_size + 1, -1)
+    res = []
+    for s in sorted(seqlens, reverse=True):
+        capacity = capacities.find_first(s)
+        if capacity == -1:  # open a new bin
+            bin_idx = len(res)
+            res.append([s])
+            capacity = pack_size
+        else:
+            bin_idx = bins_by_capacity[capacity].pop()
+            res[bin_idx].append(s)
+            if not bins_by_capacity[capacity]:
+                capacities[capacity] = -1
+        capacity -= s
+        if capacity >= 0:
+            if not bins_by_capacity[capacity]:
+                capacities[capacity] = capacity
+            bins_by_capacity[capacity].append(bin_idx)
+    return res
+
+
+def _take_bins(
+    groups: Dict[int, collections.Counter],
+    num_bins_by_capacity: np.ndarray,
+    capacity: int,
+    layout: Tuple[int, ...],
+    count: int,
+):
+    """
+    Removes 'count' open bins with the given layout from the bins with 'capacity' free tokens.
+    """
+    groups[capacity][layout] -= count
+    if groups[capacity][layout] == 0:
+        del groups[capacity][layout]
+    num_bins_by_capacity[capacity] -= count
+
+
+def histogram_best_fit_decreasing(histogram: List[int], pack_size: int) -> List[List[int]]:
+    """
+    Packs sequences into bins with the Best-Fit Decreasing algorithm, working on the histogram of sequence lengths.
+
+    All sequences of the same length are placed at once: under Best-Fit Decreasing they fill the fitting bins
+    in order of increasing remaining capacity, each bin taking as many as it can hold. Open bins that contain
+    the same sequence lengths are tracked as a single group with a count, so the cost depends on the number of
+    distinct lengths and bin layouts rather than on the number of sequences.
+
+    Args:
+      histogram: A list representing the histogram data (number of sequences for each length).
+      pack_size: The maximum capacity of each bin.
+
+    Returns:
+      A list of lists, similar to the output of the 'first_fit' function.
+    """
+    # groups[c] maps the layout of the open bins with c free tokens (a tuple of lengths) to the number of such bins
+    groups = collections.defaultdict(collections.Counter)
+    num_bins_by_capacity = np.zeros(pack_size + 1, dtype=np.int64)
+    # sequences longer than pack_size cannot share a bin, as in 'first_fit'
+    full_bins = collections.Counter()
+
+    def add_bins(layout: Tuple[int, ...], count: int, capacity: int):
+        if capacity > 0:
+            groups[capacity][layout] += count
+            num_bins_by_capacity[capacity] += count
+        else:
+            full_bins[layout] += count
+
+    for seq_len in range(len(histogram) - 1, -1, -1):
+        remaining = int(histogram[seq_len])
+        if remaining == 0:
+            continue
+        if seq_len > pack_size:
+            full_bins[(seq_len,)] += remaining
+            continue
+        if seq_len == 0:
+            # empty sequences fit anywhere, keep them together in one of the existing bins
+            zeros = (0,) * remaining
+            exactly_full = [layout for layout in full_bins if sum(layout) == pack_size]
+            if num_bins_by_capacity.any():
+                capacity = int(np.argmax(num_bins_by_capacity > 0))
+                layout = next(iter(groups[capacity]))
+                _take_bins(groups, num_bins_by_capacity, capacity, layout, 1)
+                add_bins(layout + zeros, 1, capacity)
+            elif exactly_full:
+                layout = exactly_full[0]
+                full_bins[layout] -= 1
+                if full_bins[layout] == 0:
+                    del full_bins[layout]
+                full_bins[layout + zeros] += 1
+            else:
+                full_bins[zeros] += 1
+            continue
+
+        for capacity in np.nonzero(num_bins_by_capacity[seq_len:])[0] + seq_len:
+            capacity = int(capacity)
+            per_bin = capacity // seq_len
+            for layout, count in list(groups[capacity].items()):
+                num_full = min(count, remaining // per_bin)
+                if num_full > 0:
+                    _take_bins(groups, num_bins_by_capacity, capacity, layout, num_full)
+                    add_bins(layout + (seq_len,) * per_bin, num_full, capacity - per_bin * seq_len)
+                    remaining -= num_full * per_bin
+                if 0 < remaining < per_bin and num_full < count:
+                    _take_bins(groups, num_bins_by_capacity, capacity, layout, 1)
+                    add_bins(layout + (seq_len,) * remaining, 1, capacity - remaining * seq_len)
+                    remaining = 0
+                if remaining == 0:
+                    break
+            if remaining == 0:
+                break
+
+        # open new bins for the sequences that did not fit into any open bin
+        per_bin = pack_size // seq_len
+        num_full, leftover = divmod(remaining, per_bin)
+        if num_full > 0:
+            add_bins((seq_len,) * per_bin, num_full, pack_size - per_bin * seq_len)
+        if leftover > 0:
+            add_bins((seq_len,) * leftover, 1, pack_size - leftover * seq_len)
+
+    res = []
+    for layout_counts in [full_bins] + [groups[capacity] for capacity in sorted(groups)]:
+        for layout, count in layout_counts.items():
+            res.extend(list(layout) for _ in range(count))
+    return res
+
+
 def create_hist(dataset: np.array, truncate_seq_len: int):
     """
     Creates a histogram of sequence lengths from a tokenized dataset.
@@ -152,7 +352,8 @@ def create_packing_strategy(
     Args:
           histogram: A list representing the histogram data (number of sequences for each length).
           pack_size: The maximum capacity of each bin.
-          packing_algorithm: One of the supported packing algorithms from ['first_fit_decreasing', 'first_fit_shuffle']
+          packing_algorithm: One of the supported packing algorithms from ['first_fit_decreasing', 'first_fit_shuffle',
+                             'best_fit_decreasing', 'histogram_best_fit_decreasing']
 
     Returns:
           assignments: A list of lists, where each inner list represents a bin and contains the indices of the
@@ -162,16 +363,18 @@ def create_packing_strategy(
 
     logging.info(f"Packing sequences to length {pack_size}...")
 
-    all_seq_lens = []
-    for i, count in enumerate(histogram):
-        all_seq_lens.extend([i] * count)
-
     packing_fn = globals()[packing_algorithm]
-    assignments: List[List[int]] = packing_fn(all_seq_lens, pack_size)
+    if packing_algorithm in HISTOGRAM_PACKING_ALGOS:
+        assignments: List[List[int]] = packing_fn(histogram, pack_size)
+    else:
+        all_seq_lens = []
+        for i, count in enumerate(histogram):
+            all_seq_lens.extend([i] * count)
+        assignments: List[List[int]] = packing_fn(all_seq_lens, pack_size)
     packed_seq_lens = [sum(x) for x in assignments]
-    packing_factor = len(all_seq_lens) / len(packed_seq_lens)
+    packing_factor = sum(histogram) / len(packed_seq_lens)
 
-    max_seqlen = max(all_seq_lens)
+    max_seqlen = max(i for i, count in enumerate(histogram) if count > 0)
     max_samples_per_bin = max([len(b) for b in assignments])
     min_packed_seqlen = min(packed_seq_lens)
     packing_metadata = {
@@ -0,0 +1,121 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the cost of importing NeMo packages: wall time, peak memory (RSS) and number of loaded modules.
+
+Every import statement is measured in a fresh interpreter, `--num_repeats` times, and the median is reported.
+With `--compare_eager`, every statement is also measured with `NEMO_LAZY_IMPORTS=0`, i.e. with all the names of
+the lazily imported packages (`nemo.collections.asr`, `tts`, `llm`, ...) imported eagerly.
+With `--top_k`, the slowest modules of every statement are listed, as measured by `python -X importtime`.
+
+Example usage:
+
+python scripts/benchmark_import_time.py
+
+python scripts/benchmark_import_time.py --compare_eager --output_file import_times.json \
+    --statements "import nemo.collections.asr" "from nemo.collections.asr.models import EncDecCTCModel"
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+from nemo.utils import logging
+
+DEFAULT_STATEMENTS = [
+    "import nemo.utils",
+    "import nemo.core",
+    "import nemo.collections.asr",
+    "import nemo.collections.tts",
+    "import nemo.collections.llm",
+    "from nemo.collections.asr.models import EncDecCTCModelBPE",
+    "from nemo.collections.tts.models import FastPitchModel",
+    "from nemo.collections.llm import GPTModel",
+]
+
+MEASURE_CODE = """
+import json, resource, sys, time
+start = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - start
+maxrss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+print(json.dumps({{"time": elapsed, "maxrss_mb": maxrss / 1024, "num_modules": len(sys.modules)}}))
+"""
+
+
+def run_python(args, lazy_imports):
+    env = dict(os.environ, NEMO_LAZY_IMPORTS="1" if lazy_imports else "0")
+    return subprocess.run([sys.executable, *args], env=env, capture_output=True, text=True, check=True)
+
+
+def measure(statement, num_repeats, lazy_imports):
+    results = []
+    for _ in range(num_repeats):
+        output = run_python(["-c", MEASURE_CODE.format(statement=statement)], lazy_imports).stdout
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return {key: statistics.median(result[key] for result in results) for key in results[0]}
+
+
+def slowest_modules(statement, top_k, lazy_imports):
+    """Returns the `top_k` modules with the largest self time (in seconds) reported by `python -X importtime`."""
+    stderr = run_python(["-X", "importtime", "-c", statement], lazy_imports).stderr
+    modules = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_time, _, name = line[len("import time:") :].split("|")
+        modules.append((int(self_time) / 1e6, name.strip()))
+    return sorted(modules, reverse=True)[:top_k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--statements", nargs="+", default=DEFAULT_STATEMENTS, help="Import statements to measure")
+    parser.add_argument("--num_repeats", type=int, default=3, help="Number of measurements of every statement")
+    parser.add_argument("--compare_eager", action="store_true", help="Also measure with NEMO_LAZY_IMPORTS=0")
+    parser.add_argument("--top_k", type=int, default=0, help="Number of slowest modules to list per statement")
+    parser.add_argument("--output_file", type=str, default=None, help="JSON file to save the results to")
+    args = parser.parse_args()
+
+    modes = {"lazy": True, "eager": False} if args.compare_eager else {"lazy": True}
+    results = {}
+    for statement in args.statements:
+        results[statement] = {}
+        for mode, lazy_imports in modes.items():
+            try:
+                result = measure(statement, args.num_repeats, lazy_imports)
+            except subprocess.CalledProcessError as error:
+                logging.warning(f"{statement:60s} {mode:5s}: failed\n{error.stderr.strip().splitlines()[-1]}")
+                continue
+            results[statement][mode] = result
+            logging.info(
+                f"{statement:60s} {mode:5s}: {result['time']:7.2f} s | {result['maxrss_mb']:7.0f} MB | "
+                f"{result['num_modules']:6.0f} modules"
+            )
+        if args.top_k > 0:
+            for self_time, name in slowest_modules(statement, args.top_k, lazy_imports=True):
+                logging.info(f"    {self_time:7.3f} s  {name}")
+
+    if args.output_file is not None:
+        with open(args.output_file, "w") as f:
+            json.dump(results, f, indent=2)
+        logging.info(f"Saved the results to {args.output_file}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Fills the packed supplementary data store of a TTSDataset (see `sup_data_store_dir` of TTSDataset) ahead of training.
+Log mel, pitch, voiced mask, p_voiced and energy are computed in parallel by DataLoader workers, every worker appending
+to its own shard of the store. Data already saved as .pt files in `sup_data_path` is copied to the store instead of
+being recomputed, and utterances which are already in the store are skipped.
+
+python build_sup_data_store.py \
+    --config-path=ljspeech/ds_conf \
+    --config-name=ds_for_fastpitch_align \
+    manifest_filepath=<path to the manifest> \
+    sup_data_path=<folder of existing .pt files, can be empty> \
+    +dataset.sup_data_store_dir=<folder of the store, preferably on local disk> \
+    +dataloader_params.num_workers=16
+"""
+
+import torch
+from hydra.utils import instantiate
+from tqdm import tqdm
+
+from nemo.core.config import hydra_runner
+from nemo.utils import logging
+
+
+class SupDataStoreBuilder(torch.utils.data.Dataset):
+    """Loads the utterances of a TTSDataset which are missing from its store, which computes and stores their data."""
+
+    def __init__(self, dataset, indices):
+        self.dataset = dataset
+        self.indices = indices
+
+    def __len__(self):
+        return len(self.indices)
+
+    def __getitem__(self, index):
+        self.dataset[self.indices[index]]
+        return index
+
+
+def discard_batch(batch):
+    return len(batch)
+
+
+@hydra_runner(config_path='ljspeech/ds_conf', config_name='ds_for_fastpitch_align')
+def main(cfg):
+    dataset = instantiate(cfg.dataset)
+    if not dataset.sup_data_stores:
+        raise ValueError(
+            "The dataset has no supplementary data store, please set `dataset.sup_data_store_dir` and add any of "
+            "log_mel, pitch, voiced_mask, p_voiced or energy to `sup_data_types`."
+        )
+
+    indices = [
+        index
+        for index, sample in enumerate(dataset.data)
+        if not all(
+            dataset.get_rel_audio_path_as_text_id(sample) in store for store in dataset.sup_data_stores.values()
+        )
+    ]
+    logging.info(f"Processing {len(indices)} of {len(dataset)} utterances of {cfg.manifest_filepath}")
+
+    dataloader = torch.utils.data.DataLoader(
+        dataset=SupDataStoreBuilder(dataset, indices),
+        batch_size=16,
+        collate_fn=discard_batch,
+        num_workers=cfg.get("dataloader_params", {}).get("num_workers", 4),
+    )
+    for _ in tqdm(dataloader, total=len(dataloader)):
+        pass
+
+    for data_type, store in dataset.sup_data_stores.items():
+        store.refresh(force=True)
+        logging.info(f"{data_type.name}: {len(store)} utterances in {store.cache_dir}")
+
+
+if __name__ == '__main__':
+    main()  # noqa pylint: disable=no-value-for-parameter
@@ -0,0 +1,108 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the sequence packing algorithms in nemo.utils.sequence_packing_utils.
+
+Reports the wall time, number of packs and packing efficiency of every algorithm on a histogram of sequence
+lengths. The histogram is either sampled from a log-normal distribution or read from the lengths of an existing
+tokenized dataset (a .npy file as written by prepare_packed_ft_dataset.py / tokenize_dataset).
+The original linear-scan first-fit is included as a baseline for small datasets.
+
+Example usage:
+
+python scripts/nlp_language_modeling/benchmark_sequence_packing.py --num_seqs 1000000 --pack_size 4096
+
+python scripts/nlp_language_modeling/benchmark_sequence_packing.py --dataset /path/to/tokenized.npy --pack_size 8192
+"""
+
+import argparse
+import time
+
+import numpy as np
+
+from nemo.utils import logging
+from nemo.utils.sequence_packing_utils import PACKING_ALGOS, create_hist, create_packing_strategy
+
+
+def linear_scan_first_fit_decreasing(seqlens, pack_size):
+    """First-fit decreasing that re-sums every bin for every sequence, as done before the capacity tree."""
+    res = []
+    for s in sorted(seqlens, reverse=True):
+        for abin in res:
+            if sum(abin) + s <= pack_size:
+                abin.append(s)
+                break
+        else:
+            res.append([s])
+    return res
+
+
+def get_histogram(args):
+    if args.dataset is not None:
+        dataset = np.load(args.dataset, allow_pickle=True)
+        _, histogram = create_hist(dataset, args.pack_size)
+        return histogram
+
+    rng = np.random.default_rng(args.seed)
+    seqlens = rng.lognormal(mean=np.log(args.mean_seq_len), sigma=args.sigma, size=args.num_seqs).astype(np.int64)
+    seqlens = np.clip(seqlens, 1, args.pack_size)
+    return np.bincount(seqlens, minlength=args.pack_size + 1).tolist()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dataset", type=str, default=None, help="Tokenized dataset (.npy) to take lengths from")
+    parser.add_argument("--num_seqs", type=int, default=100000, help="Number of sampled sequences")
+    parser.add_argument("--mean_seq_len", type=float, default=512, help="Median of the sampled sequence lengths")
+    parser.add_argument("--sigma", type=float, default=0.8, help="Log-normal sigma of the sampled sequence lengths")
+    parser.add_argument("--pack_size", type=int, default=4096)
+    parser.add_argument("--algorithms", nargs="+", default=PACKING_ALGOS, choices=PACKING_ALGOS)
+    parser.add_argument(
+        "--baseline_max_seqs",
+        type=int,
+        default=50000,
+        help="Run the linear-scan first-fit baseline only for datasets up to this size",
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    histogram = get_histogram(args)
+    num_seqs = sum(histogram)
+    total_tokens = sum(seq_len * count for seq_len, count in enumerate(histogram))
+    logging.info(f"Benchmarking {num_seqs} sequences ({total_tokens} tokens) with pack size {args.pack_size}")
+
+    results = []
+    if num_seqs <= args.baseline_max_seqs:
+        seqlens = [seq_len for seq_len, count in enumerate(histogram) for _ in range(count)]
+        start = time.perf_counter()
+        assignments = linear_scan_first_fit_decreasing(seqlens, args.pack_size)
+        elapsed = time.perf_counter() - start
+        results.append(("linear_scan_first_fit_decreasing", elapsed, len(assignments)))
+
+    np.random.seed(args.seed)
+    for algorithm in args.algorithms:
+        start = time.perf_counter()
+        assignments, _ = create_packing_strategy(histogram, args.pack_size, algorithm)
+        elapsed = time.perf_counter() - start
+        results.append((algorithm, elapsed, len(assignments)))
+
+    print(f"{'algorithm':<36}{'time (s)':>12}{'packs':>12}{'efficiency (%)':>16}")
+    for algorithm, elapsed, num_packs in results:
+        efficiency = total_tokens / (num_packs * args.pack_size) * 100
+        print(f"{algorithm:<36}{elapsed:>12.3f}{num_packs:>12}{efficiency:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -34,12 +34,18 @@ Two main steps are run in this script:
 sequence length truncation, tokenization, etc) and the result is an array of tokenized sequences, 
 represented by indices). 
 2. The sequences are grouped by length, and a packing algorithm is run. (https://en.wikipedia.org/wiki/Bin_packing_problem#Offline_algorithms)
-Currently, two variants of "first fit" are supported.
+Currently, two variants of "first fit" and two variants of "best fit" are supported.
 "first_fit_decreasing" sorts the sequences in decreasing order before applying first-fit. 
 It generates a more optimal packing, but it tends to keep all short sequences together, which may affect convergence.
 "first_fit_shuffle" runs first-fit in a random order. Packing is less optimal but it keeps the dataset order random.
+"best_fit_decreasing" places each sequence (longest first) into the fullest bin that still fits it.
+"histogram_best_fit_decreasing" produces the same number of bins as "best_fit_decreasing" and an equivalent best-fit
+packing, but it breaks ties between equal lengths and equally full bins differently, so the per-bin assignment of the
+sequences can differ. It works on the histogram of sequence lengths, which is much faster for datasets with millions
+of samples.
 The recommendation is to run "first_fit_shuffle" and check the packed sequence lengths in the printout. 
 If they are similar to the target length (i.e. packing is efficient), then use shuffle. Otherwise try first_fit_decreasing.
+Use scripts/nlp_language_modeling/benchmark_sequence_packing.py to compare the algorithms on your length distribution.
 
 Example usage:
 
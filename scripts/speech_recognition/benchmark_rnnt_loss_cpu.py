@@ -0,0 +1,141 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the CPU RNNT loss of the numba backend.
+
+Compares the batched numba kernels used by RNNTLossNumba on CPU with the per-sample loop over torch tensors
+(the previous CPU implementation) and with the pure PyTorch RNNTLossPytorch, for both the loss and the gradients.
+The per-sample loop is very slow, so it is only run when --with_sequential is set.
+
+Example usage:
+
+python scripts/speech_recognition/benchmark_rnnt_loss_cpu.py --batch_size 16 --max_t 200 --max_u 40 --vocab_size 129
+
+python scripts/speech_recognition/benchmark_rnnt_loss_cpu.py --batch_size 4 --max_t 50 --max_u 10 --with_sequential
+"""
+
+import argparse
+import time
+
+import numpy as np
+import torch
+
+from nemo.collections.asr.losses.rnnt_pytorch import RNNTLossPytorch
+from nemo.collections.asr.parts.numba.rnnt_loss.rnnt_pytorch import RNNTLossNumba
+from nemo.collections.asr.parts.numba.rnnt_loss.utils import rnnt_helper
+from nemo.collections.asr.parts.numba.rnnt_loss.utils.cpu_utils import cpu_rnnt
+from nemo.utils import logging
+
+
+def sequential_rnnt_loss(acts, labels, act_lens, label_lens, blank):
+    """Costs and gradients computed one sample at a time with `CPURNNT.cost_and_grad_kernel`."""
+    log_probs = torch.log_softmax(acts, -1)
+    B, maxT, maxU, V = log_probs.shape
+    size, _ = rnnt_helper.get_workspace_size(maxT, maxU, B, gpu=False)
+    workspace = torch.zeros(size, dtype=log_probs.dtype)
+    wrapper = cpu_rnnt.CPURNNT(B, maxT, maxU, V, workspace, blank, 0.0, -1, 1, batch_first=True)
+
+    flat_log_probs = log_probs.reshape(-1)
+    flat_labels = labels.reshape(-1)
+    grads = torch.zeros_like(flat_log_probs)
+    costs = torch.zeros(B, dtype=log_probs.dtype)
+    per_minibatch_bytes = maxT * maxU * 4
+    sample_size = maxT * maxU * V
+    for mb in range(B):
+        costs[mb] = wrapper.cost_and_grad_kernel(
+            flat_log_probs[mb * sample_size :],
+            grads[mb * sample_size :],
+            flat_labels[mb * (maxU - 1) :],
+            mb,
+            act_lens[mb],
+            label_lens[mb] + 1,
+            mb * per_minibatch_bytes,
+        )
+
+    # chain rule through the log softmax, as done by autograd for the other implementations
+    grads = grads.view(B, maxT, maxU, V)
+    grads = grads - torch.exp(log_probs) * grads.sum(-1, keepdim=True)
+    return costs, grads
+
+
+def autograd_rnnt_loss(loss_fn, acts, labels, act_lens, label_lens):
+    acts = acts.clone().requires_grad_(True)
+    costs = loss_fn(acts=acts, labels=labels, act_lens=act_lens, label_lens=label_lens)
+    costs.sum().backward()
+    return costs.detach(), acts.grad
+
+
+def timeit(fn, num_repeats):
+    result = fn()
+    start = time.perf_counter()
+    for _ in range(num_repeats):
+        fn()
+    return result, (time.perf_counter() - start) / num_repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the CPU RNNT loss implementations")
+    parser.add_argument("--batch_size", type=int, default=8)
+    parser.add_argument("--max_t", type=int, default=100)
+    parser.add_argument("--max_u", type=int, default=20, help="Max number of labels + 1")
+    parser.add_argument("--vocab_size", type=int, default=129, help="Vocabulary size including blank")
+    parser.add_argument("--num_repeats", type=int, default=3)
+    parser.add_argument(
+        "--num_threads", type=int, default=0, help="Number of torch / numba threads, 0 to keep default"
+    )
+    parser.add_argument("--with_sequential", action="store_true", help="Also run the per-sample loop")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    if args.num_threads > 0:
+        torch.set_num_threads(args.num_threads)
+    torch.manual_seed(args.seed)
+    B, T, U, V = args.batch_size, args.max_t, args.max_u, args.vocab_size
+    blank = V - 1
+    acts = torch.randn(B, T, U, V)
+    labels = torch.randint(0, V - 1, (B, U - 1))
+    act_lens = torch.randint(T // 2, T + 1, (B,))
+    label_lens = torch.randint(U // 2, U, (B,))
+    act_lens[0], label_lens[0] = T, U - 1
+
+    numba_loss = RNNTLossNumba(blank=blank, reduction='none')
+    pytorch_loss = RNNTLossPytorch(blank=blank, reduction='none')
+
+    results = {}
+    results["numba (batched)"] = timeit(
+        lambda: autograd_rnnt_loss(numba_loss, acts, labels, act_lens, label_lens), args.num_repeats
+    )
+    results["pytorch"] = timeit(
+        lambda: autograd_rnnt_loss(pytorch_loss, acts, labels, act_lens, label_lens), args.num_repeats
+    )
+    if args.with_sequential:
+        results["numba (sequential)"] = timeit(
+            lambda: sequential_rnnt_loss(acts, labels, act_lens, label_lens, blank), num_repeats=1
+        )
+
+    (ref_costs, ref_grads), _ = results["pytorch"]
+    logging.info(f"B={B} T={T} U={U} V={V}")
+    for name, ((costs, grads), elapsed) in results.items():
+        cost_diff = (costs - ref_costs).abs().max().item()
+        grad_diff = (grads - ref_grads).abs().max().item()
+        logging.info(
+            f"{name:>20}: {elapsed * 1000:10.2f} ms | max cost diff {cost_diff:.2e} | max grad diff {grad_diff:.2e}"
+        )
+        if not np.isclose(cost_diff, 0.0, atol=1e-3):
+            logging.warning(f"{name} costs do not match the pytorch reference")
+
+
+if __name__ == '__main__':
+    main()
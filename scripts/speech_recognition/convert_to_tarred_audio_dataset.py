@@ -27,6 +27,10 @@
 # Recommend to use --sort_in_shards to speedup the training by reducing the paddings in the batches
 # More info on how to use bucketing feature: https://docs.nvidia.com/deeplearning/nemo/user-guide/docs/en/main/asr/datasets.html
 
+# Every shard `audio_{shard_id}.tar` is written with a sidecar offset index `audio_{shard_id}.tar.idx`, which lets the
+# tarred datasets seek directly to the audio files instead of streaming through the whole shard.
+# Use create_tarred_dataset_offset_index.py to create the offset indices of an existing tarred dataset.
+
 # If valid NVIDIA DALI version is installed, will also generate the corresponding DALI index files that need to be
 # supplied to the config in order to utilize webdataset for efficient large dataset handling.
 # NOTE: DALI + Webdataset is NOT compatible with Bucketing support !
@@ -94,6 +98,8 @@ from omegaconf import DictConfig, OmegaConf, open_dict
 from tabulate import tabulate
 from tqdm import tqdm
 
+from nemo.collections.common.data.tar_index import build_tar_index, get_tar_index_path, write_tar_index
+
 try:
     import create_dali_tarred_dataset_index as dali_index
 
@@ -730,6 +736,9 @@ class ASRTarredDatasetBuilder:
 
         if not only_manifests:
             tar.close()
+
+            # Sidecar offset index used by the tarred datasets for random access into the shard.
+            write_tar_index(build_tar_index(tar_filepath), get_tar_index_path(tar_filepath))
         return new_entries
 
     @classmethod
@@ -0,0 +1,69 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import glob
+import logging
+import os
+from dataclasses import dataclass
+
+import hydra
+from hydra.core.config_store import ConfigStore
+from joblib import Parallel, delayed
+from omegaconf import MISSING
+
+from nemo.collections.common.data.tar_index import build_tar_index, get_tar_index_path, load_tar_index, write_tar_index
+
+"""
+Creates the sidecar offset index `audio_{shard_id}.tar.idx` next to every shard of an existing tarred audio dataset.
+The tarred datasets use it to seek directly to the audio files instead of streaming through the whole shard.
+Shards which already have an up-to-date index are skipped unless `overwrite=true`.
+
+python create_tarred_dataset_offset_index.py \
+    tar_dir=<path to the directory which contains tarred dataset> \
+    workers=-1
+
+"""
+
+logging.basicConfig(level=logging.INFO)
+
+
+@dataclass
+class TarredOffsetIndexConfig:
+    tar_dir: str = MISSING  # Path to the directory which contains the tar files
+    workers: int = -1  # number of worker processes
+    overwrite: bool = False  # re-create indices that already exist
+
+
+def build_index(tar_path: str, overwrite: bool) -> bool:
+    if not overwrite and load_tar_index(tar_path) is not None:
+        return False
+    write_tar_index(build_tar_index(tar_path), get_tar_index_path(tar_path))
+    return True
+
+
+@hydra.main(config_path=None, config_name='offset_index_config', version_base="1.1")
+def main(cfg: TarredOffsetIndexConfig):
+    tar_files = sorted(glob.glob(os.path.join(cfg.tar_dir, "*.tar")))
+
+    with Parallel(n_jobs=cfg.workers, verbose=len(tar_files)) as parallel:
+        created = parallel(delayed(build_index)(tar_path, cfg.overwrite) for tar_path in tar_files)
+
+    logging.info(f"Created {sum(created)} offset index files ({len(tar_files) - sum(created)} already up to date).")
+
+
+ConfigStore.instance().store(name='offset_index_config', node=TarredOffsetIndexConfig)
+
+
+if __name__ == '__main__':
+    main()
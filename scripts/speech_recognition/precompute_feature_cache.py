@@ -0,0 +1,101 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+import hydra
+from hydra.core.config_store import ConfigStore
+from joblib import Parallel, delayed
+from omegaconf import MISSING, OmegaConf
+
+from nemo.collections.asr.parts.preprocessing.feature_cache import CachedAudioFeaturizer
+from nemo.collections.common.parts.preprocessing.manifest import item_iter
+
+"""
+Fills the persistent feature cache of an ASR training dataset ahead of training, instead of during the first epoch.
+The dataset config (by default `model.train_ds` of the training config) must contain a `feature_cache` section, e.g.
+
+    train_ds:
+      feature_cache:
+        cache_dir: /local/disk/feature_cache
+        max_disk_gb: 500
+        preprocessor: ${model.preprocessor}
+
+The features are computed with the same code and cache keys as the dataset, so they are found during training.
+Segments that are already in the cache are skipped.
+
+python precompute_feature_cache.py \
+    model_config=<path to the training config> \
+    [dataset_key=train_ds] \
+    [manifest_filepath=<overrides the manifest(s) of the dataset config>] \
+    workers=-1
+
+"""
+
+logging.basicConfig(level=logging.INFO)
+
+
+@dataclass
+class PrecomputeFeatureCacheConfig:
+    model_config: str = MISSING  # Path to the training config
+    dataset_key: str = "train_ds"  # Key of the dataset config within `model`
+    manifest_filepath: Optional[str] = None  # Comma separated manifests, defaults to the ones of the dataset config
+    workers: int = -1  # number of worker processes
+
+
+def fill_cache(ds_config: dict, items: list) -> int:
+    featurizer = CachedAudioFeaturizer.from_config(
+        ds_config['feature_cache'], sample_rate=ds_config['sample_rate'], int_values=ds_config.get('int_values', False)
+    )
+    for item in items:
+        featurizer.process(
+            item['audio_file'],
+            offset=item['offset'] or 0,
+            duration=item['duration'],
+            trim=ds_config.get('trim_silence', False),
+            orig_sr=item.get('orig_sr', None),
+            channel_selector=ds_config.get('channel_selector', None),
+        )
+    return featurizer.cache.stats['misses']
+
+
+@hydra.main(config_path=None, config_name='precompute_feature_cache_config', version_base="1.1")
+def main(cfg: PrecomputeFeatureCacheConfig):
+    model_cfg = OmegaConf.load(cfg.model_config)
+    ds_config = OmegaConf.to_container(model_cfg.model[cfg.dataset_key], resolve=True)
+    if ds_config.get('feature_cache', None) is None:
+        raise ValueError(f"`model.{cfg.dataset_key}` of {cfg.model_config} has no `feature_cache` section")
+
+    manifest_filepath = cfg.manifest_filepath or ds_config['manifest_filepath']
+    if isinstance(manifest_filepath, str):
+        manifest_filepath = manifest_filepath.split(",")
+    items = list(item_iter(manifest_filepath))
+
+    workers = cfg.workers if cfg.workers > 0 else os.cpu_count()
+    chunk_size = max(1, -(-len(items) // workers))
+    chunks = [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+    with Parallel(n_jobs=cfg.workers, verbose=len(chunks)) as parallel:
+        computed = parallel(delayed(fill_cache)(ds_config, chunk) for chunk in chunks)
+
+    logging.info(f"Computed features of {sum(computed)} segments ({len(items) - sum(computed)} already cached).")
+
+
+ConfigStore.instance().store(name='precompute_feature_cache_config', node=PrecomputeFeatureCacheConfig)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,118 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+Benchmark the batched tokenization API (`batch_text_to_ids` / `batch_ids_to_text`) against per-sample
+`text_to_ids` / `ids_to_text` calls, in tokens per second.
+
+The corpus is a JSONL file in the SFT format: every line holds either the `--text_fields` (by default
+"input" and "output"), or a list of "messages" / "conversations" whose contents are tokenized.
+
+Example usage:
+
+python scripts/tokenizers/benchmark_batch_tokenization.py \
+    --tokenizer_type sentencepiece --tokenizer_path tokenizer.model --input_file sft.jsonl --batch_size 256
+
+python scripts/tokenizers/benchmark_batch_tokenization.py \
+    --tokenizer_type huggingface --tokenizer_path meta-llama/Llama-3.1-8B --input_file sft.jsonl
+
+python scripts/tokenizers/benchmark_batch_tokenization.py \
+    --tokenizer_type tiktoken --encoding_name o200_harmony --input_file sft.jsonl
+"""
+
+import argparse
+import json
+import time
+
+from nemo.utils import logging
+
+
+def get_tokenizer(args):
+    if args.tokenizer_type == "sentencepiece":
+        from nemo.collections.common.tokenizers.sentencepiece_tokenizer import SentencePieceTokenizer
+
+        return SentencePieceTokenizer(args.tokenizer_path, legacy=args.legacy)
+    if args.tokenizer_type == "huggingface":
+        from nemo.collections.common.tokenizers.huggingface.auto_tokenizer import AutoTokenizer
+
+        return AutoTokenizer(args.tokenizer_path)
+    from nemo.collections.common.tokenizers.tiktoken_tokenizer import TiktokenTokenizer
+
+    if args.encoding_name is not None:
+        return TiktokenTokenizer(encoding_name=args.encoding_name)
+    return TiktokenTokenizer(vocab_file=args.tokenizer_path)
+
+
+def read_texts(input_file, text_fields, num_samples):
+    texts = []
+    with open(input_file, "r", encoding="utf-8") as f:
+        for line in f:
+            sample = json.loads(line)
+            turns = sample.get("messages") or sample.get("conversations")
+            if turns is not None:
+                texts.extend(turn.get("content", turn.get("value", "")) for turn in turns)
+            else:
+                texts.extend(sample[field] for field in text_fields if sample.get(field))
+            if num_samples is not None and len(texts) >= num_samples:
+                return texts[:num_samples]
+    return texts
+
+
+def timeit(fn, num_repeats):
+    fn()  # warmup
+    start = time.perf_counter()
+    for _ in range(num_repeats):
+        result = fn()
+    return result, (time.perf_counter() - start) / num_repeats
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tokenizer_type", choices=["sentencepiece", "huggingface", "tiktoken"], required=True)
+    parser.add_argument("--tokenizer_path", type=str, default=None, help="Model file, vocab file or HF name")
+    parser.add_argument("--encoding_name", type=str, default=None, help="Encoding name of a tiktoken tokenizer")
+    parser.add_argument("--legacy", action="store_true", help="Legacy mode of the SentencePiece tokenizer")
+    parser.add_argument("--input_file", type=str, required=True, help="JSONL corpus in SFT format")
+    parser.add_argument("--text_fields", type=str, default="input,output", help="Comma separated text fields")
+    parser.add_argument("--num_samples", type=int, default=None, help="Number of texts to tokenize")
+    parser.add_argument("--batch_size", type=int, default=256)
+    parser.add_argument("--num_repeats", type=int, default=3)
+    args = parser.parse_args()
+
+    tokenizer = get_tokenizer(args)
+    texts = read_texts(args.input_file, args.text_fields.split(","), args.num_samples)
+    batches = [texts[i : i + args.batch_size] for i in range(0, len(texts), args.batch_size)]
+
+    ids, per_sample_time = timeit(lambda: [tokenizer.text_to_ids(text) for text in texts], args.num_repeats)
+    batch_ids, batch_time = timeit(
+        lambda: [ids for batch in batches for ids in tokenizer.batch_text_to_ids(batch)], args.num_repeats
+    )
+    num_tokens = sum(len(seq) for seq in ids)
+    logging.info(f"{type(tokenizer).__name__}: {len(texts)} texts, {num_tokens} tokens, batch size {args.batch_size}")
+    logging.info(f"  encode per sample: {num_tokens / per_sample_time:12.0f} tokens/s")
+    logging.info(f"  encode batched:    {num_tokens / batch_time:12.0f} tokens/s | identical: {batch_ids == ids}")
+
+    id_batches = [ids[i : i + args.batch_size] for i in range(0, len(ids), args.batch_size)]
+    decoded, per_sample_time = timeit(lambda: [tokenizer.ids_to_text(seq) for seq in ids], args.num_repeats)
+    batch_decoded, batch_time = timeit(
+        lambda: [text for batch in id_batches for text in tokenizer.batch_ids_to_text(batch)], args.num_repeats
+    )
+    logging.info(f"  decode per sample: {num_tokens / per_sample_time:12.0f} tokens/s")
+    logging.info(
+        f"  decode batched:    {num_tokens / batch_time:12.0f} tokens/s | identical: {batch_decoded == decoded}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -16,7 +16,7 @@ import argparse
 
 import numpy as np
 
-from nemo.collections.asr.parts.utils.vad_utils import vad_tune_threshold_on_dev
+from nemo.collections.asr.parts.utils.vad_utils import vad_tune_threshold_on_dev, vad_tune_threshold_on_dev_frame_level
 from nemo.utils import logging
 
 """
@@ -30,6 +30,8 @@ python vad_tune_threshold.py \
 --groundtruth_RTTM=<DIRECTORY OF VAD PREDICTIONS OR A FILE CONTAINS THE PATHS OF THEM> \
 --vad_pred_method="median"
 
+Add --frame_level to score the detection error on frame level labels, which is much faster for large grids.
+
 """
 if __name__ == "__main__":
     parser = argparse.ArgumentParser()
@@ -84,6 +86,14 @@ if __name__ == "__main__":
     parser.add_argument(
         "--frame_length_in_sec", help="frame_length_in_sec ", type=float, default=0.01,
     )
+    parser.add_argument(
+        "--frame_level",
+        help="Whether to score the detection error on frame level labels instead of pyannote segments",
+        action='store_true',
+    )
+    parser.add_argument(
+        "--num_workers", help="Number of processes for tuning", type=int, default=20,
+    )
     args = parser.parse_args()
 
     params = {}
@@ -127,7 +137,8 @@ if __name__ == "__main__":
             "Theshold input is invalid! Please enter it as a 'START,STOP,STEP' for onset, offset, min_duration_on and min_duration_off, and enter True/False for filter_speech_first"
         )
 
-    best_threhsold, optimal_scores = vad_tune_threshold_on_dev(
+    tune_threshold = vad_tune_threshold_on_dev_frame_level if args.frame_level else vad_tune_threshold_on_dev
+    best_threhsold, optimal_scores = tune_threshold(
         params,
         args.vad_pred,
         args.groundtruth_RTTM,
@@ -135,6 +146,7 @@ if __name__ == "__main__":
         args.vad_pred_method,
         args.focus_metric,
         args.frame_length_in_sec,
+        args.num_workers,
     )
     logging.info(
         f"Best combination of thresholds for binarization selected from input ranges is {best_threhsold}, and the optimal score is {optimal_scores}"
@@ -303,7 +303,7 @@ setuptools.setup(
     cmdclass={'style': StyleCommand},
     entry_points={
         "nemo_run.cli": [
-            "llm = nemo.collections.llm",
+            "llm = nemo.collections.llm.cli",
         ],
     },
 )
@@ -13,8 +13,10 @@
 # limitations under the License.
 
 import copy
+import gc
 import os
 from functools import cached_property, lru_cache
+from multiprocessing.pool import ThreadPool
 from pathlib import Path
 
 import jiwer
@@ -24,6 +26,7 @@ from omegaconf import DictConfig, open_dict
 
 from nemo.collections.asr.models import ASRModel
 from nemo.collections.asr.parts.mixins import mixins
+from nemo.collections.asr.parts.submodules import ctc_beam_decoding
 from nemo.collections.asr.parts.submodules.ctc_decoding import (
     CTCBPEDecoding,
     CTCBPEDecodingConfig,
@@ -350,6 +353,53 @@ class TestCTCDecoding:
                 if timestamps:
                     assert hyp.timestamp == batched_hyp.timestamp
 
+    @pytest.mark.unit
+    def test_beam_texts_to_token_ids(self):
+        decoding = ctc_beam_decoding.BeamCTCInfer(blank_id=len(char_vocabulary()), beam_size=4)
+        decoding.set_vocabulary(char_vocabulary())
+        decoding.set_decoding_type('char')
+        texts = ["abc", "", "a bad face.", "f"]
+        assert decoding._texts_to_token_ids(texts) == [[decoding.vocab_index_map[c] for c in t] for t in texts]
+        with pytest.raises(KeyError):
+            decoding._texts_to_token_ids(["abz"])
+
+        decoding.set_vocabulary([str(i) for i in range(300)])
+        decoding.set_decoding_type('subword')
+        token_ids = [[0, 17, 299], [], [5]]
+        texts = [''.join(chr(t + decoding.token_offset) for t in ids) for ids in token_ids]
+        assert decoding._texts_to_token_ids(texts) == token_ids
+
+    @pytest.mark.unit
+    def test_beam_decoder_pool(self):
+        with pytest.raises(ValueError):
+            ctc_beam_decoding.BeamCTCInfer(blank_id=0, beam_size=4, pool_type="fiber")
+
+        decoding = ctc_beam_decoding.BeamCTCInfer(blank_id=0, beam_size=4, num_workers=1)
+        assert decoding._get_decoder_pool() is None
+
+        decoding = ctc_beam_decoding.BeamCTCInfer(blank_id=0, beam_size=4, num_workers=2)
+        pool = decoding._get_decoder_pool()
+        assert pool is not None and decoding._get_decoder_pool() is pool
+        assert pool.map(abs, [-1, 2, -3]) == [1, 2, 3]
+        assert copy.deepcopy(decoding)._decoder_pool is None
+        decoding.close_decoder_pool()
+        assert decoding._decoder_pool is None
+
+        # the pool is terminated with the decoder
+        pool = decoding._get_decoder_pool()
+        del decoding
+        gc.collect()
+        with pytest.raises(ValueError):
+            pool.map(abs, [-1])
+
+    @pytest.mark.unit
+    def test_beam_decoder_process_pool_after_cuda_init(self, monkeypatch):
+        monkeypatch.setattr(torch.cuda, "is_initialized", lambda: True)
+        decoding = ctc_beam_decoding.BeamCTCInfer(blank_id=0, beam_size=4, num_workers=2, pool_type="process")
+        pool = decoding._get_decoder_pool()
+        assert isinstance(pool, ThreadPool)
+        decoding.close_decoder_pool()
+
 
 class TestCTCTimestamps(BaseTimestampsTest):
     """CTC-specific timestamp tests that inherit from BaseTimestampsTest"""
@@ -506,6 +506,31 @@ class TestRNNTLossPytorch:
 
         assert np.allclose(pt_grads1_p_2, np_grads1 + np_grads2, atol=1e-5)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize('blank', [0, 7])
+    def test_case_variable_lengths_cpu(self, blank):
+        torch.manual_seed(0)
+        B, T, U, V = 6, 12, 6, 8
+        acts = torch.randn(B, T, U, V)
+        labels = torch.randint(0, V - 1, (B, U - 1))
+        labels[labels >= blank] += 1  # labels never contain the blank token
+        act_lens = torch.tensor([12, 3, 7, 1, 12, 5])
+        label_lens = torch.tensor([5, 2, 0, 1, 3, 5])
+
+        fn_pt = RNNTLossNumba(blank=blank, reduction='none')
+        fn_ag = RNNTLossPytorch(blank=blank, reduction='none')
+
+        pt_acts = acts.clone().requires_grad_(True)
+        pt_costs = fn_pt(pt_acts, labels, act_lens, label_lens)
+        pt_costs.sum().backward()
+
+        ag_acts = acts.clone().requires_grad_(True)
+        ag_costs = fn_ag(acts=ag_acts, labels=labels, act_lens=act_lens, label_lens=label_lens)
+        ag_costs.sum().backward()
+
+        assert np.allclose(pt_costs.detach().numpy(), ag_costs.detach().numpy(), rtol=1e-5)
+        assert np.allclose(pt_acts.grad.numpy(), ag_acts.grad.numpy(), atol=1e-5)
+
 
 class TestMultiblankRNNTLoss:
     @pytest.mark.unit
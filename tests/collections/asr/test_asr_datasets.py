@@ -15,7 +15,9 @@ import copy
 import filecmp
 import json
 import os
+import pickle
 import shutil
+import tarfile
 import tempfile
 from unittest import mock
 
@@ -28,6 +30,7 @@ from torch.utils.data import DataLoader
 
 from nemo.collections.asr.data import audio_to_text_dataset
 from nemo.collections.asr.data.audio_to_text import (
+    AudioToCharDataset,
     DataStoreObject,
     TarredAudioToBPEDataset,
     TarredAudioToCharDataset,
@@ -37,14 +40,17 @@ from nemo.collections.asr.data.audio_to_text_dali import (
     __DALI_MINIMUM_VERSION__,
     AudioToBPEDALIDataset,
     AudioToCharDALIDataset,
+    DALIOutputs,
     is_dali_supported,
 )
 from nemo.collections.asr.data.audio_to_text_dataset import inject_dataloader_value_from_model_config
 from nemo.collections.asr.data.feature_to_text import FeatureToBPEDataset, FeatureToCharDataset
 from nemo.collections.asr.models.ctc_models import EncDecCTCModel
+from nemo.collections.asr.parts.preprocessing.feature_cache import FeatureCache, get_feature_cache_key
 from nemo.collections.asr.parts.utils.manifest_utils import write_manifest
 from nemo.collections.common import tokenizers
 from nemo.collections.common.data.lhotse import get_lhotse_dataloader_from_config
+from nemo.collections.common.data.tar_index import build_tar_index, get_tar_index_path, write_tar_index
 from nemo.utils import logging
 
 try:
@@ -152,6 +158,116 @@ class TestASRDatasets:
             count += 1
         assert count == 5  # file ending with sub is not part of tar ball
 
+    @pytest.mark.unit
+    def test_tarred_dataset_with_offset_index(self, tmp_path):
+        rng = np.random.default_rng(0)
+        entries = []
+        for shard_id in range(2):
+            with tarfile.open(tmp_path / f"audio_{shard_id}.tar", mode="w") as tar:
+                for i in range(4):
+                    name = f"utt_{shard_id}_{i}.wav"
+                    sf.write(tmp_path / name, rng.uniform(-0.5, 0.5, 1600 * (i + 1)), 16000)
+                    tar.add(tmp_path / name, arcname=name)
+                    entries.append({"audio_filepath": name, "duration": 0.1 * (i + 1), "text": "abc"[: i + 1]})
+        # keep only a subset of the tarred audio files in the manifest
+        manifest_path = str(tmp_path / "manifest.json")
+        write_manifest(manifest_path, entries[::2])
+        tarpath = str(tmp_path / "audio_{0..1}.tar")
+
+        def load_samples():
+            ds = TarredAudioToCharDataset(
+                audio_tar_filepaths=tarpath, manifest_filepath=manifest_path, labels=self.labels, sample_rate=16000
+            )
+            return list(ds)
+
+        ref_samples = load_samples()
+        for shard_id in range(2):
+            shard_path = str(tmp_path / f"audio_{shard_id}.tar")
+            write_tar_index(build_tar_index(shard_path), get_tar_index_path(shard_path))
+        with mock.patch("tarfile.open", side_effect=AssertionError("indexed shards must not be streamed")):
+            samples = load_samples()
+
+        assert len(samples) == len(ref_samples) == 4
+        for sample, ref_sample in zip(samples, ref_samples):
+            for value, ref_value in zip(sample, ref_sample):
+                assert torch.equal(value, ref_value)
+
+    @pytest.mark.unit
+    def test_dataset_with_feature_cache(self, tmp_path):
+        rng = np.random.default_rng(0)
+        entries = []
+        for i in range(4):
+            audio_file = str(tmp_path / f"utt_{i}.wav")
+            sf.write(audio_file, rng.uniform(-0.5, 0.5, 1600 * (i + 2)), 16000)
+            entries.append({"audio_filepath": audio_file, "duration": 0.1 * (i + 2), "text": "abcd"[: i + 1]})
+        manifest_path = str(tmp_path / "manifest.json")
+        write_manifest(manifest_path, entries)
+        preprocessor_cfg = {
+            '_target_': 'nemo.collections.asr.modules.AudioToMelSpectrogramPreprocessor',
+            'sample_rate': 16000,
+            'features': 40,
+        }
+        feature_cache = {'cache_dir': str(tmp_path / "cache"), 'preprocessor': preprocessor_cfg}
+        preprocessor = EncDecCTCModel.from_config_dict(preprocessor_cfg).eval()
+
+        def load_batches(feature_cache):
+            ds = AudioToCharDataset(
+                manifest_filepath=manifest_path, labels=self.labels, sample_rate=16000, feature_cache=feature_cache
+            )
+            batches = list(DataLoader(ds, batch_size=2, collate_fn=ds._collate_fn))
+            return ds, batches
+
+        ds, batches = load_batches(feature_cache)
+        assert ds.featurizer.cache.stats == {'hits': 0, 'misses': 4}
+        for i, batch in enumerate(batches):
+            assert isinstance(batch, DALIOutputs) and batch.has_processed_signal
+            signal, signal_len, transcript, transcript_len = batch.to('cpu')
+            for j in range(2):
+                audio, _ = sf.read(entries[2 * i + j]["audio_filepath"], dtype='float32')
+                with torch.no_grad():
+                    ref, ref_len = preprocessor(
+                        input_signal=torch.from_numpy(audio)[None], length=torch.tensor([audio.shape[0]])
+                    )
+                assert signal_len[j] == ref_len[0]
+                assert torch.allclose(signal[j, :, : signal_len[j]], ref[0, :, : ref_len[0]], atol=1e-5)
+                assert transcript_len[j] == 2 * i + j + 1
+
+        # the cache keys do not depend on the type of the config
+        cached_ds, cached_batches = load_batches(OmegaConf.create(feature_cache))
+        assert cached_ds.featurizer.cache.stats == {'hits': 4, 'misses': 0}
+        for batch, cached_batch in zip(batches, cached_batches):
+            for value, cached_value in zip(batch, cached_batch):
+                assert torch.equal(value, cached_value)
+
+        with pytest.raises(ValueError):
+            AudioToCharDataset(
+                manifest_filepath=manifest_path,
+                labels=self.labels,
+                sample_rate=16000,
+                feature_cache=feature_cache,
+                return_sample_id=True,
+            )
+
+    @pytest.mark.unit
+    def test_feature_dataset_with_feature_cache(self, tmp_path):
+        entries = []
+        for i in range(3):
+            feature_file = str(tmp_path / f"feat_{i}.pt")
+            torch.save(torch.randn(80, 10 * (i + 1)), feature_file)
+            entries.append({"audio_filepath": "", "feature_file": feature_file, "duration": 100000, "text": "a b c"})
+        manifest_path = str(tmp_path / "manifest.json")
+        write_manifest(manifest_path, entries)
+
+        ref_samples = list(FeatureToCharDataset(manifest_path, labels=self.labels))
+        feature_cache = {'cache_dir': str(tmp_path / "cache")}
+        for expected_hits in [0, 3]:
+            ds = FeatureToCharDataset(manifest_path, labels=self.labels, feature_cache=feature_cache)
+            samples = list(ds)
+            assert ds.featurizer.feature_cache.stats == {'hits': expected_hits, 'misses': 3 - expected_hits}
+            for sample, ref_sample in zip(samples, ref_samples):
+                for value, ref_value in zip(sample, ref_sample):
+                    assert torch.equal(value, ref_value)
+
     @pytest.mark.unit
     def test_mismatch_in_model_dataloader_config(self, caplog):
         logging._logger.propagate = True
@@ -781,6 +897,62 @@ class TestASRDatasets:
             assert cnt == num_samples
 
 
+class TestFeatureCache:
+    @pytest.mark.unit
+    @pytest.mark.parametrize('dtype', ['float32', 'float16'])
+    def test_put_get(self, tmp_path, dtype):
+        rng = np.random.default_rng(0)
+        cache = FeatureCache(str(tmp_path), dtype=dtype)
+        features = {
+            get_feature_cache_key(f"audio_{i}.wav", 0.5 * i, 1.0, "config"): rng.standard_normal((40, 7 + i))
+            for i in range(5)
+        }
+        for key, value in features.items():
+            cache.put(key, value)
+
+        # another process sees the entries after a refresh
+        other_cache = FeatureCache(str(tmp_path), dtype=dtype)
+        for c in [cache, other_cache]:
+            assert len(c) == 5
+            for key, value in features.items():
+                assert np.array_equal(c.get(key), value.astype(dtype))
+        assert other_cache.get(get_feature_cache_key("audio_0.wav", 0.5, 1.0, "config")) is None
+        assert other_cache.stats == {'hits': 5, 'misses': 1}
+
+        key = get_feature_cache_key("audio_5.wav", 0, 1.0, "config")
+        other_cache.put(key, rng.standard_normal((40, 3)))
+        assert key not in cache
+        assert cache.refresh(force=True) and key in cache
+        assert get_feature_cache_key("a.wav", 0, None, "config") == get_feature_cache_key("a.wav", 0.0, 0, "config")
+
+    @pytest.mark.unit
+    def test_lru_eviction(self, tmp_path):
+        shard_bytes = 40 * 100 * 4
+        cache = FeatureCache(str(tmp_path), max_disk_bytes=3 * shard_bytes, shard_size_bytes=1)
+        features = np.ones((40, 100), dtype=np.float32)
+        for i in range(3):
+            cache.put(f"key_{i}", features)
+            # shards are evicted by the time of their last access
+            os.utime(os.path.join(str(tmp_path), cache._index[f"key_{i}"][0] + ".bin"), (i, [1, 0, 2][i]))
+        assert len(cache) == 3
+
+        cache.put("key_3", features)
+        assert sorted(cache._index) == ["key_0", "key_2", "key_3"]
+        assert len([name for name in os.listdir(str(tmp_path)) if name.endswith(".bin")]) == 3
+        assert len(FeatureCache(str(tmp_path))) == 3
+
+    @pytest.mark.unit
+    def test_pickle(self, tmp_path):
+        cache = FeatureCache(str(tmp_path))
+        cache.put("key", np.zeros((2, 3)))
+        cache.get("key")
+        restored = pickle.loads(pickle.dumps(cache))
+        restored.refresh(force=True)
+        assert np.array_equal(restored.get("key"), np.zeros((2, 3)))
+        restored.put("other_key", np.ones((2, 3)))
+        assert restored._writer_shard != cache._writer_shard
+
+
 class TestUtilityFunctions:
     @pytest.mark.unit
     @pytest.mark.parametrize('cache_audio', [False, True])
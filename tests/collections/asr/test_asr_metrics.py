@@ -41,6 +41,12 @@ from nemo.collections.asr.parts.submodules.ctc_decoding import (
 )
 from nemo.collections.asr.parts.submodules.multitask_decoding import AbstractMultiTaskDecoding
 from nemo.collections.asr.parts.submodules.rnnt_decoding import AbstractRNNTDecoding, RNNTBPEDecoding, RNNTDecoding
+from nemo.collections.asr.parts.utils.edit_distance_utils import (
+    batched_edit_distance,
+    batched_text_edit_distance,
+    batched_text_edit_operations,
+    texts_to_padded_ids,
+)
 from nemo.collections.asr.parts.utils.rnnt_utils import Hypothesis
 from nemo.collections.common.tokenizers import CharTokenizer
 from nemo.utils.config_utils import assert_dataclass_signature_match
@@ -163,6 +169,28 @@ class TestWordErrorRate:
             hypotheses=['ducuti motorcycle', 'G P U'], references=['ducati motorcycle', 'GPU'], use_cer=True
         ) == ([1 / 17, 2 / 3], 0.15)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("use_cer", [False, True])
+    def test_batched_edit_distance(self, use_cer):
+        """The batched tensor implementation must agree with the per-utterance CPU implementation."""
+        rng = random.Random(0)
+
+        def __random_string(length):
+            return ''.join(rng.choice('ab c') for _ in range(length))
+
+        hypotheses = [__random_string(rng.randint(0, 40)) for _ in range(64)]
+        references = [__random_string(rng.randint(0, 40)) for _ in range(64)]
+
+        vocabulary = {}
+        hyp_ids, hyp_lengths = texts_to_padded_ids(hypotheses, use_cer=use_cer, vocabulary=vocabulary)
+        ref_ids, ref_lengths = texts_to_padded_ids(references, use_cer=use_cer, vocabulary=vocabulary)
+        batched = batched_edit_distance(hyp_ids, hyp_lengths, ref_ids, ref_lengths)
+        expected = batched_text_edit_operations(hypotheses, references, use_cer=use_cer)
+
+        for actual, reference in zip(batched, expected):
+            assert torch.equal(actual, reference)
+        assert torch.equal(batched[0], batched_text_edit_distance(hypotheses, references, use_cer=use_cer))
+
     @pytest.mark.unit
     @pytest.mark.parametrize("batch_dim_index", [0, 1])
     @pytest.mark.parametrize("test_wer_bpe", [False, True])
@@ -12,15 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import os
 import random
+import shutil
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 import torch
 from torch.nn.utils.rnn import pad_sequence
 from tqdm.auto import tqdm
 
-from nemo.collections.asr.parts.submodules.ngram_lm import KenLMBatchedWrapper, NGramGPULanguageModel
+from nemo.collections.asr.parts.submodules.ngram_lm import KenLMBatchedWrapper, NGramGPULanguageModel, ngram_lm_batched
 from nemo.core.utils.optional_libs import KENLM_AVAILABLE, TRITON_AVAILABLE
 
 DEVICES = [torch.device("cpu")]
@@ -207,3 +210,53 @@ class TestNGramGPULanguageModel:
         assert (n_gpu_lm_loaded.backoff_to_states == n_gpu_lm.backoff_to_states).all()
         assert torch.allclose(n_gpu_lm_loaded.backoff_weights, n_gpu_lm.backoff_weights)
         assert torch.allclose(n_gpu_lm_loaded.final_weights, n_gpu_lm.final_weights)
+
+    @pytest.mark.unit
+    def test_parallel_arpa_reader(self, n_gpu_lm: NGramGPULanguageModel, test_data_dir):
+        kenlm_model_path = Path(test_data_dir) / "asr/kenlm_ngram_lm/parakeet-tdt_ctc-110m-libri-1024.kenlm.tmp.arpa"
+        n_gpu_lm_parallel = NGramGPULanguageModel.from_arpa(
+            kenlm_model_path, vocab_size=1024, normalize_unk=False, num_workers=2
+        )
+        state_dict, state_dict_parallel = n_gpu_lm.state_dict(), n_gpu_lm_parallel.state_dict()
+        assert state_dict.keys() == state_dict_parallel.keys()
+        for name in state_dict:
+            assert torch.equal(state_dict[name], state_dict_parallel[name]), name
+
+    @pytest.mark.unit
+    def test_compiled_cache(self, n_gpu_lm: NGramGPULanguageModel, tmp_path, test_data_dir):
+        vocab_size = 1024
+        kenlm_model_path = Path(test_data_dir) / "asr/kenlm_ngram_lm/parakeet-tdt_ctc-110m-libri-1024.kenlm.tmp.arpa"
+        arpa_path = tmp_path / "lm.arpa"
+        shutil.copy(kenlm_model_path, arpa_path)
+        NGramGPULanguageModel.compile_arpa(arpa_path, vocab_size=vocab_size, normalize_unk=False)
+        assert NGramGPULanguageModel.get_default_cache_path(arpa_path).exists()
+
+        # cache is used instead of parsing ARPA
+        with patch.object(NGramGPULanguageModel, "from_arpa", side_effect=AssertionError("ARPA should not be read")):
+            n_gpu_lm_loaded = NGramGPULanguageModel.from_file(arpa_path, vocab_size=vocab_size, normalize_unk=False)
+        state_dict, state_dict_loaded = n_gpu_lm.state_dict(), n_gpu_lm_loaded.state_dict()
+        for name in state_dict:
+            assert torch.equal(state_dict[name], state_dict_loaded[name]), name
+
+        # checksum is computed only if the modification time changed or for strict validation
+        with patch.object(ngram_lm_batched, "_file_checksum", wraps=ngram_lm_batched._file_checksum) as checksum_mock:
+            NGramGPULanguageModel.from_file(arpa_path, vocab_size=vocab_size, normalize_unk=False)
+            assert checksum_mock.call_count == 0
+            NGramGPULanguageModel.from_file(
+                arpa_path, vocab_size=vocab_size, normalize_unk=False, strict_cache_validation=True
+            )
+            assert checksum_mock.call_count == 1
+            stat = arpa_path.stat()
+            os.utime(arpa_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+            with patch.object(NGramGPULanguageModel, "from_arpa", side_effect=AssertionError("ARPA is unchanged")):
+                NGramGPULanguageModel.from_file(arpa_path, vocab_size=vocab_size, normalize_unk=False)
+            assert checksum_mock.call_count == 2
+
+        # cache is stale for other parameters or changed ARPA file
+        with patch.object(NGramGPULanguageModel, "from_arpa") as from_arpa_mock:
+            NGramGPULanguageModel.from_file(arpa_path, vocab_size=vocab_size, normalize_unk=True)
+            assert from_arpa_mock.call_count == 1
+            with open(arpa_path, "a", encoding="utf-8") as f:
+                f.write("\n")
+            NGramGPULanguageModel.from_file(arpa_path, vocab_size=vocab_size, normalize_unk=False)
+            assert from_arpa_mock.call_count == 2
@@ -0,0 +1,75 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from nemo.collections.asr.parts.utils.streaming_utils import (
+    batched_lcs_alignment_merge_buffer,
+    batched_longest_common_subsequence_merge,
+    lcs_alignment_merge_buffer,
+    longest_common_subsequence_merge,
+)
+
+
+def _random_buffers(rng, num_streams, vocab_size=5):
+    buffers, chunks = [], []
+    for _ in range(num_streams):
+        buffer = rng.integers(vocab_size, size=rng.integers(0, 20)).tolist()
+        overlap = buffer[-rng.integers(0, 10) :] if buffer else []
+        chunk = overlap + rng.integers(vocab_size, size=rng.integers(0, 20)).tolist()
+        buffers.append(buffer)
+        chunks.append(chunk)
+    return buffers, chunks
+
+
+@pytest.mark.unit
+def test_longest_common_subsequence_merge():
+    X = [1, 2, 3, 4, 5]
+    Y = [3, 4, 5, 6, 7]
+    result_idx, alignment = longest_common_subsequence_merge(X, Y)
+
+    assert result_idx == [2, 0, 3]
+    assert len(alignment) == len(X) + 1
+    assert all(len(row) == len(Y) + 1 for row in alignment)
+    assert lcs_alignment_merge_buffer(list(X), Y, delay=1, model=None) == [1, 2, 3, 4, 5, 6, 7]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("seed", range(5))
+def test_batched_longest_common_subsequence_merge(seed):
+    rng = np.random.default_rng(seed)
+    buffers, chunks = _random_buffers(rng, num_streams=16)
+
+    results_idx, alignments = batched_longest_common_subsequence_merge(buffers, chunks)
+    for buffer, chunk, result_idx, alignment in zip(buffers, chunks, results_idx, alignments):
+        expected_idx, expected_alignment = longest_common_subsequence_merge(buffer, chunk)
+        assert result_idx == expected_idx
+        assert alignment.tolist() == expected_alignment
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("parallel_chunking", [False, True])
+def test_batched_lcs_alignment_merge_buffer(parallel_chunking):
+    rng = np.random.default_rng(0)
+    buffers, chunks = _random_buffers(rng, num_streams=16)
+
+    expected = [
+        lcs_alignment_merge_buffer(list(buffer), chunk, 2, None, parallel_chunking=parallel_chunking)
+        for buffer, chunk in zip(buffers, chunks)
+    ]
+    merged = batched_lcs_alignment_merge_buffer(
+        [list(buffer) for buffer in buffers], chunks, 2, None, parallel_chunking=parallel_chunking
+    )
+    assert merged == expected
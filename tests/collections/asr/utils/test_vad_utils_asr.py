@@ -14,17 +14,24 @@
 
 import numpy as np
 import pytest
+import torch
 from pyannote.core import Annotation, Segment
 
 from nemo.collections.asr.parts.utils.vad_utils import (
     align_labels_to_frames,
     convert_labels_to_speech_segments,
     frame_vad_construct_pyannote_object_per_file,
+    generate_overlap_vad_seq_from_tensors,
+    generate_overlap_vad_seq_per_tensor,
+    generate_vad_segment_table_from_tensors,
+    generate_vad_segment_table_per_tensor,
     get_frame_labels,
     get_nonspeech_segments,
     load_speech_overlap_segments_from_rttm,
     load_speech_segments_from_rttm,
+    prepare_gen_segment_table,
     read_rttm_as_pyannote_object,
+    vad_tune_threshold_on_dev_frame_level,
 )
 
 
@@ -124,3 +131,73 @@ class TestVADUtils:
         assert speech_segments_new == speech_segments
         ref, hyp = frame_vad_construct_pyannote_object_per_file(frame_labels, frame_labels, 0.02)
         assert ref == hyp == pyannote_object_gt
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("smoothing_method", ["mean", "median"])
+    def test_generate_overlap_vad_seq_from_tensors(self, smoothing_method):
+        torch.manual_seed(0)
+        frame_preds = {f"audio_{i}": torch.rand(length) for i, length in enumerate([1, 7, 64, 250])}
+        per_args = {"overlap": 0.875, "window_length_in_sec": 0.63, "shift_length_in_sec": 0.01}
+
+        overlap_preds = generate_overlap_vad_seq_from_tensors(frame_preds, smoothing_method, batch_size=3, **per_args)
+        for name, frame in frame_preds.items():
+            expected = generate_overlap_vad_seq_per_tensor(frame, per_args, smoothing_method)
+            assert torch.allclose(overlap_preds[name], expected)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "postprocessing_params",
+        [
+            {"onset": 0.5, "offset": 0.5},
+            {"onset": 0.6, "offset": 0.4, "pad_onset": 0.05, "pad_offset": 0.03, "min_duration_on": 0.05},
+            {"onset": 0.4, "offset": 0.6, "min_duration_off": 0.08, "filter_speech_first": False},
+            {"onset": 0.3, "offset": 0.2, "scale": "relative"},
+        ],
+    )
+    def test_generate_vad_segment_table_from_tensors(self, postprocessing_params, tmp_path):
+        torch.manual_seed(0)
+        vad_preds = {f"audio_{i}": torch.rand(length) for i, length in enumerate([1, 7, 64, 250])}
+
+        tables = generate_vad_segment_table_from_tensors(
+            vad_preds, postprocessing_params, 0.01, out_dir=str(tmp_path), batch_size=3
+        )
+        for name, sequence in vad_preds.items():
+            _, per_args = prepare_gen_segment_table(sequence, {"frame_length_in_sec": 0.01, **postprocessing_params})
+            assert torch.equal(tables[name], generate_vad_segment_table_per_tensor(sequence, per_args))
+            assert (tmp_path / f"{name}.txt").exists()
+
+    @pytest.mark.unit
+    def test_vad_tune_threshold_on_dev_frame_level(self, tmp_path):
+        pred_dir, rttm_dir = tmp_path / "pred", tmp_path / "rttm"
+        pred_dir.mkdir()
+        rttm_dir.mkdir()
+        # speech in [1, 2] seconds, predictions are noisy around it
+        probs = np.full(300, 0.1)
+        probs[100:200] = 0.9
+        probs[150] = 0.45
+        probs[250] = 0.7
+        (pred_dir / "audio.frame").write_text("".join(f"{p:.4f}\n" for p in probs))
+        (rttm_dir / "audio.rttm").write_text("SPEAKER audio 1 1.0 1.0 <NA> <NA> speech <NA> <NA>\n")
+
+        # a low onset detects the spurious spike at 2.5s
+        params = {"onset": [0.5, 0.8], "offset": [0.3, 0.5], "min_duration_on": [0.0]}
+        best_params, scores = vad_tune_threshold_on_dev_frame_level(
+            params, str(pred_dir), str(rttm_dir), str(tmp_path / "res"), num_workers=1
+        )
+        assert best_params == {"min_duration_on": 0.0, "offset": 0.3, "onset": 0.8}
+        assert scores == {'DetER (%)': 0.0, 'FA (%)': 0.0, 'MISS (%)': 0.0}
+
+        # binarizing one parameter at a time gives the same scores
+        params = {"onset": [0.5, 0.8], "offset": [0.3, 0.5], "min_duration_on": [0.0]}
+        chunked_params, chunked_scores = vad_tune_threshold_on_dev_frame_level(
+            params, str(pred_dir), str(rttm_dir), str(tmp_path / "res"), num_workers=1, max_frames_per_batch=1
+        )
+        assert (chunked_params, chunked_scores) == (best_params, scores)
+
+        params = {"onset": [0.5], "offset": [0.3]}
+        _, scores = vad_tune_threshold_on_dev_frame_level(
+            params, str(pred_dir), str(rttm_dir), str(tmp_path / "res"), num_workers=1
+        )
+        # one false alarm frame out of 101 reference speech frames in [1.0, 2.0]
+        assert scores['FA (%)'] == pytest.approx(100 / 101)
+        assert scores['MISS (%)'] == 0.0
@@ -0,0 +1,144 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+import torch
+
+from nemo.collections.common.tokenizers.aggregate_tokenizer import AggregateTokenizer
+from nemo.collections.common.tokenizers.sentencepiece_tokenizer import SentencePieceTokenizer, create_spt_model
+
+TEXTS = {
+    "en": "the quick brown fox jumps over the lazy dog\nshe sells sea shells by the sea shore\n" * 5,
+    "es": "el rapido zorro marron salta sobre el perro perezoso\nella vende conchas en la orilla\n" * 5,
+}
+
+
+@pytest.fixture(scope="module")
+def agg_tokenizer(tmp_path_factory):
+    tokenizers = {}
+    for lang, text in TEXTS.items():
+        tmpdir = tmp_path_factory.mktemp(f"tokenizer_{lang}")
+        (tmpdir / "text.txt").write_text(text)
+        create_spt_model(
+            str(tmpdir / "text.txt"), vocab_size=40, sample_size=-1, do_lower_case=False, output_dir=str(tmpdir)
+        )
+        tokenizers[lang] = SentencePieceTokenizer(str(tmpdir / "tokenizer.model"))
+    return AggregateTokenizer(tokenizers)
+
+
+def reference_ids_to_text(tokenizer, ids):
+    tokens = []
+    for id in ids:
+        tokens.extend(tokenizer.tokenizers_by_token_id[id].ids_to_tokens([tokenizer.offset_token_ids_by_token_id[id]]))
+    return ''.join(tokens).replace('▁', ' ')
+
+
+def reference_ids_to_lang(tokenizer, ids):
+    lang_cnts = {}
+    for id in ids:
+        lang = tokenizer.langs_by_token_id[id]
+        lang_cnts[lang] = lang_cnts.get(lang, 0) + 1
+    return max(lang_cnts, key=lang_cnts.get) if lang_cnts else ''
+
+
+def reference_ids_to_words_and_langs(tokenizer, ids):
+    words_and_langs = []
+    word_ids = []
+    for id in ids:
+        token = tokenizer.tokenizers_by_token_id[id].ids_to_tokens([tokenizer.offset_token_ids_by_token_id[id]])[0]
+        if token.startswith('▁') and len(word_ids) > 0:
+            words_and_langs.append(
+                {
+                    'word': reference_ids_to_text(tokenizer, word_ids).strip(),
+                    'lang': reference_ids_to_lang(tokenizer, word_ids),
+                }
+            )
+            word_ids = []
+        word_ids.append(id)
+    if len(word_ids) > 0:
+        words_and_langs.append(
+            {
+                'word': reference_ids_to_text(tokenizer, word_ids).strip(),
+                'lang': reference_ids_to_lang(tokenizer, word_ids),
+            }
+        )
+    return words_and_langs
+
+
+def random_batch(tokenizer, seed, batch_size=8, max_len=30):
+    rng = np.random.default_rng(seed)
+    lengths = rng.integers(0, max_len + 1, size=batch_size)
+    lengths[0] = max_len
+    ids = rng.integers(0, tokenizer.vocab_size, size=(batch_size, max_len))
+    return ids, lengths
+
+
+class TestAggregateTokenizer:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", range(3))
+    def test_decoding_matches_reference(self, agg_tokenizer, seed):
+        ids, lengths = random_batch(agg_tokenizer, seed)
+        for row, length in zip(ids, lengths):
+            seq = row[:length].tolist()
+            assert agg_tokenizer.ids_to_text(seq) == reference_ids_to_text(agg_tokenizer, seq)
+            assert agg_tokenizer.ids_to_text(torch.tensor(seq, dtype=torch.long)) == reference_ids_to_text(
+                agg_tokenizer, seq
+            )
+            assert agg_tokenizer.ids_to_lang(seq) == reference_ids_to_lang(agg_tokenizer, seq)
+            assert agg_tokenizer.ids_to_words_and_langs(seq) == reference_ids_to_words_and_langs(agg_tokenizer, seq)
+            assert agg_tokenizer.ids_to_tokens(seq) == [
+                agg_tokenizer.tokenizers_by_token_id[id].ids_to_tokens(
+                    [agg_tokenizer.offset_token_ids_by_token_id[id]]
+                )[0]
+                for id in seq
+            ]
+            assert [d['lang'] for d in agg_tokenizer.ids_to_text_and_langs(seq)] == [
+                agg_tokenizer.langs_by_token_id[id] for id in seq
+            ]
+
+    @pytest.mark.unit
+    def test_text_roundtrip(self, agg_tokenizer):
+        en_ids = agg_tokenizer.text_to_ids("the quick brown fox", "en")
+        es_ids = agg_tokenizer.text_to_ids("el perro perezoso", "es")
+        assert agg_tokenizer.ids_to_text(en_ids).strip() == "the quick brown fox"
+        assert agg_tokenizer.ids_to_lang(es_ids) == "es"
+        words = agg_tokenizer.ids_to_words_and_langs(en_ids + es_ids)
+        assert [w['word'] for w in words] == ["the", "quick", "brown", "fox", "el", "perro", "perezoso"]
+        assert [w['lang'] for w in words] == ["en"] * 4 + ["es"] * 3
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", range(3))
+    def test_batch_decoding(self, agg_tokenizer, seed):
+        ids, lengths = random_batch(agg_tokenizer, seed)
+        seqs = [row[:length].tolist() for row, length in zip(ids, lengths)]
+
+        expected_texts = [agg_tokenizer.ids_to_text(seq) for seq in seqs]
+        assert agg_tokenizer.batch_ids_to_text(torch.from_numpy(ids), torch.from_numpy(lengths)) == expected_texts
+        assert agg_tokenizer.batch_ids_to_text(seqs) == expected_texts
+        assert agg_tokenizer.batch_ids_to_lang(ids, lengths) == [agg_tokenizer.ids_to_lang(seq) for seq in seqs]
+        assert agg_tokenizer.batch_ids_to_words_and_langs(ids, lengths) == [
+            agg_tokenizer.ids_to_words_and_langs(seq) for seq in seqs
+        ]
+
+    @pytest.mark.unit
+    def test_batch_text_to_ids(self, agg_tokenizer):
+        texts = ["the quick brown fox", "el perro perezoso", "", "she sells sea shells"]
+        langs = ["en", "es", "es", "en"]
+        assert agg_tokenizer.batch_text_to_ids(texts, langs) == [
+            agg_tokenizer.text_to_ids(text, lang) for text, lang in zip(texts, langs)
+        ]
+        assert agg_tokenizer.batch_text_to_ids(texts, "en") == [
+            agg_tokenizer.text_to_ids(text, "en") for text in texts
+        ]
@@ -0,0 +1,84 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+
+import numpy as np
+import pytest
+
+from nemo.collections.common.parts.preprocessing.collections import ASRAudioText
+
+
+def char_parser(text):
+    return [ord(char) for char in text]
+
+
+@pytest.fixture(scope="module")
+def manifest_path(tmp_path_factory):
+    rng = np.random.default_rng(0)
+    path = tmp_path_factory.mktemp("manifest") / "manifest.json"
+    with open(path, "w", encoding="utf-8") as f:
+        for i in range(50):
+            entry = {
+                "audio_filepath": f"/data/audio_{i % 7}.wav",
+                "duration": round(float(rng.uniform(0.5, 20.0)), 2),
+                "text": ["", "hello world", "grüße, 世界", f"utterance {i}"][i % 4],
+            }
+            if i % 3 == 0:
+                entry["offset"] = 1.5 * i
+            if i % 5 == 0:
+                entry["speaker"] = i % 2
+                entry["lang"] = "en"
+                entry["orig_sample_rate"] = 8000
+            if i % 11 == 0:
+                entry["token_labels"] = [i, i + 1]
+            f.write(json.dumps(entry, ensure_ascii=False) + "\n")
+    return str(path)
+
+
+class TestCompactCollections:
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {},
+            {"min_duration": 2.0, "max_duration": 15.0},
+            {"max_number": 20},
+            {"do_sort_by_duration": True},
+            {"index_by_file_id": True},
+        ],
+    )
+    def test_compact_entries_match(self, manifest_path, kwargs):
+        collection = ASRAudioText(manifest_path, parser=char_parser, **kwargs)
+        compact_collection = ASRAudioText(manifest_path, parser=char_parser, compact=True, **kwargs)
+
+        assert len(compact_collection) == len(collection) > 0
+        assert list(compact_collection) == list(collection)
+        for i in [0, len(collection) // 2, -1]:
+            assert compact_collection[i] == collection[i]
+            assert type(compact_collection[i]) is type(collection[i])
+        assert compact_collection.data[2:5] == collection.data[2:5]
+        assert getattr(compact_collection, "mapping", None) == getattr(collection, "mapping", None)
+        with pytest.raises(IndexError):
+            compact_collection[len(collection)]
+
+    @pytest.mark.unit
+    def test_compact_storage(self, manifest_path):
+        compact_collection = ASRAudioText(manifest_path, parser=char_parser, compact=True)
+        audio_file_column = compact_collection.data.columns[compact_collection.OUTPUT_TYPE._fields.index("audio_file")]
+        # every distinct audio file is stored once
+        assert len(audio_file_column.offsets) == 8
+        for column in compact_collection.data.columns:
+            for name, value in vars(column).items():
+                assert not isinstance(value, list) or name == "values" and len(value) <= 3
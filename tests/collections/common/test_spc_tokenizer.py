@@ -14,7 +14,7 @@
 
 import pytest
 
-from nemo.collections.common.tokenizers.sentencepiece_tokenizer import SentencePieceTokenizer
+from nemo.collections.common.tokenizers.sentencepiece_tokenizer import SentencePieceTokenizer, create_spt_model
 
 MODEL_SPECIAL_TOKENS = {
     'unk_token': '[UNK]',
@@ -193,3 +193,99 @@ class TestSentencePieceTokenizer:
 
         for i in range(len(result)):
             assert result[i] == tokens[i]
+
+
+def reference_legacy_text_to_ids(tokenizer, text):
+    ids = []
+    cur_idx = 0
+    while 1:
+        st_indices = {}
+        for token in tokenizer.special_token_to_id:
+            try:
+                st_indices[token] = text[cur_idx:].index(token)
+            except ValueError:
+                continue
+        if len(st_indices) == 0:
+            break
+        next_special_token = min(st_indices, key=st_indices.get)
+        next_start_idx = cur_idx + st_indices[next_special_token]
+        text_tokens = tokenizer.tokenizer.encode(text[cur_idx:next_start_idx])
+        if (
+            tokenizer.trim_spm_separator_after_special_token
+            and len(ids) > 0
+            and ids[-1] in tokenizer.id_to_special_token
+            and len(text_tokens) > 0
+            and text_tokens[0] == tokenizer.spm_separator_id
+        ):
+            text_tokens.pop(0)
+        ids.extend(text_tokens)
+        ids.append(tokenizer.special_token_to_id[next_special_token])
+        cur_idx = next_start_idx + len(next_special_token)
+    ids.extend(tokenizer.tokenizer.encode_as_ids(text[cur_idx:]))
+    return ids
+
+
+@pytest.fixture(scope="module")
+def legacy_spt_model(tmp_path_factory):
+    tmpdir = tmp_path_factory.mktemp("spt")
+    (tmpdir / "text.txt").write_text("the quick brown fox jumps over the lazy dog\nwho are you a fox\n" * 10)
+    create_spt_model(
+        str(tmpdir / "text.txt"), vocab_size=40, sample_size=-1, do_lower_case=False, output_dir=str(tmpdir)
+    )
+    return str(tmpdir / "tokenizer.model")
+
+
+class TestSentencePieceTokenizerLegacySpecialTokens:
+    texts = [
+        "",
+        "the quick brown fox",
+        "[INST] who are you [/INST] a fox [SEP]",
+        "[INST][INST]  jumps[SEP][SEP] over [/INST]",
+        "[INST]x[INST] [MASK]the lazy dog[SEP] [/INST]",
+        "no special tokens but [ brackets ]",
+    ]
+
+    @pytest.fixture()
+    def tokenizer(self, legacy_spt_model):
+        tokenizer = SentencePieceTokenizer(legacy_spt_model, legacy=True)
+        # "[INST]x" is added after its prefix "[INST]", which must take precedence at the same position
+        tokenizer.add_special_tokens(["[INST]", "[/INST]", "[SEP]", "[INST]x", "[MASK]"])
+        return tokenizer
+
+    @pytest.mark.unit
+    def test_text_to_ids_matches_reference(self, tokenizer):
+        for text in self.texts:
+            assert tokenizer.text_to_ids(text) == reference_legacy_text_to_ids(tokenizer, text)
+
+    @pytest.mark.unit
+    def test_text_to_tokens(self, tokenizer):
+        for text in self.texts:
+            assert tokenizer.tokens_to_ids(tokenizer.text_to_tokens(text)) == tokenizer.text_to_ids(text)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("trim", [False, True])
+    def test_trim_spm_separator_after_special_token(self, tokenizer, trim):
+        tokenizer.trim_spm_separator_after_special_token = trim
+        for text in self.texts:
+            assert tokenizer.text_to_ids(text) == reference_legacy_text_to_ids(tokenizer, text)
+
+    @pytest.mark.unit
+    def test_batch_text_to_ids(self, tokenizer):
+        assert tokenizer.batch_text_to_ids(self.texts) == [tokenizer.text_to_ids(text) for text in self.texts]
+        assert tokenizer.batch_text_to_ids([]) == []
+
+    @pytest.mark.unit
+    def test_add_special_tokens_updates_split(self, tokenizer):
+        text = "the [NEW] fox"
+        assert "[NEW]" not in tokenizer.ids_to_tokens(tokenizer.text_to_ids(text))
+        tokenizer.add_special_tokens(["[NEW]"])
+        assert tokenizer.text_to_ids(text) == reference_legacy_text_to_ids(tokenizer, text)
+        assert tokenizer.special_token_to_id["[NEW]"] in tokenizer.text_to_ids(text)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("legacy", [False, True])
+    def test_batch_ids_to_text(self, legacy_spt_model, legacy):
+        tokenizer = SentencePieceTokenizer(legacy_spt_model, legacy=legacy)
+        batch_ids = tokenizer.batch_text_to_ids(self.texts)
+        assert tokenizer.batch_ids_to_text(batch_ids) == [tokenizer.ids_to_text(ids) for ids in batch_ids]
+        assert tokenizer.batch_ids_to_text([]) == []
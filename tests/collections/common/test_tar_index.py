@@ -0,0 +1,275 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import json
+import os
+import pickle
+import tarfile
+from io import BytesIO
+
+import numpy as np
+import pytest
+import soundfile
+
+from nemo.collections.common.data.lhotse.nemo_adapters import LazyNeMoTarredIterator
+from nemo.collections.common.data.tar_index import (
+    IndexedTarFile,
+    build_tar_index,
+    get_tar_index_path,
+    load_tar_index,
+    read_tar_index,
+    tar_index_from_members,
+    write_tar_index,
+)
+
+
+def _write_tar(tar_path, members):
+    with tarfile.open(tar_path, mode="w") as tar:
+        for name, data in members.items():
+            info = tarfile.TarInfo(name)
+            info.size = len(data)
+            tar.addfile(info, BytesIO(data))
+    return build_tar_index(tar_path)
+
+
+@pytest.fixture()
+def tar_members():
+    rng = np.random.default_rng(0)
+    return {f"file_{i}.bin": rng.bytes(int(rng.integers(0, 3000))) for i in range(10)}
+
+
+@pytest.mark.unit
+def test_tar_index_roundtrip(tmp_path, tar_members):
+    tar_path = str(tmp_path / "audio_0.tar")
+    index = _write_tar(tar_path, tar_members)
+    assert list(index) == list(tar_members)
+    with tarfile.open(tar_path, mode="r:") as tar:
+        assert tar_index_from_members(tar.getmembers()) == index
+        for member in tar.getmembers():
+            assert tar.extractfile(member).read() == tar_members[member.name]
+
+    write_tar_index(index, get_tar_index_path(tar_path))
+    assert read_tar_index(get_tar_index_path(tar_path)) == index
+    assert load_tar_index(tar_path) == index
+
+
+@pytest.mark.unit
+def test_load_tar_index_missing_or_stale(tmp_path, tar_members):
+    tar_path = str(tmp_path / "audio_0.tar")
+    index = _write_tar(tar_path, tar_members)
+    assert load_tar_index(tar_path) is None
+    assert load_tar_index(f"pipe:cat {tar_path}") is None
+
+    write_tar_index(index, get_tar_index_path(tar_path))
+    mtime = os.path.getmtime(get_tar_index_path(tar_path))
+    os.utime(tar_path, (mtime + 10, mtime + 10))
+    assert load_tar_index(tar_path) is None
+
+
+@pytest.mark.unit
+def test_indexed_tar_file_random_access(tmp_path, tar_members):
+    tar_path = str(tmp_path / "audio_0.tar")
+    _write_tar(tar_path, tar_members)
+
+    with IndexedTarFile(tar_path) as tar:
+        assert len(tar) == len(tar_members)
+        assert list(tar) == list(tar_members)
+        for name in reversed(list(tar_members)):
+            assert tar[name] == tar_members[name]
+        with pytest.raises(KeyError):
+            tar.read("missing.bin")
+
+        restored = pickle.loads(pickle.dumps(tar))
+        assert restored["file_3.bin"] == tar_members["file_3.bin"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("slice_length", [None, 3])
+def test_nemo_tarred_iterator_indexed_matches_sequential(tmp_path, slice_length):
+    manifest = []
+    for shard_id in range(2):
+        audios = {}
+        for i in range(5):
+            name = f"utt_{shard_id}_{i}.wav"
+            buf = BytesIO()
+            soundfile.write(buf, np.zeros(1600, dtype=np.float32), 16000, format="WAV")
+            audios[name] = buf.getvalue()
+            entry = {"audio_filepath": name, "duration": 0.1, "text": name, "shard_id": shard_id}
+            if i == 1:
+                entry["_skipme"] = True
+            if i != 3:  # filtered out of the manifest
+                manifest.append(entry)
+        _write_tar(str(tmp_path / f"audio_{shard_id}.tar"), audios)
+    with open(tmp_path / "manifest.json", "w") as f:
+        for entry in manifest:
+            f.write(json.dumps(entry) + "\n")
+
+    def cut_ids():
+        iterator = LazyNeMoTarredIterator(
+            manifest_path=str(tmp_path / "manifest.json"),
+            tar_paths=str(tmp_path / "audio__OP_0..1_CL_.tar"),
+            shard_seed=0,
+            skip_missing_manifest_entries=True,
+            slice_length=slice_length,
+        )
+        return [cut.id for cut in iterator]
+
+    sequential = cut_ids()
+    for shard_id in range(2):
+        tar_path = str(tmp_path / f"audio_{shard_id}.tar")
+        write_tar_index(build_tar_index(tar_path), get_tar_index_path(tar_path))
+    indexed = cut_ids()
+
+    assert indexed == sequential
+    assert len(indexed) == (6 if slice_length is None else 4)
+    assert not any(cut_id.endswith(("_1.wav", "_3.wav")) for cut_id in indexed)
+
+
+@pytest.mark.unit
+def test_nemo_tarred_iterator_indexed_reads_only_kept_members(tmp_path, monkeypatch):
+    buf = BytesIO()
+    soundfile.write(buf, np.zeros(1600, dtype=np.float32), 16000, format="WAV")
+    audios = {f"utt_{i}.wav": buf.getvalue() for i in range(4)}
+    tar_path = str(tmp_path / "audio_0.tar")
+    write_tar_index(_write_tar(tar_path, audios), get_tar_index_path(tar_path))
+    with open(tmp_path / "manifest.json", "w") as f:
+        for i in range(4):
+            entry = {"audio_filepath": f"utt_{i}.wav", "duration": 0.1, "text": "a", "shard_id": 0}
+            if i % 2:
+                entry["_skipme"] = True
+            f.write(json.dumps(entry) + "\n")
+
+    iterator = LazyNeMoTarredIterator(manifest_path=str(tmp_path / "manifest.json"), tar_paths=tar_path)
+    read_names = []
+    original_read = IndexedTarFile.read
+
+    def tracking_read(self, name):
+        read_names.append(name)
+        return original_read(self, name)
+
+    monkeypatch.setattr(IndexedTarFile, "read", tracking_read)
+    cuts = list(iterator)
+
+    assert len(cuts) == 2
+    assert read_names == ["utt_0.wav", "utt_2.wav"]
+
+
+@pytest.fixture()
+def nemo_tarred_dataset(tmp_path):
+    """Two shards of 6 recordings, the third recording of every shard is split into two manifest entries."""
+    buf = BytesIO()
+    soundfile.write(buf, np.zeros(1600, dtype=np.float32), 16000, format="WAV")
+    with open(tmp_path / "manifest.json", "w") as f:
+        for shard_id in range(2):
+            audios = {}
+            for i in range(6):
+                name = f"utt_{shard_id}_{i}.wav"
+                audios[name] = buf.getvalue()
+                segments = [(0.0, 0.05), (0.05, 0.05)] if i == 2 else [(0.0, 0.1)]
+                for offset, duration in segments:
+                    entry = {
+                        "audio_filepath": name,
+                        "offset": offset,
+                        "duration": duration,
+                        "text": f"{name}_{offset}",
+                        "shard_id": shard_id,
+                    }
+                    f.write(json.dumps(entry) + "\n")
+            _write_tar(str(tmp_path / f"audio_{shard_id}.tar"), audios)
+    return str(tmp_path / "manifest.json"), str(tmp_path / "audio__OP_0..1_CL_.tar")
+
+
+def _write_tar_indices(tmp_path, num_shards=2):
+    for shard_id in range(num_shards):
+        tar_path = str(tmp_path / f"audio_{shard_id}.tar")
+        write_tar_index(build_tar_index(tar_path), get_tar_index_path(tar_path))
+
+
+@pytest.mark.unit
+def test_nemo_tarred_iterator_shuffle_within_shard(tmp_path, nemo_tarred_dataset):
+    manifest_path, tar_paths = nemo_tarred_dataset
+    _write_tar_indices(tmp_path)
+
+    def texts(shuffle_within_shard):
+        iterator = LazyNeMoTarredIterator(
+            manifest_path=manifest_path, tar_paths=tar_paths, shard_seed=0, shuffle_within_shard=shuffle_within_shard
+        )
+        return [cut.supervisions[0].text for cut in iterator]
+
+    ordered, shuffled = texts(False), texts(True)
+    assert shuffled != ordered
+    assert sorted(shuffled) == sorted(ordered)
+    assert texts(True) == shuffled
+    # the members are shuffled within their shard only
+    assert all(text.startswith("utt_0_") for text in shuffled[:7])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "indexed,shuffle_within_shard,slice_length",
+    [(False, False, None), (True, False, None), (True, True, None), (False, False, 4), (True, True, 4)],
+)
+def test_nemo_tarred_iterator_resume(tmp_path, nemo_tarred_dataset, indexed, shuffle_within_shard, slice_length):
+    manifest_path, tar_paths = nemo_tarred_dataset
+    if indexed:
+        _write_tar_indices(tmp_path)
+
+    def make_iterator():
+        return LazyNeMoTarredIterator(
+            manifest_path=manifest_path,
+            tar_paths=tar_paths,
+            shuffle_shards=True,
+            shard_seed=0,
+            shuffle_within_shard=shuffle_within_shard,
+            slice_length=slice_length,
+        )
+
+    expected = [cut.supervisions[0].text for cut in make_iterator()]
+    assert len(expected) == 14 if slice_length is None else 8 <= len(expected) <= 10
+    for num_consumed in range(len(expected) + 1):
+        iterator = make_iterator()
+        cuts = iter(iterator)
+        consumed = [next(cuts).supervisions[0].text for _ in range(num_consumed)]
+        # the state survives serialization, e.g. in a checkpoint
+        state = json.loads(json.dumps(iterator.state_dict()))
+
+        resumed = make_iterator()
+        resumed.load_state_dict(state)
+        assert consumed + [cut.supervisions[0].text for cut in resumed] == expected, num_consumed
+        assert resumed.epoch == 1
+
+
+@pytest.mark.unit
+def test_nemo_tarred_iterator_resume_skips_reading_indexed_members(tmp_path, nemo_tarred_dataset, monkeypatch):
+    manifest_path, tar_paths = nemo_tarred_dataset
+    _write_tar_indices(tmp_path)
+    iterator = LazyNeMoTarredIterator(manifest_path=manifest_path, tar_paths=tar_paths, shard_seed=0)
+    cuts = iter(iterator)
+    for _ in range(9):  # the whole first shard and the first two recordings of the second one
+        next(cuts)
+    state = iterator.state_dict()
+    assert (state["shard_position"], state["member_position"], state["cut_position"]) == (1, 1, 1)
+
+    read_names = []
+    original_read = IndexedTarFile.read
+
+    def tracking_read(self, name):
+        read_names.append(name)
+        return original_read(self, name)
+
+    monkeypatch.setattr(IndexedTarFile, "read", tracking_read)
+    resumed = LazyNeMoTarredIterator(manifest_path=manifest_path, tar_paths=tar_paths, shard_seed=0)
+    resumed.load_state_dict(state)
+    assert len(list(resumed)) == 5
+    assert read_names == [f"utt_1_{i}.wav" for i in range(1, 6)]
@@ -19,9 +19,14 @@ import pytest
 
 from nemo.collections.llm.gpt.data.packed_sequence import (
     PackedSequenceSpecs,
+    TokenizedShards,
+    fill_packing_strategy_from_shards,
     prepare_packed_sequence_data,
+    save_packed_sequences,
     tokenize_dataset,
+    tokenize_dataset_to_shards,
 )
+from nemo.utils.sequence_packing_utils import create_hist, create_packing_strategy, fill_packing_strategy
 
 
 class MockTokenizer:
@@ -80,6 +85,103 @@ def test_prepare_packed_sequence_data(mock_tokenizer, sample_data_file):
         assert metadata_path.exists()
 
 
+@pytest.fixture
+def larger_data_file():
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.jsonl', delete=False) as f:
+        for i in range(25):
+            f.write(f'{{"input": "{"ab" * (i % 7 + 1)}", "output": "{"c" * (i % 3)}"}}\n')
+    yield Path(f.name)
+    Path(f.name).unlink()
+
+
+@pytest.mark.parametrize("num_workers", [1, 2])
+def test_tokenize_dataset_to_shards(mock_tokenizer, larger_data_file, num_workers):
+    dataset = tokenize_dataset(
+        path=larger_data_file, tokenizer=mock_tokenizer, max_seq_length=32, seed=42, dataset_kwargs=None
+    )
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shards = tokenize_dataset_to_shards(
+            path=larger_data_file,
+            tokenizer=mock_tokenizer,
+            max_seq_length=32,
+            seed=42,
+            dataset_kwargs=None,
+            output_dir=tmpdir,
+            num_workers=num_workers,
+            samples_per_shard=4,
+        )
+
+        assert len(shards) == len(dataset)
+        assert len(list(Path(tmpdir).glob("*.lengths.npy"))) == 7
+        for i, item in enumerate(dataset):
+            assert shards[i]["input_ids"] == list(item["input_ids"])
+            assert shards[i]["loss_mask"] == [bool(x) for x in list(item["loss_mask"][1:]) + [False]]
+        assert shards.histogram(32) == create_hist(dataset, 32)[1]
+        assert len(TokenizedShards(tmpdir)) == len(dataset)
+        with pytest.raises(ValueError):
+            shards.histogram(4)
+
+
+def test_fill_packing_strategy_from_shards(mock_tokenizer, larger_data_file):
+    dataset = tokenize_dataset(
+        path=larger_data_file, tokenizer=mock_tokenizer, max_seq_length=32, seed=42, dataset_kwargs=None
+    )
+    sequences, histogram = create_hist(dataset, 32)
+    assignments, _ = create_packing_strategy(histogram, 64, "first_fit_decreasing")
+    np.random.seed(0)
+    expected = fill_packing_strategy(assignments, sequences, 64, mock_tokenizer.eos_id)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        shards = tokenize_dataset_to_shards(
+            larger_data_file, mock_tokenizer, 32, 42, None, tmpdir, num_workers=1, samples_per_shard=10
+        )
+        np.random.seed(0)
+        output = fill_packing_strategy_from_shards(assignments, shards)
+
+    assert len(output) == len(expected)
+    for packed, packed_expected in zip(output, expected):
+        assert packed["input_ids"] == packed_expected["input_ids"]
+        assert packed["loss_mask"] == [bool(x) for x in packed_expected["loss_mask"]]
+        assert packed["seq_start_id"] == packed_expected["seq_start_id"]
+
+
+def test_save_packed_sequences():
+    packed_sequences = [
+        {"input_ids": list(range(i + 1)), "loss_mask": [True] * (i + 1), "seq_start_id": [0]} for i in range(5)
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        expected_path, output_path = Path(tmpdir) / "expected.npy", Path(tmpdir) / "output"
+        np.save(expected_path, packed_sequences)
+        # the packed sequences are consumed lazily
+        save_packed_sequences(output_path, (dict(x) for x in packed_sequences), len(packed_sequences))
+
+        expected = np.load(expected_path, allow_pickle=True)
+        output = np.load(output_path.with_suffix(".npy"), allow_pickle=True)
+        assert output.shape == expected.shape and output.dtype == expected.dtype
+        assert list(output) == list(expected)
+
+
+def test_prepare_packed_sequence_data_with_tokenizer_workers(mock_tokenizer, larger_data_file):
+    with tempfile.TemporaryDirectory() as tmpdir:
+        output_path = Path(tmpdir) / "packed_sequences.npy"
+        prepare_packed_sequence_data(
+            input_path=larger_data_file,
+            output_path=output_path,
+            output_metadata_path=None,
+            packed_sequence_size=64,
+            tokenizer=mock_tokenizer,
+            max_seq_length=32,
+            seed=42,
+            packing_algorithm="first_fit_shuffle",
+            tokenizer_workers=2,
+        )
+
+        packed = np.load(output_path, allow_pickle=True)
+        assert sum(len(x["seq_start_id"]) for x in packed) == 25
+        # the temporary shards are removed
+        assert [p.name for p in Path(tmpdir).iterdir()] == ["packed_sequences.npy"]
+
+
 def test_packed_sequence_specs():
     # Test initialization with default values
     specs = PackedSequenceSpecs()
@@ -89,6 +191,7 @@ def test_packed_sequence_specs():
     assert specs.packed_val_data_path is None
     assert specs.packed_metadata_path is None
     assert specs.pad_cu_seqlens is False
+    assert specs.tokenizer_workers == 0
 
     # Test with valid packed data paths
     with (
@@ -23,6 +23,7 @@ from nemo.collections.llm.gpt.data.utils import (
     _add_speaker_and_signal,
     _build_memmap_index_files,
     _get_header_conversation_type_mask_role,
+    _index_fn,
     _JSONLMemMapDataset,
     _mask_targets,
     _OnlineSampleMapping,
@@ -239,6 +240,49 @@ def test_build_memmap_index_files(tmp_path):
     assert result == False
 
 
+@pytest.mark.parametrize(
+    "content",
+    [b"a\nbb\nccc\n", b"a\nbb\nccc", b"a\n\nbb\n\n\n", b"\n\n\n", b"abc"],
+)
+@pytest.mark.parametrize("workers", [1, 2])
+def test_build_index_from_memdata_chunked(tmp_path, content, workers):
+    file_path = tmp_path / "test.txt"
+    file_path.write_bytes(content)
+
+    midx = build_index_from_memdata(str(file_path), 10)
+    chunked_midx = build_index_from_memdata(str(file_path), 10, workers=workers, chunk_size=2)
+
+    data = np.frombuffer(content, dtype=np.uint8)
+    expected = np.flatnonzero(data == 10).tolist()
+    if len(expected) == 0 or expected[-1] + 1 != len(data):
+        expected.append(len(data) + 1)
+    while len(expected) > 1 and expected[-1] - expected[-2] < 2:
+        expected.pop(-1)
+    assert midx.tolist() == expected
+    assert chunked_midx.tolist() == expected
+
+
+def test_build_memmap_index_files_appended(tmp_path):
+    file_path = tmp_path / "test.txt"
+    file_path.write_bytes(b"line1\nline2\n\n")
+    assert _build_memmap_index_files(
+        newline_int=10, build_index_fn=build_index_from_memdata, fn=str(file_path), index_mapping_dir=str(tmp_path)
+    )
+
+    with open(file_path, "ab") as f:
+        f.write(b"line3\nline4")
+    # the existing index is extended with the appended lines
+    assert _build_memmap_index_files(
+        newline_int=10, build_index_fn=build_index_from_memdata, fn=str(file_path), index_mapping_dir=str(tmp_path)
+    )
+    idx_fn = _index_fn(str(file_path), str(tmp_path))
+    midx = np.load(idx_fn + ".npy")
+    assert midx.tolist() == build_index_from_memdata(str(file_path), 10).tolist()
+    assert not _build_memmap_index_files(
+        newline_int=10, build_index_fn=build_index_from_memdata, fn=str(file_path), index_mapping_dir=str(tmp_path)
+    )
+
+
 @pytest.mark.parametrize(
     "dataset_size,num_samples,block_size,shuffle",
     [
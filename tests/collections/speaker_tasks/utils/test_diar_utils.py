@@ -16,20 +16,27 @@ import os
 import numpy as np
 import pytest
 import torch
+from omegaconf import OmegaConf
 from scipy.optimize import linear_sum_assignment as scipy_linear_sum_assignment
 
 from nemo.collections.asr.data.audio_to_label import repeat_signal
 from nemo.collections.asr.parts.utils.longform_clustering import LongFormSpeakerClustering
 from nemo.collections.asr.parts.utils.offline_clustering import (
+    NMESC,
     SpeakerClustering,
+    cos_similarity,
     get_scale_interpolated_embs,
+    getAffinityGraphMat,
     getCosAffinityMatrix,
     getKneighborsConnections,
+    getLaplacian,
+    partialEigh,
     split_input_data,
 )
 from nemo.collections.asr.parts.utils.online_clustering import (
     OnlineSpeakerClustering,
     get_closest_embeddings,
+    get_incremental_cos_similarity,
     get_merge_quantity,
     get_minimal_indices,
     merge_vectors,
@@ -54,6 +61,7 @@ from nemo.collections.asr.parts.utils.speaker_utils import (
     is_overlap,
     merge_float_intervals,
     merge_int_intervals,
+    perform_clustering,
     tensor_to_list,
 )
 
@@ -724,6 +732,54 @@ class TestClusteringUtilFunctions:
         output = longform_speaker_clustering.unpack_labels(Y_aggr, window_range_list, absolute_merge_mapping, org_len)
         assert torch.equal(output, expected_result)
 
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_spks", [1, 3, 5])
+    def test_nmesc_batched_eig_ratio(self, n_spks):
+        em, _, mc, _, _, _ = generate_toy_data(n_spks=n_spks, spk_dur=6, perturb_sigma=0.1)
+        mat = getCosAffinityMatrix(em[-int(mc[-1]) :])
+        nmesc = NMESC(mat, max_num_speakers=8, sparse_search_volume=10, cuda=False)
+        p_value_list = nmesc.getPvalueList()
+        expected = torch.stack([nmesc.getEigRatio(int(p_value)) for p_value in p_value_list])
+        # A small batch budget splits the p-values into several batches
+        for max_batch_numel in [2**25, mat.numel() * 3]:
+            output = nmesc.getEigRatioBatch(p_value_list, max_batch_numel)
+            assert torch.allclose(output[:, 0], expected[:, 0], rtol=1e-3)
+            assert torch.equal(output[:, 1], expected[:, 1])
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", [0, 1])
+    def test_incremental_cos_similarity(self, seed):
+        torch.manual_seed(seed)
+        prev_embs = torch.randn(40, 16)
+        prev_cos_sim = cos_similarity(prev_embs, prev_embs)
+        # Shift out old vectors, shuffle and duplicate kept vectors, and append new vectors like a streaming step
+        embs = torch.vstack((prev_embs[torch.randperm(40)[:30]], prev_embs[-1:], torch.randn(10, 16)))
+        cos_sim, reused_row_indices = get_incremental_cos_similarity(prev_embs, prev_cos_sim, embs)
+        assert torch.allclose(cos_sim, cos_similarity(embs, embs), atol=1e-6)
+        assert (reused_row_indices >= 0).sum() == 31
+        assert torch.equal(prev_embs[reused_row_indices[:31]], embs[:31])
+        assert torch.all(reused_row_indices[31:] == -1)
+
+        cos_sim, reused_row_indices = get_incremental_cos_similarity(torch.empty(0), torch.empty(0), embs)
+        assert torch.allclose(cos_sim, cos_similarity(embs, embs), atol=1e-6)
+        assert torch.all(reused_row_indices == -1)
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_eigs", [2, 6])
+    def test_partial_eigh(self, num_eigs):
+        em, _, mc, _, _, _ = generate_toy_data(n_spks=4, spk_dur=30, perturb_sigma=0.1)
+        laplacian = getLaplacian(getAffinityGraphMat(getCosAffinityMatrix(em[-int(mc[-1]) :]), 10)).float()
+        lambdas, diffusion_map = torch.linalg.eigh(laplacian)
+        partial_lambdas, partial_diffusion_map = partialEigh(laplacian, num_eigs, largest=False)
+        assert torch.allclose(partial_lambdas, lambdas[:num_eigs], atol=1e-3)
+        # Eigenvectors of the (degenerate) zero eigenvalues are only unique up to a rotation: compare the subspaces
+        assert torch.allclose(
+            diffusion_map[:, :num_eigs] @ diffusion_map[:, :num_eigs].T,
+            partial_diffusion_map @ partial_diffusion_map.T,
+            atol=1e-2,
+        )
+        assert torch.allclose(partialEigh(laplacian, 1, largest=True)[0], lambdas[-1:], rtol=1e-3)
+
 
 class TestSpeakerClustering:
     """
@@ -924,6 +980,94 @@ class TestSpeakerClustering:
         assert Y_out.shape[0] == mc[-1]
         assert all(permuted_Y == gt)
 
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("n_spks", [2, 3])
+    @pytest.mark.parametrize("eig_warm_start_min_size", [30, 600])
+    @pytest.mark.parametrize("jit_script", [False, True])
+    def test_online_speaker_clustering_incremental_cpu(self, n_spks, eig_warm_start_min_size, jit_script):
+        step_per_frame, buffer_size = 2, 30
+        em, ts, mc, _, _, gt = generate_toy_data(n_spks, spk_dur=30 / n_spks, perturb_sigma=0.1, torch_seed=0)
+        emb_gen = split_input_data(em, ts, mc)[0][-1]
+        online_clus = OnlineSpeakerClustering(
+            max_num_speakers=8,
+            max_rp_threshold=0.15,
+            sparse_search_volume=30,
+            history_buffer_size=buffer_size,
+            current_buffer_size=buffer_size,
+            incremental=True,
+            eig_warm_start_min_size=eig_warm_start_min_size,
+        )
+        if jit_script:
+            online_clus = torch.jit.script(online_clus)
+
+        n_frames = int(emb_gen.shape[0] / step_per_frame)
+        for frame_index in range(n_frames):
+            curr_emb = emb_gen[0 : (frame_index + 1) * step_per_frame]
+            merged_clus_labels = online_clus.forward_infer(
+                curr_emb=curr_emb, base_segment_indexes=torch.arange(curr_emb.shape[0]), frame_index=frame_index
+            )
+            assert len(merged_clus_labels) == curr_emb.shape[0]
+
+        assert online_clus.is_online
+        merged_clus_labels = stitch_cluster_labels(Y_old=gt[: len(merged_clus_labels)], Y_new=merged_clus_labels)
+        assert (merged_clus_labels == gt[: len(merged_clus_labels)]).float().mean() > 0.9
+        assert online_clus.step_count == n_frames
+        # Most of the affinity matrix rows are carried over from the previous step
+        assert online_clus.reused_affinity_rows > 5 * online_clus.computed_affinity_rows
+        if jit_script:
+            assert online_clus.total_step_latency == 0.0
+        else:
+            stats = online_clus.get_latency_stats()
+            assert 0.0 < stats['mean_step_latency'] <= stats['max_step_latency']
+            assert stats['step_count'] == n_frames
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_workers, export_script_module", [(1, False), (2, False), (2, True)])
+    def test_perform_clustering_num_workers(self, tmp_path, monkeypatch, num_workers, export_script_module):
+        # the scripted clustering module is exported to the working directory
+        monkeypatch.chdir(tmp_path)
+        embs_and_timestamps, audio_rttm_map, ground_truths = {}, {}, {}
+        for seed, n_spks in enumerate([2, 3, 1]):
+            em, ts, mc, mw, _, gt = generate_toy_data(n_spks=n_spks, spk_dur=5, perturb_sigma=0.1, torch_seed=seed)
+            uniq_id = f"session_{seed}"
+            embs_and_timestamps[uniq_id] = {
+                'embeddings': em,
+                'timestamps': ts,
+                'multiscale_segment_counts': mc,
+                'multiscale_weights': mw,
+            }
+            audio_rttm_map[uniq_id] = {'audio_filepath': f"{uniq_id}.wav"}
+            ground_truths[uniq_id] = gt
+        clustering_params = OmegaConf.create(
+            {
+                'oracle_num_speakers': False,
+                'max_num_speakers': 8,
+                'max_rp_threshold': 0.15,
+                'sparse_search_volume': 10,
+                'num_workers': num_workers,
+                'export_script_module': export_script_module,
+            }
+        )
+        # Cluster labels are written next to the output rttm directory, as laid out by the diarizer
+        out_rttm_dir = tmp_path / "pred_rttms"
+        out_rttm_dir.mkdir()
+        (tmp_path / "speaker_outputs").mkdir()
+        all_reference, all_hypothesis = perform_clustering(
+            embs_and_timestamps,
+            audio_rttm_map,
+            str(out_rttm_dir),
+            clustering_params,
+            torch.device('cpu'),
+            verbose=False,
+        )
+        assert all_reference == []
+        assert [uniq_id for uniq_id, _ in all_hypothesis] == list(audio_rttm_map)
+        for uniq_id, hypothesis in all_hypothesis:
+            assert len(hypothesis.labels()) == len(set(ground_truths[uniq_id].tolist()))
+            assert os.path.exists(out_rttm_dir / f"{uniq_id}.rttm")
+
     @pytest.mark.run_only_on('GPU')
     @pytest.mark.unit
     @pytest.mark.parametrize("n_spks, SSV, enhanced_count_thres, min_samples_for_nmesc", [(2, 5, 40, 6)])
@@ -0,0 +1,79 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pickle
+
+import pytest
+
+from nemo.collections.tts.g2p.compiled_phoneme_dict import CompiledPhonemeDict
+
+
+class TestCompiledPhonemeDict:
+
+    PHONEME_DICT = {
+        "HELLO": [list("həˈɫoʊ")],
+        "LEAD": [list("ˈlɛd"), list("ˈlid")],
+        "lead": [["L", "IY1", "D"]],
+        "Grüße": [list("ˈɡʁyːsə")],
+        "A": [["ə"], ["ˈeɪ"]],
+        "AB": [[]],
+        "CAN'T": [list("ˈkænt")],
+    }
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_lookup(self, tmp_path):
+        compiled_dict = CompiledPhonemeDict.build(str(tmp_path / "dict.bin"), self.PHONEME_DICT)
+
+        assert len(compiled_dict) == len(self.PHONEME_DICT)
+        assert dict(compiled_dict) == self.PHONEME_DICT
+        for word in ["HELLO", "lead", "Grüße", "A", "AB", "ABC", "", "HELL", "HELLOS", "hello", "A\0", 1]:
+            assert (word in compiled_dict) == (word in self.PHONEME_DICT)
+            assert compiled_dict.get(word) == self.PHONEME_DICT.get(word)
+        with pytest.raises(KeyError):
+            compiled_dict["WORLD"]
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_empty_dict(self, tmp_path):
+        compiled_dict = CompiledPhonemeDict.build(str(tmp_path / "dict.bin"), {})
+
+        assert len(compiled_dict) == 0
+        assert "A" not in compiled_dict
+        assert list(compiled_dict) == []
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_pickle(self, tmp_path):
+        compiled_dict = CompiledPhonemeDict.build(str(tmp_path / "dict.bin"), self.PHONEME_DICT, {"version": 1})
+
+        state = pickle.dumps(compiled_dict)
+        assert len(state) < 200
+        assert pickle.loads(state) == compiled_dict
+        assert pickle.loads(state).metadata == {"version": 1}
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_load(self, tmp_path):
+        path = str(tmp_path / "dict.bin")
+        assert CompiledPhonemeDict.load(path) is None
+
+        CompiledPhonemeDict.build(path, self.PHONEME_DICT, {"source_hash": "abc", "use_stresses": True})
+        assert CompiledPhonemeDict.load(path, {"source_hash": "abc"}) == self.PHONEME_DICT
+        assert CompiledPhonemeDict.load(path, {"source_hash": "abc", "use_stresses": False}) is None
+        assert CompiledPhonemeDict.load(path, {"grapheme_case": "upper"}) is None
+
+        with open(path, "wb") as f:
+            f.write(b"HELLO  HH AH0 L OW1\n")
+        assert CompiledPhonemeDict.load(path) is None
@@ -13,10 +13,13 @@
 # limitations under the License.
 
 import os
+import shutil
 import unicodedata
 
 import pytest
 
+from nemo.collections.tts.g2p.compiled_phoneme_dict import CompiledPhonemeDict
+from nemo.collections.tts.g2p.models.en_us_arpabet import EnglishG2p
 from nemo.collections.tts.g2p.models.i18n_ipa import IpaG2p
 from nemo.collections.tts.g2p.utils import GRAPHEME_CASE_LOWER, GRAPHEME_CASE_MIXED, GRAPHEME_CASE_UPPER
 
@@ -38,6 +41,8 @@ class TestIpaG2p:
         phoneme_probability=None,
         grapheme_case=GRAPHEME_CASE_UPPER,
         grapheme_prefix="",
+        pronunciation_cache_size=10000,
+        compiled_phoneme_dict_path=None,
     ):
         return IpaG2p(
             phoneme_dict,
@@ -47,6 +52,8 @@ class TestIpaG2p:
             phoneme_probability=phoneme_probability,
             grapheme_case=grapheme_case,
             grapheme_prefix=grapheme_prefix,
+            pronunciation_cache_size=pronunciation_cache_size,
+            compiled_phoneme_dict_path=compiled_phoneme_dict_path,
         )
 
     @pytest.mark.run_only_on('CPU')
@@ -406,3 +413,166 @@ class TestIpaG2p:
 
         phonemes = g2p(input_text)
         assert phonemes == expected_output
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("grapheme_case", [GRAPHEME_CASE_UPPER, GRAPHEME_CASE_LOWER, GRAPHEME_CASE_MIXED])
+    def test_forward_call_with_pronunciation_cache(self, grapheme_case):
+        input_texts = ["Hello NVIDIA'S airport's hello-world Kitty!", "HELLO world, lead airports Jones's hello."]
+        g2p = self._create_g2p(locale="en-US", grapheme_case=grapheme_case, grapheme_prefix=self.GRAPHEME_PREFIX)
+        g2p_without_cache = self._create_g2p(
+            locale="en-US",
+            grapheme_case=grapheme_case,
+            grapheme_prefix=self.GRAPHEME_PREFIX,
+            pronunciation_cache_size=0,
+        )
+
+        for _ in range(2):
+            for input_text in input_texts:
+                assert g2p(input_text) == g2p_without_cache(input_text)
+        assert len(g2p._pronunciation_cache) > 0
+        assert len(g2p_without_cache._pronunciation_cache) == 0
+
+        g2p.replace_symbols(g2p.symbols - {"ʊ"})
+        g2p_without_cache.replace_symbols(g2p_without_cache.symbols - {"ʊ"})
+        assert len(g2p._pronunciation_cache) == 0
+        for input_text in input_texts:
+            assert g2p(input_text) == g2p_without_cache(input_text)
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_pronunciation_cache_size(self):
+        g2p = self._create_g2p(pronunciation_cache_size=2)
+
+        g2p("Hello world lead")
+        assert list(g2p._pronunciation_cache) == [" ", "LEAD"]
+        g2p("world")
+        assert list(g2p._pronunciation_cache) == ["LEAD", "WORLD"]
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_pronunciation_cache_disabled_with_phoneme_probability(self):
+        g2p = self._create_g2p(phoneme_probability=0.5)
+
+        outputs = {tuple(g2p("Hello world")) for _ in range(50)}
+        assert len(outputs) > 1
+        assert len(g2p._pronunciation_cache) == 0
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("num_workers", [1, 2])
+    def test_batch_call(self, num_workers):
+        input_texts = ["Hello world.", "Hello Kitty!", "lead NVIDIA", ""] * 5
+        g2p = self._create_g2p(apply_to_oov_word=None)
+
+        assert g2p.batch_call(input_texts, num_workers=num_workers, chunksize=3) == [g2p(t) for t in input_texts]
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    @pytest.mark.parametrize("grapheme_case", [GRAPHEME_CASE_UPPER, GRAPHEME_CASE_LOWER, GRAPHEME_CASE_MIXED])
+    def test_forward_call_with_compiled_phoneme_dict(self, grapheme_case, tmp_path):
+        input_text = "Hello NVIDIA'S airport's Jones's lead hello-world Kitty!"
+        compiled_path = str(tmp_path / "dict.bin")
+        g2p = self._create_g2p(locale="en-US", grapheme_case=grapheme_case, use_chars=True)
+        g2p_compiled = self._create_g2p(
+            locale="en-US", grapheme_case=grapheme_case, use_chars=True, compiled_phoneme_dict_path=compiled_path
+        )
+
+        assert isinstance(g2p_compiled.phoneme_dict, CompiledPhonemeDict)
+        assert g2p_compiled.phoneme_dict == g2p.phoneme_dict
+        assert g2p_compiled.symbols == g2p.symbols
+        assert g2p_compiled(input_text) == g2p(input_text)
+
+        g2p_replaced = self._create_g2p(
+            locale="en-US", grapheme_case=grapheme_case, use_chars=True, compiled_phoneme_dict_path=compiled_path
+        )
+        g2p_reference = self._create_g2p(locale="en-US", grapheme_case=grapheme_case, use_chars=True)
+        g2p_replaced.replace_symbols(g2p.symbols - {"ʊ"})
+        g2p_reference.replace_symbols(g2p.symbols - {"ʊ"})
+        assert not isinstance(g2p_replaced.phoneme_dict, CompiledPhonemeDict)
+        assert g2p_replaced.phoneme_dict == g2p_reference.phoneme_dict
+        assert g2p_replaced(input_text) == g2p_reference(input_text)
+
+        # the compiled dictionary is mapped again, and rebuilt when the normalization settings change
+        mtime = os.stat(compiled_path).st_mtime_ns
+        g2p_compiled = self._create_g2p(
+            locale="en-US", grapheme_case=grapheme_case, use_chars=True, compiled_phoneme_dict_path=compiled_path
+        )
+        assert os.stat(compiled_path).st_mtime_ns == mtime
+        assert g2p_compiled(input_text) == g2p(input_text)
+        g2p_compiled = self._create_g2p(
+            locale="en-US", grapheme_case=grapheme_case, use_chars=False, compiled_phoneme_dict_path=compiled_path
+        )
+        assert g2p_compiled.phoneme_dict.metadata["use_chars"] is False
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_compiled_phoneme_dict_rebuilt_on_source_change(self, tmp_path):
+        phoneme_dict_path = str(tmp_path / "dict.txt")
+        compiled_path = str(tmp_path / "dict.bin")
+        shutil.copy(self.PHONEME_DICT_PATH_EN, phoneme_dict_path)
+        g2p = self._create_g2p(phoneme_dict=phoneme_dict_path, compiled_phoneme_dict_path=compiled_path)
+        assert "KITTY" not in g2p.phoneme_dict
+
+        with open(phoneme_dict_path, "a", encoding="utf-8") as f:
+            f.write("KITTY  ˈkɪti\n")
+        g2p = self._create_g2p(phoneme_dict=phoneme_dict_path, compiled_phoneme_dict_path=compiled_path)
+        assert g2p("Kitty") == list("ˈkɪti")
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_compiled_phoneme_dict_requires_path(self, tmp_path):
+        with pytest.raises(ValueError):
+            self._create_g2p(phoneme_dict={"HELLO": ["həˈɫoʊ"]}, compiled_phoneme_dict_path=str(tmp_path / "dict.bin"))
+
+
+class TestEnglishG2p:
+
+    PHONEME_DICT = {
+        "hello": [["HH", "AH0", "L", "OW1"]],
+        "world": [["W", "ER1", "L", "D"]],
+        "lead": [["L", "EH1", "D"], ["L", "IY1", "D"]],
+        "airport": [["EH1", "R", "P", "AO2", "R", "T"]],
+    }
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_forward_call_with_pronunciation_cache(self):
+        input_text = "Hello worlds, airport's hello-kitty lead hello!"
+        g2p = EnglishG2p(phoneme_dict=self.PHONEME_DICT)
+        g2p_without_cache = EnglishG2p(phoneme_dict=self.PHONEME_DICT, pronunciation_cache_size=0)
+
+        expected_output = g2p_without_cache(input_text)
+        assert expected_output[:4] == ["HH", "AH0", "L", "OW1"]
+        assert g2p(input_text) == expected_output
+        assert g2p(input_text) == expected_output
+        assert g2p._pronunciation_cache["worlds"] == ("W", "ER1", "L", "D", "Z")
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_batch_call(self):
+        input_texts = ["Hello world.", "lead airports", "hello-kitty"] * 3
+        g2p = EnglishG2p(phoneme_dict=self.PHONEME_DICT)
+
+        assert g2p.batch_call(input_texts, num_workers=2) == [g2p(t) for t in input_texts]
+
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.unit
+    def test_forward_call_with_compiled_phoneme_dict(self, tmp_path):
+        input_text = "Hello worlds, airport's hello-kitty lead hello!"
+        phoneme_dict_path = str(tmp_path / "cmudict.txt")
+        with open(phoneme_dict_path, "w", encoding="latin-1") as f:
+            f.write(";;; comment\n")
+            for word, prons in self.PHONEME_DICT.items():
+                for i, pron in enumerate(prons):
+                    word_variant = word.upper() if i == 0 else f"{word.upper()}({i})"
+                    f.write(f"{word_variant}  {' '.join(pron)}\n")
+
+        g2p = EnglishG2p(phoneme_dict=phoneme_dict_path)
+        g2p_compiled = EnglishG2p(
+            phoneme_dict=phoneme_dict_path, compiled_phoneme_dict_path=str(tmp_path / "cmudict.bin")
+        )
+
+        assert isinstance(g2p_compiled.phoneme_dict, CompiledPhonemeDict)
+        assert g2p.phoneme_dict == g2p_compiled.phoneme_dict == self.PHONEME_DICT
+        assert g2p_compiled(input_text) == g2p(input_text)
@@ -16,13 +16,19 @@ import json
 import os
 from pathlib import Path
 
+import numpy as np
 import pytest
+import soundfile as sf
 import torch
 
-from nemo.collections.common.tokenizers.text_to_speech.tts_tokenizers import EnglishPhonemesTokenizer
+from nemo.collections.common.tokenizers.text_to_speech.tts_tokenizers import (
+    EnglishCharsTokenizer,
+    EnglishPhonemesTokenizer,
+)
 from nemo.collections.tts.data.dataset import TTSDataset
 from nemo.collections.tts.g2p.models.en_us_arpabet import EnglishG2p
 from nemo.collections.tts.parts.utils.tts_dataset_utils import get_base_dir
+from nemo.collections.tts.torch.tts_data_types import AlignPriorMatrix
 
 
 class TestTTSDataset:
@@ -181,3 +187,88 @@ class TestTTSDataset:
                 z = torch.load(f"{sup_path}/{sup_data_types[2]}/{rel_audio_path_as_text_id}.pt")
                 assert not torch.equal(x, y)
                 assert not torch.equal(x, z)
+
+
+@pytest.fixture(scope="module")
+def synthetic_manifest_path(tmp_path_factory):
+    data_dir = tmp_path_factory.mktemp("synthetic_tts")
+    with open(data_dir / "manifest.json", "w", encoding="utf-8") as f:
+        for i in range(3):
+            audio_filepath = data_dir / "wavs" / f"speaker_{i % 2}" / f"audio_{i}.wav"
+            audio_filepath.parent.mkdir(parents=True, exist_ok=True)
+            time = np.arange(int(22050 * (0.3 + 0.1 * i))) / 22050
+            sf.write(audio_filepath, 0.5 * np.sin(2 * np.pi * (150 + 50 * i) * time), 22050)
+            f.write(json.dumps({"audio_filepath": str(audio_filepath), "text": f"hello world {i}"}) + "\n")
+    return str(data_dir / "manifest.json")
+
+
+class TestTTSDatasetSupDataStore:
+    SUP_DATA_TYPES = ["log_mel", "align_prior_matrix", "pitch", "voiced_mask", "energy"]
+
+    @staticmethod
+    def get_dataset(manifest_path, **kwargs):
+        return TTSDataset(
+            manifest_filepath=manifest_path,
+            sample_rate=22050,
+            sup_data_types=TestTTSDatasetSupDataStore.SUP_DATA_TYPES,
+            text_tokenizer=EnglishCharsTokenizer(),
+            **kwargs,
+        )
+
+    @staticmethod
+    def assert_items_equal(dataset, other_dataset):
+        for index in range(len(dataset)):
+            for data, other_data in zip(dataset[index], other_dataset[index]):
+                if isinstance(data, torch.Tensor):
+                    assert torch.equal(data, other_data)
+                else:
+                    assert data is None and other_data is None
+
+    @pytest.mark.unit
+    @pytest.mark.run_only_on('CPU')
+    def test_store_matches_pt_files(self, synthetic_manifest_path, tmp_path):
+        dataset = self.get_dataset(synthetic_manifest_path, sup_data_path=tmp_path / "sup_data")
+        store_dataset = self.get_dataset(synthetic_manifest_path, sup_data_store_dir=tmp_path / "store")
+
+        # computed and saved on the first pass, loaded on the second one
+        self.assert_items_equal(dataset, store_dataset)
+        self.assert_items_equal(dataset, store_dataset)
+        assert set(store_dataset.sup_data_stores) == set(store_dataset.sup_data_types) - {AlignPriorMatrix}
+        for store in store_dataset.sup_data_stores.values():
+            assert len(store) == len(dataset)
+            assert store.stats == {"hits": len(dataset), "misses": len(dataset)}
+        assert not list((tmp_path / "store").rglob("*.pt"))
+
+    @pytest.mark.unit
+    @pytest.mark.run_only_on('CPU')
+    def test_store_copies_pt_files(self, synthetic_manifest_path, tmp_path):
+        dataset = self.get_dataset(synthetic_manifest_path, sup_data_path=tmp_path / "sup_data")
+        for index in range(len(dataset)):
+            dataset[index]
+
+        store_dataset = self.get_dataset(
+            synthetic_manifest_path, sup_data_path=tmp_path / "sup_data", sup_data_store_dir=tmp_path / "store"
+        )
+        self.assert_items_equal(dataset, store_dataset)
+        for store in store_dataset.sup_data_stores.values():
+            assert len(store) == len(dataset)
+
+        # the copies are found by a new dataset
+        store_dataset = self.get_dataset(synthetic_manifest_path, sup_data_store_dir=tmp_path / "store")
+        self.assert_items_equal(dataset, store_dataset)
+        for store in store_dataset.sup_data_stores.values():
+            assert store.stats["misses"] == 0
+
+    @pytest.mark.unit
+    @pytest.mark.run_only_on('CPU')
+    @pytest.mark.parametrize("n_fft, hop_length", [(1024, 256), (1023, None), (512, 300)])
+    def test_get_num_frames(self, synthetic_manifest_path, n_fft, hop_length):
+        dataset = TTSDataset(
+            manifest_filepath=synthetic_manifest_path,
+            sample_rate=22050,
+            text_tokenizer=EnglishCharsTokenizer(),
+            n_fft=n_fft,
+            hop_length=hop_length,
+        )
+        for audio_length in [n_fft, 6615, 6616, 22050]:
+            assert dataset.get_num_frames(audio_length) == dataset.get_log_mel(torch.randn(audio_length)).shape[2]
@@ -15,8 +15,10 @@ import filecmp
 import json
 import os
 import shutil
+import tarfile
 import tempfile
 from typing import Any, Callable, Dict, Optional, Set, Union
+from unittest.mock import patch
 
 import pytest
 import torch
@@ -1332,6 +1334,158 @@ class TestSaveRestore:
         for orig, restored in zip(original_state_dict.keys(), restored_state_dict.keys()):
             assert (original_state_dict[orig] - restored_state_dict[restored]).abs().mean() < 1e-6
 
+    @pytest.mark.unit
+    def test_restore_from_save_restore_connector_mmap_restore(self):
+        with tempfile.NamedTemporaryFile('w') as empty_file, tempfile.TemporaryDirectory() as tmpdir:
+            empty_file.writelines(["*****\n"])
+            empty_file.flush()
+
+            cfg = _mock_model_config()
+            cfg.model.temp_file = empty_file.name
+            model = MockModel(cfg=cfg.model, trainer=None).to('cpu')
+            save_path = os.path.join(tmpdir, 'mmap.nemo')
+            model.save_to(save_path)
+
+            tar_index = save_restore_connector.SaveRestoreConnector._tar_member_index(save_path)
+            assert 'model_weights.ckpt' in tar_index
+            assert 'model_config.yaml' in tar_index
+
+            connector = save_restore_connector.SaveRestoreConnector()
+            connector.mmap_restore = True
+            restored_model = MockModel.restore_from(save_path, map_location='cpu', save_restore_connector=connector)
+
+        # the artifact is still extracted and the weights are read from the archive
+        assert restored_model.temp_data == ["*****\n"]
+        assert torch.equal(model.w.weight, restored_model.w.weight)
+        assert torch.equal(model.w.bias, restored_model.w.bias)
+
+    @pytest.mark.unit
+    def test_load_state_dict_from_tar_map_location(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cfg = _mock_model_config()
+            model = MockModel(cfg=cfg.model, trainer=None).to('cpu')
+            save_path = os.path.join(tmpdir, 'model.nemo')
+            model.save_to(save_path)
+            member = save_restore_connector.SaveRestoreConnector._tar_member_index(save_path)['model_weights.ckpt']
+
+            locations = []
+
+            def map_location(storage, location):
+                locations.append(location)
+                return storage
+
+            state_dict = save_restore_connector.SaveRestoreConnector._load_state_dict_from_tar(
+                save_path, member.offset_data, member.size, map_location=map_location
+            )
+            assert len(locations) > 0
+            assert torch.equal(state_dict['w.weight'], model.w.weight)
+
+            state_dict = save_restore_connector.SaveRestoreConnector._load_state_dict_from_tar(
+                save_path, member.offset_data, member.size, map_location=torch.device('meta')
+            )
+            assert state_dict['w.weight'].device.type == 'meta'
+            assert state_dict['w.weight'].shape == model.w.weight.shape
+
+    @pytest.mark.unit
+    def test_restore_from_save_restore_connector_mmap_restore_fallback(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cfg = _mock_model_config()
+            model = MockModel(cfg=cfg.model, trainer=None).to('cpu')
+            save_path = os.path.join(tmpdir, 'model.nemo')
+            model.save_to(save_path)
+
+            connector = save_restore_connector.SaveRestoreConnector()
+            connector.mmap_restore = True
+            # without the private torch API the archive is extracted and the weights loaded with torch.load
+            with patch.object(save_restore_connector, '_can_map_weights_from_archive', return_value=False):
+                with patch.object(
+                    connector, '_load_state_dict_from_tar', side_effect=AssertionError("weights were mapped")
+                ):
+                    restored_model = MockModel.restore_from(
+                        save_path, map_location='cpu', save_restore_connector=connector
+                    )
+
+        assert torch.equal(model.w.weight, restored_model.w.weight)
+
+    @pytest.mark.unit
+    def test_restore_from_save_restore_connector_mmap_restore_directory_artifact(self):
+        class MockModelWithDirectoryArtifact(MockModel):
+            def __init__(self, cfg, trainer=None):
+                super().__init__(cfg=cfg, trainer=trainer)
+                self.artifact_data = None
+                if cfg.get('artifact_dir') is not None:
+                    artifact_dir = self.register_artifact('artifact_dir', cfg.artifact_dir)
+                    self.artifact_data = {}
+                    for root, _, files in os.walk(artifact_dir):
+                        for name in files:
+                            with open(os.path.join(root, name), 'r', encoding='utf-8') as f:
+                                self.artifact_data[os.path.relpath(os.path.join(root, name), artifact_dir)] = f.read()
+
+        with tempfile.NamedTemporaryFile('w') as empty_file, tempfile.TemporaryDirectory() as tmpdir:
+            empty_file.writelines(["*****\n"])
+            empty_file.flush()
+
+            cfg = _mock_model_config()
+            cfg.model.temp_file = empty_file.name
+            model = MockModelWithDirectoryArtifact(cfg=cfg.model, trainer=None).to('cpu')
+            save_path = os.path.join(tmpdir, 'mmap.nemo')
+            model.save_to(save_path)
+
+            # add a directory artifact, e.g. a tokenizer folder, with a nested folder
+            artifact_dir = os.path.join(tmpdir, 'tokenizer')
+            os.makedirs(os.path.join(artifact_dir, 'nested'))
+            with open(os.path.join(artifact_dir, 'vocab.txt'), 'w') as f:
+                f.write("a\nb\n")
+            with open(os.path.join(artifact_dir, 'nested', 'merges.txt'), 'w') as f:
+                f.write("a b\n")
+            with tarfile.open(save_path, "a:") as tar:
+                tar.add(artifact_dir, arcname='./tokenizer')
+
+            override_cfg = OmegaConf.create(OmegaConf.to_container(model.cfg))
+            override_cfg.artifact_dir = 'nemo:tokenizer'
+            connector = save_restore_connector.SaveRestoreConnector()
+            connector.mmap_restore = True
+            with patch.object(
+                save_restore_connector.SaveRestoreConnector,
+                '_tar_member_index',
+                side_effect=save_restore_connector.SaveRestoreConnector._tar_member_index,
+            ) as tar_member_index:
+                restored_model = MockModelWithDirectoryArtifact.restore_from(
+                    save_path,
+                    override_config_path=override_cfg,
+                    map_location='cpu',
+                    save_restore_connector=connector,
+                )
+            # the archive is indexed once, not once per registered artifact
+            assert tar_member_index.call_count == 1
+
+        # the whole directory is extracted
+        assert restored_model.artifact_data == {'vocab.txt': "a\nb\n", os.path.join('nested', 'merges.txt'): "a b\n"}
+        assert restored_model.temp_data == ["*****\n"]
+        assert torch.equal(model.w.weight, restored_model.w.weight)
+
+    @pytest.mark.unit
+    def test_extract_state_dict_from_without_unpacking(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            cfg = _mock_model_config()
+            model = MockModel(cfg=cfg.model, trainer=None).to('cpu')
+            save_path = os.path.join(tmpdir, 'model.nemo')
+            model.save_to(save_path)
+
+            # the weights are streamed into the archive, which stays readable by tarfile
+            with tarfile.open(save_path, "r:") as tar:
+                state_dict = torch.load(tar.extractfile('./model_weights.ckpt'), weights_only=False)
+            assert torch.equal(state_dict['w.weight'], model.w.weight)
+
+            connector = save_restore_connector.SaveRestoreConnector()
+            with patch.object(connector, '_unpack_nemo_file', side_effect=AssertionError("archive was unpacked")):
+                state_dict = connector.extract_state_dict_from(save_path, os.path.join(tmpdir, 'ckpts'))
+                connector.extract_state_dict_from(save_path, os.path.join(tmpdir, 'modules'), split_by_module=True)
+
+            assert torch.equal(state_dict['w.weight'], model.w.weight)
+            module_state_dict = torch.load(os.path.join(tmpdir, 'modules', 'w.ckpt'), weights_only=False)
+            assert torch.equal(module_state_dict['bias'], model.w.bias)
+
     @pytest.mark.unit
     def test_hf_model_filter(self):
         filt = ModelPT.get_hf_model_filter()
@@ -1190,3 +1190,106 @@ class TestNeuralTypeCheckSystem:
             # assert that even if semantic types are disabled, output is attached with appropriate types
             assert result.sum() == torch.tensor(10.0)
             assert result.neural_type.compare(NeuralType(('B',), LabelsType())) == NeuralTypeComparisonResult.SAME
+
+
+class TestCachedNeuralTypeCheckSystem(TestNeuralTypeCheckSystem):
+    """Runs all type check tests with cached type checks enabled."""
+
+    @pytest.fixture(autouse=True)
+    def cached_checks(self):
+        typecheck.reset_cached_checks()
+        with typecheck.cached_checks():
+            yield
+        typecheck.reset_cached_checks()
+
+    @pytest.mark.unit
+    def test_multi_forward_type(self):
+        # The types of this test change with the mode of the instance, which cached type checks do not support
+        with typecheck.cached_checks():
+            typecheck.set_cached_checks_enabled(False)
+            super().test_multi_forward_type()
+
+    @pytest.mark.unit
+    def test_cached_checks_skip_validation(self):
+        class InputOutputTypes(Typing):
+            @property
+            def input_types(self):
+                return {"x": NeuralType(('B', 'D'), LogprobsType())}
+
+            @property
+            def output_types(self):
+                return {"y": NeuralType(('B', 'D'), ElementType()), "z": NeuralType(('B',), LengthsType())}
+
+            @typecheck()
+            def __call__(self, x):
+                return x + 1, torch.zeros(x.shape[0])
+
+        obj = InputOutputTypes()
+        for _ in range(5):
+            y, z = obj(x=torch.zeros(2, 3))
+            assert y.neural_type.compare(NeuralType(('B', 'D'), ElementType())) == NeuralTypeComparisonResult.SAME
+            assert z.neural_type.compare(NeuralType(('B',), LengthsType())) == NeuralTypeComparisonResult.SAME
+
+        stats = typecheck.get_cached_check_stats()[f"{InputOutputTypes.__qualname__}.__call__"]
+        assert stats['calls'] == 5
+        assert stats['validated_calls'] == 1
+        assert stats['typecheck_time'] > 0
+
+        # A new signature of the inputs is validated again
+        with pytest.raises(TypeError):
+            _ = obj(x=torch.zeros(2))
+
+        input_data = torch.zeros(2, 3)
+        input_data.neural_type = NeuralType(('B', 'D'), LabelsType())
+        with pytest.raises(TypeError):
+            _ = obj(x=input_data)
+
+        # Every instance has its own plan, failed calls are not counted
+        _ = InputOutputTypes()(x=torch.zeros(2, 3))
+        assert typecheck.get_cached_check_stats()[f"{InputOutputTypes.__qualname__}.__call__"]['validated_calls'] == 2
+
+    @pytest.mark.unit
+    def test_cached_checks_num_validated_calls(self):
+        class InputTypes(Typing):
+            @property
+            def input_types(self):
+                return {"x": NeuralType(('B',), ElementType())}
+
+            @typecheck()
+            def __call__(self, x):
+                return x
+
+        obj = InputTypes()
+        with typecheck.cached_checks(num_validated_calls=3):
+            for _ in range(5):
+                _ = obj(x=torch.zeros(2))
+
+        stats = typecheck.get_cached_check_stats()[f"{InputTypes.__qualname__}.__call__"]
+        assert stats['calls'] == 5
+        assert stats['validated_calls'] == 3
+
+    @pytest.mark.unit
+    def test_cached_checks_reset(self):
+        class AdaptiveTypes(Typing):
+            def __init__(self):
+                self.ndim = 1
+
+            @property
+            def input_types(self):
+                return {"x": NeuralType(('B', 'D')[: self.ndim], ElementType())}
+
+            @typecheck()
+            def __call__(self, x):
+                return x
+
+        obj = AdaptiveTypes()
+        _ = obj(x=torch.zeros(2))
+
+        # The types are resolved on the first call of the instance
+        obj.ndim = 2
+        with pytest.raises(TypeError):
+            _ = obj(x=torch.zeros(2, 3))
+
+        typecheck.reset_cached_checks()
+        assert typecheck.get_cached_check_stats() == {}
+        _ = obj(x=torch.zeros(2, 3))
@@ -18,7 +18,14 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
-from nemo.utils.import_utils import UnavailableError, UnavailableMeta, is_unavailable, safe_import, safe_import_from
+from nemo.utils.import_utils import (
+    UnavailableError,
+    UnavailableMeta,
+    import_all_lazy_attributes,
+    is_unavailable,
+    safe_import,
+    safe_import_from,
+)
 
 
 class TestUnavailableMeta:
@@ -265,3 +272,69 @@ class TestSafeImportFrom:
 
         assert success is False
         assert is_unavailable(symbol)
+
+
+@pytest.fixture
+def lazy_package(tmp_path, monkeypatch):
+    """Creates a package `lazy_pkg` whose names are imported with `lazy_import`."""
+    package_dir = tmp_path / "lazy_pkg"
+    package_dir.mkdir()
+    (package_dir / "__init__.py").write_text(
+        "from nemo.utils.import_utils import lazy_import\n"
+        "__getattr__, __dir__, __all__ = lazy_import(\n"
+        "    __name__,\n"
+        "    submodules=['sub'],\n"
+        "    attributes={'models': ['Model', 'Other as Alias']},\n"
+        "    wildcard_modules=['extra'],\n"
+        ")\n"
+    )
+    (package_dir / "sub.py").write_text("VALUE = 1\n")
+    (package_dir / "models.py").write_text("import lazy_pkg\nclass Model: pass\nclass Other: pass\n")
+    (package_dir / "extra.py").write_text("__all__ = ['extra_fn']\ndef extra_fn(): pass\ndef private_fn(): pass\n")
+    (package_dir / "hidden.py").write_text("")
+    monkeypatch.syspath_prepend(str(tmp_path))
+    yield
+    for name in list(sys.modules):
+        if name == "lazy_pkg" or name.startswith("lazy_pkg."):
+            del sys.modules[name]
+
+
+@pytest.mark.usefixtures("lazy_package")
+class TestLazyImport:
+    def test_names_imported_on_access(self):
+        """Test that the modules of the package are imported on first access of their names."""
+        import lazy_pkg
+
+        assert "lazy_pkg.models" not in sys.modules
+        assert sorted(lazy_pkg.__all__) == ["Alias", "Model", "sub"]
+        assert {"Alias", "Model", "sub"} <= set(dir(lazy_pkg))
+
+        from lazy_pkg import Model
+
+        assert "lazy_pkg.models" in sys.modules
+        assert Model is sys.modules["lazy_pkg.models"].Model
+        assert lazy_pkg.Alias is sys.modules["lazy_pkg.models"].Other
+        assert "Model" in vars(lazy_pkg)
+        assert lazy_pkg.sub.VALUE == 1
+        assert lazy_pkg.hidden is sys.modules["lazy_pkg.hidden"]
+
+    def test_wildcard_modules(self):
+        """Test that the `__all__` of the wildcard modules is exported."""
+        import lazy_pkg
+
+        assert lazy_pkg.extra_fn is sys.modules["lazy_pkg.extra"].extra_fn
+        assert not hasattr(lazy_pkg, "private_fn")
+        assert not hasattr(lazy_pkg, "__missing__")
+
+    def test_eager_imports(self, monkeypatch):
+        """Test that all the names are imported with the package if lazy imports are disabled."""
+        monkeypatch.setenv("NEMO_LAZY_IMPORTS", "0")
+        import lazy_pkg
+
+        assert {"Model", "Alias", "sub", "extra_fn"} <= set(vars(lazy_pkg))
+
+    def test_import_all_lazy_attributes(self):
+        """Test that import_all_lazy_attributes imports all the exported names."""
+        import_all_lazy_attributes("lazy_pkg")
+
+        assert {"Model", "Alias", "sub"} <= set(vars(sys.modules["lazy_pkg"]))
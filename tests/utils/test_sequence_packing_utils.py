@@ -0,0 +1,99 @@
+# Copyright (c) 2025, NVIDIA CORPORATION.  All rights reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import numpy as np
+import pytest
+
+from nemo.utils.sequence_packing_utils import (
+    PACKING_ALGOS,
+    best_fit_decreasing,
+    create_packing_strategy,
+    find_first_bin_that_fits,
+    first_fit,
+    histogram_best_fit_decreasing,
+)
+
+
+def reference_first_fit(seqlens, pack_size):
+    res = []
+    for s in seqlens:
+        first_bin = find_first_bin_that_fits(res, s, pack_size)
+        if first_bin == -1:
+            res.append([s])
+        else:
+            res[first_bin].append(s)
+    return res
+
+
+def reference_best_fit_decreasing(seqlens, pack_size):
+    res = []
+    for s in sorted(seqlens, reverse=True):
+        fitting = [(pack_size - sum(b), i) for i, b in enumerate(res) if sum(b) + s <= pack_size]
+        if fitting:
+            res[min(fitting)[1]].append(s)
+        else:
+            res.append([s])
+    return res
+
+
+def random_seqlens(rng, pack_size, num_seqs):
+    return rng.integers(1, pack_size + 1, size=num_seqs).tolist()
+
+
+class TestSequencePacking:
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", range(5))
+    def test_first_fit_matches_reference(self, seed):
+        rng = np.random.default_rng(seed)
+        seqlens = random_seqlens(rng, pack_size=64, num_seqs=200)
+        assert first_fit(seqlens, 64) == reference_first_fit(seqlens, 64)
+
+    @pytest.mark.unit
+    def test_first_fit_oversized_sequence(self):
+        assert first_fit([3, 10, 2, 4], 8) == [[3, 2], [10], [4]]
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", range(5))
+    def test_best_fit_decreasing_matches_reference(self, seed):
+        rng = np.random.default_rng(seed)
+        seqlens = random_seqlens(rng, pack_size=64, num_seqs=200)
+        packed = best_fit_decreasing(seqlens, 64)
+
+        assert sorted(s for b in packed for s in b) == sorted(seqlens)
+        assert all(sum(b) <= 64 for b in packed)
+        # ties between bins with the same free capacity are broken differently, so compare the number of bins
+        assert len(packed) == len(reference_best_fit_decreasing(seqlens, 64))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("seed", range(5))
+    def test_histogram_best_fit_decreasing(self, seed):
+        rng = np.random.default_rng(seed)
+        seqlens = random_seqlens(rng, pack_size=64, num_seqs=200)
+        histogram = np.bincount(seqlens, minlength=65).tolist()
+        packed = histogram_best_fit_decreasing(histogram, 64)
+
+        assert sorted(s for b in packed for s in b) == sorted(seqlens)
+        assert all(sum(b) <= 64 for b in packed)
+        assert len(packed) == len(reference_best_fit_decreasing(seqlens, 64))
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize("packing_algorithm", PACKING_ALGOS)
+    def test_create_packing_strategy(self, packing_algorithm):
+        histogram = [0, 0, 3, 0, 2, 1, 0, 4]
+        assignments, metadata = create_packing_strategy(histogram, 8, packing_algorithm)
+
+        assert sorted(s for b in assignments for s in b) == [2, 2, 2, 4, 4, 5, 7, 7, 7, 7]
+        assert all(sum(b) <= 8 for b in assignments)
+        assert metadata["dataset_max_seqlen"] == 7
+        assert metadata["pack_size"] == 8